@@ -0,0 +1,35 @@
+# src/kibana_mcp/client/__init__.py
+
+from .singleflight import SingleFlightTransport
+from .metrics import MetricsTransport
+from .tracing import TracingTransport
+from .routes import templated_path
+from .resilience import ResilienceTransport, RetryPolicy, CircuitBreaker, CircuitOpenError
+from .limiter import LimiterTransport, FamilyLimit, TokenBucket
+from .deadlines import DeadlineExceeded, remaining
+from .spaces import SpaceSettingsCache, space_settings, current_space, validate_space
+from .kibana_client import KibanaClient, PoolSettings, TimeoutClasses, PoolStatsTransport
+
+__all__ = [
+    'SingleFlightTransport',
+    'MetricsTransport',
+    'TracingTransport',
+    'templated_path',
+    'ResilienceTransport',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'LimiterTransport',
+    'FamilyLimit',
+    'TokenBucket',
+    'DeadlineExceeded',
+    'remaining',
+    'SpaceSettingsCache',
+    'space_settings',
+    'current_space',
+    'validate_space',
+    'KibanaClient',
+    'PoolSettings',
+    'TimeoutClasses',
+    'PoolStatsTransport',
+]
@@ -0,0 +1,35 @@
+import httpx
+from typing import AsyncIterator, Callable
+
+
+class CallbackStream(httpx.AsyncByteStream):
+    """Wraps a response body stream, counting its bytes and calling ``on_close(size)`` exactly once."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[int], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._bytes = 0
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._bytes += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close(self._bytes)
+
+
+def with_stream_callback(response: httpx.Response, on_close: Callable[[int], None]) -> httpx.Response:
+    """Returns a copy of a transport-level response whose body stream reports when it is closed."""
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=response.headers,
+        stream=CallbackStream(response.stream, on_close),
+        extensions=response.extensions,
+    )
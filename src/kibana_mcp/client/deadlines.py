@@ -0,0 +1,69 @@
+import httpx
+import math
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+# Monotonic time by which the current tool call must finish, or None for no deadline
+_deadline: ContextVar[Optional[float]] = ContextVar("kibana_mcp_deadline", default=None)
+
+_TIMEOUT_KEYS = ("connect", "read", "write", "pool")
+
+# Request extension set when the deadline shortened one of the request's timeouts
+DEADLINE_CAPPED_EXTENSION = "kibana_mcp.deadline_capped"
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """Raised instead of sending a Kibana request once the tool call's deadline has passed."""
+
+
+def begin_deadline(seconds: Optional[float]):
+    """Gives the current tool call ``seconds`` to finish; an enclosing, earlier deadline wins.
+
+    ``None`` or ``0`` leaves the current deadline as it is. Returns a reset token.
+    """
+    deadline = _deadline.get()
+    if seconds:
+        candidate = time.monotonic() + seconds
+        deadline = candidate if deadline is None else min(deadline, candidate)
+    return _deadline.set(deadline)
+
+
+def end_deadline(token) -> None:
+    _deadline.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    """The monotonic time by which the current tool call must finish, or None without a deadline."""
+    return _deadline.get()
+
+
+def begin_deadline_at(deadline: Optional[float]):
+    """Sets the current deadline to the monotonic time ``deadline`` (None removes it). Returns a reset token."""
+    return _deadline.set(deadline)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the current deadline (possibly negative), or None without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def apply_deadline(request: httpx.Request) -> None:
+    """Caps every timeout of ``request`` at the time left, or raises DeadlineExceeded if none is."""
+    left = remaining()
+    if left is None:
+        return
+    if left <= 0:
+        raise DeadlineExceeded(f"Deadline exceeded before {request.method} {request.url.path} was sent.", request=request)
+    timeout = request.extensions.get("timeout") or {}
+    limits = {key: timeout.get(key) if timeout.get(key) is not None else math.inf for key in _TIMEOUT_KEYS}
+    request.extensions["timeout"] = {key: min(limit, left) for key, limit in limits.items()}
+    if any(left < limit for limit in limits.values()):
+        request.extensions[DEADLINE_CAPPED_EXTENSION] = True
+
+
+def cut_short_by_deadline(request: httpx.Request) -> bool:
+    """Whether a timeout of ``request`` is the caller's deadline rather than a slow Kibana."""
+    left = remaining()
+    return bool(request.extensions.get(DEADLINE_CAPPED_EXTENSION)) or (left is not None and left <= 0)
@@ -0,0 +1,270 @@
+import httpx
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from kibana_mcp import metrics
+from ._env import env_bool, env_float, env_int
+from ._streams import with_stream_callback
+from .deadlines import apply_deadline
+from .limiter import FamilyLimit, LimiterTransport
+from .metrics import MetricsTransport
+from .resilience import ResilienceTransport, RetryPolicy
+from .singleflight import SingleFlightTransport
+from .spaces import current_space, space_path, validate_space
+from .tracing import TracingTransport
+
+client_logger = logging.getLogger("kibana-mcp.client")
+
+# Request extension a caller can set to pick a timeout class for one request,
+# e.g. ``http_client.get(path, extensions={"timeout_class": "long"})``
+TIMEOUT_CLASS_EXTENSION = "timeout_class"
+
+# Path suffixes of Kibana APIs that stream large bodies or do heavy server-side work
+LONG_REQUEST_SUFFIXES = (
+    "/_export",
+    "/_import",
+    "/download",
+    "/rules/prepackaged",
+)
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool settings for the Kibana client."""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """Reads KIBANA_MCP_POOL_MAX_CONNECTIONS, KIBANA_MCP_POOL_MAX_KEEPALIVE,
+        KIBANA_MCP_POOL_KEEPALIVE_EXPIRY and KIBANA_MCP_HTTP2."""
+        return cls(
+            max_connections=env_int("KIBANA_MCP_POOL_MAX_CONNECTIONS", cls.max_connections),
+            max_keepalive_connections=env_int("KIBANA_MCP_POOL_MAX_KEEPALIVE", cls.max_keepalive_connections),
+            keepalive_expiry=env_float("KIBANA_MCP_POOL_KEEPALIVE_EXPIRY", cls.keepalive_expiry),
+            http2=env_bool("KIBANA_MCP_HTTP2", cls.http2),
+        )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass(frozen=True)
+class TimeoutClasses:
+    """Request timeouts (seconds) by class: ``fast`` reads, ``default`` writes and searches,
+    ``long`` exports, imports and downloads."""
+    fast: float = 15.0
+    default: float = 30.0
+    long: float = 120.0
+    connect: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "TimeoutClasses":
+        """Reads KIBANA_MCP_TIMEOUT_FAST, KIBANA_MCP_TIMEOUT_DEFAULT, KIBANA_MCP_TIMEOUT_LONG
+        and KIBANA_MCP_TIMEOUT_CONNECT."""
+        return cls(
+            fast=env_float("KIBANA_MCP_TIMEOUT_FAST", cls.fast),
+            default=env_float("KIBANA_MCP_TIMEOUT_DEFAULT", cls.default),
+            long=env_float("KIBANA_MCP_TIMEOUT_LONG", cls.long),
+            connect=env_float("KIBANA_MCP_TIMEOUT_CONNECT", cls.connect),
+        )
+
+    def classify(self, request: httpx.Request) -> str:
+        """Picks the timeout class for a request from its extensions, path and method."""
+        requested = request.extensions.get(TIMEOUT_CLASS_EXTENSION)
+        if requested:
+            return requested
+        if request.url.path.endswith(LONG_REQUEST_SUFFIXES):
+            return "long"
+        if request.method in ("GET", "HEAD"):
+            return "fast"
+        return "default"
+
+    def timeout(self, timeout_class: str) -> httpx.Timeout:
+        seconds = getattr(self, timeout_class, None)
+        if not isinstance(seconds, float) or timeout_class == "connect":
+            raise ValueError(f"Unknown timeout class '{timeout_class}'. Use 'fast', 'default' or 'long'.")
+        return httpx.Timeout(seconds, connect=min(self.connect, seconds))
+
+
+class PoolStatsTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that measures connection pool saturation.
+
+    A request is *waiting* from the moment it reaches the pool until the pool hands
+    it a connection (observed through httpcore's ``trace`` extension), and *in use*
+    from then until its response body is closed.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self.waiting = 0
+        self.in_use = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _acquire(self, state: Dict[str, Any]) -> None:
+        if state["acquired"]:
+            return
+        state["acquired"] = True
+        waited = time.monotonic() - state["started_at"]
+        self.waiting -= 1
+        self.in_use += 1
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        metrics.POOL_WAIT.observe(waited)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = {"acquired": False, "started_at": time.monotonic()}
+        self.waiting += 1
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            # The first connection-level event means the pool assigned us a connection
+            if name.endswith(".started") and not state["acquired"]:
+                self._acquire(state)
+            if outer_trace is not None:
+                await outer_trace(name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            if state["acquired"]:
+                self.in_use -= 1
+            else:
+                self.waiting -= 1
+            raise
+        # Transports that emit no trace events (e.g. MockTransport) acquire immediately
+        self._acquire(state)
+
+        def release(_size: int) -> None:
+            self.in_use -= 1
+
+        return with_stream_callback(response, release)
+
+    def connections(self) -> Optional[int]:
+        """Open connections in the underlying httpcore pool, when it exposes them."""
+        pool = getattr(self._transport, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return len(connections) if connections is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_use": self.in_use,
+            "waiters": self.waiting,
+            "connections": self.connections(),
+            "acquired": self.acquired,
+            "total_wait_seconds": round(self.total_wait, 6),
+            "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 3) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class KibanaClient(httpx.AsyncClient):
+    """The shared Kibana HTTP client used by every tool.
+
+    Builds the transport stack (network pool -> pool stats -> metrics -> tracing -> per-family
+    limiter -> retries and circuit breakers -> request coalescing), applies
+    per-request timeout classes capped by the tool call's deadline, routes
+    requests to the current tool call's Kibana space (``/s/{space}``) and exposes
+    pool statistics. It is a regular ``httpx.AsyncClient``, so tools use it unchanged.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        pool: Optional[PoolSettings] = None,
+        timeouts: Optional[TimeoutClasses] = None,
+        single_flight: Optional[bool] = None,
+        retry: Optional[RetryPolicy] = None,
+        limits: Optional[Dict[str, FamilyLimit]] = None,
+        default_space: Optional[str] = None,
+        verify: bool = False,
+        network_transport: Optional[httpx.AsyncBaseTransport] = None,
+        **kwargs,
+    ):
+        self.pool_settings = pool or PoolSettings.from_env()
+        self.timeouts = timeouts or TimeoutClasses.from_env()
+        # Space used when a tool call does not select one; every space shares this client's pool
+        self.default_space = validate_space(default_space) if default_space else None
+        if single_flight is None:
+            single_flight = env_bool("KIBANA_MCP_SINGLE_FLIGHT", True)
+
+        http2 = self.pool_settings.http2
+        if http2 and not _http2_available():
+            client_logger.warning("KIBANA_MCP_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1.")
+            http2 = False
+        if network_transport is None:
+            network_transport = httpx.AsyncHTTPTransport(verify=verify, limits=self.pool_settings.limits(), http2=http2)
+
+        self.pool_stats_transport = PoolStatsTransport(network_transport)
+        # Metrics wrap the pool so they describe real Kibana requests
+        transport: httpx.AsyncBaseTransport = MetricsTransport(self.pool_stats_transport)
+        # One span per attempt, so retries show up as separate Kibana requests in a trace
+        transport = TracingTransport(transport)
+        # Queue time is kept out of the Kibana latency metrics, and backoff sleeps do not hold a slot
+        transport = self.limiter = LimiterTransport(transport, limits=limits)
+        # Each retry attempt is a separate Kibana request in the metrics; coalesced
+        # callers share the leader's retries
+        transport = self.resilience = ResilienceTransport(transport, policy=retry)
+        self.single_flight: Optional[SingleFlightTransport] = None
+        if single_flight:
+            # Concurrent identical reads share one in-flight Kibana request
+            transport = self.single_flight = SingleFlightTransport(transport)
+
+        super().__init__(
+            base_url=base_url,
+            timeout=self.timeouts.timeout("default"),
+            transport=transport,
+            **kwargs,
+        )
+
+    def build_request(self, method, url, **kwargs) -> httpx.Request:
+        request = super().build_request(method, url, **kwargs)
+        # An explicit per-call timeout wins over the timeout class
+        if kwargs.get("timeout", httpx.USE_CLIENT_DEFAULT) is httpx.USE_CLIENT_DEFAULT:
+            timeout_class = self.timeouts.classify(request)
+            request.extensions["timeout"] = self.timeouts.timeout(timeout_class).as_dict()
+        # Multi-step tools share the tool call's deadline across all of their requests
+        apply_deadline(request)
+        space = current_space() or self.default_space
+        if space:
+            # The space segment goes after any base path in KIBANA_URL: /kibana/s/{space}/api/...
+            base_path = self.base_url.path.rstrip("/")
+            path = request.url.path
+            if base_path and path.startswith(f"{base_path}/"):
+                path = base_path + space_path(path[len(base_path):], space)
+            else:
+                path = space_path(path, space)
+            request.url = request.url.copy_with(path=path)
+        return request
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool saturation: connections in use, waiters and time spent waiting."""
+        return {
+            **self.pool_stats_transport.stats(),
+            "max_connections": self.pool_settings.max_connections,
+            "http2": self.pool_settings.http2 and _http2_available(),
+        }
@@ -0,0 +1,177 @@
+import asyncio
+import httpx
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from kibana_mcp import metrics
+from ._streams import with_stream_callback
+from .routes import api_family
+
+client_logger = logging.getLogger("kibana-mcp.client")
+
+# Family used for limits of API families without their own entry
+DEFAULT_FAMILY = "*"
+
+
+@dataclass(frozen=True)
+class FamilyLimit:
+    """Limits for one API family. ``max_in_flight=0`` and ``rate=0`` mean unlimited;
+    ``rate`` is requests per second and ``burst`` the bucket size."""
+    max_in_flight: int = 0
+    rate: float = 0.0
+    burst: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "FamilyLimit":
+        """Parses ``max_in_flight[:rate[:burst]]``, e.g. ``8``, ``8:5`` or ``8:5:10``."""
+        parts = [part.strip() for part in spec.split(":")]
+        max_in_flight = int(parts[0]) if parts[0] else 0
+        rate = float(parts[1]) if len(parts) > 1 and parts[1] else 0.0
+        if len(parts) > 2 and parts[2]:
+            burst = float(parts[2])
+        else:
+            # Default burst: one second's worth of requests
+            burst = max(rate, 1.0) if rate else 0.0
+        return cls(max_in_flight=max_in_flight, rate=rate, burst=burst)
+
+
+# Concurrency caps per API family. Each is well below the default pool size (100), so a
+# burst against one family (e.g. saved object exports) cannot take every connection.
+# The named families add up to 80; every other family gets a gate of its own with the
+# "*" cap, so several of them busy at once can still use the rest of the pool.
+DEFAULT_FAMILY_LIMITS: Dict[str, FamilyLimit] = {
+    "detection_engine": FamilyLimit(max_in_flight=32),
+    "cases": FamilyLimit(max_in_flight=16),
+    "saved_objects": FamilyLimit(max_in_flight=8),
+    "endpoint": FamilyLimit(max_in_flight=16),
+    "exception_lists": FamilyLimit(max_in_flight=8),
+    DEFAULT_FAMILY: FamilyLimit(max_in_flight=8),
+}
+
+
+def limits_from_env() -> Dict[str, FamilyLimit]:
+    """Returns the default limits overridden by KIBANA_MCP_FAMILY_LIMITS.
+
+    Format: ``family=max_in_flight[:rate[:burst]],...``, e.g.
+    ``saved_objects=4:2,endpoint=20,*=8``. ``*`` applies to unlisted families.
+    """
+    limits = dict(DEFAULT_FAMILY_LIMITS)
+    raw = os.getenv("KIBANA_MCP_FAMILY_LIMITS", "")
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        family, _, spec = item.partition("=")
+        limits[family.strip()] = FamilyLimit.parse(spec)
+    return limits
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second, holding up to ``burst`` tokens."""
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # The lock keeps waiters first-come, first-served
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class _FamilyGate:
+    def __init__(self, family: str, limit: FamilyLimit):
+        self.family = family
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit.max_in_flight) if limit.max_in_flight else None
+        self.bucket = TokenBucket(limit.rate, limit.burst) if limit.rate else None
+        self.queued = 0
+        self.in_flight = 0
+        self.admitted = 0
+        self.total_wait = 0.0
+
+
+class LimiterTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that caps in-flight requests and request rate per Kibana API family.
+
+    A request first takes a token from its family's bucket (if rate limited), then a
+    concurrency slot, which it holds until its response body is closed. Time spent
+    queued is recorded per family.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limits: Optional[Dict[str, FamilyLimit]] = None):
+        self._transport = transport
+        self.limits = limits if limits is not None else limits_from_env()
+        self._gates: Dict[str, _FamilyGate] = {}
+
+    def _gate(self, family: str) -> _FamilyGate:
+        gate = self._gates.get(family)
+        if gate is None:
+            limit = self.limits.get(family) or self.limits.get(DEFAULT_FAMILY) or FamilyLimit()
+            gate = self._gates[family] = _FamilyGate(family, limit)
+        return gate
+
+    async def _admit(self, gate: _FamilyGate) -> None:
+        gate.queued += 1
+        metrics.LIMITER_QUEUED.inc(family=gate.family)
+        started_at = time.monotonic()
+        try:
+            if gate.bucket is not None:
+                await gate.bucket.acquire()
+            if gate.semaphore is not None:
+                await gate.semaphore.acquire()
+        finally:
+            gate.queued -= 1
+            metrics.LIMITER_QUEUED.dec(family=gate.family)
+        waited = time.monotonic() - started_at
+        gate.admitted += 1
+        gate.total_wait += waited
+        gate.in_flight += 1
+        metrics.LIMITER_WAIT.observe(waited, family=gate.family)
+        metrics.LIMITER_IN_FLIGHT.inc(family=gate.family)
+
+    def _release(self, gate: _FamilyGate) -> None:
+        gate.in_flight -= 1
+        metrics.LIMITER_IN_FLIGHT.dec(family=gate.family)
+        if gate.semaphore is not None:
+            gate.semaphore.release()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        gate = self._gate(api_family(request.url.path))
+        await self._admit(gate)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._release(gate)
+            raise
+        return with_stream_callback(response, lambda _size: self._release(gate))
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            family: {
+                "max_in_flight": gate.limit.max_in_flight,
+                "rate": gate.limit.rate,
+                "in_flight": gate.in_flight,
+                "queued": gate.queued,
+                "admitted": gate.admitted,
+                "avg_wait_ms": round(gate.total_wait / gate.admitted * 1000, 3) if gate.admitted else 0.0,
+            }
+            for family, gate in sorted(self._gates.items())
+        }
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
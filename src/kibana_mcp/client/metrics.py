@@ -0,0 +1,49 @@
+import httpx
+import logging
+import time
+
+from kibana_mcp import metrics
+from ._streams import with_stream_callback
+from .routes import templated_path
+
+client_logger = logging.getLogger("kibana-mcp.client")
+
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that records latency, size, in-flight and error metrics per Kibana route.
+
+    Requests are labelled by method and templated path (``/api/cases/{id}``) so label
+    cardinality stays bounded. Latency covers the request until its body has been read.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        labels = {"method": request.method, "path": templated_path(request.url.path)}
+        metrics.KIBANA_IN_FLIGHT.inc(**labels)
+        started_at = time.monotonic()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as exc:
+            # Includes cancellation, so an aborted request leaves the in-flight gauge
+            metrics.KIBANA_IN_FLIGHT.dec(**labels)
+            metrics.KIBANA_DURATION.observe(time.monotonic() - started_at, **labels)
+            metrics.KIBANA_REQUESTS.inc(status="error", **labels)
+            metrics.KIBANA_ERRORS.inc(reason=type(exc).__name__, **labels)
+            raise
+
+        status = response.status_code
+
+        def on_close(size: int) -> None:
+            metrics.KIBANA_IN_FLIGHT.dec(**labels)
+            metrics.KIBANA_DURATION.observe(time.monotonic() - started_at, **labels)
+            metrics.KIBANA_RESPONSE_BYTES.observe(size, **labels)
+            metrics.KIBANA_REQUESTS.inc(status=str(status), **labels)
+            if status >= 400:
+                metrics.KIBANA_ERRORS.inc(reason=str(status), **labels)
+
+        return with_stream_callback(response, on_close)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
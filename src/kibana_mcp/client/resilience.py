@@ -0,0 +1,245 @@
+import asyncio
+import email.utils
+import httpx
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from kibana_mcp import metrics
+from ._env import env_float, env_int
+from .deadlines import apply_deadline, cut_short_by_deadline, remaining
+from .routes import api_family
+from .singleflight import DEFAULT_READ_POST_SUFFIXES
+from .tracing import RESEND_COUNT_EXTENSION
+
+client_logger = logging.getLogger("kibana-mcp.client")
+
+# Request extension a caller can set to False to disable retries for one request
+RETRY_EXTENSION = "retry"
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+# Responses that count against a circuit breaker (other 4xx are the caller's fault)
+FAILURE_STATUS_CODES = (429, 500, 502, 503, 504)
+# API families whose writes must never be replayed: a retried isolate/execute acts twice
+NEVER_RETRY_FAMILIES = ("endpoint",)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while the breaker for its API family is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings: attempts include the first try; delays are in seconds."""
+    max_attempts: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 5.0
+    max_retry_after: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Reads KIBANA_MCP_RETRY_MAX_ATTEMPTS, KIBANA_MCP_RETRY_BASE_DELAY,
+        KIBANA_MCP_RETRY_MAX_DELAY and KIBANA_MCP_RETRY_MAX_RETRY_AFTER."""
+        return cls(
+            max_attempts=env_int("KIBANA_MCP_RETRY_MAX_ATTEMPTS", cls.max_attempts),
+            base_delay=env_float("KIBANA_MCP_RETRY_BASE_DELAY", cls.base_delay),
+            max_delay=env_float("KIBANA_MCP_RETRY_MAX_DELAY", cls.max_delay),
+            max_retry_after=env_float("KIBANA_MCP_RETRY_MAX_RETRY_AFTER", cls.max_retry_after),
+        )
+
+    def is_retryable(self, request: httpx.Request) -> bool:
+        """Idempotent methods and read-only POSTs are retried; endpoint actions never are."""
+        if request.extensions.get(RETRY_EXTENSION) is False:
+            return False
+        if request.method in IDEMPOTENT_METHODS:
+            return True
+        if request.method != "POST" or api_family(request.url.path) in NEVER_RETRY_FAMILIES:
+            return False
+        return request.url.path.rstrip("/").endswith(DEFAULT_READ_POST_SUFFIXES)
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """Full-jitter exponential backoff for the given (1-based) retry attempt."""
+        return rng.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Parses a Retry-After header (delay-seconds or HTTP-date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(moment.timestamp() - (time.time() if now is None else now), 0.0)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    ``closed``: requests flow. After ``failure_threshold`` consecutive failures it
+    turns ``open`` and rejects requests for ``recovery_time`` seconds, then goes
+    ``half_open`` and lets one trial request through: success closes it, failure
+    re-opens it.
+    """
+
+    STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._clock = clock
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == "open":
+            if self._clock() - self.opened_at < self.recovery_time:
+                return False
+            self.state = "half_open"
+            self._trial_in_flight = False
+        if self.state == "half_open":
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Ends a half-open trial that produced neither a success nor a failure."""
+        self._trial_in_flight = False
+
+
+class ResilienceTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper adding retries with jittered backoff and per-API-family circuit breakers.
+
+    Retryable requests (see ``RetryPolicy.is_retryable``) are retried on connection
+    errors and 429/502/503/504, honouring ``Retry-After``. When a Retry-After asks
+    for longer than ``max_retry_after`` the response is returned as is.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: Optional[RetryPolicy] = None,
+        failure_threshold: Optional[int] = None,
+        recovery_time: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], "asyncio.Future"] = asyncio.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self._transport = transport
+        self.policy = policy or RetryPolicy.from_env()
+        self.failure_threshold = failure_threshold or env_int("KIBANA_MCP_BREAKER_FAILURE_THRESHOLD", 5)
+        self.recovery_time = recovery_time or env_float("KIBANA_MCP_BREAKER_RECOVERY_TIME", 30.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, family: str) -> CircuitBreaker:
+        breaker = self.breakers.get(family)
+        if breaker is None:
+            breaker = self.breakers[family] = CircuitBreaker(self.failure_threshold, self.recovery_time, self._clock)
+        return breaker
+
+    async def _attempt(self, request: httpx.Request, family: str, breaker: CircuitBreaker) -> Tuple[Optional[httpx.Response], Optional[Exception]]:
+        if not breaker.allow():
+            metrics.CIRCUIT_REJECTIONS.inc(family=family)
+            raise CircuitOpenError(f"Circuit breaker for Kibana API family '{family}' is open; failing fast.", request=request)
+        response, error = None, None
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TimeoutException as exc:
+            error = exc
+            if cut_short_by_deadline(request):
+                # The caller ran out of time; Kibana was not necessarily slow
+                breaker.release()
+            else:
+                breaker.record_failure()
+        except httpx.TransportError as exc:
+            error = exc
+            breaker.record_failure()
+        except BaseException:
+            breaker.release()
+            raise
+        else:
+            if response.status_code in FAILURE_STATUS_CODES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        metrics.CIRCUIT_STATE.set(CircuitBreaker.STATES[breaker.state], family=family)
+        return response, error
+
+    def _retry_delay(self, response: Optional[httpx.Response], error: Optional[Exception], attempt: int) -> Tuple[Optional[str], float]:
+        """Returns (reason, delay) when the attempt should be retried, else (None, 0)."""
+        if error is not None:
+            return type(error).__name__, self.policy.backoff(attempt, self._rng)
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            return None, 0.0
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        if retry_after is None:
+            return str(response.status_code), self.policy.backoff(attempt, self._rng)
+        if retry_after > self.policy.max_retry_after:
+            # Kibana asked for a longer pause than we are willing to hold the caller for
+            return None, 0.0
+        return str(response.status_code), retry_after
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        family = api_family(request.url.path)
+        breaker = self.breaker(family)
+        retryable = self.policy.is_retryable(request)
+        attempt = 1
+        while True:
+            response, error = await self._attempt(request, family, breaker)
+            if not retryable or attempt >= self.policy.max_attempts or breaker.state == "open":
+                break
+            if isinstance(error, httpx.TimeoutException) and cut_short_by_deadline(request):
+                # No time is left for another attempt
+                break
+            reason, delay = self._retry_delay(response, error, attempt)
+            if reason is None:
+                break
+            left = remaining()
+            if left is not None and delay >= left:
+                # The tool call's deadline would pass before the retry is sent
+                break
+            if response is not None:
+                await response.aclose()
+            client_logger.info(
+                f"Retrying {request.method} {request.url.path} after {reason} "
+                f"(attempt {attempt + 1}/{self.policy.max_attempts}, waiting {delay:.2f}s)")
+            metrics.KIBANA_RETRIES.inc(family=family, reason=reason)
+            await self._sleep(delay)
+            # The retry gets only what is left of the deadline
+            apply_deadline(request)
+            attempt += 1
+            request.extensions[RESEND_COUNT_EXTENSION] = attempt - 1
+
+        if error is not None:
+            raise error
+        return response
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        return {family: {"state": b.state, "failures": b.failures} for family, b in self.breakers.items()}
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
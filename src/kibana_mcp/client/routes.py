@@ -0,0 +1,72 @@
+"""Kibana API route templates, used to label per-path metrics with bounded cardinality."""
+
+import re
+from typing import List, Pattern, Tuple
+
+# Path segments that are literal route parts and never an id
+_STATIC_SEGMENTS = ("configure", "tags", "status", "alerts", "reporters", "file", "download", "exceptions", "prepackaged")
+
+# Templates for the Kibana APIs the tools call. Most specific first.
+ROUTE_TEMPLATES: List[str] = [
+    "/api/cases/alerts/{id}",
+    "/api/cases/{id}/comments/_find",
+    "/api/cases/{id}/comments/{comment_id}",
+    "/api/cases/{id}/comments",
+    "/api/cases/{id}/alerts",
+    "/api/cases/{id}",
+    "/api/detection_engine/rules/{id}/exceptions",
+    "/api/endpoint/action/{id}/file/{file_id}/download",
+    "/api/endpoint/action/{id}/file/{file_id}",
+    "/api/endpoint/action/{id}",
+    "/api/saved_objects/{type}/{id}",
+    "/api/saved_objects/{type}",
+]
+
+# A placeholder matches one segment that is neither a "_action" nor a static route part
+_PLACEHOLDER = r"(?!_)(?!(?:%s)(?:/|$))[^/]+" % "|".join(_STATIC_SEGMENTS)
+# Base path of the Kibana URL, if any, and "/s/<space>" prefix of space-scoped URLs
+_SPACE_PREFIX = re.compile(r"^(?P<base>(?:/[^/]+)*?)(?P<space>/s/[^/]+)?(?=/api/)")
+# Fallback for paths not in ROUTE_TEMPLATES: segments that look like generated ids
+_ID_SEGMENT = re.compile(r"^(?:[0-9a-fA-F-]{16,}|\d+|[0-9a-zA-Z_-]*\d[0-9a-zA-Z_-]{11,})$")
+
+
+def _compile(template: str) -> Pattern:
+    parts = re.split(r"(\{[^}]+\})", template)
+    pattern = "".join(_PLACEHOLDER if part.startswith("{") else re.escape(part) for part in parts)
+    return re.compile(f"^{pattern}$")
+
+
+_COMPILED: List[Tuple[Pattern, str]] = [(_compile(template), template) for template in ROUTE_TEMPLATES]
+
+
+def templated_path(path: str) -> str:
+    """Maps a concrete Kibana path to its route template, e.g.
+
+    ``/s/soc/api/cases/5f1.../comments/_find`` -> ``/s/{space}/api/cases/{id}/comments/_find``.
+    """
+    prefix = ""
+    match = _SPACE_PREFIX.match(path)
+    if match:
+        prefix, path = match["base"] + ("/s/{space}" if match["space"] else ""), path[match.end():]
+    if len(path) > 1 and path.endswith("/"):
+        path = path[:-1]
+    for pattern, template in _COMPILED:
+        if pattern.match(path):
+            return prefix + template
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return prefix + "/".join(segments)
+
+
+def api_family(path: str) -> str:
+    """Returns the Kibana API family of a path: the segment after ``/api/``.
+
+    e.g. ``/s/soc/api/detection_engine/rules/_find`` -> ``detection_engine``,
+    ``/api/cases/{id}`` -> ``cases``. Non-API paths map to ``other``.
+    """
+    match = _SPACE_PREFIX.match(path)
+    if match:
+        path = path[match.end():]
+    parts = path.split("/", 3)
+    if len(parts) >= 3 and parts[1] == "api" and parts[2]:
+        return parts[2]
+    return "other"
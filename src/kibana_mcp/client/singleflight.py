@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import httpx
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+client_logger = logging.getLogger("kibana-mcp.client")
+
+# POST endpoints that only read data and are therefore safe to coalesce.
+DEFAULT_READ_POST_SUFFIXES: Tuple[str, ...] = (
+    "/_find",
+    "/_search",
+    "/search",
+    "/_bulk_get",
+)
+
+# Request headers that change the meaning of a request and so must be part of the key.
+_KEY_HEADERS = ("accept", "elastic-api-version", "authorization")
+
+_WIRE_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+@dataclass
+class _Flight:
+    """A single in-flight upstream request shared by every identical caller."""
+    task: asyncio.Task
+    waiters: int = 0
+
+
+@dataclass
+class _SharedResponse:
+    status_code: int
+    headers: list
+    content: bytes
+    extensions: dict = field(default_factory=dict)
+
+
+class SingleFlightTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that coalesces concurrent identical read requests.
+
+    While a GET (or a read-only POST such as ``_find``/``search``) is in flight,
+    identical requests wait on it instead of issuing their own, and every waiter
+    receives its own copy of the response. Requests arriving after it completes
+    go upstream again; caching is left to the response cache.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        read_post_suffixes: Iterable[str] = DEFAULT_READ_POST_SUFFIXES,
+    ):
+        self._transport = transport
+        self._read_post_suffixes = tuple(read_post_suffixes)
+        self._flights: Dict[str, _Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def is_coalescable(self, request: httpx.Request) -> bool:
+        if request.method in ("GET", "HEAD"):
+            return True
+        if request.method == "POST":
+            return request.url.path.rstrip("/").endswith(self._read_post_suffixes)
+        return False
+
+    @staticmethod
+    def make_key(request: httpx.Request) -> str:
+        digest = hashlib.sha1(request.content).hexdigest() if request.content else ""
+        headers = "|".join(request.headers.get(name, "") for name in _KEY_HEADERS)
+        return f"{request.method} {request.url} {digest} {headers}"
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.is_coalescable(request):
+            return await self._transport.handle_async_request(request)
+
+        # Streaming bodies can only be read once, so make sure it is buffered for the key
+        await request.aread()
+        key = self.make_key(request)
+        flight = self._flights.get(key)
+        if flight is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(self._fetch(request))
+            flight = self._flights[key] = _Flight(task=task)
+            task.add_done_callback(lambda _, key=key, flight=flight: self._forget(key, flight))
+        else:
+            self.coalesced += 1
+            client_logger.debug(f"Coalescing {request.method} {request.url.path} onto in-flight request")
+
+        flight.waiters += 1
+        try:
+            # Shield so one cancelled caller does not abort the request for the others
+            shared = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller has gone away; release the upstream connection
+                flight.task.cancel()
+
+        return httpx.Response(
+            shared.status_code,
+            headers=shared.headers,
+            stream=httpx.ByteStream(shared.content),
+            extensions=dict(shared.extensions),
+            request=request,
+        )
+
+    async def _fetch(self, request: httpx.Request) -> _SharedResponse:
+        response = await self._transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        # The body is shared already decoded, so drop the headers describing its wire encoding
+        headers = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in _WIRE_HEADERS
+        ]
+        headers.append(("content-length", str(len(content))))
+        extensions = {k: v for k, v in response.extensions.items() if k != "network_stream"}
+        return _SharedResponse(response.status_code, headers, content, extensions)
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled():
+            # Mark the exception as retrieved when every waiter already left
+            flight.task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._flights),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
+
+    async def aclose(self) -> None:
+        for flight in list(self._flights.values()):
+            flight.task.cancel()
+        await self._transport.aclose()
@@ -0,0 +1,122 @@
+import httpx
+import logging
+import re
+import time
+import weakref
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+client_logger = logging.getLogger("kibana-mcp.client")
+
+DEFAULT_SPACE = "default"
+SPACES_API_PATH = "/api/spaces/space"
+
+# Kibana space identifiers: lowercase letters, digits, "_" and "-"
+_SPACE_ID = re.compile(r"^[a-z0-9_-]+$")
+
+_current_space: ContextVar[Optional[str]] = ContextVar("kibana_mcp_space", default=None)
+
+
+def validate_space(space: str) -> str:
+    """Returns ``space`` if it is a valid Kibana space identifier, else raises ValueError."""
+    if not isinstance(space, str) or not _SPACE_ID.match(space):
+        raise ValueError(
+            f"Invalid Kibana space '{space}'. Space IDs use lowercase letters, digits, '_' and '-'.")
+    return space
+
+
+def current_space() -> Optional[str]:
+    """The space selected for the current tool call, or None to use the client's default."""
+    return _current_space.get()
+
+
+def begin_space(space: Optional[str]):
+    """Selects the space for the current tool call. Returns a reset token."""
+    return _current_space.set(space)
+
+
+def end_space(token) -> None:
+    _current_space.reset(token)
+
+
+def space_path(path: str, space: Optional[str]) -> str:
+    """Prefixes an API path with ``/s/{space}`` (the default space has no prefix)."""
+    if not space or space == DEFAULT_SPACE or path.startswith("/s/"):
+        return path
+    return f"/s/{space}{path}"
+
+
+class SpaceSettingsCache:
+    """Caches per-space settings (the Kibana space object) per client.
+
+    Used to check a space exists before running a tool against it. Known spaces are
+    kept for ``ttl`` seconds, missing ones (404) for ``negative_ttl`` seconds.
+    """
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 30.0, max_entries: int = 256, clock=time.monotonic):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._by_client: "weakref.WeakKeyDictionary[object, OrderedDict[str, Tuple[Optional[Dict[str, Any]], float]]]" = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def _entries(self, http_client) -> "OrderedDict[str, Tuple[Optional[Dict[str, Any]], float]]":
+        entries = self._by_client.get(http_client)
+        if entries is None:
+            entries = self._by_client[http_client] = OrderedDict()
+        return entries
+
+    def _store(self, http_client, space: str, settings: Optional[Dict[str, Any]]) -> None:
+        entries = self._entries(http_client)
+        entries[space] = (settings, self._clock() + (self.ttl if settings is not None else self.negative_ttl))
+        entries.move_to_end(space)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    async def get(self, http_client: httpx.AsyncClient, space: str) -> Optional[Dict[str, Any]]:
+        """Returns the settings of ``space``, or None if Kibana reports it does not exist.
+
+        Other failures (e.g. the API key may not read spaces) return an empty dict
+        without caching, so the tool call itself decides.
+        """
+        entries = self._entries(http_client)
+        entry = entries.get(space)
+        if entry is not None and entry[1] > self._clock():
+            entries.move_to_end(space)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+
+        try:
+            response = await http_client.get(f"{SPACES_API_PATH}/{space}")
+        except httpx.RequestError as exc:
+            client_logger.warning(f"Could not load settings for Kibana space '{space}': {exc}")
+            return {}
+        if response.status_code == 404:
+            self._store(http_client, space, None)
+            return None
+        if response.status_code >= 400:
+            client_logger.warning(f"Could not load settings for Kibana space '{space}': HTTP {response.status_code}")
+            return {}
+        settings = response.json()
+        self._store(http_client, space, settings)
+        return settings
+
+    def invalidate(self, http_client, space: Optional[str] = None) -> None:
+        if space is None:
+            self._by_client.pop(http_client, None)
+        else:
+            self._entries(http_client).pop(space, None)
+
+    def clear(self) -> None:
+        self._by_client.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "clients": len(self._by_client)}
+
+
+# Shared cache used by execute_tool_safely
+space_settings = SpaceSettingsCache()
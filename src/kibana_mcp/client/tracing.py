@@ -0,0 +1,71 @@
+import httpx
+import logging
+from typing import Optional
+
+from kibana_mcp.tracing import KIND_CLIENT, STATUS_ERROR, Tracer, current_span, get_tracer
+from ._streams import with_stream_callback
+from .routes import api_family, templated_path
+
+client_logger = logging.getLogger("kibana-mcp.client")
+
+# Request extension set by ResilienceTransport on retried requests: how many times the request was resent
+RESEND_COUNT_EXTENSION = "resend_count"
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that records a client span per Kibana request, as a child of the tool call's span.
+
+    Spans are named after the templated path and carry the status, request and
+    response body sizes and, for retries, the resend count. The request is sent
+    with a W3C ``traceparent`` header so Kibana's own tracing can join the trace.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, tracer: Optional[Tracer] = None):
+        self._transport = transport
+        self._tracer = tracer
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        tracer = self._tracer or get_tracer()
+        if not tracer.enabled:
+            return await self._transport.handle_async_request(request)
+
+        path = templated_path(request.url.path)
+        resend_count = request.extensions.get(RESEND_COUNT_EXTENSION, 0)
+        span = tracer.start_span(f"{request.method} {path}", KIND_CLIENT, {
+            "http.request.method": request.method,
+            "url.template": path,
+            "server.address": request.url.host,
+            "kibana.api_family": api_family(request.url.path),
+            "http.request.body.size": int(request.headers.get("content-length") or 0),
+        })
+        # The tool call's span sums up the Kibana requests made on its behalf
+        tool_span = current_span()
+        tool_span.add("kibana.requests")
+        if resend_count:
+            span.set_attribute("http.request.resend_count", resend_count)
+            tool_span.add("kibana.retries")
+        traceparent = span.traceparent()
+        if traceparent:
+            request.headers["traceparent"] = traceparent
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as exc:
+            span.set_attribute("error.type", type(exc).__name__)
+            span.set_status(STATUS_ERROR, str(exc))
+            span.end()
+            raise
+
+        span.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 400:
+            span.set_attribute("error.type", str(response.status_code))
+            span.set_status(STATUS_ERROR)
+
+        def on_close(size: int) -> None:
+            span.set_attribute("http.response.body.size", size)
+            span.end()
+
+        return with_stream_callback(response, on_close)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
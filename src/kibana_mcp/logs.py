@@ -0,0 +1,290 @@
+"""Structured, non-blocking logging.
+
+A log call only puts the record on a bounded queue; a background thread
+(``QueueListener``) formats it and writes it to stderr, so neither formatting
+large arguments nor a slow stderr reader holds up the event loop. On the way
+out every record is:
+
+- structured: ``extra=log_fields(tool=..., args=...)`` attaches key/value fields,
+  written as ``key=value`` pairs (``text``) or JSON object keys (``json``)
+- capped: each field at ``KIBANA_MCP_LOG_MAX_FIELD_CHARS`` and the whole record at
+  ``KIBANA_MCP_LOG_MAX_RECORD_CHARS``, with a marker saying how much was cut
+- redacted: fields named like secrets, and credentials in messages (``ApiKey ...``,
+  ``Basic ...``, ``Bearer ...``, ``password=...``)
+- sampled: INFO and DEBUG records of the high-volume loggers are kept at
+  ``KIBANA_MCP_LOG_SAMPLE_RATE``; warnings and errors are always kept
+
+When the queue is full, records are dropped and counted rather than blocking.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import reprlib
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, IO, Optional, Tuple
+
+REDACTED = "[REDACTED]"
+
+# Loggers that log on every tool call or Kibana request
+DEFAULT_SAMPLED_LOGGERS: Tuple[str, ...] = ("kibana-mcp.tools", "kibana-mcp.client", "httpx")
+
+_SECRET_KEY = re.compile(r"password|passwd|secret|token|api[_-]?key|authorization|cookie|credential", re.IGNORECASE)
+_SECRET_TEXT = (
+    (re.compile(r"""(["']?[\w-]*(?:password|passwd|secret|token|api[_-]?key|authorization|cookie)[\w-]*["']?\s*[:=]\s*)"""
+                r"""(?:(?:ApiKey|Basic|Bearer)\s+)?("[^"]*"|'[^']*'|[^\s,&;}]+)""", re.IGNORECASE), rf"\1{REDACTED}"),
+    (re.compile(r"\b(ApiKey|Basic|Bearer)\s+[A-Za-z0-9+/=._~-]+", re.IGNORECASE), rf"\1 {REDACTED}"),
+)
+
+
+def log_fields(**fields: Any) -> Dict[str, Any]:
+    """``extra`` for a log call with structured fields, e.g. ``logger.info(msg, extra=log_fields(tool=name))``."""
+    return {"fields": fields}
+
+
+def redact_text(text: str) -> str:
+    """Masks credentials in free text."""
+    for pattern, replacement in _SECRET_TEXT:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...[{len(text) - limit} more chars]"
+
+
+class _Preview(reprlib.Repr):
+    """``repr`` that does bounded work on large containers and strings, and masks secret keys."""
+
+    def __init__(self, max_chars: int):
+        super().__init__()
+        self.maxlevel = 4
+        self.maxdict = self.maxlist = self.maxtuple = self.maxset = 50
+        self.maxstring = self.maxother = max_chars
+
+    def repr_str(self, x: str, level: int) -> str:
+        return repr(redact_text(x[:self.maxstring])) + ("..." if len(x) > self.maxstring else "")
+
+    def repr_dict(self, x: dict, level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        pieces = []
+        for key in itertools.islice(x, self.maxdict):
+            value = REDACTED if isinstance(key, str) and _SECRET_KEY.search(key) else self.repr1(x[key], level - 1)
+            pieces.append(f"{self.repr1(key, level - 1)}: {value}")
+        if len(x) > self.maxdict:
+            pieces.append("...")
+        return "{" + ", ".join(pieces) + "}"
+
+
+def preview(name: str, value: Any, max_chars: int) -> Any:
+    """One field as it is written: secrets masked, at most ``max_chars`` characters.
+
+    Numbers, booleans and None are kept as they are.
+    """
+    if _SECRET_KEY.search(name):
+        return REDACTED
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        shown = redact_text(value[:max_chars])
+        return shown if len(value) <= max_chars else f"{shown}...[{len(value) - max_chars} more chars]"
+    return _truncate(_Preview(max_chars).repr(value), max_chars)
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formats records as ``text`` (the classic ``time - logger - level - message`` line
+    followed by ``key=value`` fields) or as one JSON object per line."""
+
+    def __init__(self, style: str = "text", max_field_chars: int = 1000, max_record_chars: int = 8000):
+        super().__init__()
+        self.style = style
+        self.max_field_chars = max_field_chars
+        self.max_record_chars = max_record_chars
+
+    def _fields(self, record: logging.LogRecord) -> Dict[str, Any]:
+        fields = getattr(record, "fields", None) or {}
+        return {name: preview(name, value, self.max_field_chars) for name, value in fields.items()}
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = redact_text(_truncate(record.getMessage(), self.max_record_chars))
+        fields = self._fields(record)
+        exception = self.formatException(record.exc_info) if record.exc_info else None
+        if self.style == "json":
+            return self._format_json(record, message, fields, exception)
+        line = f"{self.formatTime(record)} - {record.name} - {record.levelname} - {message}"
+        if fields:
+            line += " " + " ".join(f"{name}={value}" for name, value in fields.items())
+        if exception:
+            line += "\n" + exception
+        return _truncate(line, self.max_record_chars)
+
+    def _format_json(self, record: logging.LogRecord, message: str, fields: Dict[str, Any],
+                     exception: Optional[str]) -> str:
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": message,
+        }
+        entry.update((name, value) for name, value in fields.items() if name not in entry)
+        if exception:
+            entry["exception"] = exception
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        if len(line) <= self.max_record_chars:
+            return line
+        # Keep the line valid JSON: shorten the message and leave out fields and traceback
+        entry = {key: entry[key] for key in ("time", "level", "logger")}
+        entry["truncated_chars"] = len(line)
+        overhead = len(json.dumps(dict(entry, message=""), ensure_ascii=False)) + 32  # Room for the cut marker
+        entry["message"] = _truncate(message, max(0, self.max_record_chars - overhead))
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a ``rate`` fraction of the INFO and DEBUG records of ``loggers``; everything else passes."""
+
+    def __init__(self, rate: float = 1.0, loggers: Tuple[str, ...] = DEFAULT_SAMPLED_LOGGERS,
+                 random_func: Callable[[], float] = random.random):
+        super().__init__()
+        self.rate = rate
+        self.loggers = tuple(loggers)
+        self._random = random_func
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1 or record.levelno >= logging.WARNING:
+            return True
+        if not any(record.name == name or record.name.startswith(name + ".") for name in self.loggers):
+            return True
+        if self._random() < self.rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records unformatted and drops them instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting happens on the writer thread; the record stays in-process, so
+        # arguments and exc_info need not be rendered here
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _env_loggers(raw: Optional[str]) -> Tuple[str, ...]:
+    if raw is None:
+        return DEFAULT_SAMPLED_LOGGERS
+    return tuple(name.strip() for name in raw.split(",") if name.strip())
+
+
+@dataclass(frozen=True)
+class LoggingSettings:
+    """Level, output format, size caps, sampling and queue size of the logging pipeline."""
+    level: str = "INFO"
+    style: str = "text"
+    max_field_chars: int = 1000
+    max_record_chars: int = 8000
+    sample_rate: float = 1.0
+    sampled_loggers: Tuple[str, ...] = DEFAULT_SAMPLED_LOGGERS
+    queue_size: int = 10000
+
+    @classmethod
+    def from_env(cls) -> "LoggingSettings":
+        """Reads KIBANA_MCP_LOG_LEVEL, KIBANA_MCP_LOG_FORMAT (text or json), KIBANA_MCP_LOG_MAX_FIELD_CHARS,
+        KIBANA_MCP_LOG_MAX_RECORD_CHARS, KIBANA_MCP_LOG_SAMPLE_RATE, KIBANA_MCP_LOG_SAMPLED_LOGGERS
+        (comma-separated) and KIBANA_MCP_LOG_QUEUE_SIZE."""
+        return cls(
+            level=os.getenv("KIBANA_MCP_LOG_LEVEL", cls.level).upper(),
+            style=os.getenv("KIBANA_MCP_LOG_FORMAT", cls.style).lower(),
+            max_field_chars=int(os.getenv("KIBANA_MCP_LOG_MAX_FIELD_CHARS") or cls.max_field_chars),
+            max_record_chars=int(os.getenv("KIBANA_MCP_LOG_MAX_RECORD_CHARS") or cls.max_record_chars),
+            sample_rate=float(os.getenv("KIBANA_MCP_LOG_SAMPLE_RATE") or cls.sample_rate),
+            sampled_loggers=_env_loggers(os.getenv("KIBANA_MCP_LOG_SAMPLED_LOGGERS")),
+            queue_size=int(os.getenv("KIBANA_MCP_LOG_QUEUE_SIZE") or cls.queue_size),
+        )
+
+
+class LogPipeline:
+    """The queue handler callers log to and the listener thread that writes the records."""
+
+    def __init__(self, settings: LoggingSettings, stream: Optional[IO[str]] = None):
+        self.settings = settings
+        self.queue: queue.Queue = queue.Queue(maxsize=settings.queue_size)
+        self.sampler = SamplingFilter(settings.sample_rate, settings.sampled_loggers)
+        self.handler = NonBlockingQueueHandler(self.queue)
+        self.handler.addFilter(self.sampler)
+        output = logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(StructuredFormatter(settings.style, settings.max_field_chars, settings.max_record_chars))
+        self.listener = logging.handlers.QueueListener(self.queue, output, respect_handler_level=True)
+        self._started = False
+
+    def start(self) -> None:
+        if not self._started:
+            self.listener.start()
+            self._started = True
+
+    def stop(self) -> None:
+        """Writes the queued records and stops the listener thread."""
+        if self._started:
+            self._started = False
+            self.listener.stop()
+
+    def stats(self) -> Dict[str, int]:
+        return {"sampled_out": self.sampler.sampled_out, "dropped": self.handler.dropped}
+
+
+_pipeline: Optional[LogPipeline] = None
+
+
+def configure_logging(settings: Optional[LoggingSettings] = None, stream: Optional[IO[str]] = None,
+                      force: bool = False) -> Optional[LogPipeline]:
+    """Routes the root logger through a ``LogPipeline``.
+
+    Like ``logging.basicConfig``, does nothing when the root logger already has
+    handlers (an embedding application configured logging), unless ``force``.
+    """
+    global _pipeline
+    root = logging.getLogger()
+    if root.handlers and not force:
+        return None
+    settings = settings or LoggingSettings.from_env()
+    pipeline = LogPipeline(settings, stream)
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    if _pipeline is not None:
+        _pipeline.stop()
+    else:
+        atexit.register(lambda: _pipeline is not None and _pipeline.stop())
+    root.addHandler(pipeline.handler)
+    root.setLevel(settings.level)
+    pipeline.start()
+    _pipeline = pipeline
+    return pipeline
+
+
+def log_stats() -> Optional[Dict[str, int]]:
+    """Sampled-out and dropped record counts of the configured pipeline, or None."""
+    return _pipeline.stats() if _pipeline is not None else None
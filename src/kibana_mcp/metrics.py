@@ -0,0 +1,253 @@
+"""Prometheus-style metrics for tool calls and Kibana requests.
+
+A small, dependency-free registry that renders the Prometheus text exposition
+format. The server exposes it on ``/metrics`` when running over HTTP/SSE.
+"""
+
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Latency buckets (seconds): tool calls and Kibana requests range from a cache hit to slow searches
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Response size buckets (bytes)
+SIZE_BUCKETS: Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric '{self.name}' expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def total(self) -> float:
+        """Sum over every label set."""
+        return sum(self._values.values())
+
+    def samples(self) -> Iterable[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """Value that can go up and down, e.g. requests in flight."""
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed observations with a running sum and count."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (+Inf last), sum]
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> Iterable[str]:
+        for key, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total[0])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+# A collector returns (name, kind, documentation, [(labels, value), ...]) tuples at scrape time
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]]
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors, and renders them in the text exposition format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Collector) -> None:
+        """Registers a callable that reports extra gauges/counters (e.g. cache stats) at scrape time."""
+        self._collectors.append(collector)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        """Clears every recorded value (metric definitions and collectors are kept)."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        for collector in self._collectors:
+            for name, kind, documentation, values in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in values:
+                    lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(float(value))}")
+        return "\n".join(lines) + "\n"
+
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = MetricsRegistry()
+
+# --- Tool call metrics (recorded by execute_tool_safely) ---
+
+TOOL_CALLS = REGISTRY.counter(
+    "kibana_mcp_tool_calls_total", "Tool calls by outcome (success, kibana_error, error, timeout, cancelled, cache_hit).", ("tool", "outcome"))
+TOOL_ERRORS = REGISTRY.counter(
+    "kibana_mcp_tool_errors_total", "Tool calls that raised or reported a Kibana error.", ("tool",))
+TOOL_IN_FLIGHT = REGISTRY.gauge(
+    "kibana_mcp_tool_calls_in_flight", "Tool calls currently executing.", ("tool",))
+TOOL_DURATION = REGISTRY.histogram(
+    "kibana_mcp_tool_duration_seconds", "Tool call latency in seconds.", ("tool",))
+TOOL_RESPONSE_BYTES = REGISTRY.histogram(
+    "kibana_mcp_tool_response_bytes", "Size of rendered tool results in bytes.", ("tool",), SIZE_BUCKETS)
+
+# --- Kibana request metrics (recorded by MetricsTransport), labelled by templated path ---
+
+KIBANA_REQUESTS = REGISTRY.counter(
+    "kibana_mcp_kibana_requests_total", "Kibana HTTP requests by status code.", ("method", "path", "status"))
+KIBANA_ERRORS = REGISTRY.counter(
+    "kibana_mcp_kibana_request_errors_total",
+    "Kibana requests that failed, by HTTP status or exception type.", ("method", "path", "reason"))
+KIBANA_IN_FLIGHT = REGISTRY.gauge(
+    "kibana_mcp_kibana_requests_in_flight", "Kibana HTTP requests currently in flight.", ("method", "path"))
+KIBANA_DURATION = REGISTRY.histogram(
+    "kibana_mcp_kibana_request_duration_seconds",
+    "Kibana request latency in seconds, until the response body is fully read.", ("method", "path"))
+KIBANA_RESPONSE_BYTES = REGISTRY.histogram(
+    "kibana_mcp_kibana_response_bytes", "Size of Kibana response bodies in bytes.", ("method", "path"), SIZE_BUCKETS)
+
+# --- Connection pool metrics (recorded by PoolStatsTransport) ---
+
+POOL_WAIT = REGISTRY.histogram(
+    "kibana_mcp_pool_wait_seconds", "Time requests spent waiting for a pooled Kibana connection.", (),
+    (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0))
+
+# --- Resilience metrics (recorded by ResilienceTransport) ---
+
+KIBANA_RETRIES = REGISTRY.counter(
+    "kibana_mcp_kibana_retries_total", "Kibana request retries by API family and cause.", ("family", "reason"))
+CIRCUIT_STATE = REGISTRY.gauge(
+    "kibana_mcp_circuit_state", "Circuit breaker state per API family (0 closed, 1 half-open, 2 open).", ("family",))
+CIRCUIT_REJECTIONS = REGISTRY.counter(
+    "kibana_mcp_circuit_rejections_total", "Requests failed fast because the API family's breaker was open.", ("family",))
+
+# --- Per-family limiter metrics (recorded by LimiterTransport) ---
+
+LIMITER_QUEUED = REGISTRY.gauge(
+    "kibana_mcp_limiter_queued", "Kibana requests queued for a concurrency slot or rate token.", ("family",))
+LIMITER_IN_FLIGHT = REGISTRY.gauge(
+    "kibana_mcp_limiter_in_flight", "Kibana requests holding a concurrency slot.", ("family",))
+LIMITER_WAIT = REGISTRY.histogram(
+    "kibana_mcp_limiter_wait_seconds", "Time Kibana requests spent queued in the per-family limiter.", ("family",),
+    (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0))
@@ -1,8 +1,10 @@
+import httpx
+from typing import Optional
+
 import mcp.types as types
 from pydantic import AnyUrl # Assuming AnyUrl might be needed for resource URIs
 
-# Placeholder for resource state if needed later
-# resource_state = {}
+from kibana_mcp.tools.utils import render_json
 
 async def handle_list_resources() -> list[types.Resource]:
     """
@@ -12,12 +14,31 @@ async def handle_list_resources() -> list[types.Resource]:
     print("MCP Server: handle_list_resources called (stub)")
     return []
 
-async def handle_read_resource(uri: AnyUrl) -> str:
+async def handle_read_resource(uri: AnyUrl, http_client: Optional[httpx.AsyncClient] = None) -> str:
     """
-    Read a specific resource's content by its URI. (Stub implementation)
+    Read a specific resource's content by its URI.
+
+    ``alert://{alert_id}`` returns the alert's id, index and projected ``_source``
+    as JSON, fetched with one ids search and cached by id (see ``AlertCache``).
     """
-    # Raise an error or return placeholder content
-    print(f"MCP Server: handle_read_resource called for URI {uri} (stub)")
-    raise ValueError(f"Resource reading not implemented yet for URI: {uri}")
+    scheme, _, resource_id = str(uri).partition("://")
+    if scheme != "alert":
+        raise ValueError(f"Unsupported resource URI: {uri}")
+    alert_id = resource_id.strip("/")
+    if not alert_id:
+        raise ValueError(f"Missing alert id in resource URI: {uri}")
+    if http_client is None:
+        raise ValueError("Kibana client is not initialized.")
+    # Imported here, so importing the server does not load the alert cache
+    from kibana_mcp.tools.utils._alert_cache import SEARCH_PATH, get_alert_cache
 
-# You might add functions here later to update resource_state if necessary 
\ No newline at end of file
+    try:
+        alert = await get_alert_cache().get(http_client, alert_id)
+    except httpx.RequestError as exc:
+        raise ValueError(f"Error calling Kibana API ({SEARCH_PATH}): {exc}") from exc
+    except httpx.HTTPStatusError as exc:
+        raise ValueError(
+            f"Kibana API ({SEARCH_PATH}) returned error: {exc.response.status_code} - {exc.response.text}") from exc
+    if alert is None:
+        raise ValueError(f"Alert '{alert_id}' not found.")
+    return render_json(alert)
@@ -9,73 +9,83 @@ import sys
 # Import FastMCP and types
 from fastmcp import FastMCP
 import mcp.types as types
-
-# Import handler implementations using absolute paths
-from kibana_mcp.tools import (
-    # Alert tools
-    _call_tag_alert,
-    _call_adjust_alert_status,
-    _call_get_alerts,
-
-    # Exception tools
-    _call_get_rule_exceptions,
-    _call_add_rule_exception_items,
-    _call_create_exception_list,
-    _call_associate_shared_exception_list,
-
-    # Saved Objects tools
-    _call_find_objects,
-    _call_get_object,
-    _call_bulk_get_objects,
-    _call_create_object,
-    _call_update_object,
-    _call_delete_object,
-    _call_export_objects,
-    _call_import_objects,
-
-    # Rule tools
-    _call_find_rules,
-    _call_get_rule,
-    _call_delete_rule,
-    _call_update_rule_status,
-    _call_get_prepackaged_rules_status,
-    _call_install_prepackaged_rules,
-
-    # Endpoint tools
-    _call_isolate_endpoint,
-    _call_unisolate_endpoint,
-    _call_run_command_on_endpoint,
-    _call_get_response_actions,
-    _call_get_response_action_details,
-    _call_get_response_action_status,
-    _call_kill_process,
-    _call_suspend_process,
-    _call_scan_endpoint,
-    _call_get_file_info,
-    _call_download_file,
-
-    # Cases tools
-    _call_find_cases,
-    _call_get_case,
-    _call_create_case,
-    _call_update_case,
-    _call_delete_cases,
-    _call_add_case_comment,
-    _call_get_case_comments,
-    _call_get_case_alerts,
-    _call_get_cases_by_alert,
-    _call_get_case_configuration,
-    _call_get_case_tags,
-
-    # Utils
-    execute_tool_safely
-)
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+# Tool implementations come from the manifest and are imported on first call
+from kibana_mcp.tools import execute_tool_safely
+from kibana_mcp.tools._manifest import import_stats, lazy_impl, preload_all
+# The alert write batcher, cache and mirror are imported where used, on first call
+from kibana_mcp.tools.utils import CACHE_EVENT_HOOKS, get_response_cache, rule_id_resolver
+from kibana_mcp.client import KibanaClient, space_settings
+from kibana_mcp import metrics
+from kibana_mcp.tracing import get_tracer
+from kibana_mcp.logs import configure_logging, log_stats
 from kibana_mcp.resources import handle_read_resource
 from kibana_mcp.prompts import handle_get_prompt
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Alert tools
+_call_tag_alert = lazy_impl("_call_tag_alert")
+_call_adjust_alert_status = lazy_impl("_call_adjust_alert_status")
+_call_get_alerts = lazy_impl("_call_get_alerts")
+_call_aggregate_alerts = lazy_impl("_call_aggregate_alerts")
+_call_poll_new_alerts = lazy_impl("_call_poll_new_alerts")
+_call_bulk_tag_alerts = lazy_impl("_call_bulk_tag_alerts")
+_call_bulk_adjust_alert_status = lazy_impl("_call_bulk_adjust_alert_status")
+
+# Exception tools
+_call_get_rule_exceptions = lazy_impl("_call_get_rule_exceptions")
+_call_add_rule_exception_items = lazy_impl("_call_add_rule_exception_items")
+_call_create_exception_list = lazy_impl("_call_create_exception_list")
+_call_associate_shared_exception_list = lazy_impl("_call_associate_shared_exception_list")
+
+# Saved Objects tools
+_call_find_objects = lazy_impl("_call_find_objects")
+_call_get_object = lazy_impl("_call_get_object")
+_call_bulk_get_objects = lazy_impl("_call_bulk_get_objects")
+_call_create_object = lazy_impl("_call_create_object")
+_call_update_object = lazy_impl("_call_update_object")
+_call_delete_object = lazy_impl("_call_delete_object")
+_call_export_objects = lazy_impl("_call_export_objects")
+_call_import_objects = lazy_impl("_call_import_objects")
+
+# Rule tools
+_call_find_rules = lazy_impl("_call_find_rules")
+_call_get_rule = lazy_impl("_call_get_rule")
+_call_delete_rule = lazy_impl("_call_delete_rule")
+_call_update_rule_status = lazy_impl("_call_update_rule_status")
+_call_get_prepackaged_rules_status = lazy_impl("_call_get_prepackaged_rules_status")
+_call_install_prepackaged_rules = lazy_impl("_call_install_prepackaged_rules")
+
+# Endpoint tools
+_call_isolate_endpoint = lazy_impl("_call_isolate_endpoint")
+_call_unisolate_endpoint = lazy_impl("_call_unisolate_endpoint")
+_call_run_command_on_endpoint = lazy_impl("_call_run_command_on_endpoint")
+_call_get_response_actions = lazy_impl("_call_get_response_actions")
+_call_get_response_action_details = lazy_impl("_call_get_response_action_details")
+_call_get_response_action_status = lazy_impl("_call_get_response_action_status")
+_call_kill_process = lazy_impl("_call_kill_process")
+_call_suspend_process = lazy_impl("_call_suspend_process")
+_call_scan_endpoint = lazy_impl("_call_scan_endpoint")
+_call_get_file_info = lazy_impl("_call_get_file_info")
+_call_download_file = lazy_impl("_call_download_file")
+
+# Cases tools
+_call_find_cases = lazy_impl("_call_find_cases")
+_call_get_case = lazy_impl("_call_get_case")
+_call_create_case = lazy_impl("_call_create_case")
+_call_update_case = lazy_impl("_call_update_case")
+_call_delete_cases = lazy_impl("_call_delete_cases")
+_call_add_case_comment = lazy_impl("_call_add_case_comment")
+_call_get_case_comments = lazy_impl("_call_get_case_comments")
+_call_get_case_alerts = lazy_impl("_call_get_case_alerts")
+_call_get_cases_by_alert = lazy_impl("_call_get_cases_by_alert")
+_call_get_case_configuration = lazy_impl("_call_get_case_configuration")
+_call_get_case_tags = lazy_impl("_call_get_case_tags")
+
+
+# Configure logging: records are formatted and written by a background thread
+configure_logging()
 logger = logging.getLogger("kibana-mcp")
 
 # --- Global MCP Instance and HTTP Client ---
@@ -86,11 +96,13 @@ logger.info("Initializing Stateless Kibana MCP Server (FastMCP)...")
 mcp = FastMCP("kibana-mcp")
 
 # HTTP client will be created per-request or use connection pooling
-http_client: httpx.AsyncClient | None = None
+http_client: KibanaClient | None = None
 
 
 def configure_http_client():
     """Configure the global httpx client with connection pooling for stateless operation."""
+    from kibana_mcp.tools.utils import get_alert_cache
+
     global http_client
     kibana_url = os.getenv("KIBANA_URL")
     encoded_api_key = os.getenv("KIBANA_API_KEY")
@@ -102,14 +114,12 @@ def configure_http_client():
         logger.error("KIBANA_URL environment variable not set.")
         raise ValueError("KIBANA_URL environment variable not set.")
 
-    # Modify the base URL to include the space if specified
+    # The space is applied per request, so tools can select another space per call
+    # while sharing this client's connection pool
+    if kibana_url.endswith('/'):
+        kibana_url = kibana_url[:-1]
     if kibana_space:
-        # Remove trailing slash if present
-        if kibana_url.endswith('/'):
-            kibana_url = kibana_url[:-1]
-        # Add the space to the URL
-        kibana_url = f"{kibana_url}/s/{kibana_space}"
-        logger.info(f"Using Kibana space: {kibana_space}")
+        logger.info(f"Using default Kibana space: {kibana_space}")
 
     headers = {"kbn-xsrf": "true", "Content-Type": "application/json"}
     auth_config = {}
@@ -134,33 +144,116 @@ def configure_http_client():
     logger.info(
         f"Creating stateless HTTP client for Kibana at {kibana_url} using {auth_method_used}.")
 
-    # Configure connection pooling for stateless operation
-    # Optimized for multiple short-lived connections (N8N agent workflows)
-    limits = httpx.Limits(
-        max_keepalive_connections=20,  # Keep connections open for reuse
-        max_connections=100,          # Allow many concurrent connections
-        keepalive_expiry=30.0         # Keep connections alive for 30 seconds
-    )
-
-    http_client = httpx.AsyncClient(
+    # Pool limits, HTTP/2 and timeout classes are read from KIBANA_MCP_POOL_*,
+    # KIBANA_MCP_HTTP2 and KIBANA_MCP_TIMEOUT_* (see PoolSettings/TimeoutClasses)
+    http_client = KibanaClient(
         base_url=kibana_url,
+        default_space=kibana_space,
         headers=headers,
-        timeout=30.0,
-        verify=False,
-        limits=limits,
+        event_hooks=CACHE_EVENT_HOOKS,  # Lets the response cache see Kibana errors
         **auth_config
     )
+    # Cached results belong to the previous client's Kibana/space
+    get_response_cache().clear()
+    get_alert_cache().clear()
+    space_settings.clear()
 
 
 async def close_http_client():
     """Close the global httpx client."""
+    from kibana_mcp.tools.utils import close_alert_mirror, get_alert_cache
+
     global http_client
     if http_client:
         logger.info("Closing HTTP client...")
+        # The mirror syncs through this client
+        await close_alert_mirror()
         await http_client.aclose()
         http_client = None
+        get_response_cache().clear()
+        get_alert_cache().clear()
+        space_settings.clear()
         logger.info("HTTP client closed.")
 
+
+def _collect_component_stats():
+    """Exports response cache, rule resolver, request coalescing and pool counters on /metrics."""
+    from kibana_mcp.tools.utils import get_alert_cache, get_alert_mirror, get_write_batcher
+
+    cache_stats = get_response_cache().stats()
+    yield ("kibana_mcp_cache_hits_total", "counter", "Tool results served from the response cache.",
+           [({"tool": tool}, s["hits"]) for tool, s in cache_stats["tools"].items()])
+    yield ("kibana_mcp_cache_misses_total", "counter", "Tool calls that missed the response cache.",
+           [({"tool": tool}, s["misses"]) for tool, s in cache_stats["tools"].items()])
+    yield ("kibana_mcp_cache_entries", "gauge", "Results currently held in the response cache.",
+           [({}, cache_stats["entries"])])
+    resolver_stats = rule_id_resolver.stats()
+    yield ("kibana_mcp_rule_resolver_lookups_total", "counter", "rule_id to UUID lookups by result.",
+           [({"result": "hit"}, resolver_stats["hits"]), ({"result": "miss"}, resolver_stats["misses"])])
+    batcher_stats = get_write_batcher().stats()
+    yield ("kibana_mcp_alert_writes_total", "counter", "tag_alert and adjust_alert_status writes submitted.",
+           [({}, batcher_stats["writes"])])
+    yield ("kibana_mcp_alert_write_requests_total", "counter",
+           "Kibana requests sent for those writes, after merging concurrent ones.", [({}, batcher_stats["requests"])])
+    alert_cache_stats = get_alert_cache().stats()
+    yield ("kibana_mcp_alert_resource_reads_total", "counter", "alert:// resource reads by cache result.",
+           [({"result": "hit"}, alert_cache_stats["hits"]), ({"result": "miss"}, alert_cache_stats["misses"])])
+    mirror = get_alert_mirror()
+    if mirror is not None:
+        mirror_stats = mirror.stats()
+        yield ("kibana_mcp_alert_mirror_alerts", "gauge", "Alerts held in the local alert mirror.",
+               [({}, mirror_stats["alerts"])])
+        yield ("kibana_mcp_alert_mirror_reads_total", "counter", "get_alerts pages by where they were served from.",
+               [({"source": "mirror"}, mirror_stats["served"]), ({"source": "kibana"}, mirror_stats["fallbacks"])])
+        yield ("kibana_mcp_alert_mirror_sync_errors_total", "counter", "Failed alert mirror syncs.",
+               [({}, mirror_stats["sync_errors"])])
+        if mirror_stats["age_seconds"] is not None:
+            yield ("kibana_mcp_alert_mirror_age_seconds", "gauge", "Seconds since the alert mirror last synced.",
+                   [({}, mirror_stats["age_seconds"])])
+    tool_imports = import_stats()
+    yield ("kibana_mcp_tool_modules_loaded", "gauge", "Tool implementation modules imported so far (loaded on first call).",
+           [({}, tool_imports["loaded"])])
+    yield ("kibana_mcp_tool_import_seconds_total", "counter", "Time spent importing tool implementation modules.",
+           [({}, tool_imports["import_seconds"])])
+    tracer = get_tracer()
+    if tracer.enabled:
+        yield ("kibana_mcp_trace_spans_exported_total", "counter", "Spans handed to the trace exporters.",
+               [({}, tracer.exported)])
+        yield ("kibana_mcp_trace_spans_dropped_total", "counter", "Spans dropped because the export queue was full.",
+               [({}, tracer.dropped)])
+    logging_stats = log_stats()
+    if logging_stats is not None:
+        yield ("kibana_mcp_log_records_dropped_total", "counter", "Log records not written, by reason.",
+               [({"reason": "sampled"}, logging_stats["sampled_out"]),
+                ({"reason": "queue_full"}, logging_stats["dropped"])])
+    if http_client is None:
+        return
+    if http_client.single_flight is not None:
+        flight_stats = http_client.single_flight.stats()
+        yield ("kibana_mcp_single_flight_coalesced_total", "counter",
+               "Kibana reads served by joining an identical in-flight request.", [({}, flight_stats["coalesced"])])
+        yield ("kibana_mcp_single_flight_in_flight", "gauge",
+               "Distinct coalescable Kibana reads currently in flight.", [({}, flight_stats["in_flight"])])
+    pool_stats = http_client.pool_stats()
+    yield ("kibana_mcp_pool_connections_in_use", "gauge", "Kibana connections currently serving a request.",
+           [({}, pool_stats["in_use"])])
+    yield ("kibana_mcp_pool_waiters", "gauge", "Requests waiting for a pooled Kibana connection.",
+           [({}, pool_stats["waiters"])])
+    yield ("kibana_mcp_pool_max_connections", "gauge", "Configured Kibana connection pool size.",
+           [({}, pool_stats["max_connections"])])
+    if pool_stats["connections"] is not None:
+        yield ("kibana_mcp_pool_connections", "gauge", "Open Kibana connections in the pool.",
+               [({}, pool_stats["connections"])])
+
+
+metrics.REGISTRY.add_collector(_collect_component_stats)
+
+
+@mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus scrape endpoint, served next to /sse/ when running over HTTP."""
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE_LATEST)
+
 # --- Handler Functions with FastMCP Decorators ---
 
 # NOTE: list_* handlers might need specific registration if not automatic
@@ -168,9 +261,10 @@ async def close_http_client():
 
 @mcp.resource("alert://{alert_id}")
 async def read_alert_resource(alert_id: str) -> str:
+    """A security alert by id: its index and rule, severity, status, host, user and reason fields."""
     uri = f"alert://{alert_id}"
     logger.info(f"Handling read_resource for URI: {uri}")
-    return await handle_read_resource(uri=uri)
+    return await handle_read_resource(uri=uri, http_client=http_client)
 
 
 @mcp.prompt("prompt://{prompt_name}")
@@ -183,7 +277,7 @@ async def get_kibana_prompt(prompt_name: str) -> types.GetPromptResult:
 
 
 @mcp.tool()
-async def tag_alert(alert_id: str, tags: List[str]) -> list[types.TextContent]:
+async def tag_alert(alert_id: str, tags: List[str], space: Optional[str] = None) -> list[types.TextContent]:
     """Adds one or more tags to a specific Kibana security alert signal."""
     # Delegate execution to the safe wrapper
     return await execute_tool_safely(
@@ -191,12 +285,13 @@ async def tag_alert(alert_id: str, tags: List[str]) -> list[types.TextContent]:
         tool_impl_func=_call_tag_alert,
         http_client=http_client,
         alert_id=alert_id,
-        tags_to_add=tags  # Pass correct arg name expected by _call_tag_alert
+        tags_to_add=tags,  # Pass correct arg name expected by _call_tag_alert
+        space=space
     )
 
 
 @mcp.tool()
-async def adjust_alert_status(alert_id: str, new_status: str) -> list[types.TextContent]:
+async def adjust_alert_status(alert_id: str, new_status: str, space: Optional[str] = None) -> list[types.TextContent]:
     """Changes the status of a specific Kibana security alert signal."""
     # Basic validation remains here as it's specific to this tool's input
     valid_statuses = ["open", "acknowledged", "closed"]
@@ -212,27 +307,199 @@ async def adjust_alert_status(alert_id: str, new_status: str) -> list[types.Text
         tool_impl_func=_call_adjust_alert_status,
         http_client=http_client,
         alert_id=alert_id,
-        new_status=new_status
+        new_status=new_status,
+        space=space
+    )
+
+
+@mcp.tool()
+async def poll_new_alerts(
+    search_text: str = "*",
+    checkpoint: Optional[str] = None,
+    since: Optional[str] = "now-24h",
+    limit: int = 100,
+    exclude_fields: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
+) -> list[types.TextContent]:
+    """Returns only the alerts that arrived since the last poll of the same search, oldest first.
+
+    Use this instead of re-reading get_alerts on a schedule. Each result carries a
+    `checkpoint`, which the server also remembers per search, so repeated polls
+    return each alert once.
+
+    Args:
+        search_text: Free text to filter alerts, as in get_alerts ('*' matches all).
+        checkpoint: Checkpoint from a previous poll. Omit it to continue from the last poll of this search.
+        since: Where to start when this search has no checkpoint yet (date or date math, e.g. 'now-1h').
+        limit: Maximum alerts per poll (up to 1000). When `has_more` is true, poll again right away.
+        exclude_fields: Alert fields to leave out of each alert.
+        fields: Alert fields to return (dotted paths), or ["*"] for everything. Defaults to a compact summary.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
+    """
+    return await execute_tool_safely(
+        tool_name='poll_new_alerts',
+        tool_impl_func=_call_poll_new_alerts,
+        http_client=http_client,
+        output_fields=fields,
+        search_text=search_text,
+        checkpoint=checkpoint,
+        since=since,
+        limit=limit,
+        exclude_fields=exclude_fields,
+        space=space
+    )
+
+
+@mcp.tool()
+async def bulk_tag_alerts(
+    alert_ids: Optional[List[str]] = None,
+    search_text: Optional[str] = None,
+    since: Optional[str] = None,
+    tags_to_add: Optional[List[str]] = None,
+    tags_to_remove: Optional[List[str]] = None,
+    space: Optional[str] = None
+) -> list[types.TextContent]:
+    """Adds and/or removes tags on many Kibana security alerts in one call.
+
+    Select the alerts either by id or by search, not both. Returns a summary of
+    updated and failed alerts.
+
+    Args:
+        alert_ids: Ids of the alerts to tag (any number; sent in batches).
+        search_text: Tag every alert matching this free text, as in get_alerts ('*' matches all).
+        since: With search_text, only alerts at or after this date or date math (e.g. 'now-1h').
+        tags_to_add: Tags to add.
+        tags_to_remove: Tags to remove.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
+    """
+    return await execute_tool_safely(
+        tool_name='bulk_tag_alerts',
+        tool_impl_func=_call_bulk_tag_alerts,
+        http_client=http_client,
+        alert_ids=alert_ids,
+        search_text=search_text,
+        since=since,
+        tags_to_add=tags_to_add,
+        tags_to_remove=tags_to_remove,
+        space=space
+    )
+
+
+@mcp.tool()
+async def bulk_adjust_alert_status(
+    new_status: str,
+    alert_ids: Optional[List[str]] = None,
+    search_text: Optional[str] = None,
+    since: Optional[str] = None,
+    space: Optional[str] = None
+) -> list[types.TextContent]:
+    """Changes the status of many Kibana security alerts in one call, e.g. to close false positives.
+
+    Select the alerts either by id or by search, not both. Returns a summary of
+    updated and failed alerts.
+
+    Args:
+        new_status: 'open', 'acknowledged' or 'closed'.
+        alert_ids: Ids of the alerts to update (any number; sent in batches).
+        search_text: Update every alert matching this free text, as in get_alerts ('*' matches all).
+        since: With search_text, only alerts at or after this date or date math (e.g. 'now-24h').
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
+    """
+    return await execute_tool_safely(
+        tool_name='bulk_adjust_alert_status',
+        tool_impl_func=_call_bulk_adjust_alert_status,
+        http_client=http_client,
+        new_status=new_status,
+        alert_ids=alert_ids,
+        search_text=search_text,
+        since=since,
+        space=space
     )
 
 
 @mcp.tool()
 async def get_alerts(limit: int = 20,
-                     search_text: str = "*"
+                     search_text: str = "*",
+                     cursor: Optional[str] = None,
+                     fields: Optional[List[str]] = None,
+                     exclude_fields: Optional[List[str]] = None,
+                     retrieve_fields: Optional[List[str]] = None,
+                     since: Optional[str] = None,
+                     max_staleness: Optional[float] = None,
+                     space: Optional[str] = None
                      ) -> list[types.TextContent]:
-    """Fetches recent Kibana security alert signals, optionally filtering by text and limiting quantity."""
+    """Fetches recent Kibana security alert signals, newest first, optionally filtering by text and limiting quantity.
+
+    Returns at most 1000 alerts per call. When more may follow, the result includes a
+    `next_cursor`; pass it as `cursor` (with the same search_text and since) to fetch the next page.
+
+    Each alert holds a lean set of fields by default (timestamp, status, severity, risk
+    score, reason, rule, host, user and tags). `fields` chooses the fields to return
+    instead (dotted paths, `["*"]` for the whole alert), `exclude_fields` drops fields,
+    and `retrieve_fields` returns values through the Elasticsearch `fields` API, under
+    each hit's `fields`. `since` keeps alerts at or after a date or date math (e.g. 'now-24h').
+
+    When the server mirrors recent alerts locally, pages are served from the mirror if
+    it synced within `max_staleness` seconds; pass `max_staleness=0` to always ask Kibana.
+    """
     # Delegate execution to the safe wrapper, extracting values from the args model
     return await execute_tool_safely(
         tool_name='get_alerts',
         tool_impl_func=_call_get_alerts,
         http_client=http_client,
         limit=limit,
-        search_text=search_text
+        search_text=search_text,
+        cursor=cursor,
+        exclude_fields=exclude_fields,
+        retrieve_fields=retrieve_fields,
+        since=since,
+        max_staleness=max_staleness,
+        output_fields=fields,
+        space=space
+    )
+
+
+@mcp.tool()
+async def aggregate_alerts(
+    group_by: Optional[List[str]] = None,
+    search_text: str = "*",
+    since: Optional[str] = "now-24h",
+    interval: Optional[str] = None,
+    count_distinct: Optional[List[str]] = None,
+    size: int = 10,
+    space: Optional[str] = None
+) -> list[types.TextContent]:
+    """Counts security alerts per rule, host, user or any other field, computed in Kibana.
+
+    Use this instead of get_alerts to answer questions like "which hosts or rules
+    generate the most alerts this hour": no alerts are fetched, only bucket tables.
+
+    Args:
+        group_by: Fields to count alerts by, one table each (default: ["kibana.alert.rule.name", "host.name"]).
+        search_text: Free text the alerts must match ('*' matches all), as in get_alerts.
+        since: Only count alerts at or after this date or date math (default 'now-24h', e.g. 'now-1h').
+        interval: Optional histogram interval over @timestamp, e.g. '5m' or '1h'.
+        count_distinct: Fields to count distinct values of, overall and per bucket (e.g. ["user.name"]).
+        size: Buckets per group_by table (1-100, default 10).
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
+    """
+    return await execute_tool_safely(
+        tool_name='aggregate_alerts',
+        tool_impl_func=_call_aggregate_alerts,
+        http_client=http_client,
+        group_by=group_by,
+        search_text=search_text,
+        since=since,
+        interval=interval,
+        count_distinct=count_distinct,
+        size=size,
+        space=space
     )
 
 
 @mcp.tool()
-async def add_rule_exception_items(rule_id: str, items: List[Dict]) -> list[types.TextContent]:
+async def add_rule_exception_items(rule_id: str, items: List[Dict], space: Optional[str] = None) -> list[types.TextContent]:
     """Adds one or more exception items to a specific detection rule's exception list.
 
     The rule_id parameter should be the human-readable rule_id.
@@ -266,12 +533,13 @@ async def add_rule_exception_items(rule_id: str, items: List[Dict]) -> list[type
         tool_impl_func=_call_add_rule_exception_items,
         http_client=http_client,
         rule_id=rule_id,
-        items=items
+        items=items,
+        space=space
     )
 
 
 @mcp.tool()
-async def get_rule_exceptions(rule_id: str) -> list[types.TextContent]:
+async def get_rule_exceptions(rule_id: str, fields: Optional[List[str]] = None, space: Optional[str] = None) -> list[types.TextContent]:
     """Retrieves the exception items associated with a specific detection rule.
 
     The rule_id parameter should be the human-readable rule_id.
@@ -281,7 +549,9 @@ async def get_rule_exceptions(rule_id: str) -> list[types.TextContent]:
         tool_name='get_rule_exceptions',
         tool_impl_func=_call_get_rule_exceptions,
         http_client=http_client,
-        rule_id=rule_id
+        rule_id=rule_id,
+        output_fields=fields,
+        space=space
     )
 
 
@@ -293,7 +563,8 @@ async def create_exception_list(
     type: str,  # e.g., 'detection', 'endpoint'
     namespace_type: str = 'single',
     tags: Optional[List[str]] = None,
-    os_types: Optional[List[str]] = None
+    os_types: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Creates a new exception list container.
 
@@ -305,6 +576,7 @@ async def create_exception_list(
         namespace_type: Scope ('single' or 'agnostic', default: 'single').
         tags: Optional list of tags.
         os_types: Optional list of OS types ('linux', 'macos', 'windows').
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     # Delegate execution to the safe wrapper
     return await execute_tool_safely(
@@ -317,7 +589,8 @@ async def create_exception_list(
         type=type,
         namespace_type=namespace_type,
         tags=tags,
-        os_types=os_types
+        os_types=os_types,
+        space=space
     )
 
 
@@ -326,7 +599,8 @@ async def associate_shared_exception_list(
     rule_id: str,
     exception_list_id: str,
     exception_list_type: str = 'detection',
-    exception_list_namespace: str = 'single'
+    exception_list_namespace: str = 'single',
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Associates an existing shared exception list (not a rule default) with a detection rule."""
     # Delegate execution to the safe wrapper
@@ -337,7 +611,8 @@ async def associate_shared_exception_list(
         rule_id=rule_id,
         exception_list_id=exception_list_id,
         exception_list_type=exception_list_type,
-        exception_list_namespace=exception_list_namespace
+        exception_list_namespace=exception_list_namespace,
+        space=space
     )
 
 
@@ -347,7 +622,9 @@ async def find_rules(
     sort_field: Optional[str] = None,
     sort_order: Optional[str] = None,
     page: Optional[int] = None,
-    per_page: Optional[int] = None
+    per_page: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Finds detection rules, optionally filtering by KQL/Lucene, sorting, and paginating.
 
@@ -365,6 +642,8 @@ async def find_rules(
         sort_order: Sort order. Valid values are 'asc' or 'desc'.
         page: Page number (minimum 1, default 1).
         per_page: Rules per page (minimum 0, default 20).
+        fields: Optional dotted field paths to keep in each returned record (["*"] returns everything).
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='find_rules',
@@ -374,20 +653,26 @@ async def find_rules(
         sort_field=sort_field,
         sort_order=sort_order,
         page=page,
-        per_page=per_page
+        per_page=per_page,
+        output_fields=fields,
+        space=space
     )
 
 
 @mcp.tool()
 async def get_rule(
     rule_id: Optional[str] = None,
-    id: Optional[str] = None
+    id: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Retrieves details of a specific detection rule.
 
     Args:
         rule_id: The human-readable rule_id to fetch.
         id: The internal UUID of the rule to fetch.
+        fields: Optional dotted field paths to keep in each returned record (["*"] returns everything).
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
 
     Note: You must provide either rule_id OR id parameter (not both).
     """
@@ -396,20 +681,24 @@ async def get_rule(
         tool_impl_func=_call_get_rule,
         http_client=http_client,
         rule_id=rule_id,
-        id=id
+        id=id,
+        output_fields=fields,
+        space=space
     )
 
 
 @mcp.tool()
 async def delete_rule(
     rule_id: Optional[str] = None,
-    id: Optional[str] = None
+    id: Optional[str] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Deletes a specific detection rule.
 
     Args:
         rule_id: The human-readable rule_id to delete.
         id: The internal UUID of the rule to delete.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
 
     Note: You must provide either rule_id OR id parameter (not both).
     """
@@ -418,7 +707,8 @@ async def delete_rule(
         tool_impl_func=_call_delete_rule,
         http_client=http_client,
         rule_id=rule_id,
-        id=id
+        id=id,
+        space=space
     )
 
 
@@ -426,7 +716,8 @@ async def delete_rule(
 async def update_rule_status(
     rule_id: Optional[str] = None,
     id: Optional[str] = None,
-    enabled: bool = True
+    enabled: bool = True,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Enables or disables a specific detection rule.
 
@@ -434,6 +725,7 @@ async def update_rule_status(
         rule_id: The human-readable rule_id to update.
         id: The internal UUID of the rule to update.
         enabled: True to enable the rule, False to disable it (default: True).
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
 
     Note: You must provide either rule_id OR id parameter (not both).
     """
@@ -443,12 +735,13 @@ async def update_rule_status(
         http_client=http_client,
         rule_id=rule_id,
         id=id,
-        enabled=enabled
+        enabled=enabled,
+        space=space
     )
 
 
 @mcp.tool()
-async def get_prepackaged_rules_status() -> list[types.TextContent]:
+async def get_prepackaged_rules_status(space: Optional[str] = None) -> list[types.TextContent]:
     """Retrieves the status of Elastic's prepackaged detection rules and timelines.
 
     Returns information about:
@@ -461,12 +754,13 @@ async def get_prepackaged_rules_status() -> list[types.TextContent]:
     return await execute_tool_safely(
         tool_name='get_prepackaged_rules_status',
         tool_impl_func=_call_get_prepackaged_rules_status,
-        http_client=http_client
+        http_client=http_client,
+        space=space
     )
 
 
 @mcp.tool()
-async def install_prepackaged_rules() -> list[types.TextContent]:
+async def install_prepackaged_rules(space: Optional[str] = None) -> list[types.TextContent]:
     """Installs or updates Elastic's prepackaged detection rules and timelines.
 
     This tool:
@@ -480,7 +774,8 @@ async def install_prepackaged_rules() -> list[types.TextContent]:
     return await execute_tool_safely(
         tool_name='install_prepackaged_rules',
         tool_impl_func=_call_install_prepackaged_rules,
-        http_client=http_client
+        http_client=http_client,
+        space=space
     )
 
 # --- Saved Objects Management Tools ---
@@ -498,7 +793,8 @@ async def find_objects(
     sort_order: Optional[str] = None,
     fields: Optional[List[str]] = None,
     filter: Optional[str] = None,
-    has_reference: Optional[Dict[str, str]] = None
+    has_reference: Optional[Dict[str, str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Find saved objects by type and other criteria.
 
@@ -518,6 +814,7 @@ async def find_objects(
         fields: A list of fields to return in the response.
         filter: A KQL expression to filter on.
         has_reference: Filter by reference fields and values.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='find_objects',
@@ -533,7 +830,8 @@ async def find_objects(
         sort_order=sort_order,
         fields=fields,
         filter=filter,
-        has_reference=has_reference
+        has_reference=has_reference,
+        space=space
     )
 
 
@@ -542,7 +840,8 @@ async def get_object(
     type: str,
     id: str,
     include_references: Optional[bool] = None,
-    fields: Optional[List[str]] = None
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get a saved object by type and ID.
 
@@ -551,6 +850,7 @@ async def get_object(
         id: The ID of the saved object.
         include_references: Whether to include references in the response.
         fields: A list of fields to return in the response.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='get_object',
@@ -559,7 +859,8 @@ async def get_object(
         type=type,
         id=id,
         include_references=include_references,
-        fields=fields
+        fields=fields,
+        space=space
     )
 
 
@@ -567,7 +868,8 @@ async def get_object(
 async def bulk_get_objects(
     objects: List[Dict[str, str]],
     include_references: Optional[bool] = None,
-    fields: Optional[List[str]] = None
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get multiple saved objects in a single request.
 
@@ -575,6 +877,7 @@ async def bulk_get_objects(
         objects: A list of objects with 'type' and 'id' properties.
         include_references: Whether to include references in the response.
         fields: A list of fields to return in the response.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='bulk_get_objects',
@@ -582,7 +885,8 @@ async def bulk_get_objects(
         http_client=http_client,
         objects=objects,
         include_references=include_references,
-        fields=fields
+        fields=fields,
+        space=space
     )
 
 
@@ -592,7 +896,8 @@ async def create_object(
     attributes: Dict[str, Any],
     id: Optional[str] = None,
     overwrite: Optional[bool] = None,
-    references: Optional[list] = None
+    references: Optional[list] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Create a new saved object.
 
@@ -602,6 +907,7 @@ async def create_object(
         id: Optional ID to assign to the saved object. If not provided, one will be generated.
         overwrite: Whether to overwrite an existing object with the same ID.
         references: A list of references to other saved objects.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='create_object',
@@ -611,7 +917,8 @@ async def create_object(
         attributes=attributes,
         id=id,
         overwrite=overwrite,
-        references=references
+        references=references,
+        space=space
     )
 
 
@@ -621,7 +928,8 @@ async def update_object(
     id: str,
     attributes: Dict[str, Any],
     version: Optional[str] = None,
-    references: Optional[list] = None
+    references: Optional[list] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Update an existing saved object.
 
@@ -631,6 +939,7 @@ async def update_object(
         attributes: The attributes to update.
         version: The version of the saved object to update (for optimistic concurrency control).
         references: A list of references to other saved objects.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='update_object',
@@ -640,7 +949,8 @@ async def update_object(
         id=id,
         attributes=attributes,
         version=version,
-        references=references
+        references=references,
+        space=space
     )
 
 
@@ -648,7 +958,8 @@ async def update_object(
 async def delete_object(
     type: str,
     id: str,
-    force: Optional[bool] = None
+    force: Optional[bool] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Delete a saved object.
 
@@ -656,6 +967,7 @@ async def delete_object(
         type: The type of saved object to delete.
         id: The ID of the saved object.
         force: Whether to force deletion of the object even if it would break references.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='delete_object',
@@ -663,7 +975,8 @@ async def delete_object(
         http_client=http_client,
         type=type,
         id=id,
-        force=force
+        force=force,
+        space=space
     )
 
 
@@ -672,7 +985,9 @@ async def export_objects(
     objects: List[Dict[str, Any]],
     exclude_export_details: Optional[bool] = None,
     include_references: Optional[bool] = None,
-    include_namespace: Optional[bool] = None
+    include_namespace: Optional[bool] = None,
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Export saved objects.
 
@@ -681,6 +996,8 @@ async def export_objects(
         exclude_export_details: Whether to exclude export details from the response.
         include_references: Whether to include referenced objects in the export.
         include_namespace: Whether to include the namespace in the exported objects.
+        fields: Optional dotted field paths to keep in each returned record (["*"] returns everything).
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='export_objects',
@@ -689,7 +1006,9 @@ async def export_objects(
         objects=objects,
         exclude_export_details=exclude_export_details,
         include_references=include_references,
-        include_namespace=include_namespace
+        include_namespace=include_namespace,
+        output_fields=fields,
+        space=space
     )
 
 
@@ -697,7 +1016,8 @@ async def export_objects(
 async def import_objects(
     objects_ndjson: str,
     create_new_copies: Optional[bool] = None,
-    overwrite: Optional[bool] = None
+    overwrite: Optional[bool] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Import saved objects.
 
@@ -705,6 +1025,7 @@ async def import_objects(
         objects_ndjson: A string containing the objects in NDJSON format.
         create_new_copies: Whether to create new copies of the objects.
         overwrite: Whether to overwrite existing objects.
+        space: Optional Kibana space ID to run in (defaults to KIBANA_SPACE or the default space).
     """
     return await execute_tool_safely(
         tool_name='import_objects',
@@ -712,7 +1033,8 @@ async def import_objects(
         http_client=http_client,
         objects_ndjson=objects_ndjson,
         create_new_copies=create_new_copies,
-        overwrite=overwrite
+        overwrite=overwrite,
+        space=space
     )
 
 
@@ -720,7 +1042,8 @@ async def import_objects(
 async def isolate_endpoint(
     endpoint_ids: List[str],
     agent_type: str = "endpoint",
-    comment: Optional[str] = None
+    comment: Optional[str] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Isolate one or more endpoints from the network."""
     return await execute_tool_safely(
@@ -729,7 +1052,8 @@ async def isolate_endpoint(
         http_client=http_client,
         endpoint_ids=endpoint_ids,
         agent_type=agent_type,
-        comment=comment
+        comment=comment,
+        space=space
     )
 
 
@@ -737,7 +1061,8 @@ async def isolate_endpoint(
 async def unisolate_endpoint(
     endpoint_ids: List[str],
     agent_type: str = "endpoint",
-    comment: Optional[str] = None
+    comment: Optional[str] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Release one or more endpoints from isolation."""
     return await execute_tool_safely(
@@ -746,7 +1071,8 @@ async def unisolate_endpoint(
         http_client=http_client,
         endpoint_ids=endpoint_ids,
         agent_type=agent_type,
-        comment=comment
+        comment=comment,
+        space=space
     )
 
 
@@ -756,7 +1082,8 @@ async def run_command_on_endpoint(
     command: str,
     agent_type: str = "endpoint",
     comment: Optional[str] = None,
-    parameters: Optional[Dict[str, Any]] = None
+    parameters: Optional[Dict[str, Any]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Run a shell command on one or more endpoints."""
     return await execute_tool_safely(
@@ -767,7 +1094,8 @@ async def run_command_on_endpoint(
         command=command,
         agent_type=agent_type,
         comment=comment,
-        parameters=parameters
+        parameters=parameters,
+        space=space
     )
 
 
@@ -782,7 +1110,9 @@ async def get_response_actions(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     user_ids: Optional[List[str]] = None,
-    with_outputs: Optional[List[str]] = None
+    with_outputs: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get a list of all response actions from Elastic Defend endpoints."""
     return await execute_tool_safely(
@@ -798,33 +1128,41 @@ async def get_response_actions(
         start_date=start_date,
         end_date=end_date,
         user_ids=user_ids,
-        with_outputs=with_outputs
+        with_outputs=with_outputs,
+        output_fields=fields,
+        space=space
     )
 
 
 @mcp.tool()
 async def get_response_action_details(
-    action_id: str
+    action_id: str,
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get details of a response action by action ID."""
     return await execute_tool_safely(
         tool_name='get_response_action_details',
         tool_impl_func=_call_get_response_action_details,
         http_client=http_client,
-        action_id=action_id
+        action_id=action_id,
+        output_fields=fields,
+        space=space
     )
 
 
 @mcp.tool()
 async def get_response_action_status(
-    query: Dict[str, Any]
+    query: Dict[str, Any],
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get the status of response actions for specified agent IDs."""
     return await execute_tool_safely(
         tool_name='get_response_action_status',
         tool_impl_func=_call_get_response_action_status,
         http_client=http_client,
-        query=query
+        query=query,
+        space=space
     )
 
 
@@ -833,7 +1171,8 @@ async def kill_process(
     endpoint_ids: List[str],
     parameters: Dict[str, Any],
     agent_type: str = "endpoint",
-    comment: Optional[str] = None
+    comment: Optional[str] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Terminate a running process on an endpoint."""
     return await execute_tool_safely(
@@ -843,7 +1182,8 @@ async def kill_process(
         endpoint_ids=endpoint_ids,
         parameters=parameters,
         agent_type=agent_type,
-        comment=comment
+        comment=comment,
+        space=space
     )
 
 
@@ -852,7 +1192,8 @@ async def suspend_process(
     endpoint_ids: List[str],
     parameters: Dict[str, Any],
     agent_type: str = "endpoint",
-    comment: Optional[str] = None
+    comment: Optional[str] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Suspend a running process on an endpoint."""
     return await execute_tool_safely(
@@ -862,7 +1203,8 @@ async def suspend_process(
         endpoint_ids=endpoint_ids,
         parameters=parameters,
         agent_type=agent_type,
-        comment=comment
+        comment=comment,
+        space=space
     )
 
 
@@ -871,7 +1213,8 @@ async def scan_endpoint(
     endpoint_ids: List[str],
     parameters: Dict[str, Any],
     agent_type: str = "endpoint",
-    comment: Optional[str] = None
+    comment: Optional[str] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Scan a file or directory on an endpoint for malware."""
     return await execute_tool_safely(
@@ -881,14 +1224,16 @@ async def scan_endpoint(
         endpoint_ids=endpoint_ids,
         parameters=parameters,
         agent_type=agent_type,
-        comment=comment
+        comment=comment,
+        space=space
     )
 
 
 @mcp.tool()
 async def get_file_info(
     action_id: str,
-    file_id: str
+    file_id: str,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get information for a file retrieved by a response action."""
     return await execute_tool_safely(
@@ -896,14 +1241,16 @@ async def get_file_info(
         tool_impl_func=_call_get_file_info,
         http_client=http_client,
         action_id=action_id,
-        file_id=file_id
+        file_id=file_id,
+        space=space
     )
 
 
 @mcp.tool()
 async def download_file(
     action_id: str,
-    file_id: str
+    file_id: str,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Download a file from an endpoint."""
     return await execute_tool_safely(
@@ -911,7 +1258,8 @@ async def download_file(
         tool_impl_func=_call_download_file,
         http_client=http_client,
         action_id=action_id,
-        file_id=file_id
+        file_id=file_id,
+        space=space
     )
 
 
@@ -936,7 +1284,9 @@ async def find_cases(
     sort_order: str = "desc",
     status: Optional[str] = None,
     tags: Optional[List[str]] = None,
-    to_date: Optional[str] = None
+    to_date: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Search for cases based on various criteria."""
     return await execute_tool_safely(
@@ -958,18 +1308,22 @@ async def find_cases(
         sort_order=sort_order,
         status=status,
         tags=tags,
-        to_date=to_date
+        to_date=to_date,
+        output_fields=fields,
+        space=space
     )
 
 
 @mcp.tool()
-async def get_case(case_id: str) -> list[types.TextContent]:
+async def get_case(case_id: str, fields: Optional[List[str]] = None, space: Optional[str] = None) -> list[types.TextContent]:
     """Get detailed information about a specific case."""
     return await execute_tool_safely(
         tool_name='get_case',
         tool_impl_func=_call_get_case,
         http_client=http_client,
-        case_id=case_id
+        case_id=case_id,
+        output_fields=fields,
+        space=space
     )
 
 
@@ -987,7 +1341,8 @@ async def create_case(
     custom_fields: Optional[List[Dict[str, Any]]] = None,
     owner: str = "securitySolution",
     severity: str = "low",
-    settings: Optional[Dict[str, bool]] = None
+    settings: Optional[Dict[str, bool]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Create a new case."""
     return await execute_tool_safely(
@@ -1006,7 +1361,8 @@ async def create_case(
         custom_fields=custom_fields,
         owner=owner,
         severity=severity,
-        settings=settings
+        settings=settings,
+        space=space
     )
 
 
@@ -1026,7 +1382,8 @@ async def update_case(
     custom_fields: Optional[List[Dict[str, Any]]] = None,
     severity: Optional[str] = None,
     status: Optional[str] = None,
-    settings: Optional[Dict[str, bool]] = None
+    settings: Optional[Dict[str, bool]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Update an existing case."""
     return await execute_tool_safely(
@@ -1047,18 +1404,20 @@ async def update_case(
         custom_fields=custom_fields,
         severity=severity,
         status=status,
-        settings=settings
+        settings=settings,
+        space=space
     )
 
 
 @mcp.tool()
-async def delete_cases(case_ids: List[str]) -> list[types.TextContent]:
+async def delete_cases(case_ids: List[str], space: Optional[str] = None) -> list[types.TextContent]:
     """Delete one or more cases."""
     return await execute_tool_safely(
         tool_name='delete_cases',
         tool_impl_func=_call_delete_cases,
         http_client=http_client,
-        case_ids=case_ids
+        case_ids=case_ids,
+        space=space
     )
 
 
@@ -1071,7 +1430,8 @@ async def add_case_comment(
     alert_index: Optional[str] = None,
     rule_id: Optional[str] = None,
     rule_name: Optional[str] = None,
-    owner: str = "securitySolution"
+    owner: str = "securitySolution",
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Add a comment or alert to a case."""
     return await execute_tool_safely(
@@ -1085,7 +1445,8 @@ async def add_case_comment(
         alert_index=alert_index,
         rule_id=rule_id,
         rule_name=rule_name,
-        owner=owner
+        owner=owner,
+        space=space
     )
 
 
@@ -1094,7 +1455,9 @@ async def get_case_comments(
     case_id: str,
     page: int = 1,
     per_page: int = 20,
-    sort_order: str = "desc"
+    sort_order: str = "desc",
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get comments and alerts for a specific case."""
     return await execute_tool_safely(
@@ -1104,25 +1467,31 @@ async def get_case_comments(
         case_id=case_id,
         page=page,
         per_page=per_page,
-        sort_order=sort_order
+        sort_order=sort_order,
+        output_fields=fields,
+        space=space
     )
 
 
 @mcp.tool()
-async def get_case_alerts(case_id: str) -> list[types.TextContent]:
+async def get_case_alerts(case_id: str, fields: Optional[List[str]] = None, space: Optional[str] = None) -> list[types.TextContent]:
     """Get all alerts attached to a specific case."""
     return await execute_tool_safely(
         tool_name='get_case_alerts',
         tool_impl_func=_call_get_case_alerts,
         http_client=http_client,
-        case_id=case_id
+        case_id=case_id,
+        output_fields=fields,
+        space=space
     )
 
 
 @mcp.tool()
 async def get_cases_by_alert(
     alert_id: str,
-    owner: Optional[List[str]] = None
+    owner: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get all cases that contain a specific alert."""
     return await execute_tool_safely(
@@ -1130,33 +1499,39 @@ async def get_cases_by_alert(
         tool_impl_func=_call_get_cases_by_alert,
         http_client=http_client,
         alert_id=alert_id,
-        owner=owner
+        owner=owner,
+        output_fields=fields,
+        space=space
     )
 
 
 @mcp.tool()
 async def get_case_configuration(
-    owner: Optional[List[str]] = None
+    owner: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get case configuration settings."""
     return await execute_tool_safely(
         tool_name='get_case_configuration',
         tool_impl_func=_call_get_case_configuration,
         http_client=http_client,
-        owner=owner
+        owner=owner,
+        space=space
     )
 
 
 @mcp.tool()
 async def get_case_tags(
-    owner: Optional[List[str]] = None
+    owner: Optional[List[str]] = None,
+    space: Optional[str] = None
 ) -> list[types.TextContent]:
     """Get all case tags."""
     return await execute_tool_safely(
         tool_name='get_case_tags',
         tool_impl_func=_call_get_case_tags,
         http_client=http_client,
-        owner=owner
+        owner=owner,
+        space=space
     )
 
 
@@ -1170,9 +1545,22 @@ def signal_handler(signum, frame):
     shutdown_event.set()
 
 
-# Register signal handlers for graceful shutdown
-signal.signal(signal.SIGTERM, signal_handler)
-signal.signal(signal.SIGINT, signal_handler)
+def install_signal_handlers():
+    """Register signal handlers for graceful shutdown.
+
+    Not done at import time: HTTP worker processes import this module after
+    uvicorn installed its own handlers, which must keep receiving SIGTERM.
+    """
+    signal.signal(signal.SIGTERM, signal_handler)
+    signal.signal(signal.SIGINT, signal_handler)
+
+
+def preload_tools_from_env():
+    """Imports every tool implementation at startup when KIBANA_MCP_PRELOAD_TOOLS is set."""
+    if os.getenv("KIBANA_MCP_PRELOAD_TOOLS", "false").lower() in ("1", "true", "yes", "on"):
+        # Trade cold-start time for a faster first call of every tool
+        preload_all()
+        logger.info(f"Preloaded tool implementations: {import_stats()['import_seconds'] * 1000:.1f}ms")
 
 
 def run_server():
@@ -1180,13 +1568,21 @@ def run_server():
     global http_client  # Need global to ensure cleanup happens
     http_client = None  # Ensure it's None initially
 
-    # Check for SSE mode configuration
+    # stdio (default), sse or http
     transport_mode = os.getenv("MCP_TRANSPORT", "stdio").lower()
 
     try:
-        configure_http_client()  # Configure global client
-
-        if transport_mode == "sse":
+        if transport_mode != "http":
+            # In HTTP mode every worker process configures its own client
+            install_signal_handlers()
+            configure_http_client()  # Configure global client
+            preload_tools_from_env()
+
+        if transport_mode == "http":
+            # Stateless streamable HTTP served by several worker processes
+            from kibana_mcp.serving import serve
+            serve()
+        elif transport_mode == "sse":
             # Stateless SSE mode configuration
             # Use 0.0.0.0 for Cloud Run, 127.0.0.1 for local development
             host = os.getenv("MCP_SSE_HOST", "0.0.0.0" if os.getenv(
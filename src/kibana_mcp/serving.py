@@ -0,0 +1,233 @@
+"""Multi-worker serving over the stateless streamable-HTTP transport.
+
+``MCP_TRANSPORT=http`` runs ``KIBANA_MCP_WORKERS`` uvicorn worker processes that
+share one listen socket. Every worker builds the app with ``create_app()``: the
+MCP endpoint in stateless mode (no session is pinned to a worker, so any worker
+can serve any request), its own pooled ``KibanaClient``, and a heartbeat file
+with its load. ``/health`` reports the worker that answered, ``/workers`` the
+heartbeats of all of them.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from kibana_mcp import metrics, server
+from kibana_mcp.client._env import env_float, env_int
+
+logger = logging.getLogger("kibana-mcp")
+
+# Directory the workers write their heartbeats to; set by serve() for the worker processes
+STATE_DIR_ENV = "KIBANA_MCP_WORKER_STATE_DIR"
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS
+        return os.cpu_count() or 1
+
+
+def _default_host() -> str:
+    # Use 0.0.0.0 for Cloud Run, 127.0.0.1 for local development
+    return "0.0.0.0" if os.getenv("GOOGLE_CLOUD_PROJECT") or os.getenv("K_SERVICE") else "127.0.0.1"
+
+
+@dataclass(frozen=True)
+class ServingSettings:
+    """Listen address, worker count and heartbeat settings of the HTTP serving mode."""
+    host: str = "127.0.0.1"
+    port: int = 8080
+    workers: int = 1
+    path: str = "/mcp"
+    heartbeat_interval: float = 2.0
+    state_dir: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "ServingSettings":
+        """Reads MCP_HTTP_HOST/MCP_HTTP_PORT (falling back to the SSE variables and Cloud
+        Run's PORT), MCP_HTTP_PATH, KIBANA_MCP_WORKERS (default: one per available CPU),
+        KIBANA_MCP_HEARTBEAT_INTERVAL and KIBANA_MCP_WORKER_STATE_DIR."""
+        return cls(
+            host=os.getenv("MCP_HTTP_HOST") or os.getenv("MCP_SSE_HOST") or _default_host(),
+            port=int(os.getenv("PORT") or os.getenv("MCP_HTTP_PORT") or os.getenv("MCP_SSE_PORT") or cls.port),
+            workers=max(1, env_int("KIBANA_MCP_WORKERS", _available_cpus())),
+            path=os.getenv("MCP_HTTP_PATH", cls.path),
+            heartbeat_interval=env_float("KIBANA_MCP_HEARTBEAT_INTERVAL", cls.heartbeat_interval),
+            state_dir=os.getenv(STATE_DIR_ENV) or None,
+        )
+
+
+def _open_circuits() -> List[str]:
+    client = server.http_client
+    if client is None:
+        return []
+    return sorted(family for family, breaker in client.resilience.breakers.items() if breaker.state == "open")
+
+
+def worker_snapshot(started_at: float) -> Dict[str, Any]:
+    """Health and load of this worker process."""
+    client = server.http_client
+    open_circuits = _open_circuits()
+    if client is None:
+        status = "starting"
+    elif open_circuits:
+        status = "degraded"
+    else:
+        status = "ok"
+    limiter = client.limiter.stats() if client is not None else {}
+    return {
+        "pid": os.getpid(),
+        "status": status,
+        "started_at": started_at,
+        "updated_at": time.time(),
+        "uptime_seconds": round(time.time() - started_at, 3),
+        "tool_calls_in_flight": int(metrics.TOOL_IN_FLIGHT.total()),
+        "tool_calls_total": int(metrics.TOOL_CALLS.total()),
+        "tool_errors_total": int(metrics.TOOL_ERRORS.total()),
+        "kibana_requests_in_flight": int(metrics.KIBANA_IN_FLIGHT.total()),
+        "limiter_queued": int(sum(family["queued"] for family in limiter.values())),
+        "pool": client.pool_stats() if client is not None else None,
+        "open_circuits": open_circuits,
+    }
+
+
+class WorkerHeartbeat:
+    """Periodically writes this worker's snapshot to ``<state_dir>/worker-<pid>.json``."""
+
+    def __init__(self, state_dir: str, interval: float, started_at: float):
+        self.path = os.path.join(state_dir, f"worker-{os.getpid()}.json")
+        self.interval = interval
+        self.started_at = started_at
+        self._task: Optional[asyncio.Task] = None
+
+    def write(self) -> None:
+        # Write-then-rename, so readers never see a partial file
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as handle:
+            json.dump(worker_snapshot(self.started_at), handle)
+        os.replace(temporary, self.path)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self.write()
+            except OSError as e:
+                logger.warning(f"Could not write worker heartbeat {self.path}: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def read_heartbeats(state_dir: str, stale_after: float) -> Dict[str, Any]:
+    """Aggregates the workers' heartbeat files. Workers silent for ``stale_after`` seconds are marked stale."""
+    workers = []
+    now = time.time()
+    for name in sorted(os.listdir(state_dir)):
+        if not (name.startswith("worker-") and name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(state_dir, name)) as handle:
+                snapshot = json.load(handle)
+        except (OSError, ValueError):
+            continue  # Removed or replaced while listing
+        if now - snapshot.get("updated_at", 0) > stale_after:
+            snapshot["status"] = "stale"
+        workers.append(snapshot)
+    live = [worker for worker in workers if worker["status"] != "stale"]
+    return {
+        "workers": workers,
+        "total": len(workers),
+        "healthy": sum(1 for worker in live if worker["status"] == "ok"),
+        "tool_calls_in_flight": sum(worker["tool_calls_in_flight"] for worker in live),
+        "tool_calls_total": sum(worker["tool_calls_total"] for worker in workers),
+    }
+
+
+def create_app(settings: Optional[ServingSettings] = None):
+    """Builds one worker's ASGI app. uvicorn calls it in every worker process (``factory=True``)."""
+    settings = settings or ServingSettings.from_env()
+    app = server.mcp.http_app(path=settings.path, transport="streamable-http", stateless_http=True)
+    started_at = time.time()
+    mcp_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # Each worker owns its client and connection pool; nothing is shared across processes
+        server.configure_http_client()
+        server.preload_tools_from_env()
+        heartbeat = None
+        if settings.state_dir:
+            heartbeat = WorkerHeartbeat(settings.state_dir, settings.heartbeat_interval, started_at)
+            heartbeat.start()
+        logger.info(f"Worker {os.getpid()} serving stateless MCP at {settings.path}")
+        try:
+            async with mcp_lifespan(app):
+                yield
+        finally:
+            if heartbeat is not None:
+                await heartbeat.stop()
+            await server.close_http_client()
+
+    app.router.lifespan_context = lifespan
+
+    async def health(request: Request) -> JSONResponse:
+        snapshot = worker_snapshot(started_at)
+        return JSONResponse(snapshot, status_code=200 if snapshot["status"] == "ok" else 503)
+
+    async def workers(request: Request) -> JSONResponse:
+        if not settings.state_dir:
+            return JSONResponse({"workers": [worker_snapshot(started_at)], "total": 1})
+        return JSONResponse(read_heartbeats(settings.state_dir, stale_after=settings.heartbeat_interval * 3))
+
+    app.add_route("/health", health, methods=["GET"], include_in_schema=False)
+    app.add_route("/workers", workers, methods=["GET"], include_in_schema=False)
+    return app
+
+
+def serve(settings: Optional[ServingSettings] = None) -> None:
+    """Runs the worker processes until shutdown. The calling process only supervises them."""
+    import uvicorn
+
+    settings = settings or ServingSettings.from_env()
+    created_state_dir = None
+    if not settings.state_dir:
+        created_state_dir = tempfile.mkdtemp(prefix="kibana-mcp-workers-")
+    # Workers are spawned and read their settings from the environment
+    os.environ.update({
+        "MCP_HTTP_PATH": settings.path,
+        "KIBANA_MCP_HEARTBEAT_INTERVAL": str(settings.heartbeat_interval),
+        STATE_DIR_ENV: settings.state_dir or created_state_dir,
+    })
+    logger.info(f"Starting {settings.workers} stateless streamable-HTTP worker(s) on "
+                f"http://{settings.host}:{settings.port}{settings.path}")
+    try:
+        uvicorn.run("kibana_mcp.serving:create_app", factory=True, host=settings.host, port=settings.port,
+                    workers=settings.workers, lifespan="on")
+    finally:
+        if created_state_dir:
+            shutil.rmtree(created_state_dir, ignore_errors=True)
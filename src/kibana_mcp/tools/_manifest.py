@@ -0,0 +1,145 @@
+"""Manifest of tool implementations, imported on first use.
+
+The server registers every tool at startup, but a tool's implementation module
+(and the pydantic models it uses) is only imported the first time the tool is
+called. This keeps the implementation modules off the cold-start path.
+"""
+
+import functools
+import importlib
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Implementation function -> module that defines it
+TOOL_MODULES: Dict[str, str] = {
+    # Alert tools
+    "_call_tag_alert": "kibana_mcp.tools.alerts.tag_alert",
+    "_call_adjust_alert_status": "kibana_mcp.tools.alerts.adjust_alert_status",
+    "_call_get_alerts": "kibana_mcp.tools.alerts.get_alerts",
+    "_call_aggregate_alerts": "kibana_mcp.tools.alerts.aggregate_alerts",
+    "_call_poll_new_alerts": "kibana_mcp.tools.alerts.poll_new_alerts",
+    "_call_bulk_tag_alerts": "kibana_mcp.tools.alerts.bulk_tag_alerts",
+    "_call_bulk_adjust_alert_status": "kibana_mcp.tools.alerts.bulk_adjust_alert_status",
+
+    # Rule tools
+    "_call_get_rule": "kibana_mcp.tools.rules.get_rule",
+    "_call_delete_rule": "kibana_mcp.tools.rules.delete_rule",
+    "_call_update_rule_status": "kibana_mcp.tools.rules.update_rule_status",
+    "_call_find_rules": "kibana_mcp.tools.rules.find_rules",
+    "_call_get_prepackaged_rules_status": "kibana_mcp.tools.rules.get_prepackaged_rules_status",
+    "_call_install_prepackaged_rules": "kibana_mcp.tools.rules.install_prepackaged_rules",
+
+    # Exception tools
+    "_call_get_rule_exceptions": "kibana_mcp.tools.exceptions.get_rule_exceptions",
+    "_call_add_rule_exception_items": "kibana_mcp.tools.exceptions.add_rule_exception_items",
+    "_call_create_exception_list": "kibana_mcp.tools.exceptions.create_exception_list",
+    "_call_associate_shared_exception_list": "kibana_mcp.tools.exceptions.associate_shared_exception_list",
+
+    # Saved Objects tools
+    "_call_find_objects": "kibana_mcp.tools.saved_objects.find_objects",
+    "_call_get_object": "kibana_mcp.tools.saved_objects.get_object",
+    "_call_bulk_get_objects": "kibana_mcp.tools.saved_objects.bulk_get_objects",
+    "_call_create_object": "kibana_mcp.tools.saved_objects.create_object",
+    "_call_update_object": "kibana_mcp.tools.saved_objects.update_object",
+    "_call_delete_object": "kibana_mcp.tools.saved_objects.delete_object",
+    "_call_export_objects": "kibana_mcp.tools.saved_objects.export_objects",
+    "_call_import_objects": "kibana_mcp.tools.saved_objects.import_objects",
+
+    # Endpoint tools
+    "_call_isolate_endpoint": "kibana_mcp.tools.endpoint.isolate_endpoint",
+    "_call_unisolate_endpoint": "kibana_mcp.tools.endpoint.unisolate_endpoint",
+    "_call_run_command_on_endpoint": "kibana_mcp.tools.endpoint.run_command_on_endpoint",
+    "_call_get_response_actions": "kibana_mcp.tools.endpoint.get_response_actions",
+    "_call_get_response_action_details": "kibana_mcp.tools.endpoint.get_response_action_details",
+    "_call_get_response_action_status": "kibana_mcp.tools.endpoint.get_response_action_status",
+    "_call_kill_process": "kibana_mcp.tools.endpoint.kill_process",
+    "_call_suspend_process": "kibana_mcp.tools.endpoint.suspend_process",
+    "_call_scan_endpoint": "kibana_mcp.tools.endpoint.scan_endpoint",
+    "_call_get_file_info": "kibana_mcp.tools.endpoint.get_file_info",
+    "_call_download_file": "kibana_mcp.tools.endpoint.download_file",
+
+    # Cases tools
+    "_call_find_cases": "kibana_mcp.tools.cases.find_cases",
+    "_call_get_case": "kibana_mcp.tools.cases.get_case",
+    "_call_create_case": "kibana_mcp.tools.cases.create_case",
+    "_call_update_case": "kibana_mcp.tools.cases.update_case",
+    "_call_delete_cases": "kibana_mcp.tools.cases.delete_cases",
+    "_call_add_case_comment": "kibana_mcp.tools.cases.add_case_comment",
+    "_call_get_case_comments": "kibana_mcp.tools.cases.get_case_comments",
+    "_call_get_case_alerts": "kibana_mcp.tools.cases.get_case_alerts",
+    "_call_get_cases_by_alert": "kibana_mcp.tools.cases.get_cases_by_alert",
+    "_call_get_case_configuration": "kibana_mcp.tools.cases.get_case_configuration",
+    "_call_get_case_tags": "kibana_mcp.tools.cases.get_case_tags",
+}
+
+ToolImpl = Callable[..., Awaitable[str]]
+
+_loaded: Dict[str, ToolImpl] = {}
+# Seconds spent importing each implementation module (the first load only)
+IMPORT_TIMES: Dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def load_impl(name: str) -> ToolImpl:
+    """Imports (once) and returns the implementation function ``name``."""
+    impl = _loaded.get(name)
+    if impl is not None:
+        return impl
+    module_name = TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"Unknown tool implementation '{name}'")
+    with _lock:
+        impl = _loaded.get(name)
+        if impl is None:
+            started_at = time.perf_counter()
+            module = importlib.import_module(module_name)
+            IMPORT_TIMES.setdefault(module_name, time.perf_counter() - started_at)
+            impl = _loaded[name] = getattr(module, name)
+    return impl
+
+
+def lazy_impl(name: str) -> ToolImpl:
+    """Returns a stand-in for the implementation ``name`` that imports it on first call."""
+    if name not in TOOL_MODULES:
+        raise AttributeError(f"Unknown tool implementation '{name}'")
+
+    async def _impl(**kwargs: Any) -> str:
+        return await load_impl(name)(**kwargs)
+
+    _impl.__name__ = _impl.__qualname__ = name
+    _impl.__module__ = TOOL_MODULES[name]
+    return _impl
+
+
+def package_getattr(package: str) -> Callable[[str], Any]:
+    """Builds a module ``__getattr__`` (PEP 562) that loads the package's implementations on access."""
+    prefix = package + "."
+
+    def __getattr__(name: str) -> Any:
+        if TOOL_MODULES.get(name, "").startswith(prefix):
+            return load_impl(name)
+        raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+    return __getattr__
+
+
+def names_in(package: str) -> List[str]:
+    """Implementation names provided by ``package``, in manifest order."""
+    prefix = package + "."
+    return [name for name, module in TOOL_MODULES.items() if module.startswith(prefix)]
+
+
+def preload_all() -> None:
+    """Imports every implementation, e.g. to warm a worker before it takes traffic."""
+    for name in TOOL_MODULES:
+        load_impl(name)
+
+
+def import_stats() -> Dict[str, Any]:
+    return {
+        "tools": len(TOOL_MODULES),
+        "loaded": len(_loaded),
+        "import_seconds": round(sum(IMPORT_TIMES.values()), 6),
+        "modules": {module: round(seconds, 6) for module, seconds in sorted(IMPORT_TIMES.items())},
+    }
@@ -1,11 +1,8 @@
 # src/kibana_mcp/tools/alerts/__init__.py
 
-from .tag_alert import _call_tag_alert
-from .adjust_alert_status import _call_adjust_alert_status
-from .get_alerts import _call_get_alerts
+# Tool functions are imported on first access, see kibana_mcp/tools/_manifest.py
+from .._manifest import names_in, package_getattr
 
-__all__ = [
-    '_call_tag_alert',
-    '_call_adjust_alert_status',
-    '_call_get_alerts',
-]
+__getattr__ = package_getattr(__name__)
+
+__all__ = names_in(__name__)
@@ -0,0 +1,164 @@
+import asyncio
+import httpx
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+from ._query import alert_search_body
+
+# Alert ids per update request, and update requests in flight at once per tool call
+BULK_CHUNK_SIZE = 500
+BULK_CONCURRENCY = 4
+
+# Most alerts a query-based update resolves to ids before it stops
+MAX_QUERY_ALERTS = 50_000
+
+# Errors kept in a summary; the rest are only counted
+_MAX_ERRORS = 10
+
+SEARCH_PATH = "/api/detection_engine/signals/search"
+
+
+@dataclass
+class BulkSummary:
+    """Aggregated outcome of the update requests of one bulk call."""
+    requested: int = 0
+    updated: int = 0
+    version_conflicts: int = 0
+    requests: int = 0
+    failed_requests: int = 0
+    failed_alerts: int = 0
+    truncated: bool = False
+    errors: List[str] = field(default_factory=list)
+
+    def _error(self, message: str) -> None:
+        if len(self.errors) < _MAX_ERRORS:
+            self.errors.append(message)
+
+    def add_response(self, data: Dict[str, Any]) -> None:
+        """Counts an update-by-query style response (``updated``, ``version_conflicts``, ``failures``)."""
+        self.updated += data.get("updated") or 0
+        self.version_conflicts += data.get("version_conflicts") or 0
+        failures = data.get("failures") or []
+        self.failed_alerts += len(failures)
+        for failure in failures:
+            self._error(str(failure.get("cause", failure)) if isinstance(failure, dict) else str(failure))
+
+    def add_failure(self, alerts: int, message: str) -> None:
+        self.failed_requests += 1
+        self.failed_alerts += alerts
+        self._error(message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        summary = {
+            "requested": self.requested,
+            "updated": self.updated,
+            "failed": self.failed_alerts,
+            "version_conflicts": self.version_conflicts,
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+        }
+        if self.truncated:
+            summary["truncated"] = (f"Only the first {MAX_QUERY_ALERTS} matching alerts were updated; "
+                                    "run the call again to update the rest.")
+        if self.errors:
+            summary["errors"] = self.errors
+        return summary
+
+
+def chunked(ids: Iterable[str], size: int = BULK_CHUNK_SIZE) -> Iterable[List[str]]:
+    chunk: List[str] = []
+    for alert_id in ids:
+        chunk.append(alert_id)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def unique_ids(alert_ids: Iterable[str]) -> List[str]:
+    """The ids without duplicates or blanks, in their original order."""
+    return list(dict.fromkeys(alert_id for alert_id in alert_ids if alert_id))
+
+
+async def post_update(http_client: httpx.AsyncClient, api_path: str, payload: Dict[str, Any], alerts: int,
+                      summary: BulkSummary) -> Optional[Dict[str, Any]]:
+    """Sends one update request and adds its outcome to ``summary``; errors are counted, not raised.
+
+    Returns the response body, or None when the request failed.
+    """
+    summary.requests += 1
+    try:
+        response = await http_client.post(api_path, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        summary.add_response(data)
+        return data
+    except httpx.HTTPStatusError as exc:
+        summary.add_failure(alerts, f"{api_path} returned {exc.response.status_code} - {exc.response.text[:500]}")
+    except httpx.RequestError as exc:
+        summary.add_failure(alerts, f"Error calling {api_path}: {exc}")
+    except ValueError:
+        summary.add_failure(alerts, f"Error parsing JSON response from {api_path}.")
+    return None
+
+
+async def update_in_chunks(http_client: httpx.AsyncClient, api_path: str, id_batches: AsyncIterator[List[str]],
+                           payload_for: Callable[[List[str]], Dict[str, Any]], summary: BulkSummary) -> None:
+    """Sends one update request per chunk of ids, ``BULK_CONCURRENCY`` at a time.
+
+    Chunks are sent as soon as their ids are known, so resolving a query's ids and
+    updating the alerts found so far overlap.
+    """
+    slots = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def send(chunk: List[str]) -> None:
+        try:
+            await post_update(http_client, api_path, payload_for(chunk), len(chunk), summary)
+        finally:
+            slots.release()
+
+    tasks = []
+    try:
+        async for batch in id_batches:
+            for chunk in chunked(batch):
+                summary.requested += len(chunk)
+                await slots.acquire()
+                tasks.append(asyncio.create_task(send(chunk)))
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    except Exception:
+        # Updates already sent still finish and are counted before the lookup error is reported
+        await asyncio.gather(*tasks)
+        raise
+    # Cancelling the gather cancels the updates still in flight
+    await asyncio.gather(*tasks)
+
+
+async def listed_ids(alert_ids: List[str]) -> AsyncIterator[List[str]]:
+    yield alert_ids
+
+
+async def matching_ids(http_client: httpx.AsyncClient, search_text: str, since: Optional[str],
+                       summary: BulkSummary) -> AsyncIterator[List[str]]:
+    """Pages through the ids of the alerts matching an alert search (``_source`` disabled).
+
+    Stops after ``MAX_QUERY_ALERTS`` and marks ``summary`` truncated. Raises httpx errors.
+    """
+    found = 0
+    search_after = None
+    while found < MAX_QUERY_ALERTS:
+        size = min(BULK_CHUNK_SIZE * BULK_CONCURRENCY, MAX_QUERY_ALERTS - found)
+        body = alert_search_body(search_text, size, search_after, source=False, since=since)
+        response = await http_client.post(SEARCH_PATH, json=body)
+        response.raise_for_status()
+        hits = response.json().get("hits", {}).get("hits", [])
+        if hits:
+            found += len(hits)
+            yield [hit["_id"] for hit in hits]
+        if len(hits) < size or not hits[-1].get("sort"):
+            return
+        search_after = hits[-1]["sort"]
+    summary.truncated = True
@@ -0,0 +1,203 @@
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes from several processes are not serialised
+    fcntl = None
+
+from kibana_mcp.client.spaces import DEFAULT_SPACE, current_space
+from kibana_mcp.tools.utils._cursor import decode_cursor
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+DEFAULT_MAX_CHECKPOINTS = 1024
+
+# Set by the multi-worker HTTP mode to a directory every worker shares
+WORKER_STATE_DIR_ENV = "KIBANA_MCP_WORKER_STATE_DIR"
+CHECKPOINT_FILE_NAME = "alert-checkpoints.json"
+
+
+def _position(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Orders a query's checkpoints by how far they have read; unreadable ones sort first."""
+    try:
+        after = decode_cursor(entry.get("checkpoint") or "")
+    except ValueError:
+        return (0, entry.get("updated_at") or 0)
+    return (1, *after) if after and isinstance(after[0], (int, float)) else (0, entry.get("updated_at") or 0)
+
+
+def _newer(entry: Dict[str, Any], other: Optional[Dict[str, Any]]) -> bool:
+    """Whether ``entry`` has read further than ``other``."""
+    if other is None:
+        return True
+    try:
+        return _position(entry) > _position(other)
+    except TypeError:
+        return (entry.get("updated_at") or 0) > (other.get("updated_at") or 0)
+
+
+class CheckpointStore:
+    """The latest ``poll_new_alerts`` checkpoint per query, so callers need not keep it themselves.
+
+    Checkpoints are keyed by Kibana, space and search text and kept in memory
+    (bounded LRU). With ``path`` they are also written to a JSON file, so polling
+    resumes where it stopped after a restart. Several processes can share the file
+    (the HTTP mode's workers do by default): every write re-reads and merges it
+    under a file lock, and reads pick up the other processes' writes when the
+    file changes. A stored checkpoint only moves forward, keeping the one that has
+    read furthest per query, unless it is replaced (``set(..., replace=True)``,
+    e.g. to replay a query from an older checkpoint); memory and the file then
+    agree on the replacement.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_CHECKPOINTS):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._loaded = path is None
+        self._save_lock = asyncio.Lock()
+        # Serialises this process's threads; the file lock serialises processes
+        self._file_lock = threading.Lock()
+        # Identity of the file version last read; every write replaces the file with a new inode
+        self._version: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def from_env(cls) -> "CheckpointStore":
+        """Reads KIBANA_MCP_CHECKPOINT_FILE. Unset, checkpoints are kept in memory only, or with
+        several HTTP workers in a file in their shared state directory."""
+        path = os.getenv("KIBANA_MCP_CHECKPOINT_FILE") or None
+        state_dir = os.getenv(WORKER_STATE_DIR_ENV)
+        if path is None and state_dir:
+            path = os.path.join(state_dir, CHECKPOINT_FILE_NAME)
+        return cls(path=path)
+
+    @staticmethod
+    def key(http_client: Any, search_text: str) -> str:
+        """The store key of a query run through ``http_client`` in the current space."""
+        base_url = str(getattr(http_client, "base_url", "") or "")
+        return json.dumps([base_url, current_space() or DEFAULT_SPACE, search_text])
+
+    def _file_version(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._version = os.fstat(f.fileno()).st_ino, os.fstat(f.fileno()).st_mtime_ns
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            tool_logger.warning(f"Ignoring unreadable alert checkpoint file '{self.path}': {exc}")
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        return {key: entry for key, entry in entries.items() if isinstance(entry, dict)}
+
+    def _merge(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        # The file holds the last write it accepted per query, forward or replacement
+        for key, entry in entries.items():
+            current = self._entries.get(key)
+            if current is None or (entry.get("updated_at") or 0) > (current.get("updated_at") or 0):
+                self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self) -> None:
+        """Merges the file into memory when another process (or a restart) changed it."""
+        self._loaded = True
+        version = self._file_version()
+        if version is not None and version != self._version:
+            self._merge(self._read())
+
+    def get(self, key: str) -> Optional[str]:
+        if self.path is not None:
+            self._load()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry.get("checkpoint")
+
+    async def set(self, key: str, checkpoint: str, replace: bool = False) -> None:
+        """Records the checkpoint of a query and, with a file, persists every checkpoint.
+
+        The checkpoint is kept only if it has read further than the stored one, unless ``replace``.
+        """
+        if not self._loaded:
+            self._load()
+        entry = {"checkpoint": checkpoint, "updated_at": time.time()}
+        if replace or _newer(entry, self._entries.get(key)):
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        if self.path is None:
+            return
+        async with self._save_lock:
+            try:
+                entries = await asyncio.to_thread(self._write, key, entry, replace)
+            except OSError as exc:
+                tool_logger.warning(f"Could not persist alert checkpoints to '{self.path}': {exc}")
+                return
+        # The file decided this query's checkpoint; also take other processes' newer writes
+        if key in entries:
+            self._entries[key] = entries[key]
+        self._merge(entries)
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._file_lock, open(f"{self.path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def _write(self, key: str, entry: Dict[str, Any], replace: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Merges ``entry`` into the file as it is now, so other processes' checkpoints are kept.
+
+        Returns the merged checkpoints.
+        """
+        with self._locked():
+            entries = self._read()
+            if replace or _newer(entry, entries.get(key)):
+                entries[key] = entry
+            entries = dict(sorted(entries.items(), key=lambda item: item[1].get("updated_at") or 0)[-self.max_entries:])
+            # Write then rename, so a crash never leaves a half-written file behind
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+            self._version = self._file_version()
+        return entries
+
+    def stats(self) -> Dict[str, int]:
+        return {"checkpoints": len(self._entries)}
+
+
+_checkpoint_store: Optional[CheckpointStore] = None
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Returns the process-wide checkpoint store, configured from the environment on first use."""
+    global _checkpoint_store
+    if _checkpoint_store is None:
+        _checkpoint_store = CheckpointStore.from_env()
+    return _checkpoint_store
+
+
+def set_checkpoint_store(store: Optional[CheckpointStore]) -> None:
+    """Replaces the process-wide checkpoint store (None resets it to the environment default)."""
+    global _checkpoint_store
+    _checkpoint_store = store
@@ -0,0 +1,85 @@
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+# Largest page one alert search returns; walk further with the cursor
+MAX_ALERTS_PAGE = 1000
+
+# Fields matched by an alert search's free text
+ALERT_SEARCH_FIELDS: List[str] = [
+    "kibana.alert.rule.name",
+    "kibana.alert.reason",
+    "signal.rule.name",
+    "message",
+    "host.name",
+    "user.name",
+    "kibana.alert.rule.description",
+    "kibana.alert.uuid",  # Allow searching by alert UUID
+    "_id",  # Allow searching by internal _id
+]
+
+# Newest first. Alerts often share a timestamp, so the alert UUID breaks ties and makes
+# the order total, which search_after needs to neither skip nor repeat alerts between pages
+ALERT_SORT: List[Dict[str, Any]] = [
+    {"@timestamp": {"order": "desc"}},
+    {"kibana.alert.uuid": {"order": "desc", "unmapped_type": "keyword"}},
+]
+
+# Oldest first, for reading the alerts that arrived after a checkpoint in order
+ALERT_SORT_ASC: List[Dict[str, Any]] = [
+    {"@timestamp": {"order": "asc"}},
+    {"kibana.alert.uuid": {"order": "asc", "unmapped_type": "keyword"}},
+]
+
+
+def alert_search_query(search_text: str = "*", since: Optional[Union[str, int]] = None) -> Dict[str, Any]:
+    """The bool query of an alert search; ``"*"`` matches every alert.
+
+    ``since`` keeps alerts at or after a date, date math expression (e.g. ``now-1h``)
+    or epoch milliseconds.
+    """
+    bool_query: Dict[str, Any] = {"bool": {"must": [], "filter": [], "should": [], "must_not": []}}
+    if search_text != "*":
+        # Non-scoring free text match in the filter context
+        bool_query["bool"]["filter"].append({
+            "multi_match": {"query": search_text, "fields": list(ALERT_SEARCH_FIELDS)}
+        })
+    if since:
+        bool_query["bool"]["filter"].append({"range": {"@timestamp": {"gte": since}}})
+    return bool_query
+
+
+def source_filter(includes: Optional[Sequence[str]] = None,
+                  excludes: Optional[Sequence[str]] = None) -> Optional[Dict[str, List[str]]]:
+    """The ``_source`` option of a search; ``None`` or ``["*"]`` includes return all of it."""
+    source: Dict[str, List[str]] = {}
+    if includes and "*" not in includes:
+        source["includes"] = list(includes)
+    if excludes:
+        source["excludes"] = list(excludes)
+    return source or None
+
+
+def alert_search_body(search_text: str, size: int, search_after: Optional[List[Any]] = None,
+                      source: Any = None, fields: Optional[Sequence[str]] = None,
+                      since: Optional[Union[str, int]] = None,
+                      sort: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """A ``signals/search`` request for one page of alerts, after ``search_after`` when given.
+
+    ``source`` filters each hit's ``_source`` in Elasticsearch (see ``source_filter``;
+    ``False`` leaves it out), ``fields`` retrieves values through the ``fields`` API
+    into each hit's ``fields``, and ``since`` is passed to ``alert_search_query``.
+    ``sort`` defaults to ``ALERT_SORT`` (newest first).
+    """
+    body: Dict[str, Any] = {
+        "query": alert_search_query(search_text, since=since),
+        "size": size,
+        "sort": sort or ALERT_SORT,
+    }
+    if source is not None:
+        body["_source"] = source
+    if fields:
+        body["fields"] = list(fields)
+    if search_after is not None:
+        body["search_after"] = search_after
+        # The total was reported with the first page; counting it again costs Kibana a full count
+        body["track_total_hits"] = False
+    return body
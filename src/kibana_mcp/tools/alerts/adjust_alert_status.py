@@ -3,6 +3,9 @@ from typing import List, Optional, Dict
 import json
 import logging
 
+from kibana_mcp.tools.utils._alert_mirror import note_alerts_changed
+from kibana_mcp.tools.utils._write_batcher import get_write_batcher
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 async def _call_adjust_alert_status(http_client: httpx.AsyncClient, alert_id: str, new_status: str) -> str:
@@ -24,7 +27,8 @@ async def _call_adjust_alert_status(http_client: httpx.AsyncClient, alert_id: st
     }
 
     try:
-        response = await http_client.post(api_path, json=payload)
+        # Merged with concurrent status writes of the same status into one request
+        response = await get_write_batcher().post(http_client, api_path, payload, ids_key="signal_ids")
         response.raise_for_status()
         response_data = response.json()
         # Try to extract a meaningful success message, e.g., based on 'updated' count
@@ -42,4 +46,6 @@ async def _call_adjust_alert_status(http_client: httpx.AsyncClient, alert_id: st
     except Exception as e:
          result_text += f"\nUnexpected error during status update: {str(e)}"
 
+    # Even a failed request may have changed the alert
+    note_alerts_changed([alert_id])
     return result_text 
\ No newline at end of file
@@ -0,0 +1,110 @@
+import httpx
+from typing import Any, Dict, List, Optional
+import json
+import logging
+
+from kibana_mcp.tools.utils._render import render_json
+from ._query import alert_search_query
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+DEFAULT_GROUP_BY: List[str] = ["kibana.alert.rule.name", "host.name"]
+
+# Largest number of buckets one terms table returns
+MAX_BUCKETS = 100
+
+
+def _aggregations(group_by: List[str], count_distinct: List[str], interval: Optional[str], size: int) -> Dict[str, Any]:
+    """One terms table per group_by field and an optional histogram, each counting distinct values too.
+
+    Aggregations are named by position, since field names contain dots.
+    """
+    distinct = {f"distinct_{i}": {"cardinality": {"field": field}} for i, field in enumerate(count_distinct)}
+    aggs: Dict[str, Any] = dict(distinct)
+    for i, field in enumerate(group_by):
+        aggs[f"group_{i}"] = {"terms": {"field": field, "size": size}}
+        if distinct:
+            aggs[f"group_{i}"]["aggs"] = distinct
+    if interval:
+        aggs["over_time"] = {"date_histogram": {"field": "@timestamp", "fixed_interval": interval, "min_doc_count": 1}}
+        if distinct:
+            aggs["over_time"]["aggs"] = distinct
+    return aggs
+
+
+def _table(key_column: str, buckets: List[Dict[str, Any]], count_distinct: List[str], key: str = "key") -> Dict[str, Any]:
+    """Buckets as a compact table: one row of [key, alerts, distinct counts...] per bucket."""
+    columns = [key_column, "alerts"] + [f"distinct {field}" for field in count_distinct]
+    rows = [
+        [bucket.get(key), bucket.get("doc_count")]
+        + [bucket.get(f"distinct_{i}", {}).get("value") for i in range(len(count_distinct))]
+        for bucket in buckets
+    ]
+    return {"columns": columns, "rows": rows}
+
+
+def _summarize(data: Dict[str, Any], group_by: List[str], count_distinct: List[str], interval: Optional[str],
+               since: Optional[str]) -> Dict[str, Any]:
+    aggregations = data.get("aggregations") or {}
+    total = (data.get("hits") or {}).get("total")
+    summary: Dict[str, Any] = {
+        "total_alerts": total.get("value") if isinstance(total, dict) else total,
+        "since": since,
+    }
+    if count_distinct:
+        summary["distinct"] = {field: aggregations.get(f"distinct_{i}", {}).get("value")
+                               for i, field in enumerate(count_distinct)}
+    summary["groups"] = {}
+    for i, field in enumerate(group_by):
+        terms = aggregations.get(f"group_{i}", {})
+        table = _table(field, terms.get("buckets", []), count_distinct)
+        # Alerts in buckets beyond the returned size
+        table["other_alerts"] = terms.get("sum_other_doc_count", 0)
+        summary["groups"][field] = table
+    if interval:
+        buckets = aggregations.get("over_time", {}).get("buckets", [])
+        summary["over_time"] = dict(_table("time", buckets, count_distinct, key="key_as_string"), interval=interval)
+    return summary
+
+
+async def _call_aggregate_alerts(http_client: httpx.AsyncClient, group_by: Optional[List[str]] = None,
+                                 search_text: str = "*", since: Optional[str] = "now-24h",
+                                 interval: Optional[str] = None, count_distinct: Optional[List[str]] = None,
+                                 size: int = 10) -> str:
+    """Counts alerts per value of each ``group_by`` field (and over time) in Kibana, without fetching alerts.
+
+    Sends one ``size: 0`` search over the same query ``get_alerts`` builds, with a
+    terms aggregation per field, an optional ``date_histogram`` and ``cardinality``
+    counts, and returns the buckets as compact tables.
+    """
+    api_path = "/api/detection_engine/signals/search"
+    group_by = group_by if group_by is not None else DEFAULT_GROUP_BY
+    count_distinct = count_distinct or []
+    if not group_by and not count_distinct and not interval:
+        return "Error: Pass at least one group_by field, count_distinct field or interval."
+    size = max(1, min(size, MAX_BUCKETS))
+
+    payload = {
+        "query": alert_search_query(search_text, since=since),
+        "size": 0,
+        "track_total_hits": True,
+        "aggs": _aggregations(group_by, count_distinct, interval, size),
+    }
+
+    result_text = f"Attempting to aggregate alerts by {', '.join(group_by) or 'time'}..."
+    try:
+        response = await http_client.post(api_path, json=payload)
+        response.raise_for_status()
+        summary = _summarize(response.json(), group_by, count_distinct, interval, since)
+        result_text = render_json(summary, tool_name="aggregate_alerts")
+
+    except httpx.RequestError as exc:
+        result_text += f"\nError calling Kibana API ({api_path}): {exc}"
+    except httpx.HTTPStatusError as exc:
+        result_text += f"\nKibana API ({api_path}) returned error: {exc.response.status_code} - {exc.response.text}"
+    except json.JSONDecodeError:
+        result_text += f"\nError parsing JSON response from Kibana API ({api_path})."
+    except Exception as e:
+        result_text += f"\nUnexpected error during alert aggregation: {str(e)}"
+
+    return result_text
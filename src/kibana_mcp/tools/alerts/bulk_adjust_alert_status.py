@@ -0,0 +1,49 @@
+import httpx
+from typing import Any, Dict, List, Optional
+import logging
+
+from kibana_mcp.tools.utils._alert_mirror import note_alerts_changed
+from kibana_mcp.tools.utils._render import render_json
+from ._bulk import BulkSummary, listed_ids, post_update, unique_ids, update_in_chunks
+from ._query import alert_search_query
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+VALID_STATUSES = ["open", "acknowledged", "closed"]
+
+
+async def _call_bulk_adjust_alert_status(http_client: httpx.AsyncClient, new_status: str,
+                                         alert_ids: Optional[List[str]] = None, search_text: Optional[str] = None,
+                                         since: Optional[str] = None) -> str:
+    """Sets the status of many alerts: the listed ids, or every alert matching an alert search.
+
+    Ids are sent in chunks of ``BULK_CHUNK_SIZE``, ``BULK_CONCURRENCY`` requests at a
+    time. A search is sent as the query of a single request, which Kibana applies
+    as an update by query. The result sums up the outcome of every request.
+    """
+    api_path = "/api/detection_engine/signals/status"
+    if new_status not in VALID_STATUSES:
+        return f"Error: Invalid status '{new_status}'. Must be one of {VALID_STATUSES}."
+    if bool(alert_ids) == bool(search_text):
+        return "Error: Pass either alert_ids or search_text (use '*' with since to select all recent alerts)."
+
+    summary = BulkSummary()
+    if alert_ids:
+        ids = unique_ids(alert_ids)
+        tool_logger.info(f"Changing status of {len(ids)} alert(s) to {new_status}")
+
+        def payload_for(chunk: List[str]) -> Dict[str, Any]:
+            return {"signal_ids": chunk, "status": new_status}
+
+        await update_in_chunks(http_client, api_path, listed_ids(ids), payload_for, summary)
+    else:
+        tool_logger.info(f"Changing status of alerts matching '{search_text}' to {new_status}")
+        # Alerts changed concurrently are skipped and reported as version conflicts
+        payload = {"query": alert_search_query(search_text, since=since), "status": new_status, "conflicts": "proceed"}
+        data = await post_update(http_client, api_path, payload, 0, summary)
+        if data is not None:
+            # The update by query reports how many alerts matched
+            summary.requested = data.get("total", summary.updated)
+
+    note_alerts_changed(unique_ids(alert_ids) if alert_ids else None)
+    return render_json(summary.to_dict(), tool_name="bulk_adjust_alert_status")
@@ -0,0 +1,57 @@
+import httpx
+from typing import Any, Dict, List, Optional
+import json
+import logging
+
+from kibana_mcp.tools.utils._alert_mirror import note_alerts_changed
+from kibana_mcp.tools.utils._render import render_json
+from ._bulk import BulkSummary, listed_ids, matching_ids, unique_ids, update_in_chunks
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+
+async def _call_bulk_tag_alerts(http_client: httpx.AsyncClient, alert_ids: Optional[List[str]] = None,
+                                search_text: Optional[str] = None, since: Optional[str] = None,
+                                tags_to_add: Optional[List[str]] = None,
+                                tags_to_remove: Optional[List[str]] = None) -> str:
+    """Adds and removes tags on many alerts: the listed ids, or every alert matching an alert search.
+
+    The tags API only takes ids, so a search is resolved to ids page by page
+    (``_source`` disabled) and each page is tagged while the next one is fetched.
+    Ids are sent in chunks of ``BULK_CHUNK_SIZE``, ``BULK_CONCURRENCY`` requests at a
+    time, and the result sums up the outcome of every request.
+    """
+    api_path = "/api/detection_engine/signals/tags"
+    if not tags_to_add and not tags_to_remove:
+        return "Error: Pass tags_to_add and/or tags_to_remove."
+    if bool(alert_ids) == bool(search_text):
+        return "Error: Pass either alert_ids or search_text (use '*' with since to select all recent alerts)."
+
+    def payload_for(chunk: List[str]) -> Dict[str, Any]:
+        return {"ids": chunk, "tags": {"tags_to_add": tags_to_add or [], "tags_to_remove": tags_to_remove or []}}
+
+    summary = BulkSummary()
+    if alert_ids:
+        target = f"{len(alert_ids)} alert(s)"
+        id_batches = listed_ids(unique_ids(alert_ids))
+    else:
+        target = f"alerts matching '{search_text}'" + (f" since {since}" if since else "")
+        id_batches = matching_ids(http_client, search_text, since, summary)
+    result_text = f"Attempting to update tags of {target}..."
+
+    try:
+        await update_in_chunks(http_client, api_path, id_batches, payload_for, summary)
+        result_text = render_json(summary.to_dict(), tool_name="bulk_tag_alerts")
+
+    except httpx.RequestError as exc:
+        result_text += f"\nError calling Kibana API while finding the alerts: {exc}\nPartial result: {summary.to_dict()}"
+    except httpx.HTTPStatusError as exc:
+        result_text += (f"\nKibana API returned error while finding the alerts: {exc.response.status_code} - "
+                        f"{exc.response.text}\nPartial result: {summary.to_dict()}")
+    except json.JSONDecodeError:
+        result_text += f"\nError parsing JSON response while finding the alerts.\nPartial result: {summary.to_dict()}"
+    except Exception as e:
+        result_text += f"\nUnexpected error during bulk tag update: {str(e)}"
+
+    note_alerts_changed(unique_ids(alert_ids) if alert_ids else None)
+    return result_text
@@ -3,55 +3,53 @@ from typing import List, Optional, Dict
 import json
 import logging
 
+from kibana_mcp.tools.utils._alert_mirror import get_alert_mirror
+from kibana_mcp.tools.utils._cursor import decode_cursor, encode_cursor, query_hash
+from kibana_mcp.tools.utils._render import DEFAULT_ALERT_FIELDS, get_render_options, render_json
+from ._query import MAX_ALERTS_PAGE, alert_search_body, source_filter
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
-async def _call_get_alerts(http_client: httpx.AsyncClient, limit: int, search_text: str) -> str:
-    """Handles the API interaction for fetching alerts using Elasticsearch query DSL."""
+async def _call_get_alerts(http_client: httpx.AsyncClient, limit: int, search_text: str,
+                           cursor: Optional[str] = None, exclude_fields: Optional[List[str]] = None,
+                           retrieve_fields: Optional[List[str]] = None, since: Optional[str] = None,
+                           max_staleness: Optional[float] = None) -> str:
+    """Handles the API interaction for fetching one page of alerts using Elasticsearch query DSL.
+
+    Pages are at most ``MAX_ALERTS_PAGE`` alerts. When more may follow, the result
+    carries a ``next_cursor``; passing it back as ``cursor`` continues after the last
+    alert returned (``search_after`` on a total sort order). A cursor is bound to the
+    ``search_text`` and ``since`` it was issued for and rejected with any other.
+
+    The call's output projection (its ``fields``, else ``DEFAULT_ALERT_FIELDS``) is
+    sent as the search's ``_source`` includes, so Kibana only returns those fields;
+    ``exclude_fields`` become ``_source`` excludes and ``retrieve_fields`` are fetched
+    through the ``fields`` API. ``since`` keeps alerts at or after a date or date math.
+
+    When the local alert mirror is enabled (see ``AlertMirror``), the page is served
+    from it if it was synced within ``max_staleness`` seconds and holds every alert
+    the page could contain; ``max_staleness=0`` always asks Kibana.
+    """
     # Correct API endpoint for searching alert signals
     api_path = "/api/detection_engine/signals/search"
 
-    # Construct the base Elasticsearch bool query
-    bool_query: Dict = {
-        "bool": {
-            "must": [],
-            "filter": [],
-            "should": [],
-            "must_not": []
-        }
-    }
-
-    # If search_text is provided AND is not the default '*', add it as a multi_match filter
-    if search_text != "*":
-        # Place the multi_match query inside the 'filter' context for non-scoring search
-        bool_query["bool"]["filter"].append({
-            "multi_match": {
-                "query": search_text,
-                "fields": [
-                    "kibana.alert.rule.name",
-                    "kibana.alert.reason", # Added reason field
-                    "signal.rule.name",    # Kept signal.rule.name just in case
-                    "message",             # Kept message
-                    "host.name",           # Kept host.name
-                    "user.name",           # Kept user.name
-                    "kibana.alert.rule.description", # Added description
-                    "kibana.alert.uuid",   # Allow searching by alert UUID
-                    "_id"                  # Allow searching by internal _id
-                    # Add more fields as needed
-                ]
-            }
-        })
-    # If no search text, the bool query with empty clauses acts like match_all
+    query = query_hash(search_text=search_text, since=since)
+    search_after = None
+    if cursor:
+        try:
+            search_after = decode_cursor(cursor, query=query)
+        except ValueError as e:
+            return f"Error: {e} Pass the next_cursor of a previous get_alerts result, or omit cursor for the first page."
 
-    payload = {
-        "query": bool_query, # Use the constructed bool query
-        "size": limit,
-        "sort": [
-            {"@timestamp": {"order": "desc"}}
-        ]
-        # Add other potential payload fields like aggregations, _source filtering etc. if needed
-    }
+    if limit > MAX_ALERTS_PAGE:
+        tool_logger.info(f"Limiting get_alerts page from {limit} to {MAX_ALERTS_PAGE} alerts; use next_cursor for more.")
+    size = max(1, min(limit, MAX_ALERTS_PAGE))
+    output_fields = get_render_options().fields
+    includes = output_fields if output_fields is not None else DEFAULT_ALERT_FIELDS
+    payload = alert_search_body(search_text, size, search_after,
+                                source=source_filter(includes, exclude_fields), fields=retrieve_fields, since=since)
 
-    result_text = f"Attempting to fetch up to {limit} alerts (signals)"
+    result_text = f"Attempting to fetch up to {size} alerts (signals)"
     if search_text != "*":
         result_text += f" matching '{search_text}' using bool query"
     else:
@@ -59,11 +57,20 @@ async def _call_get_alerts(http_client: httpx.AsyncClient, limit: int, search_te
     result_text += "..."
 
     try:
-        # Consider adding headers={"Elastic-Api-Version": "2023-10-31"} if needed
-        response = await http_client.post(api_path, json=payload)
-        response.raise_for_status()
-        alerts_data = response.json()
-        result_text = json.dumps(alerts_data, indent=2)
+        mirror = get_alert_mirror()
+        alerts_data = None
+        if mirror is not None and not exclude_fields and not retrieve_fields:
+            alerts_data = await mirror.search(http_client, search_text, size, search_after, since=since,
+                                              fields=output_fields, max_staleness=max_staleness)
+        if alerts_data is None:
+            # Consider adding headers={"Elastic-Api-Version": "2023-10-31"} if needed
+            response = await http_client.post(api_path, json=payload)
+            response.raise_for_status()
+            alerts_data = response.json()
+        hits = alerts_data.get("hits", {}).get("hits", [])
+        # A full page means more alerts may follow
+        alerts_data["next_cursor"] = encode_cursor(hits[-1].get("sort"), query=query) if len(hits) == size else None
+        result_text = render_json(alerts_data, tool_name="get_alerts")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
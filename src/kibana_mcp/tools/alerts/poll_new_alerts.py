@@ -0,0 +1,91 @@
+import httpx
+from typing import List, Optional
+import json
+import logging
+
+from kibana_mcp.tools.utils._cursor import decode_cursor, encode_cursor
+from kibana_mcp.tools.utils._render import DEFAULT_ALERT_FIELDS, get_render_options, render_json
+from ._checkpoints import CheckpointStore, get_checkpoint_store
+from ._query import ALERT_SORT_ASC, MAX_ALERTS_PAGE, alert_search_body, source_filter
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+
+def _shown_checkpoint(text: str, checkpoint: Optional[str]) -> Optional[str]:
+    """The checkpoint in the rendered result, which moves back when the output budget dropped alerts."""
+    if not get_render_options().max_bytes:
+        return checkpoint
+    try:
+        return json.loads(text).get("checkpoint")
+    except ValueError:
+        # Cut as plain text: none of the new alerts were shown
+        return None
+
+
+async def _call_poll_new_alerts(http_client: httpx.AsyncClient, search_text: str = "*",
+                                checkpoint: Optional[str] = None, since: Optional[str] = "now-24h",
+                                limit: int = 100, exclude_fields: Optional[List[str]] = None) -> str:
+    """Fetches the alerts that arrived after a checkpoint, oldest first, and returns the next checkpoint.
+
+    A checkpoint holds the ``@timestamp`` and UUID of the last alert returned. The
+    search keeps alerts at or after that timestamp with a range filter and continues
+    after that alert with ``search_after`` on the ascending sort, so alerts sharing
+    its timestamp are neither skipped nor repeated. Without a ``checkpoint`` the
+    last one stored for this query is used, and without either the poll starts at
+    ``since``. Each result's checkpoint is stored for the query (see
+    ``CheckpointStore``), so a steady-state poll is one small search. The stored
+    checkpoint only moves forward, except after a call with an explicit
+    ``checkpoint``: its result replaces it, so a replay from an older checkpoint
+    continues from there.
+    """
+    api_path = "/api/detection_engine/signals/search"
+    store = get_checkpoint_store()
+    key = CheckpointStore.key(http_client, search_text)
+    explicit = bool(checkpoint)
+    checkpoint = checkpoint or store.get(key)
+
+    search_after = None
+    if checkpoint:
+        try:
+            search_after = decode_cursor(checkpoint)
+        except ValueError as e:
+            return f"Error: {e} Pass the checkpoint of a previous poll_new_alerts result, or omit it."
+        if not search_after or not isinstance(search_after[0], (int, float)):
+            return f"Error: Invalid checkpoint '{checkpoint}'. Pass the checkpoint of a previous poll_new_alerts result."
+
+    size = max(1, min(limit, MAX_ALERTS_PAGE))
+    output_fields = get_render_options().fields
+    includes = output_fields if output_fields is not None else DEFAULT_ALERT_FIELDS
+    payload = alert_search_body(search_text, size, search_after, source=source_filter(includes, exclude_fields),
+                                since=search_after[0] if search_after else since, sort=ALERT_SORT_ASC)
+    # Only the new alerts matter, never how many match in total
+    payload["track_total_hits"] = False
+
+    result_text = f"Attempting to poll for alerts matching '{search_text}' after checkpoint {checkpoint or since}..."
+    try:
+        response = await http_client.post(api_path, json=payload)
+        response.raise_for_status()
+        hits = response.json().get("hits", {}).get("hits", [])
+        next_checkpoint = encode_cursor(hits[-1].get("sort")) if hits else checkpoint
+        result = {
+            "alerts": hits,
+            "count": len(hits),
+            # A full page means more new alerts are waiting
+            "has_more": len(hits) == size,
+            "checkpoint": next_checkpoint,
+        }
+        result_text = render_json(result, tool_name="poll_new_alerts")
+        shown = _shown_checkpoint(result_text, next_checkpoint)
+        if shown and shown != store.get(key):
+            await store.set(key, shown, replace=explicit)
+
+    except httpx.RequestError as exc:
+        result_text += f"\nError calling Kibana API ({api_path}): {exc}"
+    except httpx.HTTPStatusError as exc:
+        result_text += f"\nKibana API ({api_path}) returned error: {exc.response.status_code} - {exc.response.text}"
+    except json.JSONDecodeError:
+        result_text += f"\nError parsing JSON response from Kibana API ({api_path})."
+    except Exception as e:
+        result_text += f"\nUnexpected error while polling alerts: {str(e)}"
+
+    return result_text
@@ -3,6 +3,9 @@ from typing import List, Optional, Dict
 import json
 import logging
 
+from kibana_mcp.tools.utils._alert_mirror import note_alerts_changed
+from kibana_mcp.tools.utils._write_batcher import get_write_batcher
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 async def _call_tag_alert(http_client: httpx.AsyncClient, alert_id: str, tags_to_add: List[str]) -> str:
@@ -23,7 +26,8 @@ async def _call_tag_alert(http_client: httpx.AsyncClient, alert_id: str, tags_to
     try:
         # The API docs mention Elastic-Api-Version header, but let's try without first
         # If issues persist, consider adding: headers={"Elastic-Api-Version": "2023-10-31"}
-        response = await http_client.post(api_path, json=payload)
+        # Merged with concurrent tag writes of the same tags into one request
+        response = await get_write_batcher().post(http_client, api_path, payload, ids_key="ids")
         response.raise_for_status()
         # Process the response which might be an Elasticsearch update-by-query response
         response_data = response.json()
@@ -38,4 +42,6 @@ async def _call_tag_alert(http_client: httpx.AsyncClient, alert_id: str, tags_to
     except Exception as e:
          result_text = f"Error processing tag update for alert {alert_id}: {str(e)}"
 
+    # Even a failed request may have changed the alert
+    note_alerts_changed([alert_id])
     return result_text 
\ No newline at end of file
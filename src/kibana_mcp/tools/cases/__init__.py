@@ -1,27 +1,8 @@
 # src/kibana_mcp/tools/cases/__init__.py
 
-from .find_cases import _call_find_cases
-from .get_case import _call_get_case
-from .create_case import _call_create_case
-from .update_case import _call_update_case
-from .delete_cases import _call_delete_cases
-from .add_case_comment import _call_add_case_comment
-from .get_case_comments import _call_get_case_comments
-from .get_case_alerts import _call_get_case_alerts
-from .get_cases_by_alert import _call_get_cases_by_alert
-from .get_case_configuration import _call_get_case_configuration
-from .get_case_tags import _call_get_case_tags
+# Tool functions are imported on first access, see kibana_mcp/tools/_manifest.py
+from .._manifest import names_in, package_getattr
 
-__all__ = [
-    '_call_find_cases',
-    '_call_get_case',
-    '_call_create_case',
-    '_call_update_case',
-    '_call_delete_cases',
-    '_call_add_case_comment',
-    '_call_get_case_comments',
-    '_call_get_case_alerts',
-    '_call_get_cases_by_alert',
-    '_call_get_case_configuration',
-    '_call_get_case_tags',
-]
+__getattr__ = package_getattr(__name__)
+
+__all__ = names_in(__name__)
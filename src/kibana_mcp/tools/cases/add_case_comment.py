@@ -3,6 +3,8 @@ from typing import List, Optional, Dict, Any, Union
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -51,7 +53,7 @@ async def _call_add_case_comment(
         response = await http_client.post(api_path, json=payload)
         response.raise_for_status()
         comment_data = response.json()
-        result_text = json.dumps(comment_data, indent=2)
+        result_text = render_json(comment_data, tool_name="add_case_comment")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
@@ -3,6 +3,8 @@ from typing import List, Optional, Dict, Any
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -56,7 +58,7 @@ async def _call_create_case(
         response = await http_client.post(api_path, json=payload)
         response.raise_for_status()
         case_data = response.json()
-        result_text = json.dumps(case_data, indent=2)
+        result_text = render_json(case_data, tool_name="create_case")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
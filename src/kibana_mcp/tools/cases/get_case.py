@@ -3,6 +3,8 @@ from typing import List, Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -16,7 +18,7 @@ async def _call_get_case(http_client: httpx.AsyncClient, case_id: str) -> str:
         response = await http_client.get(api_path)
         response.raise_for_status()
         case_data = response.json()
-        result_text = json.dumps(case_data, indent=2)
+        result_text = render_json(case_data, tool_name="get_case")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
@@ -3,6 +3,8 @@ from typing import List, Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -16,7 +18,7 @@ async def _call_get_case_alerts(http_client: httpx.AsyncClient, case_id: str) ->
         response = await http_client.get(api_path)
         response.raise_for_status()
         alerts_data = response.json()
-        result_text = json.dumps(alerts_data, indent=2)
+        result_text = render_json(alerts_data, tool_name="get_case_alerts")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
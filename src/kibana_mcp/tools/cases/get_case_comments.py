@@ -3,6 +3,8 @@ from typing import List, Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -29,7 +31,7 @@ async def _call_get_case_comments(
         response = await http_client.get(api_path, params=params)
         response.raise_for_status()
         comments_data = response.json()
-        result_text = json.dumps(comments_data, indent=2)
+        result_text = render_json(comments_data, tool_name="get_case_comments")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
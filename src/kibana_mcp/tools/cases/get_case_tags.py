@@ -3,6 +3,8 @@ from typing import List, Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -24,7 +26,7 @@ async def _call_get_case_tags(
         response = await http_client.get(api_path, params=params)
         response.raise_for_status()
         tags_data = response.json()
-        result_text = json.dumps(tags_data, indent=2)
+        result_text = render_json(tags_data, tool_name="get_case_tags")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
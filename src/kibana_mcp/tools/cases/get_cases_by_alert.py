@@ -3,6 +3,8 @@ from typing import List, Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -25,7 +27,7 @@ async def _call_get_cases_by_alert(
         response = await http_client.get(api_path, params=params)
         response.raise_for_status()
         cases_data = response.json()
-        result_text = json.dumps(cases_data, indent=2)
+        result_text = render_json(cases_data, tool_name="get_cases_by_alert")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
@@ -1,26 +1,8 @@
-# Export all tool functions from this package
-from .isolate_endpoint import _call_isolate_endpoint
-from .unisolate_endpoint import _call_unisolate_endpoint
-from .run_command_on_endpoint import _call_run_command_on_endpoint
-from .get_response_actions import _call_get_response_actions
-from .get_response_action_details import _call_get_response_action_details
-from .get_response_action_status import _call_get_response_action_status
-from .kill_process import _call_kill_process
-from .suspend_process import _call_suspend_process
-from .scan_endpoint import _call_scan_endpoint
-from .get_file_info import _call_get_file_info
-from .download_file import _call_download_file
+# src/kibana_mcp/tools/endpoint/__init__.py
 
-__all__ = [
-    '_call_isolate_endpoint',
-    '_call_unisolate_endpoint',
-    '_call_run_command_on_endpoint',
-    '_call_get_response_actions',
-    '_call_get_response_action_details',
-    '_call_get_response_action_status',
-    '_call_kill_process',
-    '_call_suspend_process',
-    '_call_scan_endpoint',
-    '_call_get_file_info',
-    '_call_download_file'
-]
+# Tool functions are imported on first access, see kibana_mcp/tools/_manifest.py
+from .._manifest import names_in, package_getattr
+
+__getattr__ = package_getattr(__name__)
+
+__all__ = names_in(__name__)
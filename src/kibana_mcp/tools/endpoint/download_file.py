@@ -3,6 +3,8 @@ import json
 import logging
 import base64
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -58,7 +60,7 @@ async def _call_download_file(
             "message": f"File downloaded successfully. File size: {len(file_content)} bytes"
         }
 
-        return json.dumps(formatted_response, indent=2)
+        return render_json(formatted_response, tool_name="download_file")
 
     except httpx.HTTPError as e:
         tool_logger.error(
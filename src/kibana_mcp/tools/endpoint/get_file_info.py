@@ -2,6 +2,8 @@ import httpx
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -45,7 +47,7 @@ async def _call_get_file_info(
             "metadata": result.get("metadata", {})
         }
 
-        return json.dumps(formatted_response, indent=2)
+        return render_json(formatted_response, tool_name="get_file_info")
 
     except httpx.HTTPError as e:
         tool_logger.error(
@@ -2,6 +2,8 @@ import httpx
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -66,7 +68,7 @@ async def _call_get_response_action_details(
         if "data" in result and "command" in result["data"]:
             formatted_response["command"] = result["data"]["command"]
 
-        return json.dumps(formatted_response, indent=2)
+        return render_json(formatted_response, tool_name="get_response_action_details")
 
     except httpx.HTTPError as e:
         tool_logger.error(
@@ -3,6 +3,8 @@ from typing import Dict, Any
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -56,7 +58,7 @@ async def _call_get_response_action_status(
             ]
         }
 
-        return json.dumps(formatted_response, indent=2)
+        return render_json(formatted_response, tool_name="get_response_action_status")
 
     except httpx.HTTPError as e:
         tool_logger.error(f"Error fetching response action status: {e}")
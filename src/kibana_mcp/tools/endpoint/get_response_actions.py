@@ -4,6 +4,8 @@ import json
 import logging
 from urllib.parse import urlencode
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -96,7 +98,7 @@ async def _call_get_response_actions(
             ]
         }
 
-        return json.dumps(formatted_response, indent=2)
+        return render_json(formatted_response, tool_name="get_response_actions")
 
     except httpx.HTTPError as e:
         tool_logger.error(f"Error fetching response actions: {e}")
@@ -3,6 +3,8 @@ from typing import List, Optional, Dict, Any
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -74,7 +76,7 @@ async def _call_kill_process(
             "message": f"Process termination started on {len(endpoint_ids)} endpoint(s)"
         }
 
-        return json.dumps(formatted_response, indent=2)
+        return render_json(formatted_response, tool_name="kill_process")
 
     except httpx.HTTPError as e:
         tool_logger.error(f"Error killing process on endpoints: {e}")
@@ -3,6 +3,8 @@ from typing import List, Optional, Dict, Any
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -71,7 +73,7 @@ async def _call_scan_endpoint(
             "message": f"Scan started on {len(endpoint_ids)} endpoint(s)"
         }
 
-        return json.dumps(formatted_response, indent=2)
+        return render_json(formatted_response, tool_name="scan_endpoint")
 
     except httpx.HTTPError as e:
         tool_logger.error(f"Error scanning endpoint: {e}")
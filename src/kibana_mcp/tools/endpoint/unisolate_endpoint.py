@@ -3,6 +3,8 @@ from typing import List, Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -58,7 +60,7 @@ async def _call_unisolate_endpoint(
             "message": f"Release from isolation action started for {len(endpoint_ids)} endpoint(s)"
         }
 
-        return json.dumps(formatted_response, indent=2)
+        return render_json(formatted_response, tool_name="unisolate_endpoint")
 
     except httpx.HTTPError as e:
         tool_logger.error(f"Error releasing endpoints from isolation: {e}")
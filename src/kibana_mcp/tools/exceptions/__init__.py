@@ -1,13 +1,8 @@
 # src/kibana_mcp/tools/exceptions/__init__.py
 
-from .get_rule_exceptions import _call_get_rule_exceptions
-from .add_rule_exception_items import _call_add_rule_exception_items
-from .create_exception_list import _call_create_exception_list
-from .associate_shared_exception_list import _call_associate_shared_exception_list
+# Tool functions are imported on first access, see kibana_mcp/tools/_manifest.py
+from .._manifest import names_in, package_getattr
 
-__all__ = [
-    '_call_get_rule_exceptions',
-    '_call_add_rule_exception_items',
-    '_call_create_exception_list',
-    '_call_associate_shared_exception_list',
-]
+__getattr__ = package_getattr(__name__)
+
+__all__ = names_in(__name__)
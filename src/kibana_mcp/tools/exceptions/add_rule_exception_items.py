@@ -5,13 +5,16 @@ import logging
 from pydantic import ValidationError
 
 from kibana_mcp.models.exception_models import AddRuleExceptionItemsRequest, ExceptionItem
+from kibana_mcp.tools.utils._rule_resolver import rule_id_resolver, RULES_API_PATH
+from kibana_mcp.tools.utils._render import render_json
 
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 async def _call_add_rule_exception_items(http_client: httpx.AsyncClient, rule_id: str, items: List[Dict]) -> str:
     """Handles the API interaction for adding exception items to a rule's list.
     
-    Now accepts the human-readable rule_id and automatically looks up the internal UUID.
+    Now accepts the human-readable rule_id and resolves the internal UUID through the
+    shared rule_id resolver.
     Uses Pydantic models for input validation.
     """
     # Validate input using Pydantic models
@@ -23,24 +26,14 @@ async def _call_add_rule_exception_items(http_client: httpx.AsyncClient, rule_id
     except ValidationError as e:
         return f"Input validation error: {str(e)}"
     
-    # First, look up the internal UUID using the rule_id
-    get_rule_api_path = f"/api/detection_engine/rules?rule_id={rule_id}"
-    
     try:
-        # 1. Get the rule configuration to find the internal UUID
-        result_text += f"\nFetching rule configuration from {get_rule_api_path}..."
-        get_rule_response = await http_client.get(get_rule_api_path)
-        get_rule_response.raise_for_status()
-        rule_config = get_rule_response.json()
-        
-        # Extract internal ID (UUID)
-        rule_internal_id = rule_config.get("id")
+        # 1. Resolve the internal UUID from the rule_id (cached after the first lookup)
+        rule_internal_id = await rule_id_resolver.resolve(http_client, rule_id)
         if not rule_internal_id:
-            result_text += "\nError: Could not extract internal 'id' (UUID) from fetched rule configuration."
-            result_text += f"\nResponse: {json.dumps(rule_config, indent=2)}"
+            result_text += f"\nKibana API returned 404: Rule with rule_id '{rule_id}' not found."
             return result_text
             
-        result_text += f"\nSuccessfully fetched rule configuration. Internal UUID: {rule_internal_id}"
+        result_text += f"\nResolved rule_id '{rule_id}' to internal UUID: {rule_internal_id}"
         
         # 2. Now use the internal UUID to add exceptions
         api_path = f"/api/detection_engine/rules/{rule_internal_id}/exceptions"
@@ -65,13 +58,16 @@ async def _call_add_rule_exception_items(http_client: httpx.AsyncClient, rule_id
         response.raise_for_status()
         # Response contains the created items with their IDs
         response_data = response.json()
-        result_text += f"\nSuccessfully added items to rule '{rule_id}' (internal UUID: '{rule_internal_id}'). Response:\n{json.dumps(response_data, indent=2)}"
+        result_text += f"\nSuccessfully added items to rule '{rule_id}' (internal UUID: '{rule_internal_id}'). Response:\n{render_json(response_data, tool_name='add_rule_exception_items')}"
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API: {exc}"
     except httpx.HTTPStatusError as exc:
         # Provide more context based on which request failed
-        failed_op = "fetching rule" if get_rule_api_path in exc.request.url.path else "adding exceptions"
+        failed_op = "fetching rule" if exc.request.url.path == RULES_API_PATH else "adding exceptions"
+        if failed_op == "adding exceptions" and exc.response.status_code == 404:
+            # The rule may have been deleted and recreated under a new UUID
+            rule_id_resolver.forget(http_client, rule_id)
         result_text += f"\nKibana API error during {failed_op}: {exc.response.status_code} - {exc.response.text}"
     except json.JSONDecodeError as exc:
         result_text += f"\nError parsing JSON response from Kibana API: {exc}"
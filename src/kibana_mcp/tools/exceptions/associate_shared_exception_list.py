@@ -3,6 +3,9 @@ from typing import List, Optional, Dict
 import json
 import logging
 
+from kibana_mcp.tools.utils._rule_resolver import rule_id_resolver
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 # Renamed function
@@ -53,6 +56,8 @@ async def _call_associate_shared_exception_list(
             result_text += "\\nError: Could not extract internal 'id' (UUID) from fetched rule configuration."
             result_text += f"\\nResponse: {json.dumps(rule_config, indent=2)}"
             return result_text
+        # The rule had to be fetched for its exceptions_list anyway, so seed the resolver
+        rule_id_resolver.remember(http_client, rule_id, rule_internal_id)
             
         result_text += "\\nSuccessfully fetched rule configuration."
             
@@ -96,7 +101,7 @@ async def _call_associate_shared_exception_list(
         patch_response.raise_for_status()
         updated_rule_data = patch_response.json()
         result_text += f"\\nSuccessfully associated shared exception list '{exception_list_id}' with rule '{rule_id}' (internal ID: '{rule_internal_id}')."
-        result_text += f"\\nUpdate Response:\\n{json.dumps(updated_rule_data, indent=2)}"
+        result_text += f"\\nUpdate Response:\\n{render_json(updated_rule_data, tool_name='associate_shared_exception_list')}"
 
     except httpx.RequestError as exc:
         result_text += f"\\nError calling Kibana API: {exc}"
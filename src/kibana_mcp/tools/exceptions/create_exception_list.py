@@ -3,6 +3,8 @@ from typing import List, Optional, Dict
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 async def _call_create_exception_list(
@@ -50,7 +52,7 @@ async def _call_create_exception_list(
         response_data = response.json()
         created_id = response_data.get('id', 'N/A') # Get the Kibana internal ID
         result_text += f"\\nSuccessfully created exception list. Internal ID: {created_id}"
-        result_text += f"\\nResponse:\\n{json.dumps(response_data, indent=2)}"
+        result_text += f"\\nResponse:\\n{render_json(response_data, tool_name='create_exception_list')}"
 
     except httpx.RequestError as exc:
         result_text += f"\\nError calling Kibana API ({api_path}): {exc}"
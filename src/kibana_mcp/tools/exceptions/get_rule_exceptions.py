@@ -3,33 +3,27 @@ from typing import List, Optional, Dict
 import json
 import logging
 
+from kibana_mcp.tools.utils._rule_resolver import rule_id_resolver, RULES_API_PATH
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 async def _call_get_rule_exceptions(http_client: httpx.AsyncClient, rule_id: str) -> str:
     """Handles the API interaction for retrieving exceptions associated with a rule.
     
-    Now accepts the human-readable rule_id and automatically looks up the internal UUID.
+    Now accepts the human-readable rule_id and resolves the internal UUID through the
+    shared rule_id resolver, so repeat calls skip the rule lookup.
     """
     result_text = f"Attempting to retrieve exceptions for rule with rule_id '{rule_id}'..."
     
-    # First, look up the internal UUID using the rule_id
-    get_rule_api_path = f"/api/detection_engine/rules?rule_id={rule_id}"
-    
     try:
-        # 1. Get the rule configuration to find the internal UUID
-        result_text += f"\nFetching rule configuration from {get_rule_api_path}..."
-        get_rule_response = await http_client.get(get_rule_api_path)
-        get_rule_response.raise_for_status()
-        rule_config = get_rule_response.json()
-        
-        # Extract internal ID (UUID)
-        rule_internal_id = rule_config.get("id")
+        # 1. Resolve the internal UUID from the rule_id (cached after the first lookup)
+        rule_internal_id = await rule_id_resolver.resolve(http_client, rule_id)
         if not rule_internal_id:
-            result_text += "\nError: Could not extract internal 'id' (UUID) from fetched rule configuration."
-            result_text += f"\nResponse: {json.dumps(rule_config, indent=2)}"
+            result_text += f"\nKibana API returned 404: Rule with rule_id '{rule_id}' not found."
             return result_text
             
-        result_text += f"\nSuccessfully fetched rule configuration. Internal UUID: {rule_internal_id}"
+        result_text += f"\nResolved rule_id '{rule_id}' to internal UUID: {rule_internal_id}"
         
         # 2. Now use the internal UUID to get exceptions
         api_path = f"/api/detection_engine/rules/{rule_internal_id}/exceptions"
@@ -40,18 +34,20 @@ async def _call_get_rule_exceptions(http_client: httpx.AsyncClient, rule_id: str
         response.raise_for_status()
         exceptions_data = response.json()
         # Format the output for readability
-        result_text = f"Exceptions for rule '{rule_id}' (internal UUID: '{rule_internal_id}'):\n{json.dumps(exceptions_data, indent=2)}"
+        result_text = f"Exceptions for rule '{rule_id}' (internal UUID: '{rule_internal_id}'):\n{render_json(exceptions_data, tool_name='get_rule_exceptions')}"
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API: {exc}"
     except httpx.HTTPStatusError as exc:
         # Provide more context based on which request failed
-        if get_rule_api_path in exc.request.url.path:
+        if exc.request.url.path == RULES_API_PATH:
             failed_op = "fetching rule"
         else:
             failed_op = "retrieving exceptions"
             # Handle 404 specifically - rule might not exist or have no exceptions/list
             if exc.response.status_code == 404:
+                # The rule may have been deleted and recreated under a new UUID
+                rule_id_resolver.forget(http_client, rule_id)
                 result_text += f"\nKibana API returned 404: Rule not found or no exception list associated."
                 return result_text
                 
@@ -1,17 +1,8 @@
 # src/kibana_mcp/tools/rules/__init__.py
 
-from .get_rule import _call_get_rule
-from .delete_rule import _call_delete_rule
-from .update_rule_status import _call_update_rule_status
-from .find_rules import _call_find_rules
-from .get_prepackaged_rules_status import _call_get_prepackaged_rules_status
-from .install_prepackaged_rules import _call_install_prepackaged_rules
+# Tool functions are imported on first access, see kibana_mcp/tools/_manifest.py
+from .._manifest import names_in, package_getattr
 
-__all__ = [
-    '_call_get_rule',
-    '_call_delete_rule',
-    '_call_update_rule_status',
-    '_call_find_rules',
-    '_call_get_prepackaged_rules_status',
-    '_call_install_prepackaged_rules',
-]
+__getattr__ = package_getattr(__name__)
+
+__all__ = names_in(__name__)
@@ -3,6 +3,8 @@ from typing import Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._rule_resolver import rule_id_resolver
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -39,6 +41,11 @@ async def _call_delete_rule(
         rule_name = response_data.get("name", "Unknown rule")
         rule_id_value = response_data.get("rule_id", "Unknown rule_id")
 
+        # A recreated rule gets a new UUID, so drop the cached mapping
+        deleted_rule_id = rule_id or response_data.get("rule_id")
+        if deleted_rule_id:
+            rule_id_resolver.forget(http_client, deleted_rule_id)
+
         return f"Successfully deleted rule '{rule_name}' (rule_id: {rule_id_value})"
 
     except httpx.RequestError as exc:
@@ -5,6 +5,7 @@ import logging
 from pydantic import ValidationError
 
 from kibana_mcp.models.rule_models import FindRulesRequest
+from kibana_mcp.tools.utils._render import render_json
 
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
@@ -54,7 +55,7 @@ async def _call_find_rules(
         response = await http_client.get(api_path, params=params)
         response.raise_for_status()
         response_data = response.json()
-        result_text = json.dumps(response_data, indent=2)
+        result_text = render_json(response_data, tool_name="find_rules")
 
     except httpx.RequestError as exc:
         result_text += f"\nError calling Kibana API ({api_path}): {exc}"
@@ -3,6 +3,9 @@ from typing import Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._rule_resolver import rule_id_resolver
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -34,6 +37,8 @@ async def _call_get_rule(
 
         # Process the response
         response_data = response.json()
+        if response_data.get("rule_id") and response_data.get("id"):
+            rule_id_resolver.remember(http_client, response_data["rule_id"], response_data["id"])
 
         # Format the result in a user-friendly way
         formatted_result = {
@@ -62,7 +67,7 @@ async def _call_get_rule(
             formatted_result["execution_summary"] = response_data["execution_summary"]
 
         # Return a nicely formatted JSON string of the result
-        return f"Rule fetched successfully:\n\n{json.dumps(formatted_result, indent=2)}"
+        return f"Rule fetched successfully:\n\n{render_json(formatted_result, tool_name='get_rule')}"
 
     except httpx.RequestError as exc:
         return f"Error connecting to Kibana API ({api_path}): {exc}"
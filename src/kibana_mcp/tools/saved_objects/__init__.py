@@ -1,21 +1,8 @@
 # src/kibana_mcp/tools/saved_objects/__init__.py
 
-from .find_objects import _call_find_objects
-from .get_object import _call_get_object
-from .bulk_get_objects import _call_bulk_get_objects
-from .create_object import _call_create_object
-from .update_object import _call_update_object
-from .delete_object import _call_delete_object
-from .export_objects import _call_export_objects
-from .import_objects import _call_import_objects
+# Tool functions are imported on first access, see kibana_mcp/tools/_manifest.py
+from .._manifest import names_in, package_getattr
 
-__all__ = [
-    '_call_find_objects',
-    '_call_get_object',
-    '_call_bulk_get_objects',
-    '_call_create_object',
-    '_call_update_object',
-    '_call_delete_object',
-    '_call_export_objects',
-    '_call_import_objects',
-]
+__getattr__ = package_getattr(__name__)
+
+__all__ = names_in(__name__)
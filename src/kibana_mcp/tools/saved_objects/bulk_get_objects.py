@@ -3,6 +3,8 @@ from typing import List, Dict, Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -45,7 +47,7 @@ async def _call_bulk_get_objects(
         )
         response.raise_for_status()
         result = response.json()
-        return json.dumps(result, indent=2)
+        return render_json(result, tool_name="bulk_get_objects")
 
     except httpx.HTTPError as e:
         error_msg = f"Error retrieving saved objects in bulk: {str(e)}"
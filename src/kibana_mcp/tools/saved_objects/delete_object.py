@@ -3,6 +3,8 @@ from typing import Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -43,7 +45,7 @@ async def _call_delete_object(
             }, indent=2)
 
         result = response.json()
-        return json.dumps(result, indent=2)
+        return render_json(result, tool_name="delete_object")
 
     except httpx.HTTPError as e:
         error_msg = f"Error deleting saved object: {str(e)}"
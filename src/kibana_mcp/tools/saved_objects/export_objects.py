@@ -3,6 +3,8 @@ from typing import List, Dict, Optional, Any
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -65,12 +67,12 @@ async def _call_export_objects(
                         result.append(json.loads(line))
                     except json.JSONDecodeError:
                         continue
-            return json.dumps(result, indent=2)
+            return render_json(result, tool_name="export_objects")
         else:
             # Regular JSON response
             try:
                 result = response.json()
-                return json.dumps(result, indent=2)
+                return render_json(result, tool_name="export_objects")
             except json.JSONDecodeError:
                 # If not valid JSON but successful HTTP response, return raw text
                 return json.dumps({
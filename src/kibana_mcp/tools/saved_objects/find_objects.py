@@ -3,6 +3,8 @@ from typing import Optional, Dict, Any, List
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 # Default values to limit response size
@@ -109,7 +111,7 @@ async def _call_find_objects(
         if warnings:
             formatted_result["warnings"] = warnings
 
-        return json.dumps(formatted_result, indent=2)
+        return render_json(formatted_result, tool_name="find_objects")
 
     except httpx.HTTPError as e:
         error_msg = f"Error finding saved objects: {str(e)}"
@@ -3,6 +3,8 @@ from typing import Optional, List
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -38,7 +40,7 @@ async def _call_get_object(
         )
         response.raise_for_status()
         result = response.json()
-        return json.dumps(result, indent=2)
+        return render_json(result, tool_name="get_object")
 
     except httpx.HTTPError as e:
         error_msg = f"Error retrieving saved object: {str(e)}"
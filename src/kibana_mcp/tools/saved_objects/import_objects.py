@@ -3,6 +3,8 @@ from typing import Optional, List
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -44,7 +46,7 @@ async def _call_import_objects(
         )
         response.raise_for_status()
         result = response.json()
-        return json.dumps(result, indent=2)
+        return render_json(result, tool_name="import_objects")
 
     except httpx.HTTPError as e:
         error_msg = f"Error importing saved objects: {str(e)}"
@@ -3,6 +3,8 @@ from typing import Dict, Any, Optional
 import json
 import logging
 
+from kibana_mcp.tools.utils._render import render_json
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 
@@ -50,7 +52,7 @@ async def _call_update_object(
         )
         response.raise_for_status()
         result = response.json()
-        return json.dumps(result, indent=2)
+        return render_json(result, tool_name="update_object")
 
     except httpx.HTTPError as e:
         error_msg = f"Error updating saved object: {str(e)}"
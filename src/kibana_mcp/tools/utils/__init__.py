@@ -1,7 +1,64 @@
 # src/kibana_mcp/tools/utils/__init__.py
 
+import importlib
+from typing import Any
+
 from ._utils import execute_tool_safely
+from ._cache import ResponseCache, NullCache, CACHE_EVENT_HOOKS, get_response_cache, set_response_cache
+from ._rule_resolver import RuleIdResolver, rule_id_resolver
+from ._deadlines import ToolBudgets, get_tool_budgets, set_tool_budgets
+from ._render import render_json, RenderOptions, RenderProfile, RENDER_PROFILES, DEFAULT_ALERT_FIELDS
 
 __all__ = [
     'execute_tool_safely',
+    'ResponseCache',
+    'NullCache',
+    'CACHE_EVENT_HOOKS',
+    'get_response_cache',
+    'set_response_cache',
+    'RuleIdResolver',
+    'rule_id_resolver',
+    'AlertWriteBatcher',
+    'get_write_batcher',
+    'set_write_batcher',
+    'AlertCache',
+    'get_alert_cache',
+    'set_alert_cache',
+    'AlertMirror',
+    'AlertMirrorSettings',
+    'get_alert_mirror',
+    'set_alert_mirror',
+    'close_alert_mirror',
+    'ToolBudgets',
+    'get_tool_budgets',
+    'set_tool_budgets',
+    'render_json',
+    'RenderOptions',
+    'RenderProfile',
+    'RENDER_PROFILES',
+    'DEFAULT_ALERT_FIELDS',
 ]
+
+# Imported on first access, like the tool modules: only the alert tools need the
+# write batcher, alert cache and mirror (and the mirror's sqlite3), so importing
+# the server does not load them
+_LAZY_NAMES = {
+    'AlertWriteBatcher': '._write_batcher',
+    'get_write_batcher': '._write_batcher',
+    'set_write_batcher': '._write_batcher',
+    'AlertCache': '._alert_cache',
+    'get_alert_cache': '._alert_cache',
+    'set_alert_cache': '._alert_cache',
+    'AlertMirror': '._alert_mirror',
+    'AlertMirrorSettings': '._alert_mirror',
+    'get_alert_mirror': '._alert_mirror',
+    'set_alert_mirror': '._alert_mirror',
+    'close_alert_mirror': '._alert_mirror',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    return getattr(importlib.import_module(module, __name__), name)
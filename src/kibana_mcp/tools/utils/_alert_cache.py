@@ -0,0 +1,142 @@
+import httpx
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from kibana_mcp.client._env import env_float, env_int
+from kibana_mcp.client.spaces import current_space
+from ._render import DEFAULT_ALERT_FIELDS
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+SEARCH_PATH = "/api/detection_engine/signals/search"
+
+# Enough to attach an alert as context: the list fields plus what happened
+RESOURCE_ALERT_FIELDS = DEFAULT_ALERT_FIELDS + ["kibana.alert.reason", "message"]
+
+
+class AlertCache:
+    """Caches single alerts fetched by id per Kibana client and space, for ``alert://`` reads.
+
+    Each miss is one ids search for the projected ``RESOURCE_ALERT_FIELDS``. Entries
+    are kept for ``ttl`` seconds (bounded LRU), and dropped as soon as one of our
+    tools changes the alert's status or tags (see ``note_alerts_changed``), so the
+    next read fetches it again.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._by_client: "weakref.WeakKeyDictionary[object, Dict[str, OrderedDict[str, Tuple[Dict[str, Any], float]]]]" = weakref.WeakKeyDictionary()
+        # Bumped by every invalidation, so a fetch that raced a change is not cached
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "AlertCache":
+        """Reads KIBANA_MCP_ALERT_CACHE_SIZE and KIBANA_MCP_ALERT_CACHE_TTL (seconds, 0 disables caching)."""
+        return cls(max_entries=env_int("KIBANA_MCP_ALERT_CACHE_SIZE", 1024),
+                   ttl=env_float("KIBANA_MCP_ALERT_CACHE_TTL", 60.0))
+
+    def _entries(self, http_client) -> "OrderedDict[str, Tuple[Dict[str, Any], float]]":
+        spaces = self._by_client.get(http_client)
+        if spaces is None:
+            spaces = self._by_client[http_client] = {}
+        space = current_space() or ""
+        entries = spaces.get(space)
+        if entries is None:
+            entries = spaces[space] = OrderedDict()
+        return entries
+
+    def _lookup(self, http_client, alert_id: str) -> Optional[Dict[str, Any]]:
+        entries = self._entries(http_client)
+        entry = entries.get(alert_id)
+        if entry is None:
+            return None
+        alert, expires_at = entry
+        if expires_at <= self._clock():
+            del entries[alert_id]
+            return None
+        entries.move_to_end(alert_id)
+        return alert
+
+    def _remember(self, http_client, alert_id: str, alert: Dict[str, Any]) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        entries = self._entries(http_client)
+        entries[alert_id] = (alert, self._clock() + self.ttl)
+        entries.move_to_end(alert_id)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def forget(self, alert_ids: Optional[Sequence[str]] = None) -> None:
+        """Drops those alerts for every client and space, or every alert when None."""
+        self._generation += 1
+        if alert_ids is None:
+            self._by_client.clear()
+            return
+        for spaces in list(self._by_client.values()):
+            for entries in spaces.values():
+                for alert_id in alert_ids:
+                    entries.pop(alert_id, None)
+
+    async def get(self, http_client: httpx.AsyncClient, alert_id: str) -> Optional[Dict[str, Any]]:
+        """Returns the alert hit (``_id``, ``_index``, projected ``_source``), or None if no alert has that id.
+
+        Raises httpx errors when the search fails.
+        """
+        alert = self._lookup(http_client, alert_id)
+        if alert is not None:
+            self.hits += 1
+            return alert
+        self.misses += 1
+
+        generation = self._generation
+        payload = {
+            "query": {"ids": {"values": [alert_id]}},
+            "size": 1,
+            "track_total_hits": False,
+            "_source": {"includes": RESOURCE_ALERT_FIELDS},
+        }
+        response = await http_client.post(SEARCH_PATH, json=payload)
+        response.raise_for_status()
+        hits = response.json().get("hits", {}).get("hits", [])
+        if not hits:
+            return None
+        hit = hits[0]
+        alert = {"_id": hit.get("_id", alert_id), "_index": hit.get("_index"), "_source": hit.get("_source") or {}}
+        if generation == self._generation:
+            self._remember(http_client, alert_id, alert)
+        return alert
+
+    def clear(self) -> None:
+        """Drops every cached alert for every client."""
+        self._by_client.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "alerts": sum(len(entries) for spaces in list(self._by_client.values()) for entries in spaces.values()),
+        }
+
+
+_alert_cache: Optional[AlertCache] = None
+
+
+def get_alert_cache() -> AlertCache:
+    """Returns the process-wide alert cache, configured from the environment on first use."""
+    global _alert_cache
+    if _alert_cache is None:
+        _alert_cache = AlertCache.from_env()
+    return _alert_cache
+
+
+def set_alert_cache(cache: Optional[AlertCache]) -> None:
+    """Replaces the process-wide alert cache (None resets it to the environment default)."""
+    global _alert_cache
+    _alert_cache = cache
@@ -0,0 +1,542 @@
+import asyncio
+import contextvars
+import httpx
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+from kibana_mcp.client._env import env_bool, env_float, env_int
+from kibana_mcp.client.spaces import current_space
+from ._alert_cache import get_alert_cache
+from ._render import DEFAULT_ALERT_FIELDS, _project
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+SEARCH_PATH = "/api/detection_engine/signals/search"
+
+# Alerts per sync request
+SYNC_PAGE_SIZE = 1000
+
+# Status changes are looked up from this long before the previous sync started,
+# so updates that became searchable after it ran are not missed
+STATUS_CHANGE_LAG_MS = 30_000
+
+# Free-text alert fields: matched word by word, like the analyzed fields in Kibana.
+# The other searched fields hold identifiers and only match the whole search text.
+_TEXT_FIELDS = ("kibana.alert.reason", "message", "kibana.alert.rule.description")
+
+# Fetched by the sync: the lean alert plus the text the search matches on
+_SYNC_FIELDS = list(dict.fromkeys(DEFAULT_ALERT_FIELDS + list(_TEXT_FIELDS)))
+
+_WORD = re.compile(r"\w+")
+_DATE_MATH = re.compile(r"^now(?:-(\d+)([smhdw]))?$")
+_UNIT_MS = {"s": 1000, "m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+# Bumped when the tables change; a mirror file of another version is rebuilt
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS alerts (
+    id TEXT PRIMARY KEY,
+    uuid TEXT NOT NULL,
+    index_name TEXT,
+    timestamp INTEGER NOT NULL,
+    rule_name TEXT,
+    host_name TEXT,
+    user_name TEXT,
+    status TEXT,
+    source TEXT NOT NULL,
+    -- Generation of the last full refresh (or of the sync after it) that saw the alert
+    seen INTEGER NOT NULL DEFAULT 0
+);
+-- Words of the free-text fields, one row per word and alert
+CREATE TABLE IF NOT EXISTS alert_words (
+    word TEXT NOT NULL,
+    id TEXT NOT NULL REFERENCES alerts (id) ON DELETE CASCADE,
+    PRIMARY KEY (word, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS alert_words_by_alert ON alert_words (id);
+CREATE INDEX IF NOT EXISTS alerts_by_time ON alerts (timestamp DESC, uuid DESC);
+CREATE INDEX IF NOT EXISTS alerts_by_uuid ON alerts (uuid);
+CREATE INDEX IF NOT EXISTS alerts_by_rule ON alerts (rule_name, timestamp);
+CREATE INDEX IF NOT EXISTS alerts_by_host ON alerts (host_name, timestamp);
+CREATE INDEX IF NOT EXISTS alerts_by_user ON alerts (user_name, timestamp);
+CREATE INDEX IF NOT EXISTS alerts_by_status ON alerts (status, timestamp);
+"""
+
+
+def _field(source: Dict[str, Any], path: str) -> Any:
+    """A dotted field of an alert ``_source``, whether stored flattened, nested or mixed."""
+    if path in source:
+        return source[path]
+    head, _, rest = path.partition(".")
+    while rest:
+        value = source.get(head)
+        if isinstance(value, dict):
+            found = _field(value, rest)
+            if found is not None:
+                return found
+        part, _, rest = rest.partition(".")
+        head = f"{head}.{part}"
+    return None
+
+
+def _text(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return None if value is None else str(value)
+
+
+def since_ms(since: Any, now_ms: int) -> Optional[int]:
+    """Epoch milliseconds of a ``since`` bound (epoch ms, ISO date or ``now-<n><s|m|h|d|w>``), None if unsupported."""
+    if isinstance(since, (int, float)):
+        return int(since)
+    if not isinstance(since, str):
+        return None
+    match = _DATE_MATH.match(since.strip())
+    if match:
+        amount, unit = match.groups()
+        return now_ms - (int(amount) * _UNIT_MS[unit] if amount else 0)
+    try:
+        parsed = datetime.fromisoformat(since.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+@dataclass(frozen=True)
+class AlertMirrorSettings:
+    """Configuration of the local alert mirror (disabled unless ``enabled``)."""
+    enabled: bool = False
+    path: str = ":memory:"
+    sync_interval: float = 15.0
+    full_refresh_interval: float = 600.0
+    retention: float = 86_400.0
+    max_alerts: int = 100_000
+    max_staleness: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "AlertMirrorSettings":
+        """Reads KIBANA_MCP_ALERT_MIRROR (true enables it), KIBANA_MCP_ALERT_MIRROR_PATH,
+        KIBANA_MCP_ALERT_MIRROR_INTERVAL, KIBANA_MCP_ALERT_MIRROR_FULL_REFRESH,
+        KIBANA_MCP_ALERT_MIRROR_RETENTION_HOURS, KIBANA_MCP_ALERT_MIRROR_MAX_ALERTS and
+        KIBANA_MCP_ALERT_MIRROR_MAX_STALENESS."""
+        return cls(
+            enabled=env_bool("KIBANA_MCP_ALERT_MIRROR", cls.enabled),
+            path=os.getenv("KIBANA_MCP_ALERT_MIRROR_PATH") or cls.path,
+            sync_interval=env_float("KIBANA_MCP_ALERT_MIRROR_INTERVAL", cls.sync_interval),
+            full_refresh_interval=env_float("KIBANA_MCP_ALERT_MIRROR_FULL_REFRESH", cls.full_refresh_interval),
+            retention=env_float("KIBANA_MCP_ALERT_MIRROR_RETENTION_HOURS", cls.retention / 3600) * 3600,
+            max_alerts=env_int("KIBANA_MCP_ALERT_MIRROR_MAX_ALERTS", cls.max_alerts),
+            max_staleness=env_float("KIBANA_MCP_ALERT_MIRROR_MAX_STALENESS", cls.max_staleness),
+        )
+
+
+class AlertMirror:
+    """Mirrors the recent alerts of one Kibana client's default space into SQLite.
+
+    A background task, started by the first ``search``, pulls every ``sync_interval``
+    seconds the alerts newer than the last one mirrored (ascending ``search_after``)
+    and the alerts whose ``kibana.alert.workflow_status_updated_at`` moved since the
+    previous sync, so status changes made in Kibana or by another worker show up
+    with the next sync. Every ``full_refresh_interval`` seconds it re-reads the whole
+    retention window, which also picks up tag changes made outside this server and
+    drops the mirrored alerts of the window it no longer finds. Alerts older than ``retention`` or beyond ``max_alerts`` are dropped. Only lean
+    fields are kept, with indexes on rule, host, user, status and timestamp.
+
+    ``search`` answers a ``get_alerts`` page locally when the last sync is recent
+    enough and the mirror holds every alert the page could contain, and returns None
+    otherwise. Alerts changed by this server's tag and status tools are re-read
+    before the mirror answers again.
+
+    SQLite work runs in worker threads (one at a time), so the event loop never
+    waits on a large store or query.
+    """
+
+    def __init__(self, settings: AlertMirrorSettings, now_ms: Callable[[], int] = lambda: int(time.time() * 1000),
+                 clock: Callable[[], float] = time.monotonic):
+        self.settings = settings
+        self._now_ms = now_ms
+        self._clock = clock
+        # Imported here, so tools that only notify the mirror do not load sqlite3 while it is disabled
+        import sqlite3
+        self._db = sqlite3.connect(settings.path, check_same_thread=False)
+        # The connection is shared by the worker threads, one statement batch at a time
+        self._lock = threading.Lock()
+        # Pruned alerts take their words with them
+        self._db.execute("PRAGMA foreign_keys = ON")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            # Only a copy of Kibana's alerts, so an older layout is dropped rather than migrated
+            self._db.executescript("DROP TABLE IF EXISTS alert_words; DROP TABLE IF EXISTS alerts;")
+            self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._db.executescript(_SCHEMA)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        # Sort values of the newest alert mirrored; the next sync continues after it
+        self._after: Optional[List[Any]] = None
+        self._synced_at: Optional[float] = None
+        # Epoch ms at which the last sync started; the next one looks for status changes after it
+        self._synced_ms: Optional[int] = None
+        self._refreshed_at: Optional[float] = None
+        # Stamped on the rows each full refresh reads; rows of the window it did not read are gone from Kibana
+        self._generation = 0
+        self._covered_from = 0
+        self._count = 0
+        self._dirty: Set[str] = set()
+        self._stale = True
+        self.served = 0
+        self.fallbacks = 0
+        self.syncs = 0
+        self.sync_errors = 0
+
+    # --- Sync ---
+
+    def start(self, http_client: httpx.AsyncClient) -> None:
+        """Starts the background sync for ``http_client`` (a no-op when already running)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._client = http_client
+        self._wake = asyncio.Event()
+        # A fresh context: the sync must not inherit the space, deadline or trace of the call that started it
+        self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._client = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _next_sync_in(self) -> Optional[float]:
+        """Seconds until the next incremental sync or full refresh is due, None before the first sync."""
+        if self._synced_at is None or self._refreshed_at is None:
+            return None
+        now = self._clock()
+        return min(self._synced_at + self.settings.sync_interval,
+                   self._refreshed_at + self.settings.full_refresh_interval) - now
+
+    async def _run(self) -> None:
+        import sqlite3
+        interval = self.settings.sync_interval
+        while True:
+            delay = self._next_sync_in()
+            if delay is None or delay <= 0 or self._stale or self._dirty:
+                try:
+                    await self.sync_once()
+                except (httpx.HTTPError, ValueError, sqlite3.Error) as exc:
+                    # Retried after the interval; meanwhile calls go to Kibana once the mirror is too old
+                    self.sync_errors += 1
+                    tool_logger.warning(f"Alert mirror sync failed: {exc}")
+                    delay = interval
+                else:
+                    delay = self._next_sync_in()
+                    delay = interval if delay is None else max(delay, 0.0)
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def sync_once(self, http_client: Optional[httpx.AsyncClient] = None) -> int:
+        """Pulls new (or, when due, all recent) alerts and re-reads changed ones. Returns the alerts stored."""
+        # Imported here, like the tool modules themselves, so importing the server does not load them
+        from kibana_mcp.tools.alerts._query import ALERT_SORT_ASC, alert_search_body
+
+        http_client = http_client or self._client
+        started_at = self._clock()
+        now_ms = self._now_ms()
+        full = self._stale or self._refreshed_at is None or \
+            started_at - self._refreshed_at >= self.settings.full_refresh_interval
+        window_start = now_ms - int(self.settings.retention * 1000)
+        if full:
+            self._generation += 1
+        generation = self._generation
+        dirty, self._dirty = self._dirty, set()
+        stored = 0
+        try:
+            after = None if full else self._after
+            while True:
+                body = alert_search_body("*", SYNC_PAGE_SIZE, after, source={"includes": _SYNC_FIELDS},
+                                         since=after[0] if after else window_start, sort=ALERT_SORT_ASC)
+                body["track_total_hits"] = False
+                hits = await self._search(http_client, body)
+                stored += await asyncio.to_thread(self._store, hits, generation)
+                if hits and hits[-1].get("sort"):
+                    after = hits[-1]["sort"]
+                    if self._after is None or after > self._after:
+                        self._after = after
+                if len(hits) < SYNC_PAGE_SIZE:
+                    break
+            # Alerts whose status changed since the last sync, in Kibana or through another worker
+            after = None
+            while not full and self._synced_ms is not None:
+                body = alert_search_body("*", SYNC_PAGE_SIZE, after, source={"includes": _SYNC_FIELDS},
+                                         since=window_start, sort=ALERT_SORT_ASC)
+                body["query"]["bool"]["filter"].append({"range": {"kibana.alert.workflow_status_updated_at": {
+                    "gte": self._synced_ms - STATUS_CHANGE_LAG_MS}}})
+                body["track_total_hits"] = False
+                hits = await self._search(http_client, body)
+                stored += await asyncio.to_thread(self._store, hits, generation)
+                if len(hits) < SYNC_PAGE_SIZE or not hits[-1].get("sort"):
+                    break
+                after = hits[-1]["sort"]
+            # Alerts changed by this server's tools since the last sync
+            ids = sorted(dirty)
+            for i in range(0, len(ids), SYNC_PAGE_SIZE):
+                chunk = ids[i:i + SYNC_PAGE_SIZE]
+                hits = await self._search(http_client, {
+                    "query": {"ids": {"values": chunk}}, "size": len(chunk), "sort": ALERT_SORT_ASC,
+                    "_source": {"includes": _SYNC_FIELDS},
+                })
+                stored += await asyncio.to_thread(self._store, hits, generation)
+        except BaseException:
+            self._dirty |= dirty
+            raise
+        await asyncio.to_thread(self._prune, window_start, generation if full else None)
+        self.syncs += 1
+        self._synced_at = started_at
+        self._synced_ms = now_ms
+        if full:
+            self._refreshed_at = started_at
+            self._stale = False
+        return stored
+
+    @staticmethod
+    async def _search(http_client: httpx.AsyncClient, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        response = await http_client.post(SEARCH_PATH, json=body)
+        response.raise_for_status()
+        return response.json().get("hits", {}).get("hits", [])
+
+    def _store(self, hits: Iterable[Dict[str, Any]], generation: int) -> int:
+        """Upserts a page of hits, seen by ``generation``. Runs in a worker thread."""
+        hits = list(hits)
+        # The free text of an alert never changes, so only new alerts need their words indexed
+        known = set()
+        with self._lock:
+            for chunk in range(0, len(hits), 500):
+                ids = [hit["_id"] for hit in hits[chunk:chunk + 500]]
+                known.update(row[0] for row in self._db.execute(
+                    f"SELECT id FROM alerts WHERE id IN ({', '.join('?' * len(ids))})", ids))
+        rows, words = [], []
+        for hit in hits:
+            source = hit.get("_source") or {}
+            sort = hit.get("sort") or []
+            timestamp = sort[0] if sort and isinstance(sort[0], (int, float)) else since_ms(_field(source, "@timestamp"), 0)
+            if timestamp is None:
+                continue
+            uuid = _text(_field(source, "kibana.alert.uuid")) or hit["_id"]
+            if hit["_id"] not in known:
+                words.extend((word, hit["_id"]) for word in {
+                    word.lower() for name in _TEXT_FIELDS for word in _WORD.findall(_text(_field(source, name)) or "")})
+            rows.append((
+                hit["_id"], uuid, hit.get("_index"), int(timestamp),
+                _text(_field(source, "kibana.alert.rule.name") or _field(source, "signal.rule.name")),
+                _text(_field(source, "host.name")), _text(_field(source, "user.name")),
+                _text(_field(source, "kibana.alert.workflow_status")),
+                json.dumps(_project(source, DEFAULT_ALERT_FIELDS), separators=(",", ":")),
+                generation,
+            ))
+        with self._lock, self._db:
+            # An upsert, not a replace, which would cascade to the words
+            self._db.executemany(
+                "INSERT INTO alerts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+                "uuid = excluded.uuid, index_name = excluded.index_name, timestamp = excluded.timestamp, "
+                "rule_name = excluded.rule_name, host_name = excluded.host_name, user_name = excluded.user_name, "
+                "status = excluded.status, source = excluded.source, seen = excluded.seen "
+                "WHERE alerts.source != excluded.source OR alerts.seen != excluded.seen", rows)
+            self._db.executemany("INSERT OR IGNORE INTO alert_words VALUES (?, ?)", words)
+        return len(rows)
+
+    def _prune(self, window_start: int, generation: Optional[int] = None) -> None:
+        """Drops alerts outside the window or beyond ``max_alerts``, and after the full refresh
+        ``generation`` the alerts of the window it did not see. Runs in a worker thread."""
+        with self._lock:
+            with self._db:
+                self._db.execute("DELETE FROM alerts WHERE timestamp < ?", (window_start,))
+                if generation is not None:
+                    # Deleted in Kibana, or moved out of the window (e.g. a corrected @timestamp)
+                    self._db.execute("DELETE FROM alerts WHERE seen != ?", (generation,))
+                self._db.execute(
+                    "DELETE FROM alerts WHERE id IN (SELECT id FROM alerts ORDER BY timestamp DESC, uuid DESC "
+                    "LIMIT -1 OFFSET ?)", (self.settings.max_alerts,))
+            self._count = self._db.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+            covered_from = window_start
+            if self._count >= self.settings.max_alerts:
+                # Alerts inside the window were dropped; only the newest ones are complete
+                oldest = self._db.execute("SELECT MIN(timestamp) FROM alerts").fetchone()[0]
+                covered_from = max(covered_from, (oldest or window_start) + 1)
+        self._covered_from = covered_from
+
+    def mark_changed(self, alert_ids: Optional[Sequence[str]] = None) -> None:
+        """Notes alerts changed by a tool: those ids, or every alert when None. Served again once re-read."""
+        if alert_ids is None:
+            self._stale = True
+        else:
+            self._dirty.update(alert_id for alert_id in alert_ids if alert_id)
+        if self._wake is not None:
+            self._wake.set()
+
+    # --- Reads ---
+
+    def count(self) -> int:
+        """Alerts held after the last sync."""
+        return self._count
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last completed sync, or None before the first one."""
+        return None if self._synced_at is None else self._clock() - self._synced_at
+
+    async def search(self, http_client: httpx.AsyncClient, search_text: str, size: int,
+               search_after: Optional[List[Any]] = None, since: Any = None,
+               fields: Optional[Sequence[str]] = None,
+               max_staleness: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """One ``get_alerts`` page (a ``signals/search`` style response) from the mirror, or None.
+
+        None means the call should go to Kibana: the mirror belongs to another client
+        or space, is older than ``max_staleness`` seconds (the configured bound when
+        None), has unsynced changes, lacks requested ``fields``, or may be missing
+        alerts that belong on the page.
+        """
+        if self._client in (None, http_client) and (self._task is None or self._task.done()):
+            self.start(http_client)
+        max_staleness = self.settings.max_staleness if max_staleness is None else max_staleness
+        age = self.age()
+        if (http_client is not self._client or current_space() is not None or age is None or age > max_staleness
+                or self._stale or self._dirty or not self._covers(fields)):
+            self.fallbacks += 1
+            return None
+
+        where, params = [], []
+        bound = since_ms(since, self._now_ms()) if since is not None else None
+        if since is not None and bound is None:
+            self.fallbacks += 1
+            return None
+        if bound is not None:
+            where.append("timestamp >= ?")
+            params.append(bound)
+        if search_text != "*":
+            # Identifier fields match the whole text, free-text fields any of its words;
+            # each lookup uses its own index
+            matches = [f"SELECT id FROM alerts WHERE {column} = ?" for column in ("rule_name", "host_name", "user_name", "uuid")]
+            params += [search_text] * len(matches)
+            matches.append("SELECT ?")
+            params.append(search_text)
+            words = sorted({word.lower() for word in _WORD.findall(search_text)})
+            if words:
+                matches.append(f"SELECT id FROM alert_words WHERE word IN ({', '.join('?' * len(words))})")
+                params += words
+            where.append(f"id IN ({' UNION '.join(matches)})")
+        total_where = list(where)
+        total_params = list(params)
+        if search_after is not None:
+            if len(search_after) != 2:
+                self.fallbacks += 1
+                return None
+            where.append("(timestamp, uuid) < (?, ?)")
+            params += list(search_after)
+
+        complete = bound is not None and bound >= self._covered_from
+        found = await asyncio.to_thread(self._query, where, params, total_where, total_params, size, complete)
+        if found is None:
+            # Older matching alerts may exist beyond what the mirror holds
+            self.fallbacks += 1
+            return None
+        rows, total = found
+        self.served += 1
+        return {
+            "took": 0,
+            "timed_out": False,
+            "hits": {
+                "total": {"value": total, "relation": "eq" if complete else "gte"},
+                "hits": [
+                    {"_id": alert_id, "_index": index_name, "_source": json.loads(source), "sort": [timestamp, uuid]}
+                    for alert_id, index_name, timestamp, uuid, source in rows
+                ],
+            },
+            "mirror": {"age_seconds": round(age, 3)},
+        }
+
+    def _query(self, where: List[str], params: List[Any], total_where: List[str], total_params: List[Any],
+               size: int, complete: bool) -> Optional[tuple]:
+        """The page rows and total of a search, or None for an incomplete page. Runs in a worker thread."""
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        total_clause = f" WHERE {' AND '.join(total_where)}" if total_where else ""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id, index_name, timestamp, uuid, source FROM alerts{clause} "
+                f"ORDER BY timestamp DESC, uuid DESC LIMIT ?", params + [size]).fetchall()
+            if len(rows) < size and not complete:
+                return None
+            total = self._db.execute(f"SELECT COUNT(*) FROM alerts{total_clause}", total_params).fetchone()[0]
+        return rows, total
+
+    def _covers(self, fields: Optional[Sequence[str]]) -> bool:
+        """Whether the mirrored (lean) alerts hold every requested field."""
+        if fields is None:
+            return True
+        return all(any(field == kept or field.startswith(f"{kept}.") for kept in DEFAULT_ALERT_FIELDS)
+                   for field in fields)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "alerts": self.count(),
+            "age_seconds": self.age(),
+            "served": self.served,
+            "fallbacks": self.fallbacks,
+            "syncs": self.syncs,
+            "sync_errors": self.sync_errors,
+        }
+
+
+_alert_mirror: Optional[AlertMirror] = None
+_mirror_configured = False
+
+
+def get_alert_mirror() -> Optional[AlertMirror]:
+    """Returns the process-wide alert mirror, or None when it is disabled (the default)."""
+    global _alert_mirror, _mirror_configured
+    if not _mirror_configured:
+        _mirror_configured = True
+        settings = AlertMirrorSettings.from_env()
+        _alert_mirror = AlertMirror(settings) if settings.enabled else None
+    return _alert_mirror
+
+
+def set_alert_mirror(mirror: Optional[AlertMirror]) -> None:
+    """Replaces the process-wide alert mirror (None resets it to the environment default)."""
+    global _alert_mirror, _mirror_configured
+    _alert_mirror = mirror
+    _mirror_configured = mirror is not None
+
+
+async def close_alert_mirror() -> None:
+    """Stops the mirror's sync, e.g. before its Kibana client is closed. It restarts on the next search."""
+    if _alert_mirror is not None:
+        await _alert_mirror.stop()
+
+
+def note_alerts_changed(alert_ids: Optional[Sequence[str]] = None) -> None:
+    """Called by tools that change alerts: those ids, or any alert when None.
+
+    Cached ``alert://`` reads of those alerts are dropped and the mirror re-reads them.
+    """
+    get_alert_cache().forget(alert_ids)
+    mirror = get_alert_mirror()
+    if mirror is not None:
+        mirror.mark_changed(alert_ids)
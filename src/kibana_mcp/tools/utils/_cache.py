@@ -0,0 +1,361 @@
+import httpx
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+# Default time-to-live (seconds) for each cacheable read tool.
+# Tools that are not listed here are never cached.
+DEFAULT_TOOL_TTLS: Dict[str, float] = {
+    # Alerts change constantly, so only absorb short bursts of identical reads
+    "get_alerts": 5.0,
+    "aggregate_alerts": 5.0,
+
+    # Rules and exceptions
+    "get_rule": 300.0,
+    "find_rules": 60.0,
+    "get_rule_exceptions": 120.0,
+    "get_prepackaged_rules_status": 300.0,
+
+    # Cases
+    "find_cases": 30.0,
+    "get_case": 30.0,
+    "get_case_comments": 30.0,
+    "get_case_alerts": 30.0,
+    "get_cases_by_alert": 30.0,
+    "get_case_configuration": 300.0,
+    "get_case_tags": 120.0,
+
+    # Saved objects
+    "find_objects": 60.0,
+    "get_object": 120.0,
+    "bulk_get_objects": 120.0,
+}
+
+# Read entries affected by each mutating tool, as (read_tool, match_arg) pairs.
+# When match_arg is set and the mutating call received that argument, only the
+# read entries called with the same value (or one of the values, for lists)
+# are dropped. Otherwise every entry of the read tool is dropped.
+INVALIDATION_RULES: Dict[str, List[Tuple[str, Optional[str]]]] = {
+    # Alert tools
+    "tag_alert": [("get_alerts", None), ("aggregate_alerts", None), ("get_case_alerts", None)],
+    "adjust_alert_status": [("get_alerts", None), ("aggregate_alerts", None), ("get_case_alerts", None)],
+    "bulk_tag_alerts": [("get_alerts", None), ("aggregate_alerts", None), ("get_case_alerts", None)],
+    "bulk_adjust_alert_status": [("get_alerts", None), ("aggregate_alerts", None), ("get_case_alerts", None)],
+
+    # Rule tools
+    "delete_rule": [("get_rule", None), ("find_rules", None), ("get_rule_exceptions", "rule_id")],
+    "update_rule_status": [("get_rule", None), ("find_rules", None)],
+    "install_prepackaged_rules": [("get_rule", None), ("find_rules", None), ("get_prepackaged_rules_status", None)],
+
+    # Exception tools
+    "add_rule_exception_items": [("get_rule_exceptions", "rule_id")],
+    "associate_shared_exception_list": [("get_rule", None), ("find_rules", None), ("get_rule_exceptions", "rule_id")],
+
+    # Cases tools
+    "create_case": [("find_cases", None), ("get_case_tags", None)],
+    "update_case": [("get_case", "case_id"), ("find_cases", None), ("get_case_tags", None)],
+    "delete_cases": [
+        ("get_case", "case_id"), ("get_case_comments", "case_id"), ("get_case_alerts", "case_id"),
+        ("find_cases", None), ("get_cases_by_alert", None), ("get_case_tags", None),
+    ],
+    "add_case_comment": [
+        ("get_case", "case_id"), ("get_case_comments", "case_id"), ("get_case_alerts", "case_id"),
+        ("find_cases", None), ("get_cases_by_alert", None),
+    ],
+
+    # Saved Objects tools
+    "create_object": [("find_objects", None), ("get_object", "id"), ("bulk_get_objects", None)],
+    "update_object": [("find_objects", None), ("get_object", "id"), ("bulk_get_objects", None)],
+    "delete_object": [("find_objects", None), ("get_object", "id"), ("bulk_get_objects", None)],
+    "import_objects": [("find_objects", None), ("get_object", None), ("bulk_get_objects", None)],
+}
+
+# Some mutating tools name the shared argument differently from the read tools.
+_ARG_ALIASES: Dict[Tuple[str, str], str] = {
+    ("delete_cases", "case_id"): "case_ids",
+}
+
+
+@dataclass
+class _CallOutcome:
+    """Tracks the Kibana requests made while a single tool call runs."""
+    started: int = 0
+    completed: int = 0
+    failed: bool = False
+
+    @property
+    def cacheable(self) -> bool:
+        # Tools report Kibana errors as text, so only results produced by calls
+        # whose requests all completed with a non-error status are stored.
+        return self.started > 0 and self.started == self.completed and not self.failed
+
+
+_call_outcome: ContextVar[Optional[_CallOutcome]] = ContextVar("kibana_mcp_call_outcome", default=None)
+
+
+async def _record_request(request: httpx.Request) -> None:
+    outcome = _call_outcome.get()
+    if outcome is not None:
+        outcome.started += 1
+
+
+async def _record_response(response: httpx.Response) -> None:
+    outcome = _call_outcome.get()
+    if outcome is not None:
+        outcome.completed += 1
+        if response.status_code >= 400:
+            outcome.failed = True
+
+
+# Event hooks to install on the shared httpx client so the cache can tell
+# whether a tool result came from successful Kibana responses.
+CACHE_EVENT_HOOKS = {
+    "request": [_record_request],
+    "response": [_record_response],
+}
+
+
+def record_shared_response(response: httpx.Response) -> None:
+    """Counts a Kibana response another task received on the current tool call's behalf."""
+    outcome = _call_outcome.get()
+    if outcome is not None:
+        outcome.started += 1
+        outcome.completed += 1
+        if response.status_code >= 400:
+            outcome.failed = True
+
+
+def begin_call_tracking():
+    """Starts tracking outbound requests for the current tool call. Returns a reset token."""
+    return _call_outcome.set(_CallOutcome())
+
+
+def end_call_tracking(token) -> Optional[_CallOutcome]:
+    """Stops tracking for the current tool call and returns what was observed."""
+    outcome = _call_outcome.get()
+    _call_outcome.reset(token)
+    return outcome
+
+
+@dataclass
+class _ToolStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    invalidations: int = 0
+    miss_seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        avg_miss = self.miss_seconds / self.misses if self.misses else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "avg_miss_latency_ms": round(avg_miss * 1000, 3),
+            # Rough latency saved: every hit avoided an average miss
+            "estimated_saved_ms": round(self.hits * avg_miss * 1000, 3),
+        }
+
+
+@dataclass
+class _Entry:
+    tool_name: str
+    kwargs: Dict[str, Any]
+    value: str
+    expires_at: float
+
+
+class ResponseCache:
+    """In-memory TTL/LRU cache for tool results, keyed on tool name and normalized kwargs.
+
+    Only tools listed in ``ttls`` are cached. Mutating tools listed in
+    ``invalidation_rules`` drop the read entries they affect.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttls: Optional[Dict[str, float]] = None,
+        invalidation_rules: Optional[Dict[str, List[Tuple[str, Optional[str]]]]] = None,
+        clock=time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TOOL_TTLS if ttls is None else ttls)
+        self.invalidation_rules = INVALIDATION_RULES if invalidation_rules is None else invalidation_rules
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # Bumped whenever a read tool is invalidated, so results fetched before
+        # a mutation are not stored after it.
+        self._generations: Dict[str, int] = {}
+        self._stats: Dict[str, _ToolStats] = {}
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """Builds a cache from KIBANA_MCP_CACHE_* environment variables.
+
+        KIBANA_MCP_CACHE_MAX_ENTRIES sets the LRU bound and KIBANA_MCP_CACHE_TTLS
+        overrides per-tool TTLs, e.g. "get_case=60,get_alerts=0" (0 disables a tool).
+        """
+        ttls = dict(DEFAULT_TOOL_TTLS)
+        for item in os.getenv("KIBANA_MCP_CACHE_TTLS", "").split(","):
+            if "=" not in item:
+                continue
+            name, _, value = item.partition("=")
+            try:
+                ttls[name.strip()] = float(value)
+            except ValueError:
+                tool_logger.warning(f"Ignoring invalid cache TTL '{item}' in KIBANA_MCP_CACHE_TTLS")
+        ttls = {name: ttl for name, ttl in ttls.items() if ttl > 0}
+        max_entries = int(os.getenv("KIBANA_MCP_CACHE_MAX_ENTRIES", "512"))
+        return cls(max_entries=max_entries, ttls=ttls)
+
+    # --- Keys ---
+
+    def is_cacheable(self, tool_name: str) -> bool:
+        return tool_name in self.ttls
+
+    @staticmethod
+    def make_key(tool_name: str, kwargs: Dict[str, Any]) -> str:
+        """Normalizes kwargs (sorted keys, None values dropped) into a stable key."""
+        normalized = {k: v for k, v in kwargs.items() if v is not None}
+        return f"{tool_name}:{json.dumps(normalized, sort_keys=True, default=str, separators=(',', ':'))}"
+
+    def generation(self, tool_name: str) -> int:
+        return self._generations.get(tool_name, 0)
+
+    # --- Lookups ---
+
+    def get(self, tool_name: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        if not self.is_cacheable(tool_name):
+            return None
+        key = self.make_key(tool_name, kwargs)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self._tool_stats(tool_name).hits += 1
+        return entry.value
+
+    def record_miss(self, tool_name: str, elapsed: float) -> None:
+        if self.is_cacheable(tool_name):
+            stats = self._tool_stats(tool_name)
+            stats.misses += 1
+            stats.miss_seconds += elapsed
+
+    def set(self, tool_name: str, kwargs: Dict[str, Any], value: str, generation: Optional[int] = None) -> bool:
+        """Stores a result. Skipped if the tool was invalidated since ``generation``."""
+        if not self.is_cacheable(tool_name):
+            return False
+        if generation is not None and generation != self.generation(tool_name):
+            return False
+        key = self.make_key(tool_name, kwargs)
+        self._entries[key] = _Entry(
+            tool_name=tool_name,
+            kwargs=dict(kwargs),
+            value=value,
+            expires_at=self._clock() + self.ttls[tool_name],
+        )
+        self._entries.move_to_end(key)
+        self._tool_stats(tool_name).stores += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    # --- Invalidation ---
+
+    def invalidate_for(self, mutating_tool: str, kwargs: Dict[str, Any]) -> int:
+        """Drops the read entries affected by a call to ``mutating_tool``. Returns the count dropped."""
+        rules = self.invalidation_rules.get(mutating_tool)
+        if not rules:
+            return 0
+        dropped = 0
+        for read_tool, match_arg in rules:
+            values = None
+            if match_arg:
+                source_arg = _ARG_ALIASES.get((mutating_tool, match_arg), match_arg)
+                value = kwargs.get(source_arg)
+                if value is not None:
+                    values = value if isinstance(value, (list, tuple, set)) else [value]
+            dropped += self.invalidate(read_tool, match_arg if values is not None else None, values)
+        if dropped:
+            tool_logger.debug(f"Tool '{mutating_tool}' invalidated {dropped} cached result(s).")
+        return dropped
+
+    def invalidate(self, tool_name: str, match_arg: Optional[str] = None, values: Optional[List[Any]] = None) -> int:
+        """Drops entries of ``tool_name``, optionally only those whose ``match_arg`` is in ``values``."""
+        self._generations[tool_name] = self.generation(tool_name) + 1
+        doomed = [
+            key for key, entry in self._entries.items()
+            if entry.tool_name == tool_name
+            and (match_arg is None or entry.kwargs.get(match_arg) in values)
+        ]
+        for key in doomed:
+            del self._entries[key]
+        if doomed:
+            self._tool_stats(tool_name).invalidations += len(doomed)
+        return len(doomed)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        for tool_name in list(self._generations):
+            self._generations[tool_name] += 1
+
+    # --- Stats ---
+
+    def _tool_stats(self, tool_name: str) -> _ToolStats:
+        stats = self._stats.get(tool_name)
+        if stats is None:
+            stats = self._stats[tool_name] = _ToolStats()
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters overall and per tool."""
+        hits = sum(s.hits for s in self._stats.values())
+        misses = sum(s.misses for s in self._stats.values())
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "tools": {name: s.as_dict() for name, s in sorted(self._stats.items())},
+        }
+
+
+class NullCache(ResponseCache):
+    """Cache implementation that never stores anything (used when caching is disabled)."""
+
+    def __init__(self):
+        super().__init__(max_entries=0, ttls={}, invalidation_rules={})
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Returns the process-wide response cache, creating it from the environment on first use."""
+    global _response_cache
+    if _response_cache is None:
+        enabled = os.getenv("KIBANA_MCP_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+        _response_cache = ResponseCache.from_env() if enabled else NullCache()
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Replaces the process-wide response cache (None resets it to the environment default)."""
+    global _response_cache
+    _response_cache = cache
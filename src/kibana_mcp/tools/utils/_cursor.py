@@ -0,0 +1,56 @@
+import base64
+import binascii
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+# Bumped when the cursor contents change, so stale cursors are rejected instead of misread
+_CURSOR_VERSION = 1
+
+
+def query_hash(**params: Any) -> str:
+    """A short fingerprint of the parameters that choose a search's hits, to bind cursors to them."""
+    raw = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(sort_values: Optional[List[Any]], query: Optional[str] = None) -> Optional[str]:
+    """An opaque cursor for the hit whose ``sort`` values are given (None without them).
+
+    ``query`` (see ``query_hash``) ties the cursor to the search it came from.
+    """
+    if not sort_values:
+        return None
+    data: Dict[str, Any] = {"v": _CURSOR_VERSION, "after": sort_values}
+    if query is not None:
+        data["q"] = query
+    raw = json.dumps(data, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> Dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor '{cursor}'.")
+    if not isinstance(data, dict) or data.get("v") != _CURSOR_VERSION or not isinstance(data.get("after"), list):
+        raise ValueError(f"Invalid cursor '{cursor}'.")
+    return data
+
+
+def decode_cursor(cursor: str, query: Optional[str] = None) -> List[Any]:
+    """The ``search_after`` values of a cursor from ``encode_cursor``. Raises ValueError if it is not one,
+    or, with ``query``, if it was issued for a different search."""
+    data = _decode(cursor)
+    if query is not None and data.get("q") != query:
+        raise ValueError(f"Invalid cursor '{cursor}': it belongs to a different search.")
+    return data["after"]
+
+
+def cursor_query(cursor: Any) -> Optional[str]:
+    """The query fingerprint a cursor is bound to, or None."""
+    try:
+        return _decode(cursor).get("q") if isinstance(cursor, str) else None
+    except ValueError:
+        return None
@@ -0,0 +1,104 @@
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from mcp.server.lowlevel.server import request_ctx
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+# Tools that export, import or download large payloads get a longer budget (seconds)
+DEFAULT_TOOL_BUDGETS: Dict[str, float] = {
+    "export_objects": 300.0,
+    "import_objects": 300.0,
+    "download_file": 300.0,
+    "install_prepackaged_rules": 300.0,
+    "bulk_tag_alerts": 300.0,
+    "bulk_adjust_alert_status": 300.0,
+}
+
+# Key of the ``_meta`` object of a tools/call request through which a client sets its own budget
+CLIENT_TIMEOUT_META = "timeoutMs"
+
+
+def _parse_budgets(raw: str) -> Dict[str, float]:
+    budgets = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        name, _, value = item.partition("=")
+        try:
+            budgets[name.strip()] = float(value)
+        except ValueError:
+            tool_logger.warning(f"Ignoring invalid tool deadline '{item}' in KIBANA_MCP_TOOL_DEADLINES")
+    return budgets
+
+
+@dataclass(frozen=True)
+class ToolBudgets:
+    """How long a tool call may run (seconds, 0 = no deadline).
+
+    A client-specified budget replaces the tool's budget, up to ``max_client``.
+    """
+    default: float = 60.0
+    per_tool: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TOOL_BUDGETS))
+    max_client: float = 600.0
+
+    @classmethod
+    def from_env(cls) -> "ToolBudgets":
+        """Reads KIBANA_MCP_TOOL_DEADLINE (default budget), KIBANA_MCP_TOOL_DEADLINES (per-tool
+        overrides, e.g. "get_alerts=20,export_objects=600") and KIBANA_MCP_MAX_CLIENT_DEADLINE."""
+        per_tool = dict(DEFAULT_TOOL_BUDGETS)
+        per_tool.update(_parse_budgets(os.getenv("KIBANA_MCP_TOOL_DEADLINES", "")))
+        return cls(
+            default=float(os.getenv("KIBANA_MCP_TOOL_DEADLINE") or cls.default),
+            per_tool=per_tool,
+            max_client=float(os.getenv("KIBANA_MCP_MAX_CLIENT_DEADLINE") or cls.max_client),
+        )
+
+    def budget(self, tool_name: str, client_seconds: Optional[float] = None) -> Optional[float]:
+        """The deadline for one call of ``tool_name`` in seconds, or None for no deadline."""
+        if client_seconds:
+            return min(client_seconds, self.max_client) if self.max_client else client_seconds
+        return self.per_tool.get(tool_name, self.default) or None
+
+
+def request_meta(name: str) -> Any:
+    """A field of the current MCP request's ``_meta`` object, or None."""
+    try:
+        meta = request_ctx.get().meta
+    except LookupError:
+        return None  # Not called from an MCP request, e.g. from tests or benchmarks
+    return getattr(meta, name, None) if meta is not None else None
+
+
+def client_budget() -> Optional[float]:
+    """The budget the client sent with the current tools/call request (``_meta.timeoutMs``), in seconds."""
+    value = request_meta(CLIENT_TIMEOUT_META)
+    if value is None:
+        return None
+    try:
+        seconds = float(value) / 1000
+    except (TypeError, ValueError):
+        seconds = 0.0
+    if seconds <= 0:
+        tool_logger.warning(f"Ignoring invalid _meta.{CLIENT_TIMEOUT_META} '{value}'")
+        return None
+    return seconds
+
+
+_tool_budgets: Optional[ToolBudgets] = None
+
+
+def get_tool_budgets() -> ToolBudgets:
+    """Returns the process-wide tool budgets, read from the environment on first use."""
+    global _tool_budgets
+    if _tool_budgets is None:
+        _tool_budgets = ToolBudgets.from_env()
+    return _tool_budgets
+
+
+def set_tool_budgets(budgets: Optional[ToolBudgets]) -> None:
+    """Replaces the process-wide tool budgets (None resets them to the environment default)."""
+    global _tool_budgets
+    _tool_budgets = budgets
@@ -0,0 +1,294 @@
+import json
+import logging
+import os
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ._cursor import cursor_query, encode_cursor
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+# Rough bytes-per-token ratio used to turn a token budget into a byte budget
+BYTES_PER_TOKEN = 4
+
+# Fields most triage agents need from an alert's _source
+DEFAULT_ALERT_FIELDS: List[str] = [
+    "@timestamp",
+    "kibana.alert.uuid",
+    "kibana.alert.status",
+    "kibana.alert.workflow_status",
+    "kibana.alert.severity",
+    "kibana.alert.risk_score",
+    "kibana.alert.reason",
+    "kibana.alert.rule.name",
+    "kibana.alert.rule.uuid",
+    "kibana.alert.rule.rule_id",
+    "kibana.alert.workflow_tags",
+    "host.name",
+    "user.name",
+    "signal.rule.name",
+    "message",
+]
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """Describes where a tool's records live in its payload and which fields to keep by default.
+
+    ``records`` is a dotted path to the list of records ("" when the payload itself
+    is the list). When ``record_key`` is set, projections apply to that key of each
+    record (e.g. "_source" for search hits) and ``keep`` lists record keys that
+    always survive projection. ``cursor`` names the payload key holding the
+    next-page cursor, which is moved back to the last record kept when the
+    output budget drops records.
+    """
+    records: Optional[str] = None
+    record_key: Optional[str] = None
+    keep: Tuple[str, ...] = ()
+    default_fields: Optional[Tuple[str, ...]] = None
+    cursor: Optional[str] = None
+
+
+RENDER_PROFILES: Dict[str, RenderProfile] = {
+    # Alert tools, the only ones projected by default; the others return whole
+    # records unless the caller passes ``fields``
+    "get_alerts": RenderProfile(
+        records="hits.hits", record_key="_source", keep=("_id", "_index", "sort", "fields"),
+        default_fields=tuple(DEFAULT_ALERT_FIELDS), cursor="next_cursor",
+    ),
+    "poll_new_alerts": RenderProfile(
+        records="alerts", record_key="_source", keep=("_id", "_index", "sort"),
+        default_fields=tuple(DEFAULT_ALERT_FIELDS), cursor="checkpoint",
+    ),
+
+    # Rule tools
+    "find_rules": RenderProfile(records="data"),
+    "get_rule_exceptions": RenderProfile(records="data"),
+
+    # Cases tools
+    "find_cases": RenderProfile(records="cases"),
+    "get_case": RenderProfile(),
+    "get_case_comments": RenderProfile(records="comments"),
+    "get_case_alerts": RenderProfile(records=""),
+    "get_cases_by_alert": RenderProfile(records=""),
+
+    # Saved Objects tools
+    "find_objects": RenderProfile(records="saved_objects"),
+    "bulk_get_objects": RenderProfile(records="saved_objects"),
+    "export_objects": RenderProfile(records=""),
+
+    # Endpoint tools
+    "get_response_actions": RenderProfile(records="actions"),
+}
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """Per-call rendering settings: encoding, caller projection and output budget."""
+    compact: bool = False
+    fields: Optional[Tuple[str, ...]] = None
+    max_bytes: int = 0
+
+    @classmethod
+    def from_env(cls) -> "RenderOptions":
+        """Reads KIBANA_MCP_OUTPUT_FORMAT (pretty|compact) and KIBANA_MCP_OUTPUT_MAX_BYTES/_TOKENS."""
+        compact = os.getenv("KIBANA_MCP_OUTPUT_FORMAT", "pretty").lower() == "compact"
+        max_bytes = int(os.getenv("KIBANA_MCP_OUTPUT_MAX_BYTES", "0"))
+        max_tokens = int(os.getenv("KIBANA_MCP_OUTPUT_MAX_TOKENS", "0"))
+        if max_tokens and (not max_bytes or max_tokens * BYTES_PER_TOKEN < max_bytes):
+            max_bytes = max_tokens * BYTES_PER_TOKEN
+        return cls(compact=compact, max_bytes=max_bytes)
+
+
+_default_options: Optional[RenderOptions] = None
+_render_options: ContextVar[Optional[RenderOptions]] = ContextVar("kibana_mcp_render_options", default=None)
+
+
+def get_render_options() -> RenderOptions:
+    """Returns the options for the current tool call, falling back to the environment defaults."""
+    global _default_options
+    options = _render_options.get()
+    if options is not None:
+        return options
+    if _default_options is None:
+        _default_options = RenderOptions.from_env()
+    return _default_options
+
+
+def begin_render_options(fields: Optional[Sequence[str]] = None, **overrides):
+    """Sets the render options for the current tool call. Returns a reset token."""
+    options = replace(get_render_options(), **overrides)
+    if fields:
+        options = replace(options, fields=tuple(fields))
+    return _render_options.set(options)
+
+
+def end_render_options(token) -> None:
+    _render_options.reset(token)
+
+
+# --- Projection ---
+
+_FieldTree = Dict[str, Any]
+
+
+@lru_cache(maxsize=256)
+def _field_tree(fields: Tuple[str, ...]) -> _FieldTree:
+    """Compiles dotted paths into a nested lookup tree; ``True`` marks a kept subtree."""
+    tree: _FieldTree = {}
+    for path in fields:
+        node = tree
+        parts = path.split(".")
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is True:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = True
+    return tree
+
+
+def _project_tree(record: Any, tree: _FieldTree) -> Any:
+    if not isinstance(record, dict):
+        return record
+    projected: Dict[str, Any] = {}
+    for key, value in record.items():
+        node: Any = tree.get(key)
+        if node is None and "." in key:
+            # Flattened key such as "kibana.alert.rule.name": walk the tree part by part
+            node = tree
+            for part in key.split("."):
+                node = node.get(part)
+                if not isinstance(node, dict):
+                    break
+        if node is True:
+            projected[key] = value
+        elif node and isinstance(value, dict):
+            sub = _project_tree(value, node)
+            if sub:
+                projected[key] = sub
+    return projected
+
+
+def _project(record: Any, fields: Sequence[str]) -> Any:
+    """Keeps only the given dotted paths, matching both nested and flattened ("a.b.c") keys."""
+    return _project_tree(record, _field_tree(tuple(fields)))
+
+
+def _get_path(payload: Any, path: str) -> Any:
+    if path == "":
+        return payload
+    current = payload
+    for part in path.split("."):
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+    return current
+
+
+def _set_path(payload: Any, path: str, value: Any) -> Any:
+    """Returns a shallow copy of ``payload`` with ``path`` replaced by ``value``."""
+    if path == "":
+        return value
+    head, _, rest = path.partition(".")
+    copied = dict(payload)
+    copied[head] = _set_path(payload[head], rest, value) if rest else value
+    return copied
+
+
+def project_records(payload: Any, profile: RenderProfile, fields: Optional[Sequence[str]]) -> Any:
+    """Applies a field projection to each record of ``payload`` described by ``profile``.
+
+    Profiles without a record list project the payload as a whole.
+    """
+    if not fields or "*" in fields:
+        return payload
+    if profile.records is None:
+        return _project(payload, fields)
+    records = _get_path(payload, profile.records)
+    if not isinstance(records, list):
+        return payload
+
+    def project_one(record):
+        if profile.record_key and isinstance(record, dict):
+            kept = {k: record[k] for k in profile.keep if k in record}
+            if profile.record_key in record:
+                kept[profile.record_key] = _project(record[profile.record_key], fields)
+            return kept
+        return _project(record, fields)
+
+    return _set_path(payload, profile.records, [project_one(r) for r in records])
+
+
+# --- Encoding and budget ---
+
+def _encode(payload: Any, compact: bool) -> str:
+    if compact:
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+    return json.dumps(payload, indent=2, default=str)
+
+
+def _truncated_payload(payload: Any, profile: RenderProfile, records: list, keep: int, max_bytes: int) -> Any:
+    marker = {
+        "returned": keep,
+        "total_records": len(records),
+        "omitted": len(records) - keep,
+        "hint": (
+            f"Output truncated to fit the {max_bytes}-byte budget. Request the next page, "
+            "a smaller limit, or pass `fields` to narrow each record to see the rest."
+        ),
+    }
+    trimmed = _set_path(payload, profile.records, records[:keep])
+    if isinstance(trimmed, dict):
+        if profile.cursor and profile.cursor in trimmed:
+            # Continue after the last record shown, not after the last one fetched
+            if keep and isinstance(records[keep - 1], dict):
+                trimmed[profile.cursor] = encode_cursor(records[keep - 1].get("sort"),
+                                                        query=cursor_query(trimmed[profile.cursor]))
+            else:
+                del trimmed[profile.cursor]
+        return {**trimmed, "_truncated": marker}
+    return {"items": trimmed, "_truncated": marker}
+
+
+def _fit_budget(payload: Any, text: str, profile: Optional[RenderProfile], options: RenderOptions) -> str:
+    """Drops trailing records (deterministically) until the encoded output fits ``max_bytes``."""
+    max_bytes = options.max_bytes
+    records = _get_path(payload, profile.records) if profile and profile.records is not None else None
+    if isinstance(records, list) and records:
+        # Binary search for the largest record prefix that fits, marker included
+        low, high, best = 0, len(records) - 1, None
+        while low <= high:
+            mid = (low + high) // 2
+            candidate = _encode(_truncated_payload(payload, profile, records, mid, max_bytes), options.compact)
+            if len(candidate.encode("utf-8")) <= max_bytes:
+                best, low = candidate, mid + 1
+            else:
+                high = mid - 1
+        if best is not None:
+            return best
+    # No record list to trim (or even zero records do not fit): cut the text itself
+    hint = f"\n... [output truncated to {max_bytes} bytes; narrow the request or pass `fields`]"
+    cut = text.encode("utf-8")[:max(max_bytes - len(hint), 0)].decode("utf-8", errors="ignore")
+    return cut + hint
+
+
+def render_json(payload: Any, tool_name: Optional[str] = None) -> str:
+    """Renders a tool's JSON payload through the shared output pipeline.
+
+    Applies, in order: the caller's ``fields`` projection (or the tool's default
+    projection), pretty or compact encoding, and the output byte budget.
+    """
+    options = get_render_options()
+    profile = (RENDER_PROFILES.get(tool_name) or RenderProfile()) if tool_name else None
+    if profile is not None:
+        fields = options.fields if options.fields is not None else profile.default_fields
+        payload = project_records(payload, profile, fields)
+
+    text = _encode(payload, options.compact)
+    if options.max_bytes and len(text.encode("utf-8")) > options.max_bytes:
+        text = _fit_budget(payload, text, profile, options)
+    return text
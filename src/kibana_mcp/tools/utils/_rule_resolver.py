@@ -0,0 +1,105 @@
+import httpx
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from kibana_mcp.client.spaces import current_space
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+RULES_API_PATH = "/api/detection_engine/rules"
+
+
+class RuleIdResolver:
+    """Caches human-readable rule_id -> internal rule UUID mappings per Kibana client and space.
+
+    A rule's UUID never changes during its lifetime, so positive mappings are kept
+    until evicted (bounded LRU) or explicitly forgotten, e.g. when the rule is
+    deleted. Unknown rule_ids (404) are cached for ``negative_ttl`` seconds.
+    """
+
+    def __init__(self, max_entries: int = 4096, negative_ttl: float = 30.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        # Separate mappings per client and space: each client may point at a different
+        # Kibana, and the same rule_id names different rules in different spaces
+        self._by_client: "weakref.WeakKeyDictionary[object, Dict[str, OrderedDict[str, Tuple[Optional[str], float]]]]" = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def _mappings(self, http_client) -> "OrderedDict[str, Tuple[Optional[str], float]]":
+        spaces = self._by_client.get(http_client)
+        if spaces is None:
+            spaces = self._by_client[http_client] = {}
+        space = current_space() or ""
+        mappings = spaces.get(space)
+        if mappings is None:
+            mappings = spaces[space] = OrderedDict()
+        return mappings
+
+    def _lookup(self, http_client, rule_id: str) -> Tuple[bool, Optional[str]]:
+        """Returns (found, uuid). ``uuid`` is None for a cached negative result."""
+        mappings = self._mappings(http_client)
+        entry = mappings.get(rule_id)
+        if entry is None:
+            return False, None
+        uuid, expires_at = entry
+        if expires_at <= self._clock():
+            del mappings[rule_id]
+            return False, None
+        mappings.move_to_end(rule_id)
+        return True, uuid
+
+    def remember(self, http_client, rule_id: str, uuid: Optional[str]) -> None:
+        """Records a mapping. ``uuid=None`` records that the rule does not exist."""
+        if not rule_id:
+            return
+        mappings = self._mappings(http_client)
+        expires_at = float("inf") if uuid else self._clock() + self.negative_ttl
+        mappings[rule_id] = (uuid, expires_at)
+        mappings.move_to_end(rule_id)
+        while len(mappings) > self.max_entries:
+            mappings.popitem(last=False)
+
+    def forget(self, http_client, rule_id: str) -> None:
+        """Drops the mapping for one rule_id."""
+        self._mappings(http_client).pop(rule_id, None)
+
+    def clear(self) -> None:
+        """Drops every mapping for every client."""
+        self._by_client.clear()
+
+    async def resolve(self, http_client: httpx.AsyncClient, rule_id: str) -> Optional[str]:
+        """Returns the internal UUID for ``rule_id``, or None if Kibana reports it does not exist.
+
+        Raises httpx errors for failures other than 404.
+        """
+        found, uuid = self._lookup(http_client, rule_id)
+        if found:
+            self.hits += 1
+            return uuid
+        self.misses += 1
+
+        response = await http_client.get(f"{RULES_API_PATH}?rule_id={rule_id}")
+        if response.status_code == 404:
+            self.remember(http_client, rule_id, None)
+            return None
+        response.raise_for_status()
+        uuid = response.json().get("id")
+        if uuid:
+            self.remember(http_client, rule_id, uuid)
+        return uuid
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "clients": len(self._by_client),
+        }
+
+
+# Shared resolver used by every rule and exception tool
+rule_id_resolver = RuleIdResolver()
@@ -1,8 +1,19 @@
+import asyncio
 import httpx
+import time
 from typing import List, Optional, Dict, Callable, Awaitable
 import mcp.types as types
 import logging
 
+from ._cache import ResponseCache, get_response_cache, begin_call_tracking, end_call_tracking
+from ._deadlines import client_budget, get_tool_budgets, request_meta
+from ._render import begin_render_options, end_render_options
+from kibana_mcp import metrics
+from kibana_mcp.logs import log_fields
+from kibana_mcp.tracing import STATUS_ERROR, STATUS_OK, get_tracer
+from kibana_mcp.client.deadlines import begin_deadline, end_deadline, remaining
+from kibana_mcp.client.spaces import begin_space, end_space, space_settings, validate_space
+
 tool_logger = logging.getLogger("kibana-mcp.tools")
 
 # Helper function to execute tools safely
@@ -10,24 +21,123 @@ async def execute_tool_safely(
     tool_name: str,
     tool_impl_func: Callable[..., Awaitable[str]], # Type hint for the _call_... funcs
     http_client: httpx.AsyncClient,
+    cache: Optional[ResponseCache] = None,
+    output_fields: Optional[List[str]] = None,
+    space: Optional[str] = None,
     **kwargs
 ) -> list[types.TextContent]:
-    """Wraps tool execution with client check, logging, and error handling."""
+    """Wraps tool execution with client check, logging, caching, metrics and error handling.
+
+    ``output_fields`` is the caller's projection for the shared render stage and
+    ``space`` the Kibana space to run in (None uses the client's default); both are
+    kept out of the implementation's kwargs.
+
+    The call runs under a deadline (the client's ``_meta.timeoutMs`` or the tool's
+    budget) that caps every Kibana request it makes. Past the deadline, or when the
+    client cancels the request, the call is cancelled and its Kibana requests aborted.
+    """
     if not http_client:
         tool_logger.error(f"HTTP client not initialized when attempting to call tool '{tool_name}'.")
         raise RuntimeError("HTTP client not initialized.")
-    
-    tool_logger.info(f"Executing tool '{tool_name}' with args: {kwargs}")
-    try:
-        # Pass the client and other args to the specific implementation
-        result_text = await tool_impl_func(http_client=http_client, **kwargs)
-        tool_logger.info(f"Tool '{tool_name}' executed successfully.")
-        return [types.TextContent(type="text", text=str(result_text))]
-    except TypeError as e:
-        # Catch argument mismatches specifically
-        tool_logger.error(f"Invalid arguments passed to tool '{tool_name}' implementation: {e}", exc_info=True)
-        # Raise a more specific error if possible, or a generic one
-        raise ValueError(f"Invalid arguments provided for tool '{tool_name}': {e}")
-    except Exception as e:
-        tool_logger.error(f"Error executing tool '{tool_name}': {e}", exc_info=True)
-        raise RuntimeError(f"An error occurred while executing tool '{tool_name}'.") 
\ No newline at end of file
+
+    if cache is None:
+        cache = get_response_cache()
+
+    if space is not None:
+        space = validate_space(space)
+
+    # One span per call; the Kibana requests it makes are recorded as child spans
+    with get_tracer().span(f"tool {tool_name}", attributes={
+        "mcp.tool.name": tool_name,
+        "kibana.space": space,
+    }, traceparent=request_meta("traceparent")) as span:
+        # The projection and space change the result, so they are part of the cache key
+        cache_kwargs = dict(kwargs, output_fields=output_fields, space=space) if output_fields or space else kwargs
+        cached_text = cache.get(tool_name, cache_kwargs)
+        if cached_text is not None:
+            tool_logger.info(f"Tool '{tool_name}' served from cache.")
+            metrics.TOOL_CALLS.inc(tool=tool_name, outcome="cache_hit")
+            metrics.TOOL_RESPONSE_BYTES.observe(len(cached_text.encode("utf-8")), tool=tool_name)
+            span.set_attribute("kibana_mcp.outcome", "cache_hit")
+            return [types.TextContent(type="text", text=cached_text)]
+
+        budget = get_tool_budgets().budget(tool_name, client_budget())
+        span.set_attribute("kibana_mcp.deadline_seconds", budget)
+        deadline_token = begin_deadline(budget)
+        try:
+            if space is not None and await space_settings.get(http_client, space) is None:
+                raise ValueError(f"Kibana space '{space}' does not exist.")
+        except BaseException:
+            end_deadline(deadline_token)
+            raise
+
+        # Arguments are capped and redacted by the log writer thread, not formatted here
+        tool_logger.info(f"Executing tool '{tool_name}'", extra=log_fields(tool=tool_name, args=kwargs))
+        generation = cache.generation(tool_name)
+        space_token = begin_space(space)
+        tracking_token = begin_call_tracking()
+        render_token = begin_render_options(fields=output_fields)
+        started_at = time.monotonic()
+        metrics.TOOL_IN_FLIGHT.inc(tool=tool_name)
+        call_outcome = "error"
+        deadline_scope = asyncio.timeout(remaining())
+        try:
+            # Pass the client and other args to the specific implementation
+            async with deadline_scope:
+                result_text = str(await tool_impl_func(http_client=http_client, **kwargs))
+            tool_logger.info(f"Tool '{tool_name}' executed successfully.", extra=log_fields(
+                tool=tool_name, duration_ms=round((time.monotonic() - started_at) * 1000, 1)))
+            call_outcome = "success"
+        except TimeoutError as e:
+            if not deadline_scope.expired():
+                # Raised by the tool itself, not by its deadline
+                tool_logger.error(f"Error executing tool '{tool_name}': {e}", exc_info=True,
+                                  extra=log_fields(tool=tool_name, args=kwargs))
+                raise RuntimeError(f"An error occurred while executing tool '{tool_name}'.")
+            call_outcome = "timeout"
+            tool_logger.warning(f"Tool '{tool_name}' exceeded its {budget:g}s deadline; cancelled its Kibana requests.")
+            raise TimeoutError(f"Tool '{tool_name}' did not finish within its {budget:g}s deadline.")
+        except asyncio.CancelledError:
+            # The client cancelled the request or went away; in-flight Kibana requests are aborted
+            call_outcome = "cancelled"
+            tool_logger.info(f"Tool '{tool_name}' was cancelled.")
+            raise
+        except TypeError as e:
+            # Catch argument mismatches specifically
+            tool_logger.error(f"Invalid arguments passed to tool '{tool_name}' implementation: {e}", exc_info=True,
+                              extra=log_fields(tool=tool_name, args=kwargs))
+            # Raise a more specific error if possible, or a generic one
+            raise ValueError(f"Invalid arguments provided for tool '{tool_name}': {e}")
+        except Exception as e:
+            # The success log may be sampled away, so errors carry the arguments themselves
+            tool_logger.error(f"Error executing tool '{tool_name}': {e}", exc_info=True,
+                              extra=log_fields(tool=tool_name, args=kwargs))
+            raise RuntimeError(f"An error occurred while executing tool '{tool_name}'.")
+        finally:
+            end_deadline(deadline_token)
+            end_space(space_token)
+            end_render_options(render_token)
+            outcome = end_call_tracking(tracking_token)
+            elapsed = time.monotonic() - started_at
+            metrics.TOOL_IN_FLIGHT.dec(tool=tool_name)
+            metrics.TOOL_DURATION.observe(elapsed, tool=tool_name)
+            # Tools report Kibana errors as text, so use the tracked request outcome to spot them
+            if call_outcome == "success" and outcome is not None and outcome.started and not outcome.cacheable:
+                call_outcome = "kibana_error"
+            metrics.TOOL_CALLS.inc(tool=tool_name, outcome=call_outcome)
+            span.set_attribute("kibana_mcp.outcome", call_outcome)
+            if call_outcome != "success":
+                metrics.TOOL_ERRORS.inc(tool=tool_name)
+                span.set_status(STATUS_ERROR, call_outcome)
+            # Mutations invalidate affected reads even when they fail part-way
+            cache.invalidate_for(tool_name, kwargs)
+
+        result_bytes = len(result_text.encode("utf-8"))
+        metrics.TOOL_RESPONSE_BYTES.observe(result_bytes, tool=tool_name)
+        span.set_attribute("kibana_mcp.result_bytes", result_bytes)
+        if call_outcome == "success":
+            span.set_status(STATUS_OK)
+        cache.record_miss(tool_name, elapsed)
+        if outcome is not None and outcome.cacheable:
+            cache.set(tool_name, cache_kwargs, result_text, generation=generation)
+        return [types.TextContent(type="text", text=result_text)]
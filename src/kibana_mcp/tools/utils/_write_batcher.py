@@ -0,0 +1,205 @@
+import asyncio
+import contextlib
+import contextvars
+import httpx
+import json
+import logging
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from kibana_mcp.client._env import env_float, env_int
+from kibana_mcp.client.deadlines import begin_deadline_at, current_deadline
+from kibana_mcp.client.spaces import begin_space, current_space
+from ._cache import record_shared_response
+
+tool_logger = logging.getLogger("kibana-mcp.tools")
+
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_MAX_IDS = 500
+
+
+@dataclass
+class _Batch:
+    """Pending writes with the same endpoint, space and payload, waiting to be sent as one request."""
+    payload: Dict[str, Any]
+    ids_key: str
+    # Per caller, the ids it asked for, the future its response is delivered on and its deadline
+    callers: List[Tuple[List[str], asyncio.Future, Optional[float]]] = field(default_factory=list)
+    full: asyncio.Event = field(default_factory=asyncio.Event)
+    flush: Optional[asyncio.Future] = None
+    sent: bool = False
+
+    def ids(self) -> List[str]:
+        return list(dict.fromkeys(alert_id for ids, _, _ in self.callers for alert_id in ids))
+
+
+class AlertWriteBatcher:
+    """Coalesces concurrent alert writes (``signals/tags``, ``signals/status``) into multi-id requests.
+
+    Writes with the same endpoint, space and payload apart from the ids, arriving
+    within ``window_ms`` of the first, are merged into one request for the union of
+    their ids (at most ``max_ids``; a full batch is sent at once). Each caller gets
+    its own response back: when the merged request updated every id, it reports
+    that caller's ids as updated; otherwise the callers' requests are sent again
+    one by one, which is safe because setting tags or a status is idempotent.
+
+    The merged request belongs to no single caller: it is sent from a fresh context
+    with the callers' space and the latest deadline of those still waiting, and
+    each caller counts its response towards its own tool call.
+
+    ``window_ms=0`` sends every write straight away.
+    """
+
+    def __init__(self, window_ms: float = DEFAULT_WINDOW_MS, max_ids: int = DEFAULT_MAX_IDS):
+        self.window = window_ms / 1000
+        self.max_ids = max_ids
+        self._batches: "weakref.WeakKeyDictionary[object, Dict[Tuple[str, str, str], _Batch]]" = weakref.WeakKeyDictionary()
+        self.writes = 0
+        self.requests = 0
+        self.fallbacks = 0
+
+    @classmethod
+    def from_env(cls) -> "AlertWriteBatcher":
+        """Reads KIBANA_MCP_WRITE_BATCH_MS (0 disables batching) and KIBANA_MCP_WRITE_BATCH_MAX_IDS."""
+        return cls(
+            window_ms=env_float("KIBANA_MCP_WRITE_BATCH_MS", DEFAULT_WINDOW_MS),
+            max_ids=env_int("KIBANA_MCP_WRITE_BATCH_MAX_IDS", DEFAULT_MAX_IDS),
+        )
+
+    async def post(self, http_client: httpx.AsyncClient, api_path: str, payload: Dict[str, Any],
+                   ids_key: str) -> httpx.Response:
+        """Sends ``payload`` to ``api_path``, merged with concurrent writes of the same payload.
+
+        ``payload[ids_key]`` holds this caller's alert ids. Returns this caller's
+        response; connection errors of the merged request are raised to every caller.
+        """
+        self.writes += 1
+        ids = list(payload[ids_key])
+        if self.window <= 0:
+            self.requests += 1
+            return await http_client.post(api_path, json=payload)
+
+        shared = {name: value for name, value in payload.items() if name != ids_key}
+        key = (api_path, current_space() or "", json.dumps(shared, sort_keys=True))
+        batches = self._batches.get(http_client)
+        if batches is None:
+            batches = self._batches[http_client] = {}
+        batch = batches.get(key)
+        if batch is None:
+            batch = batches[key] = _Batch(payload=shared, ids_key=ids_key)
+            # A fresh context: the request must not inherit this caller's deadline, call tracking or trace
+            context = contextvars.Context()
+            context.run(begin_space, current_space())
+            batch.flush = asyncio.get_running_loop().create_task(
+                self._flush(http_client, api_path, key, batch), context=context)
+        future = asyncio.get_running_loop().create_future()
+        caller = (ids, future, current_deadline())
+        batch.callers.append(caller)
+        if len(batch.ids()) >= self.max_ids:
+            batch.full.set()
+            if batches.get(key) is batch:
+                del batches[key]
+
+        try:
+            # Shield so one cancelled caller does not abort the write for the others
+            response = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not batch.sent:
+                # Not sent yet: leave this caller's ids out of the request
+                batch.callers.remove(caller)
+            else:
+                # Nobody awaits the outcome any more; mark a failure as retrieved
+                future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            raise
+        record_shared_response(response)
+        return response
+
+    async def _flush(self, http_client: httpx.AsyncClient, api_path: str, key: Tuple[str, str, str],
+                     batch: _Batch) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(batch.full.wait(), self.window)
+        batches = self._batches.get(http_client)
+        if batches is not None and batches.get(key) is batch:
+            del batches[key]
+        batch.sent = True
+        callers = [(ids, future) for ids, future, _ in batch.callers if not future.done()]
+        if not callers:
+            return
+        # Any caller without a deadline lets the request take as long as it needs
+        deadlines = [deadline for _, future, deadline in batch.callers if not future.done()]
+        begin_deadline_at(None if None in deadlines else max(deadlines))
+        try:
+            if len(callers) == 1:
+                ids, future = callers[0]
+                self.requests += 1
+                response = await http_client.post(api_path, json=dict(batch.payload, **{batch.ids_key: ids}))
+                future.set_result(response)
+                return
+            for ids, future, response in await self._send_merged(http_client, api_path, batch, callers):
+                if not future.done():
+                    future.set_result(response)
+        except Exception as exc:
+            for _, future in callers:
+                if not future.done():
+                    future.set_exception(exc)
+
+    async def _send_merged(self, http_client: httpx.AsyncClient, api_path: str, batch: _Batch,
+                           callers: List[Tuple[List[str], asyncio.Future]]) -> List[Tuple[List[str], asyncio.Future, httpx.Response]]:
+        ids = list(dict.fromkeys(alert_id for caller_ids, _ in callers for alert_id in caller_ids))
+        tool_logger.debug(f"Sending {len(callers)} writes to {api_path} as one request for {len(ids)} alert(s)")
+        self.requests += 1
+        response = await http_client.post(api_path, json=dict(batch.payload, **{batch.ids_key: ids}))
+        if response.status_code >= 400:
+            # Every caller sees the same Kibana error its own request would have got
+            return [(caller_ids, future, response) for caller_ids, future in callers]
+
+        data = response.json()
+        if data.get("updated") == len(ids) and not data.get("failures") and not data.get("version_conflicts"):
+            return [(caller_ids, future, self._caller_response(response, len(set(caller_ids))))
+                    for caller_ids, future in callers]
+
+        # Some ids were not updated and the response does not say which, so ask per caller
+        self.fallbacks += 1
+        tool_logger.info(f"Batched write to {api_path} updated {data.get('updated')} of {len(ids)} alerts; "
+                         "resending per caller")
+        self.requests += len(callers)
+        responses = await asyncio.gather(*(
+            http_client.post(api_path, json=dict(batch.payload, **{batch.ids_key: caller_ids}))
+            for caller_ids, _ in callers
+        ), return_exceptions=True)
+        results = []
+        for (caller_ids, future), caller_response in zip(callers, responses):
+            if isinstance(caller_response, BaseException):
+                future.set_exception(caller_response)
+            else:
+                results.append((caller_ids, future, caller_response))
+        return results
+
+    @staticmethod
+    def _caller_response(response: httpx.Response, updated: int) -> httpx.Response:
+        return httpx.Response(
+            response.status_code,
+            json={"updated": updated, "total": updated, "version_conflicts": 0, "failures": []},
+            request=response.request,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {"writes": self.writes, "requests": self.requests, "fallbacks": self.fallbacks}
+
+
+_write_batcher: Optional[AlertWriteBatcher] = None
+
+
+def get_write_batcher() -> AlertWriteBatcher:
+    """Returns the process-wide alert write batcher, configured from the environment on first use."""
+    global _write_batcher
+    if _write_batcher is None:
+        _write_batcher = AlertWriteBatcher.from_env()
+    return _write_batcher
+
+
+def set_write_batcher(batcher: Optional[AlertWriteBatcher]) -> None:
+    """Replaces the process-wide alert write batcher (None resets it to the environment default)."""
+    global _write_batcher
+    _write_batcher = batcher
@@ -0,0 +1,378 @@
+"""Tracing spans for tool calls and Kibana requests.
+
+A small, dependency-free tracer in the spirit of ``kibana_mcp.metrics``: every
+tool call gets a span, and every Kibana request it makes a child span (recorded
+by ``TracingTransport``). Finished spans are handed to a background thread that
+batches them to the configured exporters:
+
+- ``console``: one JSON object per span on stderr (stdout carries the STDIO protocol)
+- ``file``: the same JSON lines appended to ``KIBANA_MCP_TRACING_FILE``
+- ``otlp``: OTLP/HTTP JSON, e.g. to a local OpenTelemetry Collector on port 4318
+
+Tracing is off unless ``KIBANA_MCP_TRACING`` names at least one exporter; spans
+are then no-ops. Outbound Kibana requests carry a W3C ``traceparent`` header.
+"""
+
+import atexit
+import httpx
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger("kibana-mcp")
+
+# OTLP span kinds
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class Span:
+    """One timed operation; ended exactly once, then exported."""
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: Optional[str], kind: int,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add(self, key: str, amount: int = 1) -> None:
+        """Increments a counter attribute, e.g. the Kibana requests made under a tool span."""
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def set_status(self, status: int, message: str = "") -> None:
+        self.status = status
+        self.status_message = message
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self._tracer.finish(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": {KIND_INTERNAL: "internal", KIND_SERVER: "server", KIND_CLIENT: "client"}[self.kind],
+            "start_time_unix_nano": self.start_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            "status": {STATUS_UNSET: "unset", STATUS_OK: "ok", STATUS_ERROR: "error"}[self.status],
+            "status_message": self.status_message or None,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stands in for a span when tracing is off or the trace is not sampled."""
+    recording = False
+    trace_id = span_id = parent_id = None
+    attributes: Dict[str, Any] = {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def add(self, key: str, amount: int = 1) -> None:
+        pass
+
+    def set_status(self, status: int, message: str = "") -> None:
+        pass
+
+    def traceparent(self) -> Optional[str]:
+        return None
+
+    def end(self) -> None:
+        pass
+
+
+class _UnsampledSpan(_NoopSpan):
+    """Current span of a trace that was sampled out, so its children are not recorded either."""
+
+
+NOOP_SPAN = _NoopSpan()
+UNSAMPLED_SPAN = _UnsampledSpan()
+
+_current_span: ContextVar[Any] = ContextVar("kibana_mcp_span", default=NOOP_SPAN)
+
+
+def current_span():
+    """The span of the current tool call or Kibana request (a no-op span outside of one)."""
+    return _current_span.get()
+
+
+def parse_traceparent(value: Optional[str]):
+    """Returns (trace_id, parent_span_id, sampled) from a W3C traceparent header, or None."""
+    match = _TRACEPARENT.match(value.strip().lower()) if isinstance(value, str) else None
+    if match is None or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2), int(match.group(3), 16) & 1 == 1
+
+
+# --- Exporters ---
+
+class ConsoleExporter:
+    """Writes one JSON object per span to a stream (stderr by default)."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def export(self, spans: Sequence[Span]) -> None:
+        stream = self.stream or sys.stderr
+        stream.write("".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans))
+        stream.flush()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileExporter(ConsoleExporter):
+    """Appends one JSON object per span to a file."""
+
+    def __init__(self, path: str):
+        super().__init__(open(path, "a", encoding="utf-8"))
+
+    def shutdown(self) -> None:
+        self.stream.close()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+def _otlp_headers(raw: str) -> Dict[str, str]:
+    headers = {}
+    for item in raw.split(","):
+        name, _, value = item.partition("=")
+        if name.strip() and value:
+            headers[name.strip()] = value.strip()
+    return headers
+
+
+class OTLPExporter:
+    """Sends spans as OTLP/HTTP JSON (``POST /v1/traces``), e.g. to an OpenTelemetry Collector."""
+
+    def __init__(self, endpoint: Optional[str] = None, headers: Optional[Dict[str, str]] = None,
+                 service_name: Optional[str] = None, timeout: float = 10.0, transport=None):
+        if endpoint is None:
+            endpoint = os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
+        if endpoint is None:
+            base = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318")
+            endpoint = base.rstrip("/") + "/v1/traces"
+        self.endpoint = endpoint
+        self.service_name = service_name or os.getenv("OTEL_SERVICE_NAME", "kibana-mcp")
+        headers = headers if headers is not None else _otlp_headers(os.getenv("OTEL_EXPORTER_OTLP_HEADERS", ""))
+        self._client = httpx.Client(headers=headers, timeout=timeout, transport=transport)
+
+    def payload(self, spans: Sequence[Span]) -> Dict[str, Any]:
+        return {"resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+            "scopeSpans": [{
+                "scope": {"name": "kibana-mcp"},
+                "spans": [{
+                    "traceId": span.trace_id,
+                    "spanId": span.span_id,
+                    **({"parentSpanId": span.parent_id} if span.parent_id else {}),
+                    "name": span.name,
+                    "kind": span.kind,
+                    "startTimeUnixNano": str(span.start_ns),
+                    "endTimeUnixNano": str(span.end_ns),
+                    "attributes": _otlp_attributes(span.attributes),
+                    "status": {"code": span.status, **({"message": span.status_message} if span.status_message else {})},
+                } for span in spans],
+            }],
+        }]}
+
+    def export(self, spans: Sequence[Span]) -> None:
+        response = self._client.post(self.endpoint, json=self.payload(spans))
+        response.raise_for_status()
+
+    def shutdown(self) -> None:
+        self._client.close()
+
+
+# --- Tracer ---
+
+class Tracer:
+    """Creates spans and exports finished ones in batches from a background thread."""
+
+    def __init__(self, exporters: Sequence[Any] = (), sample_ratio: float = 1.0,
+                 max_queue: int = 4096, batch_size: int = 256, flush_interval: float = 2.0):
+        self.exporters = list(exporters)
+        self.sample_ratio = sample_ratio
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.exported = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def start_span(self, name: str, kind: int = KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None,
+                   traceparent: Optional[str] = None):
+        """Starts a child of the current span, of ``traceparent`` (a remote parent), or a new trace."""
+        if not self.exporters:
+            return NOOP_SPAN
+        parent = current_span()
+        if parent.recording:
+            return Span(self, name, parent.trace_id, parent.span_id, kind, attributes)
+        if parent is UNSAMPLED_SPAN:
+            return UNSAMPLED_SPAN
+        remote = parse_traceparent(traceparent)
+        if remote is not None:
+            trace_id, parent_id, sampled = remote
+            return Span(self, name, trace_id, parent_id, kind, attributes) if sampled else UNSAMPLED_SPAN
+        if self.sample_ratio < 1.0 and random.random() >= self.sample_ratio:
+            return UNSAMPLED_SPAN
+        return Span(self, name, f"{random.getrandbits(128):032x}", None, kind, attributes)
+
+    @contextmanager
+    def span(self, name: str, kind: int = KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None,
+             traceparent: Optional[str] = None) -> Iterator[Any]:
+        """Runs the block in a new current span; exceptions mark it as failed."""
+        span = self.start_span(name, kind, attributes, traceparent)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.set_status(STATUS_ERROR, f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def finish(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1  # Never block a tool call on a slow exporter
+            return
+        if self._thread is None:
+            self._start()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="kibana-mcp-tracing", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            stop = any(item is None for item in batch)
+            spans = [item for item in batch if item is not None]
+            if spans:
+                self._export(spans)
+            if stop:
+                return
+
+    def _export(self, spans: List[Span]) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                logger.warning(f"Could not export {len(spans)} spans with {type(exporter).__name__}: {e}")
+        self.exported += len(spans)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Exports the queued spans and stops the exporters."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+        for exporter in self.exporters:
+            try:
+                exporter.shutdown()
+            except Exception:
+                pass
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """Reads KIBANA_MCP_TRACING (comma-separated: console, file, otlp), KIBANA_MCP_TRACING_FILE
+        and KIBANA_MCP_TRACING_SAMPLE_RATIO. The OTLP exporter reads the standard OTEL_* variables."""
+        exporters = []
+        for name in filter(None, (part.strip().lower() for part in os.getenv("KIBANA_MCP_TRACING", "").split(","))):
+            if name == "console":
+                exporters.append(ConsoleExporter())
+            elif name == "file":
+                exporters.append(FileExporter(os.getenv("KIBANA_MCP_TRACING_FILE", "kibana-mcp-traces.jsonl")))
+            elif name == "otlp":
+                exporters.append(OTLPExporter())
+            elif name not in ("none", "off"):
+                logger.warning(f"Ignoring unknown tracing exporter '{name}' in KIBANA_MCP_TRACING")
+        ratio = float(os.getenv("KIBANA_MCP_TRACING_SAMPLE_RATIO") or 1.0)
+        return cls(exporters, sample_ratio=ratio)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Returns the process-wide tracer, configured from the environment on first use."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer.from_env()
+        if _tracer.enabled:
+            atexit.register(_tracer.shutdown)
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Replaces the process-wide tracer (None resets it to the environment default)."""
+    global _tracer
+    _tracer = tracer
@@ -0,0 +1,351 @@
+"""A fake Kibana for benchmarks: serves the Security APIs the tools call with synthetic payloads.
+
+``FakeKibana.transport()`` plugs it into an httpx client in-process (``httpx.MockTransport``);
+``FakeKibana.serve()`` runs it as a local HTTP server for benchmarks that start the real server.
+Response bodies are serialized once and reused, so the fake adds little to measured latency.
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from .payloads import (
+    ALERTS_NEWEST_MS,
+    make_action,
+    make_aggregations,
+    make_alerts_response,
+    make_case,
+    make_cases_response,
+    make_export_ndjson,
+    make_rule,
+    make_rules_response,
+    make_saved_object,
+)
+
+_SPACE_PREFIX = re.compile(r"^/s/[^/]+(?=/)")
+_JSON = "application/json"
+
+Route = Tuple[str, "re.Pattern[str]", Callable[..., Tuple[int, bytes, str]]]
+
+
+def _dumps(payload: Any) -> bytes:
+    return json.dumps(payload).encode("utf-8")
+
+
+class FakeKibana:
+    """Synthetic Kibana sized like a busy production deployment.
+
+    Args:
+        alerts: Alerts available to ``signals/search`` (a search returns up to its ``size``).
+        rules: Detection rules listed by ``rules/_find``.
+        cases: Cases listed by ``cases/_find``.
+        export_objects: Saved objects in a ``_export`` NDJSON body.
+        latency: Seconds added to every response, to mimic Kibana's own processing time.
+
+    Status updates by id are remembered (``status_changes``, stamped with ``now_ms()``):
+    later searches return the new ``kibana.alert.workflow_status`` and match a range
+    filter on ``kibana.alert.workflow_status_updated_at``.
+    """
+
+    def __init__(self, alerts: int = 10_000, rules: int = 5_000, cases: int = 200,
+                 export_objects: int = 2_000, latency: float = 0.0):
+        self.alerts = alerts
+        self.rules = rules
+        self.cases = cases
+        self.export_objects = export_objects
+        self.latency = latency
+        self.requests: Counter = Counter()
+        self.now_ms: Callable[[], int] = lambda: int(time.time() * 1000)
+        # Alert id -> (workflow status, updated at ms) of status updates by id
+        self.status_changes: Dict[str, Tuple[str, int]] = {}
+        self._lock = threading.Lock()
+        self._routes: List[Route] = [
+            ("POST", re.compile(r"^/api/detection_engine/signals/search$"), self._search_alerts),
+            ("POST", re.compile(r"^/api/detection_engine/signals/(status|tags)$"), self._update_alerts),
+            ("GET", re.compile(r"^/api/detection_engine/rules/_find$"), self._find_rules),
+            ("GET", re.compile(r"^/api/detection_engine/rules/prepackaged/_status$"), self._prepackaged_status),
+            ("PUT", re.compile(r"^/api/detection_engine/rules/prepackaged$"), self._install_prepackaged),
+            ("GET", re.compile(r"^/api/detection_engine/rules/([^/]+)/exceptions$"), self._rule_exceptions),
+            ("POST", re.compile(r"^/api/detection_engine/rules/([^/]+)/exceptions$"), self._rule_exceptions),
+            ("*", re.compile(r"^/api/detection_engine/rules$"), self._rule),
+            ("GET", re.compile(r"^/api/exception_lists$"), lambda params, **_: (200, _dumps({"id": "list-uuid-1", "list_id": params.get("list_id"), "type": "detection", "namespace_type": params.get("namespace_type", "single")}), _JSON)),
+            ("POST", re.compile(r"^/api/exception_lists$"), self._echo),
+            ("GET", re.compile(r"^/api/cases/_find$"), self._find_cases),
+            ("GET", re.compile(r"^/api/cases/configure$"), lambda **_: (200, _dumps([{"id": "config-1", "closure_type": "close-by-user"}]), _JSON)),
+            ("GET", re.compile(r"^/api/cases/tags$"), lambda **_: (200, _dumps(["triage", "phishing", "malware"]), _JSON)),
+            ("GET", re.compile(r"^/api/cases/alerts/([^/]+)$"), lambda **_: (200, _dumps([{"id": "case-1", "title": "Case", "totals": {"alerts": 1}}]), _JSON)),
+            ("GET", re.compile(r"^/api/cases/([^/]+)/comments/_find$"), self._case_comments),
+            ("POST", re.compile(r"^/api/cases/([^/]+)/comments$"), self._case),
+            ("GET", re.compile(r"^/api/cases/([^/]+)/alerts$"), self._case_alerts),
+            ("GET", re.compile(r"^/api/cases/([^/]+)$"), self._case),
+            ("*", re.compile(r"^/api/cases$"), self._cases_write),
+            ("POST", re.compile(r"^/api/endpoint/action/status$"), lambda **_: (200, _dumps({"data": [make_action(i) for i in range(10)]}), _JSON)),
+            ("GET", re.compile(r"^/api/endpoint/action/([^/]+)/file/([^/]+)/download$"), lambda **_: (200, b"\x00" * 65536, "application/octet-stream")),
+            ("GET", re.compile(r"^/api/endpoint/action/([^/]+)/file/([^/]+)$"), lambda **_: (200, _dumps({"id": "file-1", "name": "memdump.zip", "size": 65536, "status": "READY", "mimeType": "application/zip"}), _JSON)),
+            ("GET", re.compile(r"^/api/endpoint/action/([^/]+)$"), lambda match, **_: (200, _dumps(make_action(1)), _JSON)),
+            ("GET", re.compile(r"^/api/endpoint/action$"), self._actions),
+            ("POST", re.compile(r"^/api/endpoint/action$"), lambda body, **_: (200, _dumps(make_action(1, body.get("name", "isolate"))), _JSON)),
+            ("POST", re.compile(r"^/api/saved_objects/_export$"), self._export),
+            ("POST", re.compile(r"^/api/saved_objects/_import$"), lambda **_: (200, _dumps({"success": True, "successCount": 1}), _JSON)),
+            ("GET", re.compile(r"^/api/saved_objects/_find$"), self._find_objects),
+            ("POST", re.compile(r"^/api/saved_objects/_bulk_get$"), self._bulk_get_objects),
+            ("*", re.compile(r"^/api/saved_objects/([^/_][^/]*)(?:/([^/]+))?$"), lambda **_: (200, _dumps(make_saved_object(1)), _JSON)),
+            ("GET", re.compile(r"^/api/spaces/space/([^/]+)$"), lambda match, **_: (200, _dumps({"id": match.group(1), "name": match.group(1)}), _JSON)),
+        ]
+
+    # --- Serialized bodies, cached per shape ---
+
+    @lru_cache(maxsize=16)
+    def _alerts_body(self, size: int, start: int, includes: Optional[Tuple[str, ...]],
+                     excludes: Tuple[str, ...], ascending: bool = False) -> bytes:
+        count = max(0, min(size, self.alerts - start))
+        source = {"includes": includes, "excludes": excludes} if includes is not None or excludes else None
+        response = make_alerts_response(count, start=start, total=self.alerts, source=source)
+        if ascending:
+            response["hits"]["hits"].reverse()
+        return _dumps(response)
+
+    @lru_cache(maxsize=64)
+    def _rules_body(self, page: int, per_page: int) -> bytes:
+        return _dumps(make_rules_response(self.rules, page, per_page))
+
+    @lru_cache(maxsize=16)
+    def _cases_body(self, page: int, per_page: int) -> bytes:
+        return _dumps(make_cases_response(self.cases, page, per_page))
+
+    @lru_cache(maxsize=4)
+    def _export_body(self) -> bytes:
+        return make_export_ndjson(self.export_objects)
+
+    # --- Route handlers: return (status, body, content type) ---
+
+    def _with_status_changes(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        for hit in response["hits"]["hits"]:
+            change = self.status_changes.get(hit["_id"])
+            if change and "kibana.alert.workflow_status" in hit["_source"]:
+                hit["_source"]["kibana.alert.workflow_status"] = change[0]
+        return response
+
+    def _search_alerts(self, body: Dict[str, Any], **_) -> Tuple[int, bytes, str]:
+        if body.get("aggs"):
+            return 200, _dumps({"took": 25, "timed_out": False, "hits": {"total": {"value": self.alerts}, "hits": []},
+                                "aggregations": make_aggregations(body["aggs"], self.alerts)}), _JSON
+        source = body.get("_source") if isinstance(body.get("_source"), dict) else {}
+        includes = tuple(source["includes"]) if "includes" in source else None
+        if body.get("_source") is False:
+            includes = ()
+        excludes = tuple(source.get("excludes", ()))
+        hit_source = {"includes": includes, "excludes": excludes} if includes is not None or excludes else None
+        ids = (body.get("query") or {}).get("ids", {}).get("values")
+        if ids is not None:
+            hits = [make_alerts_response(1, start=int(alert_id.rsplit("-", 1)[1]))["hits"]["hits"][0]
+                    for alert_id in ids if alert_id.startswith("alert-")]
+            response = {"took": 3, "timed_out": False, "hits": {"total": {"value": len(hits)}, "hits": hits}}
+            return 200, _dumps(self._with_status_changes(response)), _JSON
+        filters = (body.get("query") or {}).get("bool", {}).get("filter", [])
+        changed_since = next((f["range"]["kibana.alert.workflow_status_updated_at"]["gte"] for f in filters
+                              if "kibana.alert.workflow_status_updated_at" in f.get("range", {})), None)
+        if changed_since is not None:
+            # Oldest first, after search_after
+            after = body.get("search_after")
+            starts = sorted((int(alert_id.rsplit("-", 1)[1]) for alert_id, (_, updated_ms) in self.status_changes.items()
+                             if alert_id.startswith("alert-") and updated_ms >= changed_since), reverse=True)
+            starts = [i for i in starts if i < self.alerts and (not after or ALERTS_NEWEST_MS - i * 1000 > after[0])]
+            hits = [make_alerts_response(1, start=i, source=hit_source)["hits"]["hits"][0]
+                    for i in starts[:int(body.get("size", 10))]]
+            response = {"took": 3, "timed_out": False, "hits": {"total": {"value": len(hits)}, "hits": hits}}
+            return 200, _dumps(self._with_status_changes(response)), _JSON
+        # Pages continue after the search_after timestamp, one alert per second
+        search_after = body.get("search_after")
+        size = int(body.get("size", 10))
+        if body.get("sort") and body["sort"][0]["@timestamp"]["order"] == "asc":
+            # Oldest first: the page ends at the oldest alert newer than search_after
+            end = (ALERTS_NEWEST_MS - int(search_after[0])) // 1000 if search_after else self.alerts
+            end = max(0, min(end, self.alerts))
+            page = self._alerts_body(min(size, end), end - min(size, end), includes, excludes, True)
+        else:
+            start = (ALERTS_NEWEST_MS - int(search_after[0])) // 1000 + 1 if search_after else 0
+            page = self._alerts_body(size, start, includes, excludes)
+        if self.status_changes:
+            page = _dumps(self._with_status_changes(json.loads(page)))
+        return 200, page, _JSON
+
+    def _update_alerts(self, body: Dict[str, Any], match: "re.Match[str]", **_) -> Tuple[int, bytes, str]:
+        ids = body.get("signal_ids") or body.get("ids") or []
+        if match.group(1) == "status" and ids:
+            updated_ms = self.now_ms()
+            for alert_id in ids:
+                self.status_changes[alert_id] = (body.get("status"), updated_ms)
+        # An update by query matches every alert
+        updated = len(ids) or (self.alerts if "query" in body else 1)
+        return 200, _dumps({"updated": updated, "total": updated, "failures": []}), _JSON
+
+    def _find_rules(self, params: httpx.QueryParams, **_) -> Tuple[int, bytes, str]:
+        return 200, self._rules_body(int(params.get("page", 1)), int(params.get("per_page", 20))), _JSON
+
+    def _prepackaged_status(self, **_) -> Tuple[int, bytes, str]:
+        return 200, _dumps({"rules_installed": self.rules, "rules_not_installed": 12, "rules_not_updated": 30,
+                            "timelines_installed": 10, "timelines_not_installed": 0, "timelines_not_updated": 0}), _JSON
+
+    def _install_prepackaged(self, **_) -> Tuple[int, bytes, str]:
+        return 200, _dumps({"rules_installed": 12, "rules_updated": 30, "timelines_installed": 0, "timelines_updated": 0}), _JSON
+
+    def _rule_exceptions(self, **_) -> Tuple[int, bytes, str]:
+        items = [{"id": f"item-{i}", "item_id": f"item-{i}", "name": f"Exclude host-{i}", "type": "simple",
+                  "entries": [{"field": "host.name", "operator": "included", "type": "match", "value": f"host-{i}"}]}
+                 for i in range(50)]
+        return 200, _dumps(items), _JSON
+
+    def _rule(self, method: str, params: httpx.QueryParams, **_) -> Tuple[int, bytes, str]:
+        rule_id = params.get("rule_id") or params.get("id") or "rule-1"
+        rule = make_rule(int(re.sub(r"\D", "", rule_id) or 1))
+        if method == "PATCH":
+            rule["enabled"] = not rule["enabled"]
+        return 200, _dumps(rule), _JSON
+
+    def _echo(self, body: Dict[str, Any], **_) -> Tuple[int, bytes, str]:
+        return 200, _dumps({"id": "generated-1", **body}), _JSON
+
+    def _find_cases(self, params: httpx.QueryParams, **_) -> Tuple[int, bytes, str]:
+        return 200, self._cases_body(int(params.get("page", 1)), int(params.get("perPage", 20))), _JSON
+
+    def _case(self, **_) -> Tuple[int, bytes, str]:
+        return 200, _dumps(make_case(1)), _JSON
+
+    def _case_comments(self, params: httpx.QueryParams, **_) -> Tuple[int, bytes, str]:
+        per_page = int(params.get("perPage", params.get("per_page", 20)))
+        comments = [{"id": f"comment-{i}", "type": "user", "comment": "Checked process tree. " * 5,
+                     "owner": "securitySolution", "created_at": "2024-05-01T00:00:00.000Z"} for i in range(per_page)]
+        return 200, _dumps({"page": 1, "per_page": per_page, "total": per_page, "comments": comments}), _JSON
+
+    def _case_alerts(self, **_) -> Tuple[int, bytes, str]:
+        return 200, _dumps([{"id": f"alert-{i}", "index": ".alerts-security.alerts-default"} for i in range(25)]), _JSON
+
+    def _cases_write(self, method: str, **_) -> Tuple[int, bytes, str]:
+        if method == "DELETE":
+            return 204, b"", _JSON
+        case = make_case(1)
+        return 200, _dumps([case] if method == "PATCH" else case), _JSON
+
+    def _actions(self, params: httpx.QueryParams, **_) -> Tuple[int, bytes, str]:
+        page_size = int(params.get("pageSize", 10))
+        return 200, _dumps({"page": 1, "pageSize": page_size, "total": 500,
+                            "items": [make_action(i) for i in range(page_size)]}), _JSON
+
+    def _export(self, **_) -> Tuple[int, bytes, str]:
+        return 200, self._export_body(), "application/ndjson"
+
+    def _find_objects(self, params: httpx.QueryParams, **_) -> Tuple[int, bytes, str]:
+        per_page = int(params.get("per_page", 20))
+        return 200, _dumps({"page": 1, "per_page": per_page, "total": self.export_objects,
+                            "saved_objects": [make_saved_object(i) for i in range(per_page)]}), _JSON
+
+    def _bulk_get_objects(self, body: Any, **_) -> Tuple[int, bytes, str]:
+        count = len(body) if isinstance(body, list) else 1
+        return 200, _dumps({"saved_objects": [make_saved_object(i) for i in range(count)]}), _JSON
+
+    # --- Dispatch ---
+
+    def respond(self, method: str, path: str, params: httpx.QueryParams, raw_body: bytes) -> Tuple[int, bytes, str]:
+        """Returns (status, body, content type) for a request."""
+        path = _SPACE_PREFIX.sub("", path, count=1)
+        with self._lock:
+            self.requests[f"{method} {path}"] += 1
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            body = {}
+        for route_method, pattern, handler in self._routes:
+            if route_method not in ("*", method):
+                continue
+            match = pattern.match(path)
+            if match:
+                return handler(method=method, match=match, params=params, body=body)
+        return 404, _dumps({"statusCode": 404, "error": "Not Found", "message": f"No route for {method} {path}"}), _JSON
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        status, body, content_type = self.respond(request.method, request.url.path, request.url.params, request.read())
+        return httpx.Response(status, content=body, headers={"content-type": content_type})
+
+    def transport(self) -> httpx.MockTransport:
+        """An in-process transport for ``httpx.AsyncClient`` / ``KibanaClient(network_transport=...)``."""
+        if not self.latency:
+            return httpx.MockTransport(self.handle)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(self.latency)
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    @contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """Serves the fake on a local port in a background thread; yields its base URL."""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self) -> None:
+                url = httpx.URL(self.path)
+                length = int(self.headers.get("content-length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                if fake.latency:
+                    time.sleep(fake.latency)
+                status, body, content_type = fake.respond(self.command, url.path, url.params, raw_body)
+                self.send_response(status)
+                self.send_header("content-type", content_type)
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name="fake-kibana", daemon=True)
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.requests)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the fake Kibana in the foreground, e.g. to point a manually started server at it."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve a fake Kibana for benchmarks.")
+    parser.add_argument("--port", type=int, default=5601)
+    parser.add_argument("--alerts", type=int, default=10_000)
+    parser.add_argument("--rules", type=int, default=5_000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    args = parser.parse_args(argv)
+    fake = FakeKibana(alerts=args.alerts, rules=args.rules, latency=args.latency)
+    with fake.serve(port=args.port) as url:
+        print(f"Fake Kibana listening on {url}", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
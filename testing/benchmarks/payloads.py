@@ -0,0 +1,235 @@
+"""Synthetic Kibana payloads shaped like real Security API responses, for offline benchmarks."""
+
+import json
+import random
+from typing import Any, Dict, Optional, Sequence
+
+_RULE_NAMES = [
+    "Suspicious PowerShell Execution",
+    "Unusual Parent-Child Process Relationship",
+    "Potential Credential Access via LSASS",
+    "Multiple Failed SSH Logins",
+    "Outbound Connection to Rare Domain",
+]
+_SEVERITIES = ["low", "medium", "high", "critical"]
+
+# Sort timestamp of the newest synthetic alert; each older one is a second earlier
+ALERTS_NEWEST_MS = 1714521600000
+
+
+def make_alert(i: int, rng: random.Random) -> Dict[str, Any]:
+    """One alert document (``_source``) with the nested ECS fields Kibana returns."""
+    rule_index = rng.randrange(len(_RULE_NAMES))
+    return {
+        "@timestamp": f"2024-05-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:00.000Z",
+        "kibana.alert.uuid": f"{i:08x}-0000-4000-8000-{rng.getrandbits(48):012x}",
+        "kibana.alert.status": "active",
+        "kibana.alert.workflow_status": rng.choice(["open", "acknowledged", "closed"]),
+        "kibana.alert.severity": rng.choice(_SEVERITIES),
+        "kibana.alert.risk_score": rng.choice([21, 47, 73, 99]),
+        "kibana.alert.reason": f"process event with process powershell.exe, on host-{i % 500} created {_RULE_NAMES[rule_index].lower()} alert.",
+        "kibana.alert.rule.name": _RULE_NAMES[rule_index],
+        "kibana.alert.rule.uuid": f"rule-uuid-{rule_index}",
+        "kibana.alert.rule.rule_id": f"rule-{rule_index}",
+        "kibana.alert.rule.description": "Detects activity commonly associated with attacker tradecraft. " * 4,
+        "kibana.alert.rule.parameters": {
+            "index": ["logs-endpoint.events.*", "winlogbeat-*"],
+            "query": "process.name : \"powershell.exe\" and process.args : (\"-enc\" or \"-encodedcommand\")",
+            "threat": [{"framework": "MITRE ATT&CK", "tactic": {"id": "TA0002", "name": "Execution"}}],
+        },
+        "kibana.alert.workflow_tags": [],
+        "host": {
+            "name": f"host-{i % 500}",
+            "os": {"family": "windows", "version": "10.0.19045", "kernel": "22H2"},
+            "ip": [f"10.0.{i % 255}.{rng.randrange(255)}"],
+        },
+        "user": {"name": f"user{i % 97}", "domain": "CORP"},
+        "process": {
+            "name": "powershell.exe",
+            "pid": rng.randrange(1000, 65000),
+            "command_line": "powershell.exe -NoProfile -EncodedCommand " + "A" * rng.randrange(80, 400),
+            "parent": {"name": "cmd.exe", "pid": rng.randrange(1000, 65000)},
+        },
+        "event": {"kind": "signal", "category": ["process"], "action": "start"},
+    }
+
+
+def filter_source(document: Dict[str, Any], includes: Optional[Sequence[str]] = None,
+                  excludes: Sequence[str] = (), prefix: str = "") -> Dict[str, Any]:
+    """Elasticsearch-style ``_source`` filtering by exact dotted paths (no wildcards)."""
+    filtered = {}
+    for key, value in document.items():
+        path = prefix + key
+        if any(path == exclude or path.startswith(exclude + ".") for exclude in excludes):
+            continue
+        if includes is None or any(path == include or path.startswith(include + ".") for include in includes):
+            filtered[key] = filter_source(value, None, excludes, path + ".") if isinstance(value, dict) else value
+        elif isinstance(value, dict) and any(include.startswith(path + ".") for include in includes):
+            nested = filter_source(value, includes, excludes, path + ".")
+            if nested:
+                filtered[key] = nested
+    return filtered
+
+
+def make_alerts_response(count: int, seed: int = 0, start: int = 0, total: Optional[int] = None,
+                         source: Optional[Dict[str, Sequence[str]]] = None) -> Dict[str, Any]:
+    """A ``/api/detection_engine/signals/search`` response with ``count`` hits, from the ``start``-th newest.
+
+    ``source`` is the search's ``_source`` option (``includes``/``excludes``).
+    """
+    rng = random.Random(seed)
+    hits = []
+    for i in range(start, start + count):
+        alert = make_alert(i, rng)
+        hits.append({
+            "_index": ".internal.alerts-security.alerts-default-000001",
+            "_id": f"alert-{i}",
+            "_source": filter_source(alert, source.get("includes"), source.get("excludes", ())) if source else alert,
+            "sort": [ALERTS_NEWEST_MS - i * 1000, alert["kibana.alert.uuid"]],
+        })
+    return {
+        "took": 12,
+        "timed_out": False,
+        "hits": {
+            "total": {"value": count if total is None else total, "relation": "eq"},
+            "hits": hits,
+        },
+    }
+
+
+def make_aggregations(aggs: Dict[str, Any], total: int) -> Dict[str, Any]:
+    """Synthetic results for the ``terms``, ``date_histogram`` and ``cardinality`` aggregations of a search."""
+    results: Dict[str, Any] = {}
+    for name, agg in aggs.items():
+        sub_aggs = agg.get("aggs") or {}
+        if "cardinality" in agg:
+            results[name] = {"value": max(1, total // 7)}
+            continue
+        if "terms" in agg:
+            field = agg["terms"]["field"]
+            counts = [max(1, total // (2 ** (i + 1))) for i in range(agg["terms"].get("size", 10))]
+            buckets = [{"key": f"{field.rsplit('.', 1)[-1]}-{i}", "doc_count": count} for i, count in enumerate(counts)]
+            results[name] = {"doc_count_error_upper_bound": 0, "sum_other_doc_count": max(0, total - sum(counts)),
+                             "buckets": buckets}
+        elif "date_histogram" in agg:
+            buckets = [{"key_as_string": f"2024-05-01T{hour:02d}:00:00.000Z", "key": ALERTS_NEWEST_MS - hour * 3600_000,
+                        "doc_count": max(1, total // 24)} for hour in range(24)]
+            results[name] = {"buckets": buckets}
+        else:
+            continue
+        for bucket in results[name]["buckets"]:
+            bucket.update(make_aggregations(sub_aggs, bucket["doc_count"]))
+    return results
+
+
+def make_rule(i: int) -> Dict[str, Any]:
+    """One detection rule as returned by the rules API."""
+    return {
+        "id": f"rule-uuid-{i}",
+        "rule_id": f"rule-{i}",
+        "name": f"{_RULE_NAMES[i % len(_RULE_NAMES)]} #{i}",
+        "description": "Detects activity commonly associated with attacker tradecraft. " * 3,
+        "enabled": i % 3 != 0,
+        "type": "query",
+        "severity": _SEVERITIES[i % len(_SEVERITIES)],
+        "risk_score": 21 + (i % 4) * 26,
+        "tags": ["Domain: Endpoint", "OS: Windows", "Tactic: Execution"],
+        "interval": "5m",
+        "from": "now-6m",
+        "index": ["logs-endpoint.events.*", "winlogbeat-*"],
+        "query": "process.name : \"powershell.exe\"",
+        "threat": [{"framework": "MITRE ATT&CK", "tactic": {"id": "TA0002", "name": "Execution"}}],
+        "updated_at": "2024-05-01T00:00:00.000Z",
+        "execution_summary": {"last_execution": {"status": "succeeded", "date": "2024-05-01T00:00:00.000Z"}},
+    }
+
+
+def make_rules_response(count: int, page: int = 1, per_page: int = 0) -> Dict[str, Any]:
+    """A ``/api/detection_engine/rules/_find`` response for a page of ``count`` rules."""
+    per_page = per_page or count
+    start = (page - 1) * per_page
+    return {
+        "page": page,
+        "perPage": per_page,
+        "total": count,
+        "data": [make_rule(i) for i in range(start, min(start + per_page, count))],
+    }
+
+
+def make_case(i: int) -> Dict[str, Any]:
+    """One case as returned by the cases API."""
+    return {
+        "id": f"case-{i}",
+        "version": "WzEsMV0=",
+        "title": f"Investigate {_RULE_NAMES[i % len(_RULE_NAMES)].lower()} on host-{i % 500}",
+        "description": "Escalated from the alert triage queue. " * 3,
+        "status": ["open", "in-progress", "closed"][i % 3],
+        "severity": _SEVERITIES[i % len(_SEVERITIES)],
+        "tags": ["triage", f"host-{i % 500}"],
+        "owner": "securitySolution",
+        "totalAlerts": i % 7,
+        "totalComment": i % 5,
+        "created_at": "2024-05-01T00:00:00.000Z",
+        "created_by": {"username": "analyst", "full_name": "SOC Analyst"},
+        "connector": {"id": "none", "name": "none", "type": ".none", "fields": None},
+        "settings": {"syncAlerts": True},
+    }
+
+
+def make_cases_response(count: int, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
+    """A ``/api/cases/_find`` response."""
+    start = (page - 1) * per_page
+    return {
+        "page": page,
+        "per_page": per_page,
+        "total": count,
+        "cases": [make_case(i) for i in range(start, min(start + per_page, count))],
+        "count_open_cases": count // 3,
+        "count_in_progress_cases": count // 3,
+        "count_closed_cases": count - 2 * (count // 3),
+    }
+
+
+def make_saved_object(i: int) -> Dict[str, Any]:
+    """One dashboard saved object with a realistically sized panel definition."""
+    return {
+        "id": f"dashboard-{i}",
+        "type": "dashboard",
+        "namespaces": ["default"],
+        "updated_at": "2024-05-01T00:00:00.000Z",
+        "version": "WzUsMV0=",
+        "attributes": {
+            "title": f"SOC overview {i}",
+            "description": "Alert volume, top hosts and rule health.",
+            "panelsJSON": "[" + ",".join(
+                f'{{"panelIndex":"{p}","gridData":{{"x":0,"y":{p * 15},"w":24,"h":15}},"type":"lens"}}' for p in range(12)) + "]",
+            "optionsJSON": '{"useMargins":true,"syncColors":false}',
+            "timeRestore": False,
+        },
+        "references": [{"id": f"lens-{i}-{p}", "name": f"panel_{p}", "type": "lens"} for p in range(12)],
+    }
+
+
+def make_export_ndjson(count: int) -> bytes:
+    """A ``/api/saved_objects/_export`` body: ``count`` objects plus the export summary line."""
+    lines = [json.dumps(make_saved_object(i)) for i in range(count)]
+    lines.append(json.dumps({"exportedCount": count, "missingRefCount": 0, "missingReferences": []}))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def make_action(i: int, command: str = "isolate") -> Dict[str, Any]:
+    """One endpoint response action."""
+    completed = i % 2 == 0
+    return {
+        "id": f"action-{i}",
+        "name": command,
+        "type": "INPUT_ACTION",
+        "status": "successful" if completed else "pending",
+        "startedAt": "2024-05-01T00:00:00.000Z",
+        "completedAt": "2024-05-01T00:01:00.000Z" if completed else None,
+        "userId": "analyst",
+        "comment": "Containment while investigating",
+        "agents": [{"id": f"agent-{i % 500}", "type": "endpoint", "status": "successful" if completed else "pending"}],
+        "outputs": [{"agentId": f"agent-{i % 500}", "actionId": f"action-{i}", "type": "text",
+                     "status": "successful", "content": {"output": "done"}}] if completed else [],
+    }
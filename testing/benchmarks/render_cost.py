@@ -0,0 +1,68 @@
+"""Measures the shared render stage against the legacy ``json.dumps(..., indent=2)`` output.
+
+Run with: PYTHONPATH=src python -m testing.benchmarks.render_cost [--alerts 500] [--rules 500]
+"""
+
+import argparse
+import json
+import time
+
+from kibana_mcp.tools.utils import render_json
+from kibana_mcp.tools.utils._render import begin_render_options, end_render_options, BYTES_PER_TOKEN
+
+from .payloads import make_alerts_response, make_rules_response
+
+# find_rules keeps whole rules by default; projected variants ask for a rule list's worth
+RULE_FIELDS = ["id", "rule_id", "name", "enabled", "severity", "risk_score", "tags", "updated_at"]
+
+
+def _time_render(fn, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        text = fn()
+    return text, (time.perf_counter() - started) / repeat * 1000
+
+
+def _render(payload, tool_name, **overrides):
+    token = begin_render_options(**overrides)
+    try:
+        return render_json(payload, tool_name=tool_name)
+    finally:
+        end_render_options(token)
+
+
+def measure(tool_name: str, payload, repeat: int, fields=None):
+    """``fields`` is the projection of the projected variants (the tool's default when None)."""
+    variants = {
+        "legacy_pretty": lambda: json.dumps(payload, indent=2),
+        "pretty_projected": lambda: _render(payload, tool_name, fields=fields),
+        "compact_full": lambda: _render(payload, tool_name, compact=True, fields=["*"]),
+        "compact_projected": lambda: _render(payload, tool_name, compact=True, fields=fields),
+    }
+    results = {}
+    for name, fn in variants.items():
+        text, ms = _time_render(fn, repeat)
+        size = len(text.encode("utf-8"))
+        results[name] = {"bytes": size, "approx_tokens": size // BYTES_PER_TOKEN, "ms": round(ms, 3)}
+    baseline = results["legacy_pretty"]["bytes"]
+    for result in results.values():
+        result["ratio_vs_legacy"] = round(result["bytes"] / baseline, 3)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alerts", type=int, default=500, help="Alerts in the get_alerts payload")
+    parser.add_argument("--rules", type=int, default=500, help="Rules in the find_rules payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Renders per variant")
+    args = parser.parse_args()
+
+    report = {
+        "get_alerts": measure("get_alerts", make_alerts_response(args.alerts), args.repeat),
+        "find_rules": measure("find_rules", make_rules_response(args.rules), args.repeat, fields=RULE_FIELDS),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""Load generator for the SSE transport: many concurrent short-lived MCP sessions.
+
+Starts a fake Kibana and kibana-mcp in SSE mode (or targets ``--url``), opens ``--sessions``
+concurrent SSE sessions that each run a weighted mix of tool calls, and reports session setup
+latency, tool call latency distributions, errors and the server's RSS over time as JSON.
+
+Run with: PYTHONPATH=src python -m testing.benchmarks.sse_load --sessions 200 --calls-per-session 5
+          [--mix get_alerts=5,find_rules=2,get_case=3] [--ramp-up 2] [--output sse_load.json]
+
+The generator is a single asyncio process; for more sessions than one process can drive, run
+several generators with ``--url`` against the same server.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+from .mock_kibana import FakeKibana
+from .startup import SERVER_COMMAND, _free_port, _server_env, _wait_for_port
+from .tool_latency import _percentile
+
+# MCP tool arguments used by the mix; list-style tools ask for realistic page sizes
+TOOL_ARGUMENTS: Dict[str, Dict[str, Any]] = {
+    "get_alerts": {"limit": 50, "search_text": "*"},
+    "find_rules": {"page": 1, "per_page": 100},
+    "get_rule": {"rule_id": "rule-1"},
+    "get_rule_exceptions": {"rule_id": "rule-1"},
+    "find_cases": {"page": 1, "per_page": 20},
+    "get_case": {"case_id": "case-1"},
+    "get_case_comments": {"case_id": "case-1"},
+    "get_case_tags": {},
+    "find_objects": {"type": ["dashboard"], "per_page": 20},
+    "get_response_actions": {"page": 1, "page_size": 20},
+    "tag_alert": {"alert_id": "alert-1", "tags": ["load-test"]},
+    "adjust_alert_status": {"alert_id": "alert-1", "new_status": "acknowledged"},
+}
+
+DEFAULT_MIX = "get_alerts=4,find_rules=2,get_rule=2,find_cases=2,get_case=3,get_case_comments=1,tag_alert=1"
+
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    """Parses ``tool=weight,...``; every tool needs an entry in TOOL_ARGUMENTS."""
+    mix = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        tool, _, weight = item.partition("=")
+        tool = tool.strip()
+        if tool not in TOOL_ARGUMENTS:
+            raise ValueError(f"No arguments defined for tool '{tool}'. Known: {', '.join(sorted(TOOL_ARGUMENTS))}")
+        mix.append((tool, float(weight) if weight else 1.0))
+    if not mix:
+        raise ValueError("The tool mix is empty")
+    return mix
+
+
+def distribution(samples: List[float]) -> Dict[str, Any]:
+    """Latency distribution in milliseconds."""
+    values = sorted(samples)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "p50_ms": round(_percentile(values, 50) * 1000, 3),
+        "p90_ms": round(_percentile(values, 90) * 1000, 3),
+        "p99_ms": round(_percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3),
+    }
+
+
+def rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process, from /proc on Linux or ``ps`` elsewhere."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        completed = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True, check=True)
+        return int(completed.stdout.strip()) * 1024
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
+class LoadResults:
+    def __init__(self):
+        self.setup: List[float] = []
+        self.calls: Dict[str, List[float]] = {}
+        self.errors: Counter = Counter()
+        self.completed_sessions = 0
+        self.rss: List[Tuple[float, int]] = []
+
+    def error(self, kind: str, exc: Optional[BaseException] = None) -> None:
+        self.errors[f"{kind}:{type(exc).__name__}" if exc is not None else kind] += 1
+
+
+async def run_session(url: str, mix: List[Tuple[str, float]], calls: int, rng: random.Random,
+                      results: LoadResults, timeout: float) -> None:
+    tools = [tool for tool, _ in mix]
+    weights = [weight for _, weight in mix]
+    started = time.perf_counter()
+    try:
+        async with sse_client(url, timeout=timeout, sse_read_timeout=timeout) as (read, write):
+            async with ClientSession(read, write) as session:
+                await asyncio.wait_for(session.initialize(), timeout)
+                results.setup.append(time.perf_counter() - started)
+                for tool in rng.choices(tools, weights, k=calls):
+                    call_started = time.perf_counter()
+                    try:
+                        result = await asyncio.wait_for(session.call_tool(tool, TOOL_ARGUMENTS[tool]), timeout)
+                    except Exception as exc:
+                        results.error(f"call:{tool}", exc)
+                        continue
+                    results.calls.setdefault(tool, []).append(time.perf_counter() - call_started)
+                    if result.isError:
+                        results.error(f"tool_error:{tool}")
+        results.completed_sessions += 1
+    except Exception as exc:
+        # Connection refused, handshake timeouts, dropped streams, ...
+        results.error("session", exc)
+
+
+async def sample_rss(pid: int, interval: float, started: float, results: LoadResults, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        rss = rss_bytes(pid)
+        if rss is not None:
+            results.rss.append((round(time.perf_counter() - started, 3), rss))
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_load(url: str, server_pid: Optional[int], args: argparse.Namespace) -> Dict[str, Any]:
+    mix = parse_mix(args.mix)
+    results = LoadResults()
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    stop = asyncio.Event()
+    sampler = None
+    if server_pid is not None:
+        sampler = asyncio.create_task(sample_rss(server_pid, args.sample_interval, started, results, stop))
+
+    semaphore = asyncio.Semaphore(args.concurrency or args.sessions)
+
+    async def start_session(index: int) -> None:
+        # Spread session starts evenly over the ramp-up period
+        if args.ramp_up:
+            await asyncio.sleep(args.ramp_up * index / args.sessions)
+        async with semaphore:
+            await run_session(url, mix, args.calls_per_session, random.Random(rng.random()), results, args.timeout)
+
+    await asyncio.gather(*(start_session(index) for index in range(args.sessions)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    if sampler is not None:
+        await sampler
+
+    all_calls = [latency for latencies in results.calls.values() for latency in latencies]
+    rss_values = [rss for _, rss in results.rss]
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "sessions": {"requested": args.sessions, "completed": results.completed_sessions},
+        "session_setup": distribution(results.setup),
+        "tool_calls": {
+            "all": distribution(all_calls),
+            "calls_per_sec": round(len(all_calls) / elapsed, 2) if elapsed else None,
+            "by_tool": {tool: distribution(latencies) for tool, latencies in sorted(results.calls.items())},
+        },
+        "errors": {"total": sum(results.errors.values()), "by_kind": dict(results.errors)},
+        "server_rss": {
+            "start_bytes": rss_values[0] if rss_values else None,
+            "peak_bytes": max(rss_values) if rss_values else None,
+            "end_bytes": rss_values[-1] if rss_values else None,
+            "samples": [{"t": t, "bytes": rss} for t, rss in results.rss],
+        },
+    }
+
+
+async def run_with_local_server(args: argparse.Namespace) -> Dict[str, Any]:
+    fake = FakeKibana(latency=args.kibana_latency)
+    with fake.serve() as kibana_url:
+        port = _free_port()
+        env = _server_env(kibana_url, MCP_TRANSPORT="sse", MCP_SSE_HOST="127.0.0.1", MCP_SSE_PORT=str(port))
+        env.pop("PORT", None)
+        log = open(args.server_log, "w") if args.server_log else subprocess.DEVNULL
+        process = subprocess.Popen([sys.executable, "-c", SERVER_COMMAND], env=env, stdout=log, stderr=log)
+        try:
+            await _wait_for_port(port, process, timeout=60)
+            report = await run_load(f"http://127.0.0.1:{port}/sse", process.pid, args)
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+            if log is not subprocess.DEVNULL:
+                log.close()
+        report["kibana_requests"] = sum(fake.stats().values())
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100, help="Total SSE sessions to open")
+    parser.add_argument("--concurrency", type=int, default=0, help="Sessions open at once (default: all)")
+    parser.add_argument("--calls-per-session", type=int, default=5, help="Tool calls per session")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted tool mix, e.g. get_alerts=5,get_case=1")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds over which sessions start")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-step timeout in seconds")
+    parser.add_argument("--kibana-latency", type=float, default=0.0, help="Seconds the fake Kibana adds per response")
+    parser.add_argument("--sample-interval", type=float, default=0.25, help="Seconds between server RSS samples")
+    parser.add_argument("--url", help="Load an already running server's SSE endpoint instead of starting one")
+    parser.add_argument("--server-pid", type=int, help="PID of the --url server, for RSS sampling")
+    parser.add_argument("--server-log", help="Write the started server's output to this file")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the tool mix")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+    # Per-request client logs would dominate the generator's own CPU time
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("kibana-mcp").setLevel(logging.WARNING)
+
+    if args.url:
+        load = run_load(args.url, args.server_pid, args)
+    else:
+        load = run_with_local_server(args)
+    report = {
+        "benchmark": "sse_load",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "settings": {
+            "sessions": args.sessions, "concurrency": args.concurrency or args.sessions,
+            "calls_per_session": args.calls_per_session, "mix": args.mix, "ramp_up": args.ramp_up,
+            "kibana_latency": args.kibana_latency, "url": args.url,
+        },
+        **asyncio.run(load),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Measures kibana-mcp cold start: import time per module, and time from process start to the
+first tool-list and tool-call responses in STDIO and SSE mode, against a local fake Kibana.
+
+Run with: PYTHONPATH=src python -m testing.benchmarks.startup [--runs 5] [--output startup.json]
+
+The report is JSON so results can be stored per commit and compared for cold-start regressions.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+
+from .mock_kibana import FakeKibana
+
+# Starts the server the same way the ``kibana-mcp`` entry point does
+SERVER_COMMAND = "from kibana_mcp.server import run_server; run_server()"
+
+# Third-party modules reported next to every kibana_mcp module
+REPORTED_MODULES = ("fastmcp", "mcp", "pydantic", "httpx", "starlette", "uvicorn")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+def _server_env(kibana_url: str, **extra: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(__file__), "..", "..", "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.abspath(src), env.get("PYTHONPATH")]))
+    env.update({"KIBANA_URL": kibana_url, "KIBANA_USERNAME": "bench", "KIBANA_PASSWORD": "bench"})
+    env.update(extra)
+    return env
+
+
+def _median(samples: List[float]) -> Optional[float]:
+    return round(statistics.median(samples), 3) if samples else None
+
+
+def _summary(samples: Dict[str, List[float]]) -> Dict[str, Any]:
+    return {
+        name: {"median_ms": _median(values), "min_ms": round(min(values), 3), "max_ms": round(max(values), 3),
+               "samples_ms": [round(value, 3) for value in values]}
+        for name, values in samples.items() if values
+    }
+
+
+# --- Import time ---
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, float]]:
+    """Parses ``python -X importtime`` output into {module: {self_ms, cumulative_ms}}."""
+    modules: Dict[str, Dict[str, float]] = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules[name] = {"self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000}
+    return modules
+
+
+def _reported(name: str) -> bool:
+    return name.startswith("kibana_mcp") or name in REPORTED_MODULES
+
+
+def measure_imports(runs: int, env: Dict[str, str]) -> Dict[str, Any]:
+    """Import time per module, plus wall time of ``import kibana_mcp.server`` and of loading every tool."""
+    # Tool modules load on first call, so they are imported after the server module
+    script = "import kibana_mcp.server\nfrom kibana_mcp.tools._manifest import preload_all\npreload_all()\n"
+    timing_script = (
+        "import time\nstarted = time.perf_counter()\nimport kibana_mcp.server\nimported = time.perf_counter()\n"
+        "from kibana_mcp.tools._manifest import preload_all\npreload_all()\n"
+        "print(imported - started, time.perf_counter() - imported)\n"
+    )
+    per_module: Dict[str, Dict[str, List[float]]] = {}
+    wall: Dict[str, List[float]] = {"import_server": [], "load_all_tools": [], "process_import_server": []}
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                                   capture_output=True, text=True, env=env, check=True)
+        for name, timing in parse_importtime(completed.stderr).items():
+            if _reported(name):
+                entry = per_module.setdefault(name, {"self_ms": [], "cumulative_ms": []})
+                entry["self_ms"].append(timing["self_ms"])
+                entry["cumulative_ms"].append(timing["cumulative_ms"])
+
+        completed = subprocess.run([sys.executable, "-c", timing_script],
+                                   capture_output=True, text=True, env=env, check=True)
+        import_seconds, load_seconds = (float(value) for value in completed.stdout.split())
+        wall["import_server"].append(import_seconds * 1000)
+        wall["load_all_tools"].append(load_seconds * 1000)
+
+        # Interpreter start included, as a process manager sees it
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import kibana_mcp.server"], capture_output=True, env=env, check=True)
+        wall["process_import_server"].append((time.perf_counter() - started) * 1000)
+
+    modules = {
+        name: {"self_ms": _median(values["self_ms"]), "cumulative_ms": _median(values["cumulative_ms"])}
+        for name, values in sorted(per_module.items())
+    }
+    return {"wall": _summary(wall), "modules": modules}
+
+
+# --- Time to first response ---
+
+async def _exercise(session: ClientSession, started: float, tool: str, arguments: Dict[str, Any]) -> Dict[str, float]:
+    timings: Dict[str, float] = {}
+    await session.initialize()
+    timings["initialize"] = (time.perf_counter() - started) * 1000
+    tools = await session.list_tools()
+    timings["first_tool_list"] = (time.perf_counter() - started) * 1000
+    if not any(item.name == tool for item in tools.tools):
+        raise RuntimeError(f"Tool '{tool}' is not registered")
+    call_started = time.perf_counter()
+    result = await session.call_tool(tool, arguments)
+    timings["first_tool_response"] = (time.perf_counter() - started) * 1000
+    timings["first_tool_call"] = (time.perf_counter() - call_started) * 1000
+    if result.isError:
+        raise RuntimeError(f"Tool '{tool}' failed: {result.content}")
+    return timings
+
+
+async def measure_stdio(env: Dict[str, str], tool: str, arguments: Dict[str, Any]) -> Dict[str, float]:
+    params = StdioServerParameters(command=sys.executable, args=["-c", SERVER_COMMAND], env=env)
+    with open(os.devnull, "w") as errlog:
+        started = time.perf_counter()
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                return await _exercise(session, started, tool, arguments)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_for_port(port: int, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before listening")
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.01)
+    raise TimeoutError(f"Server did not listen on port {port} within {timeout}s")
+
+
+async def measure_sse(env: Dict[str, str], tool: str, arguments: Dict[str, Any], timeout: float = 60.0) -> Dict[str, float]:
+    port = _free_port()
+    env = dict(env, MCP_TRANSPORT="sse", MCP_SSE_HOST="127.0.0.1", MCP_SSE_PORT=str(port))
+    env.pop("PORT", None)
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", SERVER_COMMAND], env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        await _wait_for_port(port, process, timeout)
+        listening = (time.perf_counter() - started) * 1000
+        async with sse_client(f"http://127.0.0.1:{port}/sse") as (read, write):
+            async with ClientSession(read, write) as session:
+                timings = await _exercise(session, started, tool, arguments)
+        return {"listening": listening, **timings}
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _collect(runs: int, measure, *args) -> Dict[str, Any]:
+    samples: Dict[str, List[float]] = {}
+    for _ in range(runs):
+        for name, value in asyncio.run(measure(*args)).items():
+            samples.setdefault(name, []).append(value)
+    return _summary(samples)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per measurement")
+    parser.add_argument("--modes", default="imports,stdio,sse", help="Comma-separated subset of imports,stdio,sse")
+    parser.add_argument("--tool", default="get_alerts", help="Tool used for the first call")
+    parser.add_argument("--arguments", default='{"limit": 10, "search_text": "*"}', help="JSON arguments for --tool")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+    modes = {mode.strip() for mode in args.modes.split(",") if mode.strip()}
+    arguments = json.loads(args.arguments)
+
+    report: Dict[str, Any] = {
+        "benchmark": "startup",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "tool": args.tool,
+    }
+    with FakeKibana().serve() as kibana_url:
+        env = _server_env(kibana_url)
+        if "imports" in modes:
+            report["imports"] = measure_imports(args.runs, env)
+        if "stdio" in modes:
+            report["stdio"] = _collect(args.runs, measure_stdio, env, args.tool, arguments)
+        if "sse" in modes:
+            report["sse"] = _collect(args.runs, measure_sse, env, args.tool, arguments)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
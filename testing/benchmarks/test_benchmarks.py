@@ -0,0 +1,106 @@
+import json
+import os
+
+import httpx
+import pytest
+
+from kibana_mcp.tools.alerts.get_alerts import _call_get_alerts
+from kibana_mcp.tools.saved_objects.export_objects import _call_export_objects
+from testing.benchmarks.mock_kibana import FakeKibana
+from kibana_mcp.tools._manifest import TOOL_MODULES
+from testing.benchmarks.startup import parse_importtime
+from testing.benchmarks import sse_load, tool_latency
+
+
+def test_parse_importtime_reads_self_and_cumulative_times():
+    # Arrange
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     kibana_mcp.metrics\n"
+        "import time:      2500 |      30000 |   fastmcp\n"
+    )
+
+    # Act
+    modules = parse_importtime(stderr)
+
+    # Assert
+    assert modules == {
+        "kibana_mcp.metrics": {"self_ms": 0.12, "cumulative_ms": 0.12},
+        "fastmcp": {"self_ms": 2.5, "cumulative_ms": 30.0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_fake_kibana_serves_tool_requests_in_process():
+    # Arrange
+    fake = FakeKibana(alerts=50, export_objects=3)
+    async with httpx.AsyncClient(base_url="http://kibana", transport=fake.transport()) as client:
+        # Act
+        alerts = await _call_get_alerts(client, limit=20, search_text="*")
+        export = await _call_export_objects(client, objects=[{"type": "dashboard", "id": "dashboard-1"}])
+
+    # Assert
+    assert alerts.count('"kibana.alert.rule.name"') == 20
+    assert len(json.loads(export)) == 4
+    assert fake.stats()["POST /api/detection_engine/signals/search"] == 1
+
+
+def test_fake_kibana_serves_over_http_with_space_prefix():
+    # Arrange
+    fake = FakeKibana()
+
+    # Act
+    with fake.serve() as url:
+        found = httpx.get(f"{url}/s/soc/api/detection_engine/rules/_find", params={"per_page": 5})
+        missing = httpx.get(f"{url}/api/unknown")
+
+    # Assert
+    assert found.status_code == 200
+    assert len(found.json()["data"]) == 5
+    assert missing.status_code == 404
+
+
+def test_tool_latency_covers_every_tool():
+    # Assert
+    assert set(tool_latency.scenarios(10, 10)) == {name[len("_call_"):] for name in TOOL_MODULES}
+
+
+def test_tool_latency_reports_percentiles_and_memory(tmp_path):
+    # Arrange
+    output = tmp_path / "tool_latency.json"
+
+    # Act
+    tool_latency.main(["--tools", "get_alerts,get_case", "--alerts", "200", "--iterations", "4",
+                       "--warmup", "0", "--wrapper", "--quiet", "--output", str(output)])
+
+    # Assert
+    report = json.loads(output.read_text())
+    for tool in ("get_alerts", "get_case"):
+        stats = report["tools"][tool]
+        assert stats["iterations"] == 4
+        assert 0 < stats["p50_ms"] <= stats["p99_ms"]
+        assert stats["calls_per_sec"] > 0
+        assert stats["peak_memory_bytes"] > 0
+    assert report["tools"]["get_alerts"]["result_bytes"] > report["tools"]["get_case"]["result_bytes"]
+
+
+def test_sse_load_parses_weighted_mix():
+    # Act
+    mix = sse_load.parse_mix("get_alerts=3, get_case")
+
+    # Assert
+    assert mix == [("get_alerts", 3.0), ("get_case", 1.0)]
+    with pytest.raises(ValueError):
+        sse_load.parse_mix("delete_rule=1")
+
+
+def test_sse_load_distribution_and_rss():
+    # Act
+    stats = sse_load.distribution([0.001 * i for i in range(1, 101)])
+    rss = sse_load.rss_bytes(os.getpid())
+
+    # Assert
+    assert stats["count"] == 100
+    assert stats["p50_ms"] == 50.0
+    assert stats["p99_ms"] == 99.0
+    assert rss is None or rss > 0
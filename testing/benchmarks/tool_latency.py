@@ -0,0 +1,263 @@
+"""Per-tool latency, throughput and memory benchmark, fully offline.
+
+Runs every ``_call_*`` implementation against a fake Kibana on ``httpx.MockTransport`` serving
+realistically sized payloads (1000-hit alert pages, 5k-rule ``_find`` pages, large NDJSON
+exports), and reports p50/p99 latency, calls/sec and peak memory per tool as JSON.
+
+Run with: PYTHONPATH=src python -m testing.benchmarks.tool_latency [--tools get_alerts,find_rules]
+          [--iterations 20] [--wrapper] [--output tool_latency.json]
+
+``--wrapper`` calls tools through ``execute_tool_safely`` (metrics, caching, rendering), as the
+server does; ``--cache`` additionally keeps the response cache enabled between calls.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from kibana_mcp.client import KibanaClient, PoolSettings
+from kibana_mcp.tools._manifest import load_impl
+from kibana_mcp.tools.alerts._query import MAX_ALERTS_PAGE
+from kibana_mcp.tools.utils import NullCache, ResponseCache, execute_tool_safely
+from kibana_mcp.tools.utils._cursor import encode_cursor
+
+from .mock_kibana import FakeKibana
+from .payloads import ALERTS_NEWEST_MS
+
+RULE_UUID = "9a1a2dae-0b5f-4c3d-9b1c-1234567890ab"
+_EXCEPTION_ITEM = {
+    "name": "Exclude build server",
+    "description": "Known-good automation",
+    "entries": [{"field": "host.name", "operator": "included", "type": "match", "value": "build-01"}],
+}
+_OBJECTS = [{"type": "dashboard", "id": f"dashboard-{i}"} for i in range(20)]
+
+
+def scenarios(alerts: int, rules: int) -> Dict[str, Dict[str, Any]]:
+    """Arguments per tool. The list-style tools request the largest page the fake serves."""
+    return {
+        # Alert tools
+        "tag_alert": {"alert_id": "alert-1", "tags_to_add": ["triaged"]},
+        "adjust_alert_status": {"alert_id": "alert-1", "new_status": "acknowledged"},
+        "get_alerts": {"limit": min(alerts, MAX_ALERTS_PAGE), "search_text": "*"},
+        "poll_new_alerts": {"search_text": "*", "checkpoint": encode_cursor([ALERTS_NEWEST_MS, "uuid"])},
+        "bulk_tag_alerts": {"alert_ids": [f"alert-{i}" for i in range(3000)], "tags_to_add": ["false-positive"]},
+        "bulk_adjust_alert_status": {"new_status": "closed", "alert_ids": [f"alert-{i}" for i in range(3000)]},
+        "aggregate_alerts": {"group_by": ["kibana.alert.rule.name", "host.name"], "interval": "1h",
+                             "count_distinct": ["user.name"]},
+
+        # Rule tools
+        "get_rule": {"rule_id": "rule-1"},
+        "delete_rule": {"rule_id": "rule-1"},
+        "update_rule_status": {"rule_id": "rule-1", "enabled": False},
+        "find_rules": {"page": 1, "per_page": rules},
+        "get_prepackaged_rules_status": {},
+        "install_prepackaged_rules": {},
+
+        # Exception tools
+        "get_rule_exceptions": {"rule_id": "rule-1"},
+        "add_rule_exception_items": {"rule_id": RULE_UUID, "items": [_EXCEPTION_ITEM]},
+        "create_exception_list": {"list_id": "trusted", "name": "Trusted", "description": "Trusted hosts", "type": "detection"},
+        "associate_shared_exception_list": {"rule_id": "rule-1", "exception_list_id": "trusted"},
+
+        # Saved Objects tools
+        "find_objects": {"type": ["dashboard"], "per_page": 100},
+        "get_object": {"type": "dashboard", "id": "dashboard-1"},
+        "bulk_get_objects": {"objects": _OBJECTS},
+        "create_object": {"type": "dashboard", "attributes": {"title": "Bench"}},
+        "update_object": {"type": "dashboard", "id": "dashboard-1", "attributes": {"title": "Bench"}},
+        "delete_object": {"type": "dashboard", "id": "dashboard-1"},
+        "export_objects": {"objects": _OBJECTS},
+        "import_objects": {"objects_ndjson": json.dumps({"type": "dashboard", "id": "d-1", "attributes": {"title": "x"}})},
+
+        # Endpoint tools
+        "isolate_endpoint": {"endpoint_ids": ["agent-1"]},
+        "unisolate_endpoint": {"endpoint_ids": ["agent-1"]},
+        "run_command_on_endpoint": {"endpoint_ids": ["agent-1"], "command": "execute", "parameters": {"command": "ls"}},
+        "get_response_actions": {"page": 1, "page_size": 100},
+        "get_response_action_details": {"action_id": "action-1"},
+        "get_response_action_status": {"query": {"agent_ids": ["agent-1"]}},
+        "kill_process": {"endpoint_ids": ["agent-1"], "parameters": {"pid": 1234}},
+        "suspend_process": {"endpoint_ids": ["agent-1"], "parameters": {"pid": 1234}},
+        "scan_endpoint": {"endpoint_ids": ["agent-1"], "parameters": {"path": "/tmp"}},
+        "get_file_info": {"action_id": "action-1", "file_id": "file-1"},
+        "download_file": {"action_id": "action-1", "file_id": "file-1"},
+
+        # Cases tools
+        "find_cases": {"page": 1, "per_page": 100},
+        "get_case": {"case_id": "case-1"},
+        "create_case": {"title": "Bench", "description": "Benchmark case"},
+        "update_case": {"case_id": "case-1", "version": "WzEsMV0=", "status": "in-progress"},
+        "delete_cases": {"case_ids": ["case-1"]},
+        "add_case_comment": {"case_id": "case-1", "comment": "Checked"},
+        "get_case_comments": {"case_id": "case-1", "per_page": 100},
+        "get_case_alerts": {"case_id": "case-1"},
+        "get_cases_by_alert": {"alert_id": "alert-1"},
+        "get_case_configuration": {},
+        "get_case_tags": {},
+    }
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(percentile / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class ToolRunner:
+    """Calls one tool, either directly or through ``execute_tool_safely``."""
+
+    def __init__(self, client: httpx.AsyncClient, tool: str, arguments: Dict[str, Any], wrapper: bool, cache):
+        self.client = client
+        self.tool = tool
+        self.arguments = arguments
+        self.wrapper = wrapper
+        self.cache = cache
+        self.impl = load_impl(f"_call_{tool}")
+
+    async def __call__(self) -> int:
+        """Runs the tool once and returns the result size in bytes."""
+        if self.wrapper:
+            result = await execute_tool_safely(self.tool, self.impl, self.client, cache=self.cache, **self.arguments)
+            text = result[0].text
+        else:
+            text = str(await self.impl(http_client=self.client, **self.arguments))
+        return len(text.encode("utf-8"))
+
+
+async def measure_tool(runner: ToolRunner, iterations: int, warmup: int, concurrency: int) -> Dict[str, Any]:
+    for _ in range(warmup):
+        await runner()
+
+    latencies: List[float] = []
+
+    async def worker(calls: int) -> None:
+        for _ in range(calls):
+            started = time.perf_counter()
+            await runner()
+            latencies.append(time.perf_counter() - started)
+
+    shares = [iterations // concurrency + (1 if i < iterations % concurrency else 0) for i in range(concurrency)]
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(calls) for calls in shares if calls))
+    elapsed = time.perf_counter() - started
+
+    # Peak Python heap of one call, measured separately since tracing slows calls down
+    tracemalloc.start()
+    result_bytes = await runner()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "iterations": len(latencies),
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+        "calls_per_sec": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "peak_memory_bytes": peak,
+        "result_bytes": result_bytes,
+    }
+
+
+def _max_rss_bytes() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    fake = FakeKibana(alerts=args.alerts, rules=args.rules, export_objects=args.export_objects, latency=args.latency)
+    all_scenarios = scenarios(args.alerts, args.rules)
+    selected = [tool.strip() for tool in args.tools.split(",")] if args.tools else list(all_scenarios)
+    unknown = [tool for tool in selected if tool not in all_scenarios]
+    if unknown:
+        raise SystemExit(f"Unknown tools: {', '.join(unknown)}")
+
+    if args.client == "kibana":
+        client: httpx.AsyncClient = KibanaClient(
+            "http://kibana.bench", pool=PoolSettings(), network_transport=fake.transport(),
+            headers={"kbn-xsrf": "true", "Content-Type": "application/json"})
+    else:
+        client = httpx.AsyncClient(base_url="http://kibana.bench", transport=fake.transport())
+
+    results: Dict[str, Any] = {}
+    async with client:
+        for tool in selected:
+            cache = ResponseCache() if args.cache else NullCache()
+            runner = ToolRunner(client, tool, all_scenarios[tool], args.wrapper, cache)
+            try:
+                results[tool] = await measure_tool(runner, args.iterations, args.warmup, args.concurrency)
+            except Exception as exc:
+                # Report the failure and keep benchmarking the other tools
+                results[tool] = {"error": f"{type(exc).__name__}: {exc}"}
+                if not args.quiet:
+                    print(f"{tool:36s} failed: {results[tool]['error']}", file=sys.stderr)
+                continue
+            if not args.quiet:
+                stats = results[tool]
+                print(f"{tool:36s} p50 {stats['p50_ms']:9.3f} ms  p99 {stats['p99_ms']:9.3f} ms  "
+                      f"{stats['calls_per_sec']:9.1f}/s  peak {stats['peak_memory_bytes'] / 1e6:8.2f} MB",
+                      file=sys.stderr)
+
+    return {
+        "benchmark": "tool_latency",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "settings": {
+            "alerts": args.alerts, "rules": args.rules, "export_objects": args.export_objects,
+            "iterations": args.iterations, "warmup": args.warmup, "concurrency": args.concurrency,
+            "client": args.client, "wrapper": args.wrapper, "cache": args.cache, "latency": args.latency,
+        },
+        "tools": results,
+        "process_max_rss_bytes": _max_rss_bytes(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", help="Comma-separated tool names (default: every tool)")
+    parser.add_argument("--iterations", type=int, default=20, help="Measured calls per tool")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured calls per tool")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent callers per tool")
+    parser.add_argument("--alerts", type=int, default=10_000, help="Alerts the fake Kibana holds (get_alerts pages are capped at 1000)")
+    parser.add_argument("--rules", type=int, default=5_000, help="Rules in the find_rules page")
+    parser.add_argument("--export-objects", type=int, default=2_000, help="Saved objects in the NDJSON export")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the fake Kibana adds to each response")
+    parser.add_argument("--client", choices=("kibana", "plain"), default="kibana",
+                        help="KibanaClient (full transport stack) or a plain httpx.AsyncClient")
+    parser.add_argument("--wrapper", action="store_true", help="Call tools through execute_tool_safely")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache enabled (with --wrapper)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--quiet", action="store_true", help="Do not print per-tool progress to stderr")
+    parser.add_argument("--verbose", action="store_true", help="Keep the tools' INFO logging")
+    args = parser.parse_args(argv)
+    if not args.verbose:
+        logging.getLogger("kibana-mcp").setLevel(logging.WARNING)
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import pytest
+import httpx
+import asyncio
+
+from kibana_mcp import metrics
+from kibana_mcp.client import KibanaClient, PoolSettings, ResilienceTransport, RetryPolicy, TimeoutClasses
+from kibana_mcp.client.deadlines import DeadlineExceeded, apply_deadline, begin_deadline, end_deadline, remaining
+
+
+class HangingKibana:
+    """MockTransport handler that records request timeouts and hangs on paths ending in /slow."""
+
+    def __init__(self):
+        self.timeouts = []
+        self.started = asyncio.Event()
+
+    async def __call__(self, request):
+        self.timeouts.append(request.extensions["timeout"])
+        if request.url.path.endswith("/slow"):
+            self.started.set()
+            await asyncio.Event().wait()
+        return httpx.Response(200, json={})
+
+
+def create_client(handler, **kwargs):
+    return KibanaClient(
+        "http://kibana.test",
+        network_transport=httpx.MockTransport(handler),
+        pool=PoolSettings(max_connections=4),
+        timeouts=TimeoutClasses(fast=5.0, default=30.0, long=300.0),
+        single_flight=False,
+        **kwargs,
+    )
+
+
+def test_nested_deadlines_keep_the_earliest():
+    # Arrange
+    outer = begin_deadline(10)
+    try:
+        # Act
+        inner = begin_deadline(60)
+        nested = remaining()
+        end_deadline(inner)
+    finally:
+        end_deadline(outer)
+
+    # Assert
+    assert 9 < nested <= 10
+    assert remaining() is None
+
+
+def test_apply_deadline_caps_timeouts_and_rejects_expired_requests():
+    # Arrange
+    request = httpx.Request("GET", "http://kibana.test/api/cases/case-1",
+                            extensions={"timeout": {"connect": 10.0, "read": 30.0, "write": 30.0, "pool": None}})
+    token = begin_deadline(2)
+    try:
+        # Act
+        apply_deadline(request)
+    finally:
+        end_deadline(token)
+
+    # Assert
+    timeout = request.extensions["timeout"]
+    assert all(0 < timeout[key] <= 2 for key in ("connect", "read", "write", "pool"))
+
+    token = begin_deadline(-1)
+    try:
+        with pytest.raises(DeadlineExceeded):
+            apply_deadline(request)
+    finally:
+        end_deadline(token)
+
+
+@pytest.mark.asyncio
+async def test_every_request_of_a_call_shares_its_deadline():
+    # Arrange
+    kibana = HangingKibana()
+    token = begin_deadline(3)
+
+    # Act
+    try:
+        async with create_client(kibana) as client:
+            await client.get("/api/cases/case-1")
+            await client.post("/api/saved_objects/_export", json={})
+    finally:
+        end_deadline(token)
+    async with create_client(kibana) as client:
+        await client.get("/api/cases/case-1")
+
+    # Assert
+    first, second, without_deadline = kibana.timeouts
+    assert first["read"] <= 3 and second["read"] <= first["read"]
+    assert without_deadline["read"] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_when_the_backoff_would_pass_the_deadline():
+    # Arrange
+    calls = []
+    sleeps = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(503, headers={"retry-after": "2"})
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    transport = ResilienceTransport(httpx.MockTransport(handler), sleep=sleep, policy=RetryPolicy(max_attempts=3))
+    token = begin_deadline(1)
+
+    # Act
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://kibana.test") as client:
+            response = await client.get("/api/cases/case-1")
+    finally:
+        end_deadline(token)
+
+    # Assert
+    assert response.status_code == 503
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_releases_its_connection_slot_and_gauges():
+    # Arrange
+    kibana = HangingKibana()
+    labels = {"method": "GET", "path": "/api/cases/{id}"}
+    before_in_flight = metrics.KIBANA_IN_FLIGHT.value(**labels)
+
+    async with create_client(kibana) as client:
+        task = asyncio.create_task(client.get("/api/cases/slow"))
+        await kibana.started.wait()
+        # MockTransport sends no trace events, so the request counts as waiting for a connection
+        held_during = client.pool_stats()["waiters"] + client.pool_stats()["in_use"]
+        limiter_during = client.limiter.stats()["cases"]["in_flight"]
+
+        # Act
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Assert
+        assert (held_during, limiter_during) == (1, 1)
+        assert client.pool_stats()["in_use"] == 0
+        assert client.pool_stats()["waiters"] == 0
+        assert all(family["in_flight"] == 0 for family in client.limiter.stats().values())
+    assert metrics.KIBANA_IN_FLIGHT.value(**labels) == before_in_flight
+
+
+@pytest.mark.asyncio
+async def test_deadline_timeouts_do_not_trip_the_circuit_breaker():
+    # Arrange: Kibana answers in 300 ms, callers give up after 50 ms
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        read = request.extensions["timeout"]["read"]
+        await asyncio.sleep(min(read, 0.3))
+        if read < 0.3:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json={})
+
+    # Act
+    async with create_client(handler) as client:
+        for _ in range(6):
+            token = begin_deadline(0.05)
+            try:
+                with pytest.raises(httpx.ReadTimeout):
+                    await client.get("/api/detection_engine/rules/_find")
+            finally:
+                end_deadline(token)
+        response = await client.get("/api/detection_engine/rules/_find")
+
+    # Assert: one attempt per call, and the caller without a deadline still gets through
+    assert len(calls) == 7
+    assert response.status_code == 200
+    assert client.resilience.stats()["detection_engine"] == {"state": "closed", "failures": 0}
@@ -0,0 +1,118 @@
+import pytest
+import httpx
+import asyncio
+
+from kibana_mcp.client import KibanaClient, PoolSettings, TimeoutClasses
+
+
+class RecordingKibana:
+    """MockTransport handler that records the timeout applied to each request."""
+
+    def __init__(self):
+        self.timeouts = {}
+
+    def __call__(self, request):
+        self.timeouts[(request.method, request.url.path)] = request.extensions["timeout"]["read"]
+        return httpx.Response(200, json={})
+
+
+class SlowPoolTransport(httpx.AsyncBaseTransport):
+    """Network transport stand-in with one connection: requests queue until it is free."""
+
+    def __init__(self):
+        self.connection = asyncio.Lock()
+        self.release = asyncio.Event()
+
+    async def handle_async_request(self, request):
+        async with self.connection:
+            trace = request.extensions.get("trace")
+            if trace is not None:
+                await trace("http11.send_request_headers.started", {})
+            await self.release.wait()
+        return httpx.Response(200, content=b"{}")
+
+
+def create_client(network_transport, **kwargs):
+    return KibanaClient(
+        "http://kibana.test",
+        network_transport=network_transport,
+        pool=PoolSettings(max_connections=1),
+        timeouts=TimeoutClasses(fast=5.0, default=30.0, long=300.0),
+        single_flight=False,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_timeout_classes_follow_path_method_and_overrides():
+    # Arrange
+    kibana = RecordingKibana()
+
+    # Act
+    async with create_client(httpx.MockTransport(kibana)) as client:
+        await client.get("/api/cases/case-1")
+        await client.post("/api/cases", json={})
+        await client.post("/api/saved_objects/_export", json={})
+        await client.get("/api/endpoint/action/a1", extensions={"timeout_class": "long"})
+        await client.get("/api/cases/_find", timeout=1.0)
+
+    # Assert
+    assert kibana.timeouts[("GET", "/api/cases/case-1")] == 5.0
+    assert kibana.timeouts[("POST", "/api/cases")] == 30.0
+    assert kibana.timeouts[("POST", "/api/saved_objects/_export")] == 300.0
+    assert kibana.timeouts[("GET", "/api/endpoint/action/a1")] == 300.0
+    assert kibana.timeouts[("GET", "/api/cases/_find")] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_report_waiters_in_use_and_wait_time():
+    # Arrange
+    network = SlowPoolTransport()
+    client = create_client(network)
+
+    # Act
+    async with client:
+        tasks = [asyncio.create_task(client.get(f"/api/cases/case-{i}")) for i in range(3)]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        during = client.pool_stats()
+        network.release.set()
+        await asyncio.gather(*tasks)
+        after = client.pool_stats()
+
+    # Assert
+    assert during["in_use"] == 1
+    assert during["waiters"] == 2
+    assert after["in_use"] == 0
+    assert after["waiters"] == 0
+    assert after["acquired"] == 3
+    assert after["max_wait_ms"] >= 0.0
+
+
+def test_pool_settings_and_timeouts_from_env(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("KIBANA_MCP_POOL_MAX_CONNECTIONS", "250")
+    monkeypatch.setenv("KIBANA_MCP_POOL_MAX_KEEPALIVE", "50")
+    monkeypatch.setenv("KIBANA_MCP_TIMEOUT_LONG", "600")
+
+    # Act
+    pool = PoolSettings.from_env()
+    timeouts = TimeoutClasses.from_env()
+
+    # Assert
+    assert pool.limits().max_connections == 250
+    assert pool.limits().max_keepalive_connections == 50
+    assert timeouts.timeout("long").read == 600.0
+    with pytest.raises(ValueError):
+        timeouts.timeout("connect")
+
+
+def test_http2_falls_back_when_h2_is_missing(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("kibana_mcp.client.kibana_client._http2_available", lambda: False)
+
+    # Act
+    client = KibanaClient("http://kibana.test", pool=PoolSettings(http2=True))
+
+    # Assert
+    assert client.pool_stats()["http2"] is False
@@ -0,0 +1,87 @@
+import pytest
+import httpx
+import asyncio
+
+from kibana_mcp.client import LimiterTransport, FamilyLimit, TokenBucket
+from kibana_mcp.client.limiter import limits_from_env
+
+
+class GatedKibana:
+    """MockTransport handler that holds saved object requests until released."""
+
+    def __init__(self):
+        self.active = {}
+        self.peak = {}
+        self.release = asyncio.Event()
+
+    async def __call__(self, request):
+        family = request.url.path.split("/")[2]
+        self.active[family] = self.active.get(family, 0) + 1
+        self.peak[family] = max(self.peak.get(family, 0), self.active[family])
+        try:
+            if family == "saved_objects":
+                await self.release.wait()
+            return httpx.Response(200, json={})
+        finally:
+            self.active[family] -= 1
+
+
+@pytest.mark.asyncio
+async def test_family_concurrency_cap_queues_without_starving_other_families():
+    # Arrange
+    kibana = GatedKibana()
+    limiter = LimiterTransport(httpx.MockTransport(kibana), limits={
+        "saved_objects": FamilyLimit(max_in_flight=2),
+        "endpoint": FamilyLimit(max_in_flight=2),
+    })
+
+    # Act
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=limiter) as client:
+        exports = [asyncio.create_task(client.post("/api/saved_objects/_export", json={})) for _ in range(6)]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # Endpoint actions still go through while exports are queued
+        isolate = await asyncio.wait_for(client.post("/api/endpoint/action/isolate", json={}), timeout=1)
+        during = limiter.stats()
+        kibana.release.set()
+        await asyncio.gather(*exports)
+
+    # Assert
+    assert isolate.status_code == 200
+    assert kibana.peak["saved_objects"] == 2
+    assert during["saved_objects"]["in_flight"] == 2
+    assert during["saved_objects"]["queued"] == 4
+    after = limiter.stats()["saved_objects"]
+    assert after["in_flight"] == 0
+    assert after["queued"] == 0
+    assert after["admitted"] == 6
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_beyond_the_burst():
+    # Arrange
+    bucket = TokenBucket(rate=50.0, burst=2.0)
+    loop = asyncio.get_running_loop()
+
+    # Act
+    started = loop.time()
+    for _ in range(4):
+        await bucket.acquire()
+    elapsed = loop.time() - started
+
+    # Assert: two requests ride the burst, the other two wait ~20ms each
+    assert elapsed >= 0.03
+
+
+def test_family_limits_parse_from_env(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("KIBANA_MCP_FAMILY_LIMITS", "saved_objects=4:2, endpoint=20, *=0")
+
+    # Act
+    limits = limits_from_env()
+
+    # Assert
+    assert limits["saved_objects"] == FamilyLimit(max_in_flight=4, rate=2.0, burst=2.0)
+    assert limits["endpoint"].max_in_flight == 20
+    assert limits["*"] == FamilyLimit()
+    assert limits["cases"].max_in_flight == 16
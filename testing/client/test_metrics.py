@@ -0,0 +1,102 @@
+import pytest
+import httpx
+
+from kibana_mcp import metrics
+from kibana_mcp.client import MetricsTransport, templated_path
+from kibana_mcp.client.routes import api_family
+from kibana_mcp.metrics import MetricsRegistry
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/api/cases/7f2c9a10-1b2c-11ef-9a3b-0242ac120002/comments/_find", "/api/cases/{id}/comments/_find"),
+    ("/api/cases/abc/alerts", "/api/cases/{id}/alerts"),
+    ("/api/cases/_find", "/api/cases/_find"),
+    ("/api/cases/configure", "/api/cases/configure"),
+    ("/api/cases/alerts/alert-1", "/api/cases/alerts/{id}"),
+    ("/api/endpoint/action/status", "/api/endpoint/action/status"),
+    ("/api/endpoint/action/a1/file/f1/download", "/api/endpoint/action/{id}/file/{file_id}/download"),
+    ("/api/saved_objects/dashboard/my-dash", "/api/saved_objects/{type}/{id}"),
+    ("/api/saved_objects/_bulk_get", "/api/saved_objects/_bulk_get"),
+    ("/s/soc/api/detection_engine/rules/5f1e0b2a-0000-4000-8000-000000000001/exceptions",
+     "/s/{space}/api/detection_engine/rules/{id}/exceptions"),
+    ("/kibana/s/soc/api/cases/abc/alerts", "/kibana/s/{space}/api/cases/{id}/alerts"),
+    ("/api/unknown/123456/thing", "/api/unknown/{id}/thing"),
+])
+def test_templated_path(path, expected):
+    assert templated_path(path) == expected
+
+
+@pytest.mark.asyncio
+async def test_metrics_transport_records_latency_size_and_errors():
+    # Arrange
+    def handler(request):
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, content=b"x" * 100)
+
+    labels = {"method": "GET", "path": "/api/cases/{id}"}
+    before_count = metrics.KIBANA_DURATION.count(**labels)
+    before_ok = metrics.KIBANA_REQUESTS.value(status="200", **labels)
+    before_errors = metrics.KIBANA_ERRORS.value(reason="404", **labels)
+    transport = MetricsTransport(httpx.MockTransport(handler))
+
+    # Act
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=transport) as client:
+        await client.get("/api/cases/case-1")
+        await client.get("/api/cases/missing")
+
+    # Assert
+    assert metrics.KIBANA_DURATION.count(**labels) == before_count + 2
+    assert metrics.KIBANA_REQUESTS.value(status="200", **labels) == before_ok + 1
+    assert metrics.KIBANA_ERRORS.value(reason="404", **labels) == before_errors + 1
+    assert metrics.KIBANA_IN_FLIGHT.value(**labels) == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_transport_counts_connection_errors():
+    # Arrange
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    labels = {"method": "POST", "path": "/api/detection_engine/signals/search"}
+    before = metrics.KIBANA_ERRORS.value(reason="ConnectError", **labels)
+    transport = MetricsTransport(httpx.MockTransport(handler))
+
+    # Act
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=transport) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.post("/api/detection_engine/signals/search", json={})
+
+    # Assert
+    assert metrics.KIBANA_ERRORS.value(reason="ConnectError", **labels) == before + 1
+    assert metrics.KIBANA_IN_FLIGHT.value(**labels) == 0
+
+
+def test_registry_renders_prometheus_text_format():
+    # Arrange
+    registry = MetricsRegistry()
+    calls = registry.counter("demo_calls_total", "Demo calls.", ("tool",))
+    latency = registry.histogram("demo_seconds", "Demo latency.", ("tool",), buckets=(0.1, 1.0))
+    registry.add_collector(lambda: [("demo_entries", "gauge", "Demo entries.", [({}, 3)])])
+
+    # Act
+    calls.inc(tool='say "hi"')
+    latency.observe(0.05, tool="a")
+    latency.observe(0.5, tool="a")
+    text = registry.render()
+
+    # Assert
+    assert '# TYPE demo_calls_total counter' in text
+    assert 'demo_calls_total{tool="say \\"hi\\""} 1' in text
+    assert 'demo_seconds_bucket{tool="a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{tool="a",le="1"} 2' in text
+    assert 'demo_seconds_bucket{tool="a",le="+Inf"} 2' in text
+    assert 'demo_seconds_count{tool="a"} 2' in text
+    assert "demo_entries 3" in text
+
+
+def test_api_family_skips_base_path_and_space():
+    assert api_family("/kibana/s/soc/api/detection_engine/rules/_find") == "detection_engine"
+    assert api_family("/kibana/api/cases/_find") == "cases"
+    assert api_family("/s/soc/api/cases") == "cases"
+    assert api_family("/kibana/app/home") == "other"
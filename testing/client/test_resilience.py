@@ -0,0 +1,162 @@
+import pytest
+import httpx
+import random
+
+from kibana_mcp.client import ResilienceTransport, RetryPolicy, CircuitBreaker, CircuitOpenError
+from kibana_mcp.client.resilience import parse_retry_after
+
+
+class ScriptedKibana:
+    """MockTransport handler that replays a list of responses (or exceptions) in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def __call__(self, request):
+        self.calls.append((request.method, request.url.path))
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_client(handler, clock=None, **kwargs):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    transport = ResilienceTransport(
+        httpx.MockTransport(handler),
+        policy=kwargs.pop("policy", RetryPolicy(max_attempts=3, base_delay=0.1, max_delay=1.0)),
+        clock=clock or FakeClock(),
+        sleep=sleep,
+        rng=random.Random(0),
+        **kwargs,
+    )
+    return httpx.AsyncClient(base_url="http://kibana.test", transport=transport), transport, sleeps
+
+
+@pytest.mark.asyncio
+async def test_idempotent_request_retries_and_honours_retry_after():
+    # Arrange
+    kibana = ScriptedKibana(
+        httpx.Response(503, headers={"Retry-After": "2"}),
+        httpx.Response(429),
+        httpx.Response(200, json={"ok": True}),
+    )
+    client, _, sleeps = create_client(kibana)
+
+    # Act
+    async with client:
+        response = await client.get("/api/cases/case-1")
+
+    # Assert
+    assert response.status_code == 200
+    assert len(kibana.calls) == 3
+    assert sleeps[0] == 2.0
+    assert 0.0 <= sleeps[1] <= 0.2
+
+
+@pytest.mark.asyncio
+async def test_endpoint_actions_are_never_retried():
+    # Arrange
+    kibana = ScriptedKibana(httpx.Response(503), httpx.Response(200, json={}))
+    client, _, sleeps = create_client(kibana)
+
+    # Act
+    async with client:
+        response = await client.post("/api/endpoint/action/isolate", json={"endpoint_ids": ["e1"]})
+
+    # Assert
+    assert response.status_code == 503
+    assert kibana.calls == [("POST", "/api/endpoint/action/isolate")]
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_read_post_and_connection_errors_are_retried_until_attempts_run_out():
+    # Arrange
+    kibana = ScriptedKibana(httpx.ConnectError("refused"))
+    client, _, sleeps = create_client(kibana)
+
+    # Act
+    async with client:
+        with pytest.raises(httpx.ConnectError):
+            await client.post("/api/detection_engine/rules/_find", json={})
+
+    # Assert
+    assert len(kibana.calls) == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_long_retry_after_is_returned_to_the_caller():
+    # Arrange
+    kibana = ScriptedKibana(httpx.Response(429, headers={"Retry-After": "120"}))
+    client, _, sleeps = create_client(kibana)
+
+    # Act
+    async with client:
+        response = await client.get("/api/cases/_find")
+
+    # Assert
+    assert response.status_code == 429
+    assert len(kibana.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_per_family_and_recovers():
+    # Arrange
+    clock = FakeClock()
+    kibana = ScriptedKibana(httpx.Response(500))
+    client, transport, _ = create_client(
+        kibana, clock=clock, policy=RetryPolicy(max_attempts=1), failure_threshold=2, recovery_time=10.0)
+
+    # Act / Assert
+    async with client:
+        await client.get("/api/cases/a")
+        await client.get("/api/cases/b")
+        with pytest.raises(CircuitOpenError):
+            await client.get("/api/cases/c")
+        # Other API families are unaffected
+        assert (await client.get("/api/saved_objects/_find")).status_code == 500
+        assert len(kibana.calls) == 3
+
+        clock.now = 11.0
+        kibana.outcomes = [httpx.Response(200, json={})]
+        assert (await client.get("/api/cases/d")).status_code == 200
+
+    assert transport.breakers["cases"].state == "closed"
+
+
+def test_half_open_breaker_allows_one_trial():
+    # Arrange
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=5.0, clock=clock)
+
+    # Act
+    breaker.record_failure()
+    clock.now = 6.0
+    first, second = breaker.allow(), breaker.allow()
+    breaker.record_failure()
+
+    # Assert
+    assert (first, second) == (True, False)
+    assert breaker.state == "open"
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0) == 10.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,115 @@
+import pytest
+import httpx
+import asyncio
+
+from kibana_mcp.client import SingleFlightTransport
+
+
+class GatedKibana:
+    """MockTransport handler that holds every request until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, request):
+        self.calls.append((request.method, request.url.path))
+        await self.release.wait()
+        return httpx.Response(200, json={"path": request.url.path, "hits": {"total": {"value": 1}}})
+
+
+def create_client(handler):
+    transport = SingleFlightTransport(httpx.MockTransport(handler))
+    return httpx.AsyncClient(base_url="http://kibana.test", transport=transport), transport
+
+
+async def wait_for_waiters(count):
+    # Let the concurrent callers reach the shared flight
+    for _ in range(count + 5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request():
+    # Arrange
+    kibana = GatedKibana()
+    client, transport = create_client(kibana)
+
+    # Act
+    async with client:
+        tasks = [asyncio.create_task(client.get("/api/cases/case-1")) for _ in range(5)]
+        await wait_for_waiters(5)
+        kibana.release.set()
+        responses = await asyncio.gather(*tasks)
+
+    # Assert
+    assert kibana.calls == [("GET", "/api/cases/case-1")]
+    assert all(r.json()["path"] == "/api/cases/case-1" for r in responses)
+    assert transport.stats()["coalesced"] == 4
+    assert transport.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_search_posts_coalesce_only_with_identical_bodies():
+    # Arrange
+    kibana = GatedKibana()
+    client, transport = create_client(kibana)
+    path = "/api/detection_engine/signals/search"
+
+    # Act
+    async with client:
+        tasks = [
+            asyncio.create_task(client.post(path, json={"size": 10})),
+            asyncio.create_task(client.post(path, json={"size": 10})),
+            asyncio.create_task(client.post(path, json={"size": 20})),
+        ]
+        await wait_for_waiters(3)
+        kibana.release.set()
+        await asyncio.gather(*tasks)
+
+    # Assert
+    assert len(kibana.calls) == 2
+    assert transport.stats()["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_mutating_requests_are_never_coalesced():
+    # Arrange
+    kibana = GatedKibana()
+    client, transport = create_client(kibana)
+
+    # Act
+    async with client:
+        tasks = [
+            asyncio.create_task(client.post("/api/detection_engine/signals/status", json={"status": "closed"}))
+            for _ in range(2)
+        ]
+        await wait_for_waiters(2)
+        kibana.release.set()
+        await asyncio.gather(*tasks)
+
+    # Assert
+    assert len(kibana.calls) == 2
+    assert transport.stats()["coalesced"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_request():
+    # Arrange
+    kibana = GatedKibana()
+    client, transport = create_client(kibana)
+
+    # Act
+    async with client:
+        first = asyncio.create_task(client.get("/api/cases/case-1"))
+        second = asyncio.create_task(client.get("/api/cases/case-1"))
+        await wait_for_waiters(2)
+        first.cancel()
+        await wait_for_waiters(1)
+        kibana.release.set()
+        response = await second
+
+    # Assert
+    assert first.cancelled()
+    assert response.status_code == 200
+    assert len(kibana.calls) == 1
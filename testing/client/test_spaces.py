@@ -0,0 +1,120 @@
+import pytest
+import httpx
+
+from kibana_mcp.client import KibanaClient, SpaceSettingsCache, validate_space
+from kibana_mcp.client.spaces import begin_space, end_space
+from kibana_mcp.tools.cases.get_case import _call_get_case
+from kibana_mcp.tools.utils import execute_tool_safely, ResponseCache, CACHE_EVENT_HOOKS
+import kibana_mcp.tools.utils._utils as tool_utils
+
+
+class SpacedKibana:
+    """MockTransport handler serving two spaces: 'default' and 'soc'."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, request):
+        path = request.url.path
+        self.calls.append(path)
+        if path.endswith("/api/spaces/space/soc"):
+            return httpx.Response(200, json={"id": "soc", "name": "SOC", "disabledFeatures": []})
+        if "/api/spaces/space/" in path:
+            return httpx.Response(404, json={"message": "Not found"})
+        space = path.split("/")[2] if path.startswith("/s/") else "default"
+        return httpx.Response(200, json={"id": "case-1", "space": space})
+
+
+def create_client(handler, **kwargs):
+    return KibanaClient(
+        "http://kibana.test",
+        network_transport=httpx.MockTransport(handler),
+        single_flight=False,
+        event_hooks=CACHE_EVENT_HOOKS,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def fresh_space_settings(monkeypatch):
+    settings = SpaceSettingsCache()
+    monkeypatch.setattr(tool_utils, "space_settings", settings)
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_tools_route_to_the_requested_space_through_one_client(fresh_space_settings):
+    # Arrange
+    kibana = SpacedKibana()
+    cache = ResponseCache()
+
+    # Act
+    async with create_client(kibana) as client:
+        default = await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-1")
+        soc = await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-1", space="soc")
+        soc_again = await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-1", space="soc")
+
+    # Assert
+    assert '"space": "default"' in default[0].text
+    assert '"space": "soc"' in soc[0].text
+    assert soc_again[0].text == soc[0].text
+    assert kibana.calls == ["/api/cases/case-1", "/api/spaces/space/soc", "/s/soc/api/cases/case-1"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_space_is_rejected_and_remembered(fresh_space_settings):
+    # Arrange
+    kibana = SpacedKibana()
+
+    # Act
+    async with create_client(kibana) as client:
+        for _ in range(2):
+            with pytest.raises(ValueError, match="does not exist"):
+                await execute_tool_safely("get_case", _call_get_case, client, cache=ResponseCache(), case_id="c", space="nope")
+
+    # Assert
+    assert kibana.calls == ["/api/spaces/space/nope"]
+    assert fresh_space_settings.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_default_space_applies_when_no_space_is_selected():
+    # Arrange
+    kibana = SpacedKibana()
+
+    # Act
+    async with create_client(kibana, default_space="soc") as client:
+        response = await client.get("/api/cases/case-1")
+
+    # Assert
+    assert response.json()["space"] == "soc"
+
+
+def test_validate_space_rejects_path_characters():
+    assert validate_space("tenant_a-1") == "tenant_a-1"
+    for bad in ("../api", "Tenant", "a/b", ""):
+        with pytest.raises(ValueError):
+            validate_space(bad)
+
+
+@pytest.mark.asyncio
+async def test_space_follows_the_base_path_of_the_kibana_url():
+    # Arrange
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={})
+
+    # Act
+    async with KibanaClient("http://kibana.test/kibana", network_transport=httpx.MockTransport(handler),
+                            single_flight=False, default_space="soc") as client:
+        await client.get("/api/cases/_find")
+        token = begin_space("tenant-a")
+        try:
+            await client.get("/api/cases/_find")
+        finally:
+            end_space(token)
+
+    # Assert
+    assert calls == ["/kibana/s/soc/api/cases/_find", "/kibana/s/tenant-a/api/cases/_find"]
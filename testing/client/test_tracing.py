@@ -0,0 +1,174 @@
+import pytest
+import httpx
+import json
+
+from kibana_mcp.client import KibanaClient, PoolSettings, ResilienceTransport, RetryPolicy, TracingTransport
+from kibana_mcp.tools.exceptions.associate_shared_exception_list import _call_associate_shared_exception_list
+from kibana_mcp.tools.utils import execute_tool_safely, NullCache
+from kibana_mcp.tracing import (
+    STATUS_ERROR, STATUS_OK, OTLPExporter, Tracer, get_tracer, parse_traceparent, set_tracer,
+)
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def exporter():
+    exporter = ListExporter()
+    tracer = Tracer([exporter])
+    set_tracer(tracer)
+    yield exporter
+    tracer.shutdown()
+    set_tracer(None)
+
+
+def flush():
+    """Exports the spans queued so far."""
+    get_tracer().shutdown()
+
+
+def associate_kibana(request):
+    if request.url.path == "/api/exception_lists":
+        return httpx.Response(200, json={"id": "list-uuid", "list_id": "trusted"})
+    if request.method == "GET":
+        return httpx.Response(200, json={"id": "rule-uuid", "rule_id": "rule-1", "exceptions_list": []})
+    return httpx.Response(200, json={"id": "rule-uuid", "exceptions_list": [{"id": "list-uuid"}]})
+
+
+@pytest.mark.asyncio
+async def test_tool_span_has_a_child_span_per_kibana_request(exporter):
+    # Arrange
+    seen_traceparents = []
+
+    def kibana(request):
+        seen_traceparents.append(request.headers.get("traceparent"))
+        return associate_kibana(request)
+
+    client = KibanaClient("http://kibana.test", network_transport=httpx.MockTransport(kibana),
+                          pool=PoolSettings(), single_flight=False)
+
+    # Act
+    async with client:
+        await execute_tool_safely("associate_shared_exception_list", _call_associate_shared_exception_list,
+                                  client, cache=NullCache(), rule_id="rule-1", exception_list_id="trusted")
+    flush()
+
+    # Assert
+    tool_span = next(span for span in exporter.spans if span.name == "tool associate_shared_exception_list")
+    children = [span for span in exporter.spans if span.parent_id == tool_span.span_id]
+    assert [span.name for span in children] == [
+        "GET /api/exception_lists", "GET /api/detection_engine/rules", "PATCH /api/detection_engine/rules"]
+    assert all(span.trace_id == tool_span.trace_id for span in children)
+    assert tool_span.attributes["kibana.requests"] == 3
+    assert tool_span.attributes["kibana_mcp.outcome"] == "success"
+    assert tool_span.status == STATUS_OK
+
+    patch = children[2]
+    assert patch.attributes["http.response.status_code"] == 200
+    assert patch.attributes["http.request.body.size"] > 0
+    assert patch.attributes["http.response.body.size"] > 0
+    assert patch.attributes["url.template"] == "/api/detection_engine/rules"
+    # Kibana sees each request's own span as the parent
+    assert [parse_traceparent(value)[1] for value in seen_traceparents] == [span.span_id for span in children]
+
+
+@pytest.mark.asyncio
+async def test_retried_requests_get_a_span_per_attempt_with_resend_count(exporter):
+    # Arrange
+    responses = [httpx.Response(503), httpx.Response(200, json={})]
+
+    async def no_sleep(delay):
+        pass
+
+    transport = ResilienceTransport(TracingTransport(httpx.MockTransport(lambda request: responses.pop(0))),
+                                    policy=RetryPolicy(max_attempts=2), sleep=no_sleep)
+
+    # Act
+    async with httpx.AsyncClient(transport=transport, base_url="http://kibana.test") as client:
+        await client.get("/api/cases/case-1")
+    flush()
+
+    # Assert
+    first, retry = exporter.spans
+    assert first.name == retry.name == "GET /api/cases/{id}"
+    assert first.status == STATUS_ERROR and first.attributes["error.type"] == "503"
+    assert "http.request.resend_count" not in first.attributes
+    assert retry.attributes["http.request.resend_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tracing_off_sends_no_traceparent():
+    # Arrange
+    set_tracer(Tracer([]))
+    headers = []
+
+    def kibana(request):
+        headers.append(request.headers.get("traceparent"))
+        return httpx.Response(200, json={})
+
+    # Act
+    try:
+        async with httpx.AsyncClient(transport=TracingTransport(httpx.MockTransport(kibana)), base_url="http://k") as client:
+            await client.get("/api/cases/case-1")
+    finally:
+        set_tracer(None)
+
+    # Assert
+    assert headers == [None]
+
+
+def test_remote_parent_and_sampling_decide_the_trace():
+    # Arrange
+    exporter = ListExporter()
+    tracer = Tracer([exporter], sample_ratio=0.0)
+
+    # Act
+    with tracer.span("sampled out") as dropped:
+        with tracer.span("child of sampled out") as dropped_child:
+            pass
+    with tracer.span("remote", traceparent="00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01") as remote:
+        pass
+    tracer.shutdown()
+
+    # Assert
+    assert not dropped.recording and not dropped_child.recording
+    assert [span.name for span in exporter.spans] == ["remote"]
+    assert (remote.trace_id, remote.parent_id) == ("0af7651916cd43dd8448eb211c80319c", "b7ad6b7169203331")
+
+
+def test_otlp_exporter_posts_otlp_json():
+    # Arrange
+    requests = []
+
+    def collector(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    otlp = OTLPExporter(endpoint="http://collector:4318/v1/traces", headers={}, service_name="kibana-mcp-test",
+                        transport=httpx.MockTransport(collector))
+    tracer = Tracer([otlp])
+    with tracer.span("tool get_case", attributes={"mcp.tool.name": "get_case", "kibana_mcp.result_bytes": 12}):
+        pass
+
+    # Act
+    tracer.shutdown()
+
+    # Assert
+    body = json.loads(requests[0].content)
+    resource_spans = body["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "kibana-mcp-test"}}]
+    span = resource_spans["scopeSpans"][0]["spans"][0]
+    assert span["name"] == "tool get_case"
+    assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+    assert {"key": "kibana_mcp.result_bytes", "value": {"intValue": "12"}} in span["attributes"]
+    assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
@@ -0,0 +1,114 @@
+import json
+import os
+import time
+
+import pytest
+from starlette.testclient import TestClient
+
+from kibana_mcp import server
+from kibana_mcp.client import CircuitBreaker
+from kibana_mcp.serving import ServingSettings, WorkerHeartbeat, create_app, read_heartbeats
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+@pytest.fixture
+def kibana_env(monkeypatch):
+    monkeypatch.setenv("KIBANA_URL", "http://kibana.test")
+    monkeypatch.setenv("KIBANA_USERNAME", "elastic")
+    monkeypatch.setenv("KIBANA_PASSWORD", "changeme")
+    monkeypatch.delenv("KIBANA_API_KEY", raising=False)
+
+
+def _sse_json(response):
+    data = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+    return json.loads(data[-1])
+
+
+def test_settings_from_env(monkeypatch):
+    # Arrange
+    for name in ("PORT", "MCP_HTTP_HOST", "MCP_HTTP_PORT", "MCP_SSE_PORT", "MCP_HTTP_PATH"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("MCP_SSE_HOST", "0.0.0.0")
+    monkeypatch.setenv("MCP_HTTP_PORT", "9000")
+    monkeypatch.setenv("KIBANA_MCP_WORKERS", "4")
+
+    # Act
+    settings = ServingSettings.from_env()
+
+    # Assert
+    assert (settings.host, settings.port, settings.workers, settings.path) == ("0.0.0.0", 9000, 4, "/mcp")
+
+    # Cloud Run's PORT wins
+    monkeypatch.setenv("PORT", "8081")
+    assert ServingSettings.from_env().port == 8081
+
+
+def test_worker_serves_stateless_requests_and_reports_health(kibana_env, tmp_path):
+    # Arrange
+    settings = ServingSettings(workers=1, state_dir=str(tmp_path), heartbeat_interval=60)
+    request = {"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}}
+
+    # Act
+    with TestClient(create_app(settings)) as client:
+        # No initialize handshake and no session id: any worker can take any request
+        listed = client.post("/mcp/", json=request, headers=MCP_HEADERS)
+        health = client.get("/health")
+        workers = client.get("/workers")
+        worker_client = server.http_client
+
+    # Assert
+    assert listed.status_code == 200
+    assert "mcp-session-id" not in listed.headers
+    tools = {tool["name"] for tool in _sse_json(listed)["result"]["tools"]}
+    assert {"get_alerts", "find_rules", "get_case"} <= tools
+
+    assert health.status_code == 200
+    assert health.json()["pid"] == os.getpid()
+    assert health.json()["status"] == "ok"
+    assert health.json()["pool"]["max_connections"] == worker_client.pool_settings.max_connections
+
+    assert workers.json()["total"] == 1
+    assert workers.json()["workers"][0]["pid"] == os.getpid()
+
+    # Shutdown closes the worker's client and removes its heartbeat
+    assert worker_client.is_closed
+    assert server.http_client is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_health_reports_degraded_when_a_circuit_is_open(kibana_env):
+    # Arrange
+    with TestClient(create_app(ServingSettings())) as client:
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+        server.http_client.resilience.breakers["cases"] = breaker
+
+        # Act
+        response = client.get("/health")
+
+    # Assert
+    assert response.status_code == 503
+    assert response.json()["status"] == "degraded"
+    assert response.json()["open_circuits"] == ["cases"]
+
+
+def test_read_heartbeats_aggregates_workers_and_marks_stale(tmp_path):
+    # Arrange
+    heartbeat = WorkerHeartbeat(str(tmp_path), interval=1, started_at=time.time())
+    heartbeat.write()
+    stale = {"pid": 1, "status": "ok", "updated_at": time.time() - 60,
+             "tool_calls_in_flight": 3, "tool_calls_total": 10}
+    (tmp_path / "worker-1.json").write_text(json.dumps(stale))
+    (tmp_path / "worker-2.json.tmp").write_text("{")
+
+    # Act
+    report = read_heartbeats(str(tmp_path), stale_after=5)
+
+    # Assert
+    statuses = {worker["pid"]: worker["status"] for worker in report["workers"]}
+    assert statuses == {1: "stale", os.getpid(): "starting"}
+    assert report["total"] == 2
+    # Stale workers no longer count as in flight, but their completed calls do
+    assert report["tool_calls_in_flight"] == 0
+    assert report["tool_calls_total"] >= 10
@@ -8,6 +8,24 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from kibana_mcp.tools.alerts.get_alerts import _call_get_alerts
 from kibana_mcp.tools.alerts.tag_alert import _call_tag_alert
 from kibana_mcp.tools.alerts.adjust_alert_status import _call_adjust_alert_status
+from kibana_mcp.tools.alerts.aggregate_alerts import _call_aggregate_alerts
+from kibana_mcp.tools.alerts.bulk_tag_alerts import _call_bulk_tag_alerts
+from kibana_mcp.tools.alerts.bulk_adjust_alert_status import _call_bulk_adjust_alert_status
+from kibana_mcp.tools.alerts.poll_new_alerts import _call_poll_new_alerts
+from kibana_mcp.tools.alerts._bulk import BULK_CHUNK_SIZE, BULK_CONCURRENCY
+from kibana_mcp.tools.alerts._checkpoints import CheckpointStore, set_checkpoint_store
+from kibana_mcp.tools.alerts._query import ALERT_SORT, ALERT_SORT_ASC, MAX_ALERTS_PAGE
+from kibana_mcp.tools.utils import (
+    DEFAULT_ALERT_FIELDS, AlertWriteBatcher, NullCache, execute_tool_safely, set_write_batcher,
+)
+from kibana_mcp.client import KibanaClient
+from kibana_mcp.client.deadlines import begin_deadline, end_deadline
+from kibana_mcp.tools.utils import CACHE_EVENT_HOOKS
+from kibana_mcp.tools.utils._cache import begin_call_tracking, end_call_tracking
+from kibana_mcp.tools.utils._cursor import encode_cursor
+from kibana_mcp.tools.utils._render import begin_render_options, end_render_options
+
+from testing.benchmarks.mock_kibana import FakeKibana
 
 # Import test utilities
 from testing.tools.utils.test_utils import create_mock_response
@@ -91,6 +109,523 @@ async def test_get_alerts_with_search():
     args, kwargs = mock_client.post.call_args
     assert "Test Rule 1" in str(kwargs["json"])
 
+
+@pytest.mark.asyncio
+async def test_get_alerts_returns_cursor_for_full_page():
+    # Arrange
+    mock_client = AsyncMock()
+    hits = [{"_id": f"alert-{i}", "_source": {}, "sort": [1000 - i, f"uuid-{i}"]} for i in range(2)]
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": hits, "total": {"value": 5}}})
+
+    # Act
+    first = json.loads(await _call_get_alerts(mock_client, limit=2, search_text="*"))
+    await _call_get_alerts(mock_client, limit=2, search_text="*", cursor=first["next_cursor"])
+
+    # Assert
+    first_body = mock_client.post.call_args_list[0].kwargs["json"]
+    second_body = mock_client.post.call_args_list[1].kwargs["json"]
+    assert first_body["sort"] == ALERT_SORT and "search_after" not in first_body
+    assert second_body["search_after"] == [999, "uuid-1"]
+    assert second_body["track_total_hits"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_alerts_last_page_has_no_cursor():
+    # Arrange
+    mock_client = AsyncMock()
+    hits = [{"_id": "alert-1", "_source": {}, "sort": [1000, "uuid-1"]}]
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": hits}})
+
+    # Act
+    result = json.loads(await _call_get_alerts(mock_client, limit=10, search_text="*"))
+
+    # Assert
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_alerts_rejects_invalid_cursor():
+    # Arrange
+    mock_client = AsyncMock()
+
+    # Act
+    result = await _call_get_alerts(mock_client, limit=10, search_text="*", cursor="not-a-cursor")
+
+    # Assert
+    assert "Invalid cursor" in result
+    mock_client.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_alerts_rejects_cursor_of_another_search():
+    # Arrange
+    mock_client = AsyncMock()
+    hits = [{"_id": f"alert-{i}", "_source": {}, "sort": [1000 - i, f"uuid-{i}"]} for i in range(2)]
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": hits}})
+    first = json.loads(await _call_get_alerts(mock_client, limit=2, search_text="host-1", since="now-1h"))
+
+    # Act
+    other_text = await _call_get_alerts(mock_client, limit=2, search_text="host-2", since="now-1h",
+                                        cursor=first["next_cursor"])
+    other_since = await _call_get_alerts(mock_client, limit=2, search_text="host-1", since="now-2h",
+                                         cursor=first["next_cursor"])
+
+    # Assert
+    assert other_text.startswith("Error: Invalid cursor") and other_since.startswith("Error: Invalid cursor")
+    assert mock_client.post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_alerts_caps_page_size():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": []}})
+
+    # Act
+    await _call_get_alerts(mock_client, limit=50_000, search_text="*")
+
+    # Assert
+    assert mock_client.post.call_args.kwargs["json"]["size"] == MAX_ALERTS_PAGE
+
+
+@pytest.mark.asyncio
+async def test_get_alerts_cursor_walks_every_alert_once():
+    # Arrange
+    fake = FakeKibana(alerts=25)
+    seen = []
+    cursor = None
+
+    # Act
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+        for _ in range(10):
+            page = json.loads(await _call_get_alerts(client, limit=10, search_text="*", cursor=cursor))
+            seen.extend(hit["_id"] for hit in page["hits"]["hits"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+    # Assert
+    assert seen == [f"alert-{i}" for i in range(25)]
+
+
+@pytest.mark.asyncio
+async def test_get_alerts_requests_lean_source_by_default():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": []}})
+
+    # Act
+    await _call_get_alerts(mock_client, limit=10, search_text="*")
+
+    # Assert
+    body = mock_client.post.call_args.kwargs["json"]
+    assert body["_source"] == {"includes": DEFAULT_ALERT_FIELDS}
+    assert "fields" not in body
+
+
+@pytest.mark.asyncio
+async def test_get_alerts_pushes_projection_and_excludes_to_kibana():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": []}})
+
+    # Act
+    token = begin_render_options(fields=["*"])
+    try:
+        await _call_get_alerts(mock_client, limit=10, search_text="*", exclude_fields=["kibana.alert.rule.parameters"],
+                               retrieve_fields=["@timestamp"])
+    finally:
+        end_render_options(token)
+
+    # Assert
+    body = mock_client.post.call_args.kwargs["json"]
+    assert body["_source"] == {"excludes": ["kibana.alert.rule.parameters"]}
+    assert body["fields"] == ["@timestamp"]
+
+
+@pytest.mark.asyncio
+async def test_get_alerts_projection_shrinks_kibana_response():
+    # Arrange
+    fake = FakeKibana(alerts=50)
+    response_bytes = []
+
+    def handler(request):
+        response = fake.handle(request)
+        response_bytes.append(len(response.content))
+        return response
+
+    # Act
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=httpx.MockTransport(handler)) as client:
+        lean = json.loads((await execute_tool_safely("get_alerts", _call_get_alerts, client, cache=NullCache(),
+                                                     limit=50, search_text="*"))[0].text)
+        await execute_tool_safely("get_alerts", _call_get_alerts, client, cache=NullCache(),
+                                  output_fields=["*"], limit=50, search_text="*")
+
+    # Assert
+    assert response_bytes[0] * 2 < response_bytes[1]
+    source = lean["hits"]["hits"][0]["_source"]
+    assert source["kibana.alert.rule.name"] and source["host"] == {"name": "host-0"}
+    assert "process" not in source
+
+# --- Tests for aggregate_alerts ---
+
+
+@pytest.mark.asyncio
+async def test_aggregate_alerts_sends_size_zero_aggregation_search():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"total": {"value": 0}}, "aggregations": {}})
+
+    # Act
+    await _call_aggregate_alerts(mock_client, group_by=["host.name"], search_text="powershell", since="now-1h",
+                                 interval="5m", count_distinct=["user.name"], size=500)
+
+    # Assert
+    body = mock_client.post.call_args.kwargs["json"]
+    assert body["size"] == 0
+    assert {"range": {"@timestamp": {"gte": "now-1h"}}} in body["query"]["bool"]["filter"]
+    assert body["query"]["bool"]["filter"][0]["multi_match"]["query"] == "powershell"
+    assert body["aggs"]["group_0"]["terms"] == {"field": "host.name", "size": 100}
+    assert body["aggs"]["group_0"]["aggs"]["distinct_0"] == {"cardinality": {"field": "user.name"}}
+    assert body["aggs"]["over_time"]["date_histogram"]["fixed_interval"] == "5m"
+
+
+@pytest.mark.asyncio
+async def test_aggregate_alerts_returns_compact_tables():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {
+        "hits": {"total": {"value": 130}, "hits": []},
+        "aggregations": {
+            "distinct_0": {"value": 4},
+            "group_0": {"sum_other_doc_count": 10, "buckets": [
+                {"key": "host-1", "doc_count": 100, "distinct_0": {"value": 3}},
+                {"key": "host-2", "doc_count": 20, "distinct_0": {"value": 1}},
+            ]},
+        },
+    })
+
+    # Act
+    result = json.loads(await _call_aggregate_alerts(mock_client, group_by=["host.name"], count_distinct=["user.name"]))
+
+    # Assert
+    assert result["total_alerts"] == 130
+    assert result["distinct"] == {"user.name": 4}
+    table = result["groups"]["host.name"]
+    assert table["columns"] == ["host.name", "alerts", "distinct user.name"]
+    assert table["rows"] == [["host-1", 100, 3], ["host-2", 20, 1]]
+    assert table["other_alerts"] == 10
+
+
+@pytest.mark.asyncio
+async def test_aggregate_alerts_is_much_smaller_than_fetching_alerts():
+    # Arrange
+    fake = FakeKibana(alerts=500)
+
+    # Act
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+        summary = await _call_aggregate_alerts(client, interval="1h")
+        alerts = await _call_get_alerts(client, limit=500, search_text="*")
+
+    # Assert
+    assert json.loads(summary)["groups"]["host.name"]["rows"][0] == ["name-0", 250]
+    assert len(summary) * 20 < len(alerts)
+
+
+@pytest.mark.asyncio
+async def test_aggregate_alerts_requires_something_to_aggregate():
+    # Arrange
+    mock_client = AsyncMock()
+
+    # Act
+    result = await _call_aggregate_alerts(mock_client, group_by=[])
+
+    # Assert
+    assert result.startswith("Error")
+    mock_client.post.assert_not_called()
+
+# --- Tests for poll_new_alerts ---
+
+
+@pytest.fixture
+def checkpoint_store():
+    store = CheckpointStore()
+    set_checkpoint_store(store)
+    yield store
+    set_checkpoint_store(None)
+
+
+@pytest.mark.asyncio
+async def test_poll_new_alerts_sends_range_filter_and_search_after(checkpoint_store):
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": []}})
+    checkpoint = encode_cursor([1700000000000, "uuid-7"])
+
+    # Act
+    result = json.loads(await _call_poll_new_alerts(mock_client, search_text="host-3", checkpoint=checkpoint))
+
+    # Assert
+    body = mock_client.post.call_args.kwargs["json"]
+    assert body["sort"] == ALERT_SORT_ASC and body["search_after"] == [1700000000000, "uuid-7"]
+    assert {"range": {"@timestamp": {"gte": 1700000000000}}} in body["query"]["bool"]["filter"]
+    assert body["track_total_hits"] is False
+    assert result == {"alerts": [], "count": 0, "has_more": False, "checkpoint": checkpoint}
+
+
+@pytest.mark.asyncio
+async def test_poll_new_alerts_resumes_from_stored_checkpoint(checkpoint_store):
+    # Arrange
+    fake = FakeKibana(alerts=25)
+    seen = []
+
+    # Act: no checkpoint is passed back, the store keeps it per query
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+        for _ in range(4):
+            page = json.loads(await _call_poll_new_alerts(client, limit=10))
+            seen.extend(hit["_id"] for hit in page["alerts"])
+        idle = json.loads(await _call_poll_new_alerts(client, limit=10))
+
+    # Assert: oldest first, every alert once, then one empty search per poll
+    assert seen == [f"alert-{i}" for i in reversed(range(25))]
+    assert idle["count"] == 0 and idle["checkpoint"] == page["checkpoint"]
+    assert fake.requests["POST /api/detection_engine/signals/search"] == 5
+
+
+@pytest.mark.asyncio
+async def test_poll_new_alerts_persists_checkpoints(tmp_path):
+    # Arrange
+    path = str(tmp_path / "checkpoints.json")
+    fake = FakeKibana(alerts=5)
+    set_checkpoint_store(CheckpointStore(path=path))
+
+    # Act
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+            first = json.loads(await _call_poll_new_alerts(client, limit=3))
+            # A new store, as after a restart, reads the file
+            set_checkpoint_store(CheckpointStore(path=path))
+            second = json.loads(await _call_poll_new_alerts(client, limit=3))
+    finally:
+        set_checkpoint_store(None)
+
+    # Assert
+    assert [hit["_id"] for hit in first["alerts"]] == ["alert-4", "alert-3", "alert-2"]
+    assert [hit["_id"] for hit in second["alerts"]] == ["alert-1", "alert-0"]
+
+
+@pytest.mark.asyncio
+async def test_poll_new_alerts_shares_checkpoints_between_workers(tmp_path, monkeypatch):
+    # Arrange: two worker processes' stores on the HTTP mode's shared state directory
+    monkeypatch.delenv("KIBANA_MCP_CHECKPOINT_FILE", raising=False)
+    monkeypatch.setenv("KIBANA_MCP_WORKER_STATE_DIR", str(tmp_path))
+    worker_a, worker_b = CheckpointStore.from_env(), CheckpointStore.from_env()
+    fake = FakeKibana(alerts=5)
+    seen = []
+
+    # Act: consecutive polls land on alternating workers
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+            for store in (worker_a, worker_b, worker_a):
+                set_checkpoint_store(store)
+                page = json.loads(await _call_poll_new_alerts(client, limit=2))
+                seen.extend(hit["_id"] for hit in page["alerts"])
+    finally:
+        set_checkpoint_store(None)
+
+    # Assert: every alert once
+    assert worker_a.path == str(tmp_path / "alert-checkpoints.json")
+    assert seen == ["alert-4", "alert-3", "alert-2", "alert-1", "alert-0"]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_file_keeps_the_newest_checkpoint_per_query(tmp_path):
+    # Arrange
+    path = str(tmp_path / "checkpoints.json")
+    worker_a, worker_b = CheckpointStore(path=path), CheckpointStore(path=path)
+    newer, older = encode_cursor([1700000005000, "uuid-5"]), encode_cursor([1700000003000, "uuid-3"])
+    worker_b.get("q")
+
+    # Act: worker B, which has not seen A's write, saves an older checkpoint and another query's
+    await worker_a.set("q", newer)
+    await worker_b.set("q", older)
+    await worker_b.set("other", older)
+
+    # Assert
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert saved["q"]["checkpoint"] == newer and saved["other"]["checkpoint"] == older
+    assert worker_a.get("other") == older
+    assert worker_b.get("q") == newer
+
+
+@pytest.mark.asyncio
+async def test_poll_new_alerts_replay_replaces_the_stored_checkpoint(tmp_path):
+    # Arrange: two workers sharing a checkpoint file, after a full read of the query
+    path = str(tmp_path / "checkpoints.json")
+    worker_a, worker_b = CheckpointStore(path=path), CheckpointStore(path=path)
+    fake = FakeKibana(alerts=5)
+
+    # Act: worker A replays from an older checkpoint, then worker B polls without one
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+            set_checkpoint_store(worker_a)
+            first = json.loads(await _call_poll_new_alerts(client, limit=2))
+            await _call_poll_new_alerts(client, limit=10)
+            replay = json.loads(await _call_poll_new_alerts(client, limit=1, checkpoint=first["checkpoint"]))
+            key = CheckpointStore.key(client, "*")
+            with open(path, encoding="utf-8") as f:
+                stored = (worker_a.get(key), json.load(f)[key]["checkpoint"])
+            set_checkpoint_store(worker_b)
+            resumed = json.loads(await _call_poll_new_alerts(client, limit=10))
+    finally:
+        set_checkpoint_store(None)
+
+    # Assert: the replay moved the stored checkpoint back in memory and in the file
+    assert [hit["_id"] for hit in replay["alerts"]] == ["alert-2"]
+    assert stored == (replay["checkpoint"], replay["checkpoint"])
+    assert [hit["_id"] for hit in resumed["alerts"]] == ["alert-1", "alert-0"]
+    assert worker_a.get(key) == resumed["checkpoint"]
+
+
+@pytest.mark.asyncio
+async def test_poll_new_alerts_truncated_output_does_not_skip_alerts(checkpoint_store):
+    # Arrange
+    fake = FakeKibana(alerts=20)
+    seen = []
+    truncated = False
+
+    # Act
+    token = begin_render_options(max_bytes=3000)
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+            for _ in range(20):
+                page = json.loads(await _call_poll_new_alerts(client, limit=20))
+                seen.extend(hit["_id"] for hit in page["alerts"])
+                truncated = truncated or "_truncated" in page
+                if len(seen) >= 20:
+                    break
+    finally:
+        end_render_options(token)
+
+    # Assert
+    assert truncated
+    assert seen == [f"alert-{i}" for i in reversed(range(20))]
+
+
+@pytest.mark.asyncio
+async def test_poll_new_alerts_rejects_invalid_checkpoint(checkpoint_store):
+    # Arrange
+    mock_client = AsyncMock()
+
+    # Act
+    result = await _call_poll_new_alerts(mock_client, checkpoint="not-a-checkpoint")
+
+    # Assert
+    assert result.startswith("Error: Invalid cursor")
+    mock_client.post.assert_not_called()
+
+# --- Tests for bulk_tag_alerts and bulk_adjust_alert_status ---
+
+
+@pytest.mark.asyncio
+async def test_bulk_adjust_alert_status_chunks_ids_with_bounded_concurrency():
+    # Arrange
+    in_flight = 0
+    peak = 0
+    payloads = []
+
+    async def post(path, json):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        payloads.append(json)
+        return create_mock_response(200, {"updated": len(json["signal_ids"])})
+
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = post
+    alert_ids = [f"alert-{i}" for i in range(BULK_CHUNK_SIZE * 5 + 1)]
+
+    # Act
+    result = json.loads(await _call_bulk_adjust_alert_status(mock_client, "closed", alert_ids=alert_ids + alert_ids[:10]))
+
+    # Assert
+    assert len(payloads) == 6 and peak <= BULK_CONCURRENCY
+    assert sorted(i for p in payloads for i in p["signal_ids"]) == sorted(alert_ids)
+    assert all(p["status"] == "closed" for p in payloads)
+    assert result["requested"] == result["updated"] == len(alert_ids)
+    assert result["requests"] == 6 and result["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_adjust_alert_status_by_query_sends_one_update_by_query():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {"total": 1200, "updated": 1198, "version_conflicts": 2})
+
+    # Act
+    result = json.loads(await _call_bulk_adjust_alert_status(mock_client, "closed", search_text="host-3",
+                                                             since="now-24h"))
+
+    # Assert
+    mock_client.post.assert_called_once()
+    body = mock_client.post.call_args.kwargs["json"]
+    assert body["status"] == "closed" and body["conflicts"] == "proceed"
+    assert {"range": {"@timestamp": {"gte": "now-24h"}}} in body["query"]["bool"]["filter"]
+    assert (result["requested"], result["updated"], result["version_conflicts"]) == (1200, 1198, 2)
+
+
+@pytest.mark.asyncio
+async def test_bulk_tag_alerts_by_query_pages_ids_and_tags_them():
+    # Arrange
+    fake = FakeKibana(alerts=BULK_CHUNK_SIZE * BULK_CONCURRENCY + 300)
+
+    # Act
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+        result = json.loads(await _call_bulk_tag_alerts(client, search_text="*", tags_to_add=["false-positive"]))
+
+    # Assert
+    assert result["requested"] == result["updated"] == fake.alerts
+    assert fake.requests["POST /api/detection_engine/signals/search"] == 2
+    assert fake.requests["POST /api/detection_engine/signals/tags"] == BULK_CONCURRENCY + 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_tag_alerts_aggregates_failed_chunks():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = [
+        create_mock_response(200, {"updated": BULK_CHUNK_SIZE}),
+        create_mock_response(500, {"error": "boom"}),
+        httpx.ConnectError("Connection failed"),
+    ]
+    alert_ids = [f"alert-{i}" for i in range(BULK_CHUNK_SIZE * 2 + 7)]
+
+    # Act
+    result = json.loads(await _call_bulk_tag_alerts(mock_client, alert_ids=alert_ids, tags_to_remove=["triage"]))
+
+    # Assert
+    assert result["updated"] == BULK_CHUNK_SIZE
+    assert result["failed"] == BULK_CHUNK_SIZE + 7 and result["failed_requests"] == 2
+    assert len(result["errors"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_tools_require_one_selection():
+    # Arrange
+    mock_client = AsyncMock()
+
+    # Act
+    neither = await _call_bulk_tag_alerts(mock_client, tags_to_add=["x"])
+    both = await _call_bulk_adjust_alert_status(mock_client, "open", alert_ids=["a"], search_text="*")
+    no_tags = await _call_bulk_tag_alerts(mock_client, alert_ids=["a"])
+
+    # Assert
+    assert neither.startswith("Error:") and both.startswith("Error:") and no_tags.startswith("Error:")
+    mock_client.post.assert_not_called()
+
 # --- Tests for tag_alert ---
 
 
@@ -117,6 +652,132 @@ async def test_tag_alert_success():
     assert kwargs["json"]["ids"] == ["alert-123"]
     assert kwargs["json"]["tags"]["tags_to_add"] == tags_to_add
 
+@pytest.mark.asyncio
+async def test_concurrent_tag_alert_calls_share_one_request():
+    # Arrange
+    fake = FakeKibana(alerts=10)
+    batcher = AlertWriteBatcher(window_ms=20)
+    set_write_batcher(batcher)
+
+    # Act
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+            results = await asyncio.gather(
+                *(_call_tag_alert(client, alert_id=f"alert-{i}", tags_to_add=["triaged"]) for i in range(5)),
+                _call_tag_alert(client, alert_id="alert-9", tags_to_add=["escalated"]),
+            )
+    finally:
+        set_write_batcher(None)
+
+    # Assert
+    assert fake.requests["POST /api/detection_engine/signals/tags"] == 2
+    assert all("Updated: 1" in result for result in results)
+    assert batcher.stats() == {"writes": 6, "requests": 2, "fallbacks": 0}
+
+
+@pytest.mark.asyncio
+async def test_batched_status_write_resends_per_caller_when_not_all_updated():
+    # Arrange
+    payloads = []
+
+    def handler(request):
+        ids = json.loads(request.content)["signal_ids"]
+        payloads.append(ids)
+        # "missing" does not exist, so it is never updated
+        return httpx.Response(200, json={"updated": len([i for i in ids if i != "missing"])})
+
+    set_write_batcher(AlertWriteBatcher(window_ms=20))
+
+    # Act
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=httpx.MockTransport(handler)) as client:
+            found, missing = await asyncio.gather(
+                _call_adjust_alert_status(client, alert_id="alert-1", new_status="closed"),
+                _call_adjust_alert_status(client, alert_id="missing", new_status="closed"),
+            )
+    finally:
+        set_write_batcher(None)
+
+    # Assert
+    assert payloads[0] == ["alert-1", "missing"] and sorted(payloads[1:]) == [["alert-1"], ["missing"]]
+    assert "Successfully updated status for 1 signal" in found
+    assert "no signals were updated" in missing
+
+
+@pytest.mark.asyncio
+async def test_batched_write_errors_reach_every_caller():
+    # Arrange
+    def handler(request):
+        return httpx.Response(503, text="Kibana unavailable")
+
+    set_write_batcher(AlertWriteBatcher(window_ms=20))
+
+    # Act
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=httpx.MockTransport(handler)) as client:
+            results = await asyncio.gather(
+                *(_call_tag_alert(client, alert_id=f"alert-{i}", tags_to_add=["triaged"]) for i in range(3)))
+    finally:
+        set_write_batcher(None)
+
+    # Assert
+    assert all("returned error: 503" in result for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batched_write_runs_with_the_latest_caller_deadline_and_tracks_every_caller():
+    # Arrange: Kibana answers in 50 ms and rejects the write
+    payloads = []
+
+    async def handler(request):
+        payloads.append(json.loads(request.content)["ids"])
+        await asyncio.sleep(0.05)
+        return httpx.Response(400, json={"message": "Bad tags"})
+
+    async def tag(client, alert_id, budget):
+        deadline = begin_deadline(budget)
+        tracking = begin_call_tracking()
+        try:
+            result = await _call_tag_alert(client, alert_id=alert_id, tags_to_add=["triaged"])
+        finally:
+            outcome = end_call_tracking(tracking)
+            end_deadline(deadline)
+        return result, outcome
+
+    set_write_batcher(AlertWriteBatcher(window_ms=20))
+
+    # Act: the short budget has passed by the time the merged write is sent
+    try:
+        async with KibanaClient("http://kibana.test", network_transport=httpx.MockTransport(handler),
+                                single_flight=False, event_hooks=CACHE_EVENT_HOOKS) as client:
+            results = await asyncio.gather(tag(client, "alert-1", 0.01), tag(client, "alert-2", 60))
+    finally:
+        set_write_batcher(None)
+
+    # Assert: one request reached Kibana, and both calls saw its error
+    assert payloads == [["alert-1", "alert-2"]]
+    for result, outcome in results:
+        assert "returned error: 400" in result
+        assert (outcome.started, outcome.completed, outcome.failed) == (1, 1, True)
+
+
+@pytest.mark.asyncio
+async def test_write_batching_can_be_disabled():
+    # Arrange
+    fake = FakeKibana(alerts=10)
+    set_write_batcher(AlertWriteBatcher(window_ms=0))
+
+    # Act
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+            await asyncio.gather(
+                *(_call_adjust_alert_status(client, alert_id=f"alert-{i}", new_status="open") for i in range(3)))
+    finally:
+        set_write_batcher(None)
+
+    # Assert
+    assert fake.requests["POST /api/detection_engine/signals/status"] == 3
+
 # --- Tests for adjust_alert_status ---
 
 
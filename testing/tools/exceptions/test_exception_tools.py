@@ -68,6 +68,45 @@ async def test_get_rule_exceptions_success():
     second_call_args = mock_client.get.call_args_list[1]
     assert "rule-uuid-123" in str(second_call_args)
 
+
+
+@pytest.mark.asyncio
+async def test_get_rule_exceptions_reuses_resolved_rule_uuid():
+    # Arrange
+    mock_client = AsyncMock()
+    rule_response_data = {"id": "rule-uuid-456", "rule_id": "cached-rule-id"}
+    exceptions_response_data = {"data": [], "page": 1, "perPage": 20, "total": 0}
+    mock_client.get.side_effect = [
+        create_mock_response(200, rule_response_data),
+        create_mock_response(200, exceptions_response_data),
+        create_mock_response(200, exceptions_response_data)
+    ]
+
+    # Act
+    await _call_get_rule_exceptions(mock_client, rule_id="cached-rule-id")
+    result = await _call_get_rule_exceptions(mock_client, rule_id="cached-rule-id")
+
+    # Assert
+    assert "rule-uuid-456" in result
+    # The rule lookup only happens for the first call
+    assert mock_client.get.call_count == 3
+    assert "rule-uuid-456/exceptions" in str(mock_client.get.call_args_list[2])
+
+
+@pytest.mark.asyncio
+async def test_get_rule_exceptions_rule_not_found():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.get.return_value = create_mock_response(404, {"message": "rule not found"})
+
+    # Act
+    result = await _call_get_rule_exceptions(mock_client, rule_id="missing-rule-id")
+
+    # Assert
+    assert "404" in result
+    assert "missing-rule-id" in result
+    mock_client.get.assert_called_once()
+
 # --- Tests for add_rule_exception_items ---
 
 
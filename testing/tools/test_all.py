@@ -10,3 +10,11 @@ from .exceptions.test_exception_tools import *
 from .endpoint.test_endpoint_tools import *
 from .saved_objects.test_saved_objects import *
 from .cases.test_case_tools import *
+from .utils.test_response_cache import *
+from .utils.test_rule_resolver import *
+from .utils.test_render import *
+from .utils.test_tool_metrics import *
+from .utils.test_tool_deadlines import *
+from .utils.test_manifest import *
+from .utils.test_alert_mirror import *
+from .utils.test_alert_cache import *
@@ -0,0 +1,104 @@
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+
+from kibana_mcp.resources import handle_read_resource
+from kibana_mcp.tools.alerts.tag_alert import _call_tag_alert
+from kibana_mcp.tools.utils import AlertCache, set_alert_cache
+from kibana_mcp.tools.utils._alert_cache import RESOURCE_ALERT_FIELDS
+
+from testing.benchmarks.mock_kibana import FakeKibana
+from testing.tools.utils.test_utils import create_mock_response
+
+SEARCHES = "POST /api/detection_engine/signals/search"
+
+
+class CacheClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def alert_cache():
+    cache = AlertCache(max_entries=2, ttl=60, clock=CacheClock())
+    set_alert_cache(cache)
+    yield cache
+    set_alert_cache(None)
+
+
+@pytest.mark.asyncio
+async def test_alert_resource_is_one_projected_ids_search(alert_cache):
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": [
+        {"_id": "alert-1", "_index": ".alerts-security.alerts-default", "_source": {"host.name": "web-1"}},
+    ]}})
+
+    # Act
+    first = json.loads(await handle_read_resource("alert://alert-1", http_client=mock_client))
+    second = json.loads(await handle_read_resource("alert://alert-1", http_client=mock_client))
+
+    # Assert
+    assert first == second == {
+        "_id": "alert-1", "_index": ".alerts-security.alerts-default", "_source": {"host.name": "web-1"}}
+    mock_client.post.assert_called_once()
+    payload = mock_client.post.call_args.kwargs["json"]
+    assert payload["query"] == {"ids": {"values": ["alert-1"]}}
+    assert payload["size"] == 1
+    assert payload["_source"] == {"includes": RESOURCE_ALERT_FIELDS}
+    assert alert_cache.stats() == {"hits": 1, "misses": 1, "alerts": 1}
+
+
+@pytest.mark.asyncio
+async def test_alert_resource_is_refetched_after_our_tools_change_it(alert_cache):
+    # Arrange
+    fake = FakeKibana(alerts=10)
+    async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+        await handle_read_resource("alert://alert-3", http_client=client)
+        await handle_read_resource("alert://alert-4", http_client=client)
+        searches = fake.requests[SEARCHES]
+
+        # Act
+        await _call_tag_alert(client, alert_id="alert-3", tags_to_add=["triaged"])
+        await handle_read_resource("alert://alert-3", http_client=client)
+        await handle_read_resource("alert://alert-4", http_client=client)
+
+    # Assert: only the tagged alert was fetched again
+    assert fake.requests[SEARCHES] == searches + 1
+
+
+@pytest.mark.asyncio
+async def test_alert_cache_is_bounded_and_expires(alert_cache):
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = lambda path, json: create_mock_response(200, {"hits": {"hits": [
+        {"_id": json["query"]["ids"]["values"][0], "_source": {}}]}})
+
+    # Act
+    for alert_id in ("a", "b", "c", "a"):
+        await alert_cache.get(mock_client, alert_id)
+    alert_cache._clock.now += 61
+    await alert_cache.get(mock_client, "c")
+
+    # Assert: "a" was evicted by "c", then "c" expired
+    assert mock_client.post.call_count == 5
+    assert alert_cache.stats()["alerts"] == 2
+
+
+@pytest.mark.asyncio
+async def test_alert_resource_reports_unknown_alerts(alert_cache):
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, {"hits": {"hits": []}})
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Alert 'missing' not found"):
+        await handle_read_resource("alert://missing", http_client=mock_client)
+    with pytest.raises(ValueError, match="Unsupported resource URI"):
+        await handle_read_resource("case://1", http_client=mock_client)
+    assert alert_cache.stats()["alerts"] == 0
@@ -0,0 +1,250 @@
+import asyncio
+import json
+import sqlite3
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from kibana_mcp.tools.alerts.get_alerts import _call_get_alerts
+from kibana_mcp.tools.utils import AlertMirror, AlertMirrorSettings, set_alert_mirror
+from kibana_mcp.tools.utils._alert_mirror import note_alerts_changed, since_ms
+from kibana_mcp.tools.utils._render import begin_render_options, end_render_options
+
+from testing.benchmarks.mock_kibana import FakeKibana
+from testing.benchmarks.payloads import ALERTS_NEWEST_MS
+
+SEARCHES = "POST /api/detection_engine/signals/search"
+
+
+class MirrorClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@asynccontextmanager
+async def mirrored_kibana(alerts=300, **settings):
+    """A FakeKibana client with an installed, synced mirror whose clocks the test controls."""
+    fake = FakeKibana(alerts=alerts)
+    clock = MirrorClock()
+    # Long intervals keep the background task from syncing on its own
+    settings = {"sync_interval": 3600, "full_refresh_interval": 3600, **settings}
+    mirror = AlertMirror(AlertMirrorSettings(enabled=True, **settings),
+                         now_ms=lambda: ALERTS_NEWEST_MS + 1000, clock=clock)
+    set_alert_mirror(mirror)
+    try:
+        async with httpx.AsyncClient(base_url="http://kibana.test", transport=fake.transport()) as client:
+            await mirror.sync_once(client)
+            yield fake, client, mirror, clock
+    finally:
+        await mirror.stop()
+        mirror.close()
+        set_alert_mirror(None)
+
+
+async def _ids(client, **kwargs):
+    page = json.loads(await _call_get_alerts(client, **kwargs))
+    return [hit["_id"] for hit in page["hits"]["hits"]], page
+
+
+@pytest.mark.asyncio
+async def test_mirror_pages_match_kibana_pages():
+    async with mirrored_kibana() as (fake, client, mirror, _):
+        # Arrange
+        kibana_ids, kibana_page = await _ids(client, limit=20, search_text="*", max_staleness=0)
+        searches = fake.requests[SEARCHES]
+
+        # Act
+        mirror_ids, mirror_page = await _ids(client, limit=20, search_text="*")
+        next_ids, _ = await _ids(client, limit=20, search_text="*", cursor=mirror_page["next_cursor"])
+
+        # Assert
+        assert fake.requests[SEARCHES] == searches
+        assert mirror_ids == kibana_ids
+        assert mirror_page["hits"]["hits"][0]["_source"] == kibana_page["hits"]["hits"][0]["_source"]
+        assert mirror_page["next_cursor"] == kibana_page["next_cursor"]
+        assert next_ids == [f"alert-{i}" for i in range(20, 40)]
+
+
+@pytest.mark.asyncio
+async def test_mirror_answers_partial_pages_only_within_its_window():
+    async with mirrored_kibana() as (fake, client, mirror, _):
+        # Act
+        recent_ids, recent_page = await _ids(client, limit=20, search_text="user5", since="now-1h")
+        searches = fake.requests[SEARCHES]
+        await _ids(client, limit=20, search_text="user5")
+
+        # Assert: without a since bound, older matching alerts may exist in Kibana
+        assert recent_ids == ["alert-5", "alert-102", "alert-199", "alert-296"]
+        assert recent_page["hits"]["total"] == {"value": 4, "relation": "eq"}
+        assert fake.requests[SEARCHES] == searches + 1
+
+
+@pytest.mark.asyncio
+async def test_mirror_respects_freshness_bound_and_projection():
+    async with mirrored_kibana() as (fake, client, mirror, clock):
+        # Arrange
+        clock.now += 120
+        searches = fake.requests[SEARCHES]
+
+        # Act
+        await _ids(client, limit=10, search_text="*")
+        await _ids(client, limit=10, search_text="*", max_staleness=300)
+        token = begin_render_options(fields=["process.name"])
+        try:
+            await _ids(client, limit=10, search_text="*", max_staleness=300)
+        finally:
+            end_render_options(token)
+
+        # Assert: too old, served, field not mirrored
+        assert fake.requests[SEARCHES] == searches + 2
+        assert (mirror.served, mirror.fallbacks) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_mirror_age_counts_from_the_last_sync():
+    async with mirrored_kibana() as (fake, client, mirror, clock):
+        # Arrange
+        clock.now += 90
+        searches = fake.requests[SEARCHES]
+
+        # Act
+        await _ids(client, limit=10, search_text="*")
+        await mirror.sync_once(client)
+        await _ids(client, limit=10, search_text="*")
+
+        # Assert: Kibana answered the old mirror; the incremental sync (new alerts,
+        # status changes) made it fresh again without a full re-read
+        assert fake.requests[SEARCHES] == searches + 1 + 2
+        assert (mirror.served, mirror.fallbacks) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_mirror_picks_up_status_changes_made_elsewhere():
+    async with mirrored_kibana() as (fake, client, mirror, clock):
+        # Arrange: another worker closes alert-7, so this mirror is not told
+        fake.now_ms = lambda: ALERTS_NEWEST_MS + 5000
+        response = await client.post("/api/detection_engine/signals/status",
+                                     json={"signal_ids": ["alert-7"], "status": "closed"})
+        response.raise_for_status()
+        clock.now += 15
+        searches = fake.requests[SEARCHES]
+
+        # Act
+        await mirror.sync_once(client)
+        _, page = await _ids(client, limit=10, search_text="*")
+
+        # Assert: one search for new alerts, one for status changes, then served locally
+        assert fake.requests[SEARCHES] == searches + 2
+        assert mirror.served == 1
+        assert page["hits"]["hits"][7]["_source"]["kibana.alert.workflow_status"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_mirror_matches_rule_descriptions_like_kibana():
+    async with mirrored_kibana() as (fake, client, mirror, _):
+        # Arrange
+        searches = fake.requests[SEARCHES]
+
+        # Act
+        ids, page = await _ids(client, limit=20, search_text="tradecraft", since="now-1h")
+
+        # Assert
+        assert fake.requests[SEARCHES] == searches
+        assert ids == [f"alert-{i}" for i in range(20)]
+        assert page["hits"]["total"] == {"value": 300, "relation": "eq"}
+
+
+@pytest.mark.asyncio
+async def test_mirror_syncs_incrementally_and_rereads_changed_alerts():
+    async with mirrored_kibana() as (fake, client, mirror, _):
+        # Arrange
+        searches = fake.requests[SEARCHES]
+
+        # Act
+        stored = await mirror.sync_once(client)
+        await _ids(client, limit=10, search_text="*")
+        note_alerts_changed(["alert-7"])
+        await _ids(client, limit=10, search_text="*")
+        syncs = mirror.syncs
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if mirror.syncs > syncs:
+                break
+        await _ids(client, limit=10, search_text="*")
+
+        # Assert: an empty incremental sync (new alerts, status changes), one Kibana
+        # read while alert-7 was being re-read, then the mirror serves again
+        assert stored == 0
+        assert fake.requests[SEARCHES] == searches + 2 + 1 + 3
+        assert mirror.served == 2
+
+
+@pytest.mark.asyncio
+async def test_mirror_full_refresh_drops_alerts_gone_from_kibana():
+    async with mirrored_kibana(alerts=300, full_refresh_interval=100) as (fake, client, mirror, clock):
+        # Arrange: the 100 oldest alerts were deleted in Kibana
+        fake.alerts = 200
+        FakeKibana._alerts_body.cache_clear()
+        await mirror.sync_once(client)
+        incremental_count = mirror.count()
+
+        # Act
+        clock.now += 100
+        await mirror.sync_once(client)
+        ids, page = await _ids(client, limit=20, search_text="user5", since="now-1h")
+
+        # Assert: incremental syncs keep them, the full refresh does not
+        assert incremental_count == 300
+        assert mirror.count() == 200
+        assert ids == ["alert-5", "alert-102", "alert-199"]
+        assert page["hits"]["total"] == {"value": 3, "relation": "eq"}
+
+
+@pytest.mark.asyncio
+async def test_mirror_retention_is_bounded():
+    async with mirrored_kibana(alerts=300, max_alerts=100) as (fake, client, mirror, _):
+        # Arrange
+        searches = fake.requests[SEARCHES]
+
+        # Act
+        ids, _ = await _ids(client, limit=20, search_text="*")
+        await _ids(client, limit=20, search_text="user5", since="now-1h")
+
+        # Assert: the newest pages are complete, older alerts were dropped
+        assert mirror.count() == 100
+        assert ids == [f"alert-{i}" for i in range(20)]
+        assert fake.requests[SEARCHES] == searches + 1
+
+
+def test_mirror_rebuilds_a_file_of_an_older_layout(tmp_path):
+    # Arrange
+    path = str(tmp_path / "mirror.db")
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE alerts (id TEXT PRIMARY KEY, uuid TEXT NOT NULL, index_name TEXT, timestamp INTEGER NOT NULL, "
+                   "rule_name TEXT, host_name TEXT, user_name TEXT, status TEXT, source TEXT NOT NULL)")
+        db.execute("INSERT INTO alerts VALUES ('alert-1', 'u', 'i', 1, 'r', 'h', 'u', 'open', '{}')")
+    db.close()
+
+    # Act
+    mirror = AlertMirror(AlertMirrorSettings(enabled=True, path=path))
+    try:
+        columns = [row[1] for row in mirror._db.execute("PRAGMA table_info(alerts)")]
+        rows = mirror._db.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+    finally:
+        mirror.close()
+
+    # Assert
+    assert "seen" in columns
+    assert rows == 0
+
+
+def test_since_ms_parses_date_math_and_dates():
+    # Act / Assert
+    assert since_ms("now-15m", 1_000_000_000) == 1_000_000_000 - 900_000
+    assert since_ms("2024-05-01T00:00:00Z", 0) == 1714521600000
+    assert since_ms(1714521600000, 0) == 1714521600000
+    assert since_ms("now-1d/d", 0) is None
@@ -0,0 +1,86 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+from unittest.mock import AsyncMock
+
+from kibana_mcp import tools
+from kibana_mcp.tools._manifest import TOOL_MODULES, lazy_impl, load_impl, names_in
+from kibana_mcp.tools.utils import execute_tool_safely, NullCache
+from testing.tools.utils.test_utils import create_mock_response
+
+
+def test_manifest_entries_resolve_to_their_implementations():
+    # Act / Assert
+    for name, module_name in TOOL_MODULES.items():
+        assert load_impl(name) is getattr(importlib.import_module(module_name), name)
+
+
+def test_packages_expose_manifest_names():
+    # Assert
+    assert set(tools.__all__) == set(TOOL_MODULES) | {"execute_tool_safely"}
+    from kibana_mcp.tools import cases
+    from kibana_mcp.tools.cases import _call_get_case
+    assert cases.__all__ == names_in("kibana_mcp.tools.cases")
+    assert _call_get_case is load_impl("_call_get_case")
+    with pytest.raises(AttributeError):
+        cases._call_get_alerts
+
+
+def test_lazy_impl_rejects_unknown_names():
+    # Act / Assert
+    with pytest.raises(AttributeError):
+        lazy_impl("_call_does_not_exist")
+
+
+@pytest.mark.asyncio
+async def test_lazy_impl_delegates_to_implementation():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.get.return_value = create_mock_response(200, {"id": "case-1", "title": "Lazy"})
+    impl = lazy_impl("_call_get_case")
+
+    # Act
+    result = await execute_tool_safely("get_case", impl, mock_client, cache=NullCache(), case_id="case-1")
+
+    # Assert
+    assert impl.__name__ == "_call_get_case"
+    assert "Lazy" in result[0].text
+
+
+def test_importing_server_does_not_import_tool_modules():
+    # Arrange
+    script = (
+        "import sys, kibana_mcp.server\n"
+        "loaded = [m for m in sys.modules if m.startswith('kibana_mcp.tools.') and m.count('.') == 3"
+        " and not m.startswith('kibana_mcp.tools.utils')]\n"
+        "print(','.join(loaded))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    # Act
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=60)
+
+    # Assert
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == ""
+
+
+def test_importing_server_does_not_import_the_alert_machinery():
+    # Arrange
+    script = (
+        "import sys, kibana_mcp.server\n"
+        "names = ['sqlite3', 'kibana_mcp.tools.utils._alert_mirror', 'kibana_mcp.tools.utils._alert_cache',"
+        " 'kibana_mcp.tools.utils._write_batcher']\n"
+        "print(','.join(name for name in names if name in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    # Act
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=60)
+
+    # Assert
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == ""
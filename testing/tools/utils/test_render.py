@@ -0,0 +1,156 @@
+import pytest
+import json
+from unittest.mock import AsyncMock
+
+from kibana_mcp.tools.alerts.get_alerts import _call_get_alerts
+from kibana_mcp.tools.utils import execute_tool_safely, render_json, ResponseCache
+from kibana_mcp.tools.utils._cursor import decode_cursor, encode_cursor
+from kibana_mcp.tools.utils._render import begin_render_options, end_render_options
+from testing.tools.utils.test_utils import create_mock_response
+
+
+def make_alert_hits(count):
+    return {
+        "hits": {
+            "total": {"value": count},
+            "hits": [
+                {
+                    "_id": f"alert-{i}",
+                    "_index": ".alerts-security.alerts-default",
+                    "_source": {
+                        "@timestamp": "2024-01-01T00:00:00Z",
+                        "kibana.alert.rule.name": f"Rule {i}",
+                        "kibana.alert.workflow_status": "open",
+                        "host": {"name": f"host-{i}", "os": {"family": "linux"}},
+                        "process": {"command_line": "x" * 200},
+                    },
+                }
+                for i in range(count)
+            ],
+        }
+    }
+
+
+def render_with(payload, tool_name, **overrides):
+    token = begin_render_options(**overrides)
+    try:
+        return render_json(payload, tool_name=tool_name)
+    finally:
+        end_render_options(token)
+
+
+def test_render_applies_default_projection_to_alert_records():
+    # Act
+    rendered = json.loads(render_with(make_alert_hits(2), "get_alerts"))
+
+    # Assert
+    hit = rendered["hits"]["hits"][0]
+    assert hit["_id"] == "alert-0"
+    assert hit["_source"]["kibana.alert.rule.name"] == "Rule 0"
+    assert hit["_source"]["host"] == {"name": "host-0"}
+    assert "process" not in hit["_source"]
+    assert rendered["hits"]["total"]["value"] == 2
+
+
+def test_render_caller_fields_override_defaults_and_star_keeps_everything():
+    # Arrange
+    payload = make_alert_hits(1)
+
+    # Act
+    narrowed = json.loads(render_with(payload, "get_alerts", fields=["process.command_line"]))
+    full = json.loads(render_with(payload, "get_alerts", fields=["*"]))
+
+    # Assert
+    assert narrowed["hits"]["hits"][0]["_source"] == {"process": {"command_line": "x" * 200}}
+    assert full == payload
+
+
+def test_render_keeps_whole_records_of_other_tools_unless_fields_are_given():
+    # Arrange
+    payload = {"page": 1, "data": [{"id": "uuid-1", "name": "Rule 1", "query": "process.name: x",
+                                    "threat": [{"tactic": {"id": "TA0002"}}], "actions": []}]}
+
+    # Act
+    default = json.loads(render_with(payload, "find_rules"))
+    narrowed = json.loads(render_with(payload, "find_rules", fields=["name"]))
+
+    # Assert
+    assert default == payload
+    assert narrowed["data"] == [{"name": "Rule 1"}]
+
+
+def test_render_compact_encoding_is_smaller_and_equivalent():
+    # Arrange
+    payload = make_alert_hits(5)
+
+    # Act
+    pretty = render_with(payload, "get_alerts")
+    compact = render_with(payload, "get_alerts", compact=True)
+
+    # Assert
+    assert "\n" not in compact
+    assert len(compact) < len(pretty)
+    assert json.loads(compact) == json.loads(pretty)
+
+
+def test_render_budget_truncates_records_deterministically():
+    # Arrange
+    payload = make_alert_hits(50)
+
+    # Act
+    first = render_with(payload, "get_alerts", max_bytes=2000)
+    second = render_with(payload, "get_alerts", max_bytes=2000)
+
+    # Assert
+    assert first == second
+    assert len(first.encode("utf-8")) <= 2000
+    rendered = json.loads(first)
+    marker = rendered["_truncated"]
+    assert marker["total_records"] == 50
+    assert marker["returned"] == len(rendered["hits"]["hits"])
+    assert marker["omitted"] == 50 - marker["returned"]
+    assert rendered["hits"]["hits"][0]["_id"] == "alert-0"
+    assert "fields" in marker["hint"]
+
+
+def test_render_budget_moves_cursor_to_last_record_shown():
+    # Arrange
+    payload = make_alert_hits(50)
+    for i, hit in enumerate(payload["hits"]["hits"]):
+        hit["sort"] = [1000 - i, f"uuid-{i}"]
+    payload["next_cursor"] = encode_cursor([951, "uuid-49"], query="q1")
+
+    # Act
+    rendered = json.loads(render_with(payload, "get_alerts", max_bytes=2000))
+
+    # Assert: the moved cursor stays bound to the same search
+    last_shown = rendered["hits"]["hits"][-1]
+    assert decode_cursor(rendered["next_cursor"], query="q1") == last_shown["sort"]
+
+
+def test_render_budget_cuts_payloads_without_records():
+    # Act
+    rendered = render_with({"description": "y" * 5000}, "get_case", max_bytes=300)
+
+    # Assert
+    assert len(rendered.encode("utf-8")) <= 300
+    assert "output truncated" in rendered
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_safely_passes_output_fields_to_render_stage():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.post.return_value = create_mock_response(200, make_alert_hits(1))
+
+    # Act
+    result = await execute_tool_safely(
+        "get_alerts", _call_get_alerts, mock_client,
+        cache=ResponseCache(), output_fields=["host.os.family"], limit=1, search_text="*",
+    )
+
+    # Assert
+    hit = json.loads(result[0].text)["hits"]["hits"][0]
+    assert hit["_source"] == {"host": {"os": {"family": "linux"}}}
+    # The projection is not forwarded to the implementation
+    assert "output_fields" not in json.dumps(mock_client.post.call_args.kwargs.get("json", {}))
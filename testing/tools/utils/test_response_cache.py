@@ -0,0 +1,136 @@
+import pytest
+import httpx
+import json
+
+from kibana_mcp.tools.cases.get_case import _call_get_case
+from kibana_mcp.tools.cases.update_case import _call_update_case
+from kibana_mcp.tools.utils import execute_tool_safely, ResponseCache, CACHE_EVENT_HOOKS
+
+
+def create_kibana_client(handler):
+    """Real httpx client backed by a MockTransport, with the cache event hooks installed."""
+    return httpx.AsyncClient(
+        base_url="http://kibana.test",
+        transport=httpx.MockTransport(handler),
+        event_hooks=CACHE_EVENT_HOOKS,
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_repeated_read_from_memory():
+    # Arrange
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"id": "case-1", "status": "open"})
+
+    cache = ResponseCache()
+    async with create_kibana_client(handler) as client:
+        # Act
+        first = await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-1")
+        second = await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-1")
+
+    # Assert
+    assert first[0].text == second[0].text
+    assert calls == ["/api/cases/case-1"]
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["tools"]["get_case"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_store_kibana_errors():
+    # Arrange
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(404, json={"message": "Not found"})
+
+    cache = ResponseCache()
+    async with create_kibana_client(handler) as client:
+        # Act
+        await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="missing")
+        await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="missing")
+
+    # Assert
+    assert len(calls) == 2
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_mutating_tool_invalidates_affected_reads():
+    # Arrange
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if request.method == "PATCH":
+            return httpx.Response(200, json=[{"id": "case-1", "status": "closed"}])
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1], "status": "open"})
+
+    cache = ResponseCache()
+    async with create_kibana_client(handler) as client:
+        await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-1")
+        await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-2")
+
+        # Act
+        await execute_tool_safely(
+            "update_case", _call_update_case, client, cache=cache,
+            case_id="case-1", version="v1", status="closed"
+        )
+        await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-1")
+        await execute_tool_safely("get_case", _call_get_case, client, cache=cache, case_id="case-2")
+
+    # Assert
+    get_calls = [path for method, path in calls if method == "GET"]
+    # case-1 is fetched again after the update, case-2 is still served from cache
+    assert get_calls == ["/api/cases/case-1", "/api/cases/case-2", "/api/cases/case-1"]
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used():
+    # Arrange
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=2, ttls={"get_case": 10.0}, clock=clock)
+    cache.set("get_case", {"case_id": "a"}, "A")
+    cache.set("get_case", {"case_id": "b"}, "B")
+
+    # Act
+    assert cache.get("get_case", {"case_id": "a"}) == "A"  # "a" becomes most recently used
+    cache.set("get_case", {"case_id": "c"}, "C")
+
+    # Assert
+    assert cache.get("get_case", {"case_id": "b"}) is None
+    assert cache.get("get_case", {"case_id": "a"}) == "A"
+    assert cache.evictions == 1
+    clock.now = 11.0
+    assert cache.get("get_case", {"case_id": "a"}) is None
+
+
+def test_cache_key_ignores_none_and_argument_order():
+    assert ResponseCache.make_key("find_cases", {"page": 1, "tags": None, "status": "open"}) == \
+        ResponseCache.make_key("find_cases", {"status": "open", "page": 1})
+
+
+def test_stale_result_not_stored_after_invalidation():
+    # Arrange
+    cache = ResponseCache(ttls={"get_case": 10.0})
+    generation = cache.generation("get_case")
+
+    # Act - a mutation lands while the read is in flight
+    cache.invalidate_for("update_case", {"case_id": "a"})
+    stored = cache.set("get_case", {"case_id": "a"}, "stale", generation=generation)
+
+    # Assert
+    assert stored is False
+    assert cache.get("get_case", {"case_id": "a"}) is None
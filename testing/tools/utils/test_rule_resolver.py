@@ -0,0 +1,94 @@
+import pytest
+import httpx
+from unittest.mock import AsyncMock
+
+from kibana_mcp.tools.utils import RuleIdResolver
+from kibana_mcp.client.spaces import begin_space, end_space
+
+# Import test utilities
+from testing.tools.utils.test_utils import create_mock_response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_resolve_caches_uuid_per_client():
+    # Arrange
+    resolver = RuleIdResolver()
+    mock_client = AsyncMock()
+    other_client = AsyncMock()
+    mock_client.get.return_value = create_mock_response(200, {"id": "uuid-1", "rule_id": "rule-1"})
+    other_client.get.return_value = create_mock_response(200, {"id": "uuid-2", "rule_id": "rule-1"})
+
+    # Act
+    first = await resolver.resolve(mock_client, "rule-1")
+    second = await resolver.resolve(mock_client, "rule-1")
+    other = await resolver.resolve(other_client, "rule-1")
+
+    # Assert
+    assert first == second == "uuid-1"
+    assert other == "uuid-2"
+    mock_client.get.assert_called_once()
+    assert "rule_id=rule-1" in str(mock_client.get.call_args)
+    assert resolver.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_keeps_separate_mappings_per_space():
+    # Arrange
+    resolver = RuleIdResolver()
+    mock_client = AsyncMock()
+    mock_client.get.side_effect = [
+        create_mock_response(200, {"id": "uuid-default", "rule_id": "rule-1"}),
+        create_mock_response(200, {"id": "uuid-soc", "rule_id": "rule-1"}),
+    ]
+
+    # Act
+    default = await resolver.resolve(mock_client, "rule-1")
+    token = begin_space("soc")
+    try:
+        soc = await resolver.resolve(mock_client, "rule-1")
+        soc_again = await resolver.resolve(mock_client, "rule-1")
+    finally:
+        end_space(token)
+
+    # Assert
+    assert default == "uuid-default"
+    assert soc == soc_again == "uuid-soc"
+    assert mock_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_caches_not_found_for_negative_ttl():
+    # Arrange
+    clock = FakeClock()
+    resolver = RuleIdResolver(negative_ttl=30.0, clock=clock)
+    mock_client = AsyncMock()
+    mock_client.get.return_value = create_mock_response(404, {"message": "rule not found"})
+
+    # Act
+    assert await resolver.resolve(mock_client, "missing") is None
+    assert await resolver.resolve(mock_client, "missing") is None
+    clock.now = 31.0
+    assert await resolver.resolve(mock_client, "missing") is None
+
+    # Assert
+    assert mock_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_raises_on_server_errors():
+    # Arrange
+    resolver = RuleIdResolver()
+    mock_client = AsyncMock()
+    mock_client.get.return_value = create_mock_response(500, {"message": "boom"})
+
+    # Act / Assert
+    with pytest.raises(httpx.HTTPStatusError):
+        await resolver.resolve(mock_client, "rule-1")
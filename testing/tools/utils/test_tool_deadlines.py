@@ -0,0 +1,113 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+
+import mcp.types as types
+from mcp.shared.context import RequestContext
+from mcp.server.lowlevel.server import request_ctx
+
+from kibana_mcp import metrics
+from kibana_mcp.client.deadlines import remaining
+from kibana_mcp.tools.utils import execute_tool_safely, NullCache, ToolBudgets, set_tool_budgets
+from kibana_mcp.tools.utils._deadlines import client_budget
+
+
+@pytest.fixture
+def budgets():
+    set_tool_budgets(ToolBudgets(default=0.2, per_tool={"slow_export": 5.0}, max_client=1.0))
+    yield
+    set_tool_budgets(None)
+
+
+def test_tool_budgets_prefer_the_client_up_to_the_cap():
+    # Arrange
+    budgets = ToolBudgets(default=60.0, per_tool={"export_objects": 300.0, "get_alerts": 0}, max_client=120.0)
+
+    # Act / Assert
+    assert budgets.budget("get_case") == 60.0
+    assert budgets.budget("export_objects") == 300.0
+    assert budgets.budget("get_alerts") is None
+    assert budgets.budget("get_case", client_seconds=5.0) == 5.0
+    assert budgets.budget("export_objects", client_seconds=900.0) == 120.0
+
+
+def test_client_budget_is_read_from_the_request_meta():
+    # Arrange
+    meta = types.RequestParams.Meta(timeoutMs=2500)
+    token = request_ctx.set(RequestContext(request_id=1, meta=meta, session=None, lifespan_context=None))
+
+    # Act
+    try:
+        budget = client_budget()
+    finally:
+        request_ctx.reset(token)
+
+    # Assert
+    assert budget == 2.5
+    assert client_budget() is None
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_safely_gives_the_impl_the_call_deadline(budgets):
+    # Arrange
+    seen = {}
+
+    async def impl(http_client, **kwargs):
+        seen["remaining"] = remaining()
+        return "{}"
+
+    # Act
+    await execute_tool_safely("slow_export", impl, AsyncMock(), cache=NullCache())
+
+    # Assert
+    assert 4 < seen["remaining"] <= 5.0
+    assert remaining() is None
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_safely_cancels_calls_past_their_deadline(budgets):
+    # Arrange
+    cancelled = asyncio.Event()
+
+    async def hanging_impl(http_client, **kwargs):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    before = metrics.TOOL_CALLS.value(tool="hanging_tool", outcome="timeout")
+
+    # Act
+    with pytest.raises(TimeoutError, match="0.2s deadline"):
+        await execute_tool_safely("hanging_tool", hanging_impl, AsyncMock(), cache=NullCache())
+
+    # Assert
+    assert cancelled.is_set()
+    assert metrics.TOOL_CALLS.value(tool="hanging_tool", outcome="timeout") == before + 1
+    assert metrics.TOOL_IN_FLIGHT.value(tool="hanging_tool") == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_safely_records_client_cancellation(budgets):
+    # Arrange
+    started = asyncio.Event()
+
+    async def waiting_impl(http_client, **kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    before = metrics.TOOL_CALLS.value(tool="cancelled_tool", outcome="cancelled")
+    set_tool_budgets(ToolBudgets(default=0))
+    task = asyncio.create_task(
+        execute_tool_safely("cancelled_tool", waiting_impl, AsyncMock(), cache=NullCache()))
+    await started.wait()
+
+    # Act
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Assert
+    assert metrics.TOOL_CALLS.value(tool="cancelled_tool", outcome="cancelled") == before + 1
+    assert metrics.TOOL_IN_FLIGHT.value(tool="cancelled_tool") == 0
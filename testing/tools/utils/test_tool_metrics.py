@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from kibana_mcp import metrics
+from kibana_mcp.tools.cases.get_case import _call_get_case
+from kibana_mcp.tools.utils import execute_tool_safely, NullCache
+from testing.tools.utils.test_utils import create_mock_response
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_safely_records_tool_metrics():
+    # Arrange
+    mock_client = AsyncMock()
+    mock_client.get.return_value = create_mock_response(200, {"id": "case-1"})
+    before_calls = metrics.TOOL_CALLS.value(tool="get_case", outcome="success")
+    before_count = metrics.TOOL_DURATION.count(tool="get_case")
+    before_sizes = metrics.TOOL_RESPONSE_BYTES.count(tool="get_case")
+
+    # Act
+    await execute_tool_safely("get_case", _call_get_case, mock_client, cache=NullCache(), case_id="case-1")
+
+    # Assert
+    assert metrics.TOOL_CALLS.value(tool="get_case", outcome="success") == before_calls + 1
+    assert metrics.TOOL_DURATION.count(tool="get_case") == before_count + 1
+    assert metrics.TOOL_RESPONSE_BYTES.count(tool="get_case") == before_sizes + 1
+    assert metrics.TOOL_IN_FLIGHT.value(tool="get_case") == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_safely_counts_raised_errors():
+    # Arrange
+    async def failing_impl(http_client, **kwargs):
+        raise KeyError("boom")
+
+    before = metrics.TOOL_ERRORS.value(tool="failing_tool")
+
+    # Act
+    with pytest.raises(RuntimeError):
+        await execute_tool_safely("failing_tool", failing_impl, AsyncMock(), cache=NullCache())
+
+    # Assert
+    assert metrics.TOOL_ERRORS.value(tool="failing_tool") == before + 1
+    assert metrics.TOOL_CALLS.value(tool="failing_tool", outcome="error") >= 1
+    assert metrics.TOOL_IN_FLIGHT.value(tool="failing_tool") == 0